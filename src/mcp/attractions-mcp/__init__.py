@@ -2,46 +2,148 @@
 Tourist Attractions MCP Package - Discover and book attractions worldwide.
 """
 
-from attractions_service import (
-    get_attraction_details_data, 
-    search_attractions_data,
-    get_random_attraction_data,
-    get_world_wonders_data,
-    book_attraction_data,
-    get_attraction_categories_data
-)
-from models import (
-    Attraction, AttractionDetails, BookingRequest, BookingResponse,
-    AttractionsList, SearchFilters, Location, Coordinates
-)
-from utils import (
-    get_attraction_by_id, search_attractions, parse_attraction_data,
-    format_attraction_name, get_category_display_name, generate_booking_id,
-    validate_visit_date, validate_email, format_attraction_details
-)
+import importlib
+
+# Exported names are imported from their modules on first use, so importing the package
+# does not load the services, catalogue and their dependencies up front
+_EXPORTS = {
+    "attractions_service": (
+        "get_attraction_details_data", "search_attractions_data", "find_open_attractions_data",
+        "plan_day_data", "autocomplete_attractions_data", "get_similar_attractions_data",
+        "get_random_attraction_data", "get_world_wonders_data", "book_attraction_data",
+        "book_attractions_batch_data", "get_booking_data", "get_availability_data",
+        "list_bookings_data", "cancel_booking_data", "get_delivery_status_data",
+        "get_attraction_categories_data", "get_catalogue_version_data"
+    ),
+    "models": (
+        "Attraction", "AttractionDetails", "BookingRequest", "BookingResponse", "AttractionsList",
+        "BookingsList", "BatchBookingItem", "BatchBookingResponse", "OutboxDelivery",
+        "DeliveryStatus", "SearchFilters", "Availability", "DayAvailability", "TimeSlot",
+        "Location", "Coordinates", "Price", "OpeningHours", "DayHours", "DayPlan", "PlannedStop",
+        "Suggestion", "AutocompleteResults", "SimilarAttraction", "SimilarAttractions"
+    ),
+    "catalogue": (
+        "AttractionCatalogue", "get_catalogue", "reload_catalogue", "get_attraction_by_id",
+        "search_attractions"
+    ),
+    "synthetic": ("generate_attractions", "pick_wonders"),
+    "bookings": ("BookingStore", "BookingError", "BatchBookingError", "WriteTimeout", "get_booking_store"),
+    "outbox": ("OutboxDispatcher", "LocalSink", "get_outbox_dispatcher", "register_sink"),
+    "providers": ("LocalProvider", "UpstreamProvider", "ShardedProvider", "get_provider", "set_provider"),
+    "sharding": ("shard_of", "shard_rows"),
+    "shard_server": ("ShardApi",),
+    "mcp_common.admission": ("AdmissionController", "Overloaded", "register_server", "get_admission_controller"),
+    "upstream": ("UpstreamClient", "UpstreamUnavailable"),
+    "mcp_common.profiling": ("span", "instrumented"),
+    "projection": ("parse_fields", "project_attraction", "fit_to_budget"),
+    "mcp_common.encoding": ("dumps", "loads", "to_builtins", "encoded", "get_encoder", "set_encoder"),
+    "utils": (
+        "parse_attraction_data", "parse_entry_fee", "parse_opening_hours",
+        "format_attraction_name", "get_category_display_name", "generate_booking_id",
+        "validate_visit_date", "validate_email", "format_attraction_details"
+    )
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
 
 __version__ = "1.0.0"
 __all__ = [
     # Service functions
     "get_attraction_details_data",
     "search_attractions_data", 
+    "find_open_attractions_data",
+    "plan_day_data",
+    "autocomplete_attractions_data",
+    "get_similar_attractions_data",
     "get_random_attraction_data",
     "get_world_wonders_data",
     "book_attraction_data",
+    "book_attractions_batch_data",
+    "get_booking_data",
+    "get_availability_data",
+    "list_bookings_data",
+    "cancel_booking_data",
+    "get_delivery_status_data",
     "get_attraction_categories_data",
+    "get_catalogue_version_data",
     # Models
     "Attraction",
     "AttractionDetails", 
     "BookingRequest",
     "BookingResponse",
     "AttractionsList",
+    "BookingsList",
+    "BatchBookingItem",
+    "BatchBookingResponse",
+    "OutboxDelivery",
+    "DeliveryStatus",
+    "Availability",
+    "DayAvailability",
+    "TimeSlot",
     "SearchFilters",
     "Location",
     "Coordinates",
-    # Utilities
+    "Price",
+    "OpeningHours",
+    "DayHours",
+    "DayPlan",
+    "PlannedStop",
+    "Suggestion",
+    "AutocompleteResults",
+    "SimilarAttraction",
+    "SimilarAttractions",
+    # Catalogue
+    "AttractionCatalogue",
+    "get_catalogue",
+    "reload_catalogue",
     "get_attraction_by_id",
     "search_attractions",
+    "generate_attractions",
+    "pick_wonders",
+    # Booking ledger
+    "BookingStore",
+    "BookingError",
+    "BatchBookingError",
+    "WriteTimeout",
+    "get_booking_store",
+    # Booking side-effects
+    "OutboxDispatcher",
+    "LocalSink",
+    "get_outbox_dispatcher",
+    "register_sink",
+    # Attraction data providers
+    "LocalProvider",
+    "UpstreamProvider",
+    "ShardedProvider",
+    "get_provider",
+    "set_provider",
+    "UpstreamClient",
+    "UpstreamUnavailable",
+    "shard_of",
+    "shard_rows",
+    "ShardApi",
+    # Admission control
+    "AdmissionController",
+    "Overloaded",
+    "register_server",
+    "get_admission_controller",
+    # Profiling and tracing
+    "span",
+    "instrumented",
+    # Response shaping
+    "parse_fields",
+    "project_attraction",
+    "fit_to_budget",
+    # JSON encoding
+    "dumps",
+    "loads",
+    "to_builtins",
+    "encoded",
+    "get_encoder",
+    "set_encoder",
+    # Utilities
     "parse_attraction_data",
+    "parse_entry_fee",
+    "parse_opening_hours",
     "format_attraction_name",
     "get_category_display_name",
     "generate_booking_id", 
@@ -49,3 +151,11 @@ __all__ = [
     "validate_email",
     "format_attraction_details"
 ]
+
+
+def __getattr__(name: str):
+    """Import an exported name from its module the first time it is used"""
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
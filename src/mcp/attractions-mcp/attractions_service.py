@@ -2,58 +2,109 @@
 Attractions service with MCP tools and API logic.
 """
 
-from typing import Dict, Any, List
-from dataclasses import asdict
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable
+from datetime import datetime, timedelta
 
-from config import DEFAULT_SEARCH_LIMIT, ATTRACTION_CATEGORIES
+from mcp_common.profiling import span
+from mcp_common.encoding import to_builtins
+
+from config import (
+    DEFAULT_SEARCH_LIMIT, PLANNER_DAY_END, PLANNER_MAX_STOPS,
+    AUTOCOMPLETE_DEFAULT_LIMIT, AUTOCOMPLETE_MAX_LIMIT, BOOKING_STATUS, MAX_AVAILABILITY_DAYS,
+    MAX_BATCH_BOOKINGS, SIMILAR_DEFAULT_LIMIT, SIMILAR_MAX_LIMIT
+)
 from models import (
     AttractionDetails, BookingRequest, BookingResponse, 
-    AttractionsList, SearchFilters
+    AttractionsList, SearchFilters, AutocompleteResults, BookingsList, Availability,
+    BatchBookingItem, BatchBookingResponse, SimilarAttraction, SimilarAttractions
 )
+from bookings import get_booking_store, BookingError, BatchBookingError, WriteTimeout
+from availability import slot_layout, daily_capacity, day_availability
+from catalogue import get_catalogue
+from providers import get_provider
 from utils import (
-    get_attraction_by_id, search_attractions, get_random_famous_attraction,
-    get_random_india_attraction, get_wonders_of_world, parse_attraction_data,
-    format_attraction_name, get_category_display_name, generate_booking_id,
+    format_attraction_name, format_attraction_listing, get_category_display_name, generate_booking_id,
     generate_confirmation_code, validate_visit_date, validate_email,
-    calculate_estimated_cost, format_attraction_details
+    calculate_estimated_cost, format_attraction_details, parse_datetime, parse_clock, parse_attraction_data
 )
+from planner import plan_day
+from projection import parse_fields, project_attraction, fit_to_budget
 
 
-def get_attraction_details_data(attraction_id: int) -> Dict[str, Any]:
+def get_attraction_details_data(attraction_id: int, fields: Optional[str] = None) -> Dict[str, Any]:
     """Get detailed information about a specific attraction
     
     Args:
         attraction_id: Unique ID of the attraction
+        fields: Optional comma-separated Attraction fields to return (e.g., "name,rating,hours"); all by default
         
     Returns:
         AttractionDetails object as dictionary or error dict
     """
     try:
-        data = get_attraction_by_id(attraction_id)
-        if not data:
+        projection = parse_fields(fields)
+    except ValueError as e:
+        return {"error": str(e)}
+    
+    try:
+        provider = get_provider()
+        data = provider.attraction(attraction_id)
+        if data is None:
             return {"error": f"Attraction with ID {attraction_id} not found"}
         
-        attraction = parse_attraction_data(data)
-        
         attraction_details = AttractionDetails(
-            attraction=attraction,
+            attraction=None,
             reviews_count=data.get("reviews_count"),
             facilities=data.get("facilities", []),
             best_time_to_visit=data.get("best_time_to_visit"),
             duration=data.get("duration")
         )
         
-        return asdict(attraction_details)
+        # The attraction itself is serialised once and shared
+        return dict(to_builtins(attraction_details), attraction=project_attraction(provider.serialised(attraction_id), projection))
         
     except Exception as e:
         return {"error": f"Failed to get attraction details: {str(e)}"}
 
 
+def attractions_list_data(
+    search_data: Dict[str, Any],
+    category: str = None,
+    location: str = None,
+    max_bytes: Optional[int] = None
+) -> Dict[str, Any]:
+    """Build an AttractionsList dictionary from provider search results
+    
+    Args:
+        search_data: Search result with matching serialised attractions and total count
+        category: Category searched for, if any
+        location: Location searched for, if any
+        max_bytes: Optional size budget for the response as JSON
+        
+    Returns:
+        AttractionsList object as dictionary, reusing each attraction's serialised form
+        (copied only where it is cut to fit the budget)
+    """
+    attractions_list = AttractionsList(
+        category=get_category_display_name(category) if category else "All Categories",
+        location=location or "Worldwide",
+        total_count=search_data.get("total", 0),
+        attractions=None,
+        corrected_location=search_data.get("corrected_location"),
+        total_is_estimate=search_data.get("total_is_estimate", False)
+    )
+    return fit_to_budget(dict(to_builtins(attractions_list), attractions=search_data["attractions"]), max_bytes)
+
+
 def search_attractions_data(
     location: str = None, 
     category: str = None, 
-    limit: int = DEFAULT_SEARCH_LIMIT
+    limit: int = DEFAULT_SEARCH_LIMIT,
+    rating_min: Optional[float] = None,
+    max_price: Optional[float] = None,
+    free_entry: Optional[bool] = None,
+    fields: Optional[str] = None,
+    max_bytes: Optional[int] = None
 ) -> Dict[str, Any]:
     """Search for attractions with filters
     
@@ -61,99 +112,320 @@ def search_attractions_data(
         location: Location to search in (e.g., "Paris", "India", "Italy")
         category: Category of attractions (e.g., "historical", "natural", "cultural")
         limit: Maximum number of results (default: 20, max: 100)
+        rating_min: Optional minimum rating (0-5)
+        max_price: Optional maximum lowest ticket price, in USD
+        free_entry: Optional filter for free (True) or paid (False) attractions
+        fields: Optional comma-separated Attraction fields to return (e.g., "name,rating,price"); all by default
+        max_bytes: Optional size budget for the response as JSON; descriptions are shortened,
+            then the lowest ranked results dropped, to fit
         
     Returns:
         AttractionsList object as dictionary or error dict
     """
+    try:
+        projection = parse_fields(fields)
+    except ValueError as e:
+        return {"error": str(e)}
+    if max_bytes is not None and max_bytes < 1:
+        return {"error": "max_bytes must be greater than 0"}
+    
     try:
         if limit > 100:
             limit = 100
         elif limit < 1:
             limit = 1
             
-        data = search_attractions(location, category, limit)
+        data = get_provider().search(
+            location, category, limit, projection, rating_min=rating_min, max_price=max_price, free_entry=free_entry
+        )
         if not data:
             return {"error": "No attractions found matching the criteria"}
         
-        attractions = []
-        if "attractions" in data:
-            for item in data["attractions"]:
-                attraction = parse_attraction_data(item)
-                attractions.append(attraction)
-        
-        attractions_list = AttractionsList(
-            category=get_category_display_name(category) if category else "All Categories",
-            location=location or "Worldwide",
-            total_count=data.get("total", len(attractions)),
-            attractions=attractions
+        return attractions_list_data(data, category, location, max_bytes)
+        
+    except Exception as e:
+        return {"error": f"Failed to search attractions: {str(e)}"}
+
+
+def find_open_attractions_data(
+    location: str = None,
+    start: str = None,
+    end: str = None,
+    category: str = None,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+    fields: Optional[str] = None,
+    max_bytes: Optional[int] = None
+) -> Dict[str, Any]:
+    """Find attractions open at a local date and time, or for a whole time window
+    
+    Args:
+        location: Location to search in (e.g., "Paris", "India", "Italy")
+        start: Local date and time in ISO format (e.g., "2025-09-20T14:30")
+        end: Optional end of the window in ISO format; attractions must stay open until then
+        category: Optional category filter
+        limit: Maximum number of results (default: 20, max: 100)
+        fields: Optional comma-separated Attraction fields to return; all by default
+        max_bytes: Optional size budget for the response as JSON
+        
+    Returns:
+        AttractionsList object as dictionary or error dict
+    """
+    try:
+        projection = parse_fields(fields)
+    except ValueError as e:
+        return {"error": str(e)}
+    if max_bytes is not None and max_bytes < 1:
+        return {"error": "max_bytes must be greater than 0"}
+    
+    try:
+        open_at = parse_datetime(start)
+        if open_at is None:
+            return {"error": "Start must be a date and time in YYYY-MM-DDTHH:MM format"}
+        
+        open_until = None
+        if end:
+            open_until = parse_datetime(end)
+            if open_until is None or open_until < open_at:
+                return {"error": "End must be a date and time in YYYY-MM-DDTHH:MM format, after the start"}
+        
+        limit = max(1, min(limit, 100))
+        data = get_provider().search(location, category, limit, projection, open_at=open_at, open_until=open_until)
+        return attractions_list_data(data, category, location, max_bytes)
+        
+    except Exception as e:
+        return {"error": f"Failed to find open attractions: {str(e)}"}
+
+
+def plan_day_data(
+    location: str,
+    date: str,
+    preferences: Optional[str] = None,
+    start_time: str = "09:00",
+    max_stops: int = PLANNER_MAX_STOPS,
+    budget: Optional[float] = None
+) -> Dict[str, Any]:
+    """Plan a timed one-day itinerary of attractions
+    
+    Args:
+        location: City or place to plan around (e.g., "Paris", "Rome")
+        date: Visit date in YYYY-MM-DD format
+        preferences: Optional comma-separated interests or categories (e.g., "museums, art")
+        start_time: Time to start the day in HH:MM format (default: "09:00")
+        max_stops: Maximum number of attractions to visit (1-8, default: 5)
+        budget: Optional maximum total entry cost per person, in USD
+        
+    Returns:
+        DayPlan object as dictionary or error dict
+    """
+    try:
+        if not location or not location.strip():
+            return {"error": "Location is required"}
+        
+        visit_date = parse_datetime(date)
+        if visit_date is None:
+            return {"error": "Date must be in YYYY-MM-DD format"}
+        
+        day_start = parse_clock(start_time)
+        if day_start is None:
+            return {"error": "Start time must be in HH:MM format"}
+        day_end = parse_clock(PLANNER_DAY_END)
+        if day_start >= day_end:
+            return {"error": f"Start time must be before {PLANNER_DAY_END}"}
+        
+        if budget is not None and budget < 0:
+            return {"error": "Budget cannot be negative"}
+        
+        max_stops = max(1, min(max_stops, 8))
+        interests = [item.strip().lower() for item in (preferences or "").split(",") if item.strip()]
+        
+        day_plan = plan_day(
+            get_catalogue(), location, visit_date.date(), interests,
+            day_start, day_end, max_stops, budget
         )
+        if not day_plan.stops:
+            return {"error": f"No attractions in {location} could be scheduled for {date}"}
         
-        return asdict(attractions_list)
+        return to_builtins(day_plan)
         
     except Exception as e:
-        return {"error": f"Failed to search attractions: {str(e)}"}
+        return {"error": f"Failed to plan day: {str(e)}"}
+
+
+def autocomplete_attractions_data(prefix: str, limit: int = AUTOCOMPLETE_DEFAULT_LIMIT) -> Dict[str, Any]:
+    """Suggest attraction and place names starting with a prefix
+    
+    Args:
+        prefix: Start of an attraction, city, country or region name (e.g., "Eif", "Par")
+        limit: Maximum number of suggestions (default: 10, max: 20)
+        
+    Returns:
+        AutocompleteResults object as dictionary or error dict
+    """
+    try:
+        limit = max(1, min(limit, AUTOCOMPLETE_MAX_LIMIT))
+        suggestions = get_catalogue().prefix_index.complete(prefix or "", limit)
+        return to_builtins(AutocompleteResults(prefix=prefix, suggestions=suggestions))
+        
+    except Exception as e:
+        return {"error": f"Failed to autocomplete: {str(e)}"}
+
+
+def get_similar_attractions_data(
+    attraction_id: int,
+    k: int = SIMILAR_DEFAULT_LIMIT,
+    within_km: Optional[float] = None,
+    fields: Optional[str] = None,
+    max_bytes: Optional[int] = None
+) -> Dict[str, Any]:
+    """Find the attractions most similar to one, e.g. alternatives when a stop is full or closed
+    
+    Args:
+        attraction_id: ID of the attraction to find alternatives for
+        k: Number of similar attractions to return (default: 5, max: 20)
+        within_km: Optional radius in kilometres around the attraction to stay within
+        fields: Optional comma-separated Attraction fields to return; all by default
+        max_bytes: Optional size budget for the response as JSON
+        
+    Returns:
+        SimilarAttractions object as dictionary or error dict
+    """
+    try:
+        projection = parse_fields(fields)
+    except ValueError as e:
+        return {"error": str(e)}
+    if max_bytes is not None and max_bytes < 1:
+        return {"error": "max_bytes must be greater than 0"}
+    
+    try:
+        catalogue = get_catalogue()
+        position = catalogue.position_of(attraction_id)
+        if position is None:
+            return {"error": f"Attraction with ID {attraction_id} not found"}
+        
+        if within_km is not None:
+            if within_km <= 0:
+                return {"error": "within_km must be greater than 0"}
+            if catalogue.location(position).get("latitude") is None:
+                return {"error": f"Attraction with ID {attraction_id} has no coordinates to search around"}
+        
+        k = max(1, min(k, SIMILAR_MAX_LIMIT))
+        similar = catalogue.similar(position, k, within_km)
+        response = SimilarAttractions(
+            attraction_id=attraction_id,
+            name=catalogue.text["name"][position],
+            within_km=within_km,
+            total_count=len(similar),
+            attractions=None
+        )
+        attractions = [
+            # Each attraction's serialised form is shared, not copied, unless only some fields are wanted
+            dict(to_builtins(SimilarAttraction(attraction=None, similarity=score, distance_km=distance)),
+                 attraction=catalogue.to_dicts([similar_position], projection)[0])
+            for similar_position, score, distance in similar
+        ]
+        return fit_to_budget(dict(to_builtins(response), attractions=attractions), max_bytes, nested="attraction")
+        
+    except Exception as e:
+        return {"error": f"Failed to find similar attractions: {str(e)}"}
 
 
-def get_random_attraction_data(region: str = "famous") -> Dict[str, Any]:
+def get_random_attraction_data(region: str = "famous", fields: Optional[str] = None) -> Dict[str, Any]:
     """Get a random attraction
     
     Args:
         region: Region type - "famous" for world famous attractions, "india" for Indian attractions
+        fields: Optional comma-separated Attraction fields to return; all by default
         
     Returns:
         Attraction object as dictionary or error dict
     """
     try:
-        if region.lower() == "india":
-            data = get_random_india_attraction()
-        else:
-            data = get_random_famous_attraction()
-            
+        projection = parse_fields(fields)
+    except ValueError as e:
+        return {"error": str(e)}
+    
+    try:
+        data = get_provider().random(region)
         if not data:
             return {"error": f"No random attraction found for region: {region}"}
         
-        attraction = parse_attraction_data(data)
-        return asdict(attraction)
+        return project_attraction(data, projection)
         
     except Exception as e:
         return {"error": f"Failed to get random attraction: {str(e)}"}
 
 
+def memoised_resource(key: Any, build: Callable[[], str]) -> str:
+    """Get a formatted resource from the catalogue's resource cache, building it on first use
+    
+    Args:
+        key: Cache key identifying the resource and its parameters
+        build: Function formatting the resource from the current catalogue
+        
+    Returns:
+        Formatted resource ending with the catalogue version it was built from; errors are not cached,
+        and with an upstream provider resources expire after UPSTREAM_RESOURCE_TTL_SECONDS
+    """
+    catalogue = get_catalogue()
+    
+    with span("resource cache", key=str(key), cache="hit") as cache_span:
+        def build_versioned() -> str:
+            cache_span.set("cache", "miss")
+            text = build()
+            if text.startswith("Error"):
+                return text
+            return f"{text.rstrip()}\n\n_Catalogue version: {catalogue.version}_\n"
+        
+        return catalogue.resources.get_or_build(
+            key, build_versioned, lambda text: not text.startswith("Error"), ttl=get_provider().resource_ttl
+        )
+
+
+def get_catalogue_version_data() -> Dict[str, Any]:
+    """Get the catalogue version, resource cache statistics and where attraction data comes from
+    
+    Returns:
+        Dictionary with the ETag-style catalogue version, load time, cache counters and provider status
+    """
+    catalogue = get_catalogue()
+    return {
+        "version": catalogue.version,
+        "loaded_at": catalogue.loaded_at,
+        "total_attractions": len(catalogue),
+        "cached_resources": len(catalogue.resources),
+        "cache_hits": catalogue.resources.hits,
+        "cache_misses": catalogue.resources.misses,
+        "provider": get_provider().stats()
+    }
+
+
 def get_world_wonders_data() -> str:
-    """Get list of world wonders attractions as formatted string
+    """Get list of world wonders attractions as formatted string, memoised per catalogue version
+    
+    Returns:
+        Formatted string with world wonders attractions
+    """
+    return memoised_resource("wonders", format_world_wonders)
+
+
+def format_world_wonders() -> str:
+    """Format the world wonders attractions
     
     Returns:
         Formatted string with world wonders attractions
     """
     try:
-        data = get_wonders_of_world()
+        data = get_provider().wonders()
         if not data:
             return "Error: No world wonders found"
         
-        attractions = []
-        if "attractions" in data:
-            for item in data["attractions"]:
-                attraction = parse_attraction_data(item)
-                attractions.append(attraction)
+        attractions = data.get("attractions", [])
         
         result = "🌟 **Wonders of the World**\n\n"
         result += f"Total Wonders: {len(attractions)}\n\n"
         
         for i, attraction in enumerate(attractions, 1):
-            location_str = f"{attraction.location.city}, {attraction.location.country}" if attraction.location.city else attraction.location.country
-            
-            result += f"{i}. 🏛️ **{attraction.name}**\n"
-            result += f"   📍 {location_str}\n"
-            result += f"   🏷️ {get_category_display_name(attraction.category)}\n"
-            
-            if attraction.rating:
-                result += f"   ⭐ {attraction.rating}/5.0\n"
-            if attraction.entry_fee:
-                result += f"   💰 {attraction.entry_fee}\n"
-            if attraction.description:
-                result += f"   📝 {attraction.description}\n"
-            
-            result += "\n"
+            result += format_attraction_listing(i, attraction, include_description=True)
         
         return result
         
@@ -161,6 +433,102 @@ def get_world_wonders_data() -> str:
         return f"Error: Failed to get world wonders: {str(e)}"
 
 
+def prepare_booking(
+    attraction_id: int,
+    visitor_name: str,
+    email: str,
+    visit_date: str,
+    num_visitors: int = 1,
+    phone: str = None,
+    special_requirements: str = None,
+    idempotency_key: str = None,
+    time_slot: str = None,
+    attractions: Dict[int, Any] = None
+) -> Dict[str, Any]:
+    """Validate a booking request and work out its cost and bookable slots
+    
+    Args:
+        attraction_id: ID of the attraction to book
+        visitor_name: Name of the primary visitor
+        email: Email address for booking confirmation
+        visit_date: Visit date in YYYY-MM-DD format
+        num_visitors: Number of visitors
+        phone: Optional phone number
+        special_requirements: Optional special requirements
+        idempotency_key: Optional client-chosen key
+        time_slot: Optional slot start time in HH:MM format
+        attractions: Optional cache of (record, price, opening hours) by attraction ID, reused across a batch
+        
+    Returns:
+        Dictionary with the booking store item (booking values, slots, daily capacity, slot index) or error dict
+    """
+    if not visitor_name or not visitor_name.strip():
+        return {"error": "Visitor name is required"}
+    
+    if not validate_email(email):
+        return {"error": "Invalid email address"}
+    
+    if not validate_visit_date(visit_date):
+        return {"error": "Visit date must be in the future and in YYYY-MM-DD format"}
+    
+    if not isinstance(num_visitors, int) or isinstance(num_visitors, bool):
+        return {"error": "Number of visitors must be a whole number"}
+    if num_visitors < 1 or num_visitors > 50:
+        return {"error": "Number of visitors must be between 1 and 50"}
+    
+    if time_slot is not None and not isinstance(time_slot, str):
+        return {"error": "Time slot must be a start time in HH:MM format"}
+    
+    # Get attraction details for cost calculation, once per attraction
+    attractions = {} if attractions is None else attractions
+    if attraction_id not in attractions:
+        provider = get_provider()
+        attraction_data = provider.attraction(attraction_id)
+        attractions[attraction_id] = attraction_data and (
+            attraction_data,
+            attraction_data.get("price"),
+            provider.opening_hours(attraction_id)
+        )
+    if not attractions[attraction_id]:
+        return {"error": f"Attraction with ID {attraction_id} not found"}
+    attraction_data, price, opening_hours = attractions[attraction_id]
+    
+    # Calculate estimated cost from the fee range parsed at load
+    total_cost = calculate_estimated_cost(num_visitors, price)
+    total_cost_max = calculate_estimated_cost(num_visitors, price, upper=True)
+    
+    # Work out the bookable slots for the day
+    slots = slot_layout(attraction_data, opening_hours, datetime.strptime(visit_date, "%Y-%m-%d").date())
+    slot_index = None
+    if time_slot:
+        slot_starts = [start for start, _ in slots]
+        if time_slot not in slot_starts:
+            return {"error": f"No {time_slot} time slot on {visit_date}. Available slots: {', '.join(slot_starts) or 'none (closed)'}"}
+        slot_index = slot_starts.index(time_slot)
+    
+    booking_request = BookingRequest(
+        attraction_id=attraction_id,
+        visitor_name=visitor_name.strip(),
+        email=email.strip(),
+        visit_date=visit_date,
+        num_visitors=num_visitors,
+        phone=phone,
+        special_requirements=special_requirements,
+        idempotency_key=idempotency_key or None,
+        time_slot=time_slot
+    )
+    booking = dict(
+        to_builtins(booking_request),
+        booking_id=generate_booking_id(),
+        confirmation_code=generate_confirmation_code(),
+        total_cost=total_cost,
+        total_cost_max=total_cost_max,
+        currency=price.currency if price else None,
+        booking_status="confirmed"
+    )
+    return {"item": (booking, slots, daily_capacity(attraction_data), slot_index)}
+
+
 def book_attraction_data(
     attraction_id: int,
     visitor_name: str,
@@ -168,7 +536,9 @@ def book_attraction_data(
     visit_date: str,
     num_visitors: int = 1,
     phone: str = None,
-    special_requirements: str = None
+    special_requirements: str = None,
+    idempotency_key: str = None,
+    time_slot: str = None
 ) -> Dict[str, Any]:
     """Book an attraction visit
     
@@ -180,65 +550,274 @@ def book_attraction_data(
         num_visitors: Number of visitors (default: 1)
         phone: Optional phone number
         special_requirements: Optional special requirements
+        idempotency_key: Optional client-chosen key; retrying with the same key returns the original booking
+        time_slot: Optional slot start time in HH:MM format; defaults to the earliest slot with room
         
     Returns:
         BookingResponse object as dictionary or error dict
     """
     try:
-        if not visitor_name.strip():
-            return {"error": "Visitor name is required"}
+        prepared = prepare_booking(
+            attraction_id, visitor_name, email, visit_date, num_visitors,
+            phone, special_requirements, idempotency_key, time_slot
+        )
+        if "error" in prepared:
+            return prepared
         
-        if not validate_email(email):
-            return {"error": "Invalid email address"}
+        # Side-effects are queued in the booking's transaction and delivered in the background
+        booking_response = get_booking_store().create_booking(*prepared["item"])
+        return to_builtins(booking_response)
         
-        if not validate_visit_date(visit_date):
-            return {"error": "Visit date must be in the future and in YYYY-MM-DD format"}
+    except BookingError as e:
+        return {"error": str(e)}
+    except WriteTimeout as e:
+        return {"error": str(e), "retryable": True}
+    except Exception as e:
+        return {"error": f"Failed to book attraction: {str(e)}"}
+
+
+def book_attractions_batch_data(
+    items: List[Dict[str, Any]],
+    visitor_name: str,
+    email: str,
+    phone: str = None,
+    idempotency_key: str = None
+) -> Dict[str, Any]:
+    """Book several attraction visits for one party, all or nothing
+    
+    Args:
+        items: Bookings to make, each with attraction_id and visit_date, and optionally
+            num_visitors, time_slot, special_requirements and idempotency_key
+        visitor_name: Name of the primary visitor for every booking
+        email: Email address for booking confirmation
+        phone: Optional phone number
+        idempotency_key: Optional key for the whole batch; item N without its own key uses "<key>:N"
         
-        if num_visitors < 1 or num_visitors > 50:
-            return {"error": "Number of visitors must be between 1 and 50"}
+    Returns:
+        BatchBookingResponse object as dictionary or error dict
+    """
+    try:
+        if not items:
+            return {"error": "At least one booking item is required"}
+        if len(items) > MAX_BATCH_BOOKINGS:
+            return {"error": f"A batch can hold at most {MAX_BATCH_BOOKINGS} bookings"}
+        
+        # Validate every item before touching the ledger
+        results = []
+        prepared_items = []
+        attractions: Dict[int, Any] = {}
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                results.append(BatchBookingItem(
+                    index=index, status="failed",
+                    error="Each item must be an object with attraction_id and visit_date"
+                ))
+                continue
+            result = BatchBookingItem(index=index, attraction_id=item.get("attraction_id"))
+            results.append(result)
+            if result.attraction_id is None or not item.get("visit_date"):
+                result.status, result.error = "failed", "attraction_id and visit_date are required"
+                continue
+            if not isinstance(result.attraction_id, int) or isinstance(result.attraction_id, bool):
+                result.status, result.error = "failed", "attraction_id must be an integer"
+                continue
+            
+            item_key = item.get("idempotency_key") or (f"{idempotency_key}:{index}" if idempotency_key else None)
+            prepared = prepare_booking(
+                result.attraction_id, visitor_name, email, item["visit_date"], item.get("num_visitors", 1),
+                phone, item.get("special_requirements"), item_key, item.get("time_slot"), attractions
+            )
+            if "error" in prepared:
+                result.status, result.error = "failed", prepared["error"]
+            else:
+                prepared_items.append(prepared["item"])
+        
+        batch = BatchBookingResponse(status="rejected", total_items=len(items), results=results)
+        if len(prepared_items) < len(items):
+            for result in results:
+                if result.status != "failed":
+                    result.status = "not_booked"
+            return to_builtins(batch)
+        
+        # Reserve and insert every booking in one transaction
+        try:
+            bookings = get_booking_store().create_bookings(prepared_items)
+        except BatchBookingError as e:
+            for result in results:
+                result.status = "not_booked"
+            results[e.index].status, results[e.index].error = "failed", str(e)
+            return to_builtins(batch)
+        
+        for result, booking in zip(results, bookings):
+            result.status, result.booking = "confirmed", booking
+        batch.status, batch.booked = "confirmed", len(bookings)
+        return to_builtins(batch)
+        
+    except BookingError as e:
+        return {"error": str(e)}
+    except WriteTimeout as e:
+        return {"error": str(e), "retryable": True}
+    except Exception as e:
+        return {"error": f"Failed to book attractions: {str(e)}"}
+
+
+def get_availability_data(attraction_id: int, start_date: str, end_date: str = None) -> Dict[str, Any]:
+    """Get remaining capacity per day and time slot for an attraction
+    
+    Args:
+        attraction_id: ID of the attraction
+        start_date: First date in YYYY-MM-DD format
+        end_date: Optional last date in YYYY-MM-DD format (default: start_date, max 31 days)
         
-        # Get attraction details for cost calculation
-        attraction_data = get_attraction_by_id(attraction_id)
+    Returns:
+        Availability object as dictionary or error dict
+    """
+    try:
+        provider = get_provider()
+        attraction_data = provider.attraction(attraction_id)
         if not attraction_data:
             return {"error": f"Attraction with ID {attraction_id} not found"}
         
-        attraction = parse_attraction_data(attraction_data)
+        try:
+            first_day = datetime.strptime(start_date, "%Y-%m-%d").date()
+            last_day = datetime.strptime(end_date, "%Y-%m-%d").date() if end_date else first_day
+        except (TypeError, ValueError):
+            return {"error": "Dates must be in YYYY-MM-DD format"}
         
-        # Calculate estimated cost
-        total_cost = calculate_estimated_cost(num_visitors, attraction.entry_fee)
+        num_days = (last_day - first_day).days + 1
+        if not 1 <= num_days <= MAX_AVAILABILITY_DAYS:
+            return {"error": f"Date range must cover 1 to {MAX_AVAILABILITY_DAYS} days"}
         
-        # Create booking
-        booking_id = generate_booking_id()
-        confirmation_code = generate_confirmation_code()
+        opening_hours = provider.opening_hours(attraction_id)
+        store = get_booking_store()
+        days = []
+        for offset in range(num_days):
+            visit_date = first_day + timedelta(days=offset)
+            day_reserved, slot_reserved = store.reserved_counts(attraction_id, visit_date.isoformat())
+            days.append(day_availability(attraction_data, opening_hours, visit_date, day_reserved, slot_reserved))
         
-        booking_response = BookingResponse(
-            booking_id=booking_id,
-            attraction_id=attraction_id,
-            visitor_name=visitor_name,
-            visit_date=visit_date,
-            num_visitors=num_visitors,
-            total_cost=total_cost,
-            booking_status="confirmed",
-            confirmation_code=confirmation_code
-        )
+        availability = Availability(attraction_id=attraction_id, name=attraction_data["name"], days=days)
+        return to_builtins(availability)
+        
+    except Exception as e:
+        return {"error": f"Failed to get availability: {str(e)}"}
+
+
+def get_booking_data(booking_id: str) -> Dict[str, Any]:
+    """Get a booking by ID
+    
+    Args:
+        booking_id: Booking ID returned when booking (e.g., "ATT-01J8ZK6Q5XG4T7M2V9R3C1B0NA")
+        
+    Returns:
+        BookingResponse object as dictionary or error dict
+    """
+    try:
+        booking = get_booking_store().get_booking(booking_id)
+        if not booking:
+            return {"error": f"Booking {booking_id} not found"}
         
-        return asdict(booking_response)
+        return to_builtins(booking)
         
     except Exception as e:
-        return {"error": f"Failed to book attraction: {str(e)}"}
+        return {"error": f"Failed to get booking: {str(e)}"}
+
+
+def list_bookings_data(email: str, status: str = None, limit: int = 20) -> Dict[str, Any]:
+    """List bookings made with an email address, newest first
+    
+    Args:
+        email: Email address used when booking
+        status: Optional status filter - "confirmed" or "cancelled"
+        limit: Maximum number of bookings (default: 20, max: 100)
+        
+    Returns:
+        BookingsList object as dictionary or error dict
+    """
+    try:
+        if not validate_email(email):
+            return {"error": "Invalid email address"}
+        
+        if status and status not in BOOKING_STATUS:
+            return {"error": f"Status must be one of: {', '.join(BOOKING_STATUS)}"}
+        
+        limit = max(1, min(limit, 100))
+        bookings = get_booking_store().list_bookings(email, status, limit)
+        
+        bookings_list = BookingsList(email=email, total_count=len(bookings), bookings=bookings)
+        return to_builtins(bookings_list)
+        
+    except Exception as e:
+        return {"error": f"Failed to list bookings: {str(e)}"}
+
+
+def cancel_booking_data(booking_id: str, email: str) -> Dict[str, Any]:
+    """Cancel a booking
+    
+    Args:
+        booking_id: Booking ID to cancel
+        email: Email address the booking was made with
+        
+    Returns:
+        BookingResponse object as dictionary with cancelled status, or error dict
+    """
+    try:
+        booking = get_booking_store().cancel_booking(booking_id, email)
+        return to_builtins(booking)
+        
+    except BookingError as e:
+        return {"error": str(e)}
+    except WriteTimeout as e:
+        return {"error": str(e), "retryable": True}
+    except Exception as e:
+        return {"error": f"Failed to cancel booking: {str(e)}"}
+
+
+def get_delivery_status_data(booking_id: str = None, retry_dead: bool = False) -> Dict[str, Any]:
+    """Get delivery state of booking side-effects (confirmation email, partner API, audit log)
+    
+    Args:
+        booking_id: Optional booking ID; without it, returns counts across all bookings and recent dead letters
+        retry_dead: Re-queue dead-lettered deliveries (of this booking, or all) before reporting
+        
+    Returns:
+        DeliveryStatus object as dictionary or error dict
+    """
+    try:
+        store = get_booking_store()
+        if booking_id and not store.get_booking(booking_id):
+            return {"error": f"Booking {booking_id} not found"}
+        
+        if retry_dead:
+            store.retry_dead_events(booking_id)
+        
+        return to_builtins(store.delivery_status(booking_id))
+        
+    except Exception as e:
+        return {"error": f"Failed to get delivery status: {str(e)}"}
 
 
 def get_attraction_categories_data() -> str:
-    """Get list of available attraction categories as formatted string
+    """Get list of available attraction categories as formatted string, memoised per catalogue version
+    
+    Returns:
+        Formatted string with category codes and display names
+    """
+    return memoised_resource("categories", format_attraction_categories)
+
+
+def format_attraction_categories() -> str:
+    """Format the available attraction categories
     
     Returns:
         Formatted string with category codes and display names
     """
     try:
         result = "🏛️ **Available Attraction Categories**\n\n"
-        result += f"Total Categories: {len(ATTRACTION_CATEGORIES)}\n\n"
+        categories = get_provider().categories()
+        result += f"Total Categories: {len(categories)}\n\n"
         
-        for code, display_name in ATTRACTION_CATEGORIES.items():
+        for code, display_name in categories.items():
             result += f"• **{code}**: {display_name}\n"
         
         result += "\n*Use these category codes when searching for attractions.*"
@@ -250,14 +829,21 @@ def get_attraction_categories_data() -> str:
 
 def format_attraction_resource(attraction_id: int) -> str:
     """Get attraction information as a formatted resource"""
-    data = get_attraction_details_data(attraction_id)
-    if "error" in data:
-        return f"Error: {data['error']}"
+    def build() -> str:
+        data = get_provider().attraction(attraction_id)
+        if data is None:
+            return f"Error: Attraction with ID {attraction_id} not found"
+        return format_attraction_details(parse_attraction_data(data))
     
-    attraction_data = data['attraction']
-    attraction = parse_attraction_data(attraction_data)
-    
-    return format_attraction_details(attraction)
+    return memoised_resource(("attraction", attraction_id), build)
+
+
+def format_attractions_resource(location: str = None, category: str = None) -> str:
+    """Get up to 10 attractions for a location and/or category as a formatted resource"""
+    return memoised_resource(
+        ("attractions", location, category),
+        lambda: format_search_results(search_attractions_data(location=location, category=category, limit=10))
+    )
 
 
 def get_booking_summary_prompt(location: str, category: str = None) -> str:
@@ -284,23 +870,33 @@ def format_search_results(search_data: Dict[str, Any]) -> str:
     if search_data.get('category') != "All Categories":
         result += f" ({search_data['category']})"
     result += ":\n\n"
+    if search_data.get('corrected_location'):
+        result += f"🔎 Showing results for '{search_data['corrected_location']}'\n\n"
     
     for i, attraction_data in enumerate(attractions[:10], 1):  # Show first 10
-        attraction = parse_attraction_data(attraction_data)
-        location_str = f"{attraction.location.city}, {attraction.location.country}" if attraction.location.city else attraction.location.country
-        
-        result += f"{i}. 🏛️ **{attraction.name}**\n"
-        result += f"   📍 {location_str}\n"
-        result += f"   🏷️ {get_category_display_name(attraction.category)}\n"
-        
-        if attraction.rating:
-            result += f"   ⭐ {attraction.rating}/5.0\n"
-        if attraction.entry_fee:
-            result += f"   💰 {attraction.entry_fee}\n"
-        
-        result += "\n"
+        result += format_attraction_listing(i, attraction_data)
     
     if len(attractions) > 10:
         result += f"... and {len(attractions) - 10} more attractions\n"
     
     return result
+
+
+def format_autocomplete_results(autocomplete_data: Dict[str, Any]) -> str:
+    """Format autocomplete suggestions as a readable string"""
+    if "error" in autocomplete_data:
+        return f"Error: {autocomplete_data['error']}"
+    
+    suggestions = autocomplete_data.get('suggestions', [])
+    if not suggestions:
+        return f"No suggestions for '{autocomplete_data['prefix']}'."
+    
+    result = f"🔤 Suggestions for '{autocomplete_data['prefix']}':\n\n"
+    for suggestion in suggestions:
+        icon = "🏛️" if suggestion['kind'] == "attraction" else "📍"
+        result += f"{icon} {suggestion['text']} ({suggestion['kind']})"
+        if suggestion.get('attraction_id') is not None:
+            result += f" - ID {suggestion['attraction_id']}"
+        result += "\n"
+    
+    return result
@@ -0,0 +1,72 @@
+"""
+Attraction capacity - Daily capacity and bookable time slots derived from opening hours.
+"""
+
+from datetime import date
+from typing import Dict, Any, Optional, List, Tuple
+
+from config import SLOT_MINUTES, DEFAULT_SLOT_CAPACITY, DEFAULT_DAILY_CAPACITY, MINUTES_PER_DAY
+from models import OpeningHours, TimeSlot, DayAvailability
+from utils import day_windows, format_clock
+
+# (start label, capacity) per bookable slot of a day
+SlotLayout = List[Tuple[str, int]]
+
+
+def daily_capacity(record: Dict[str, Any]) -> int:
+    """Get the number of visitors an attraction admits per day"""
+    return record.get("daily_capacity", DEFAULT_DAILY_CAPACITY)
+
+
+def slot_times(opening_hours: Optional[OpeningHours], visit_date: date) -> List[Tuple[int, int]]:
+    """Get (start, end) minutes of each time slot starting on a date, following its opening windows.
+
+    Attractions with unknown hours get a single all-day slot; closed days get none.
+    """
+    if opening_hours is None:
+        return [(0, MINUTES_PER_DAY)]
+
+    slots = []
+    for opens, closes in day_windows(opening_hours, visit_date.weekday()):
+        for start in range(opens, min(closes, MINUTES_PER_DAY), SLOT_MINUTES):
+            slots.append((start, min(start + SLOT_MINUTES, closes)))
+    return slots
+
+
+def slot_layout(record: Dict[str, Any], opening_hours: Optional[OpeningHours], visit_date: date) -> SlotLayout:
+    """Get the bookable slots of an attraction on a date with their visitor capacity"""
+    capacity = record.get("slot_capacity", DEFAULT_SLOT_CAPACITY)
+    return [(format_clock(start), capacity) for start, _ in slot_times(opening_hours, visit_date)]
+
+
+def day_availability(
+    record: Dict[str, Any],
+    opening_hours: Optional[OpeningHours],
+    visit_date: date,
+    day_reserved: int,
+    slot_reserved: List[int]
+) -> DayAvailability:
+    """Combine an attraction's slots on a date with its reservation counters"""
+    times = slot_times(opening_hours, visit_date)
+    capacity = daily_capacity(record) if times else 0
+    day_available = max(capacity - day_reserved, 0)
+    slot_capacity = record.get("slot_capacity", DEFAULT_SLOT_CAPACITY)
+
+    slots = []
+    for index, (start, end) in enumerate(times):
+        reserved = slot_reserved[index] if index < len(slot_reserved) else 0
+        slots.append(TimeSlot(
+            start=format_clock(start),
+            end=format_clock(end),
+            capacity=slot_capacity,
+            reserved=reserved,
+            available=min(max(slot_capacity - reserved, 0), day_available)
+        ))
+
+    return DayAvailability(
+        date=visit_date.isoformat(),
+        capacity=capacity,
+        reserved=day_reserved,
+        available=day_available,
+        slots=slots
+    )
@@ -0,0 +1,87 @@
+"""
+Booking ID benchmark - Throughput, ordering and cross-process collisions of booking IDs.
+
+Compares the ULID-style generator with the previous minute-timestamp + 6 random character
+scheme. Run from the attractions-mcp directory:
+    uv run python benchmarks/bench_booking_ids.py [--ids 200000] [--processes 4] [--threads 8]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import string
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import generate_booking_id, generate_confirmation_code
+
+
+def legacy_booking_id() -> str:
+    """The previous scheme: minute timestamp and six non-cryptographic random characters"""
+    timestamp = datetime.now().strftime("%Y%m%d%H%M")
+    random_part = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+    return f"ATT-{timestamp}-{random_part}"
+
+
+def throughput(generate, count: int) -> float:
+    """IDs generated per second on one thread"""
+    start = time.perf_counter()
+    for _ in range(count):
+        generate()
+    return count / (time.perf_counter() - start)
+
+
+def threaded(generate, count: int, threads: int) -> tuple:
+    """IDs per second across threads, and whether every per-thread sequence came out sorted"""
+    def run(n: int) -> list:
+        return [generate() for _ in range(n)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        batches = list(pool.map(run, [count // threads] * threads))
+    elapsed = time.perf_counter() - start
+    ids = [identifier for batch in batches for identifier in batch]
+    return len(ids) / elapsed, all(batch == sorted(batch) for batch in batches), len(ids) - len(set(ids))
+
+
+def generate_in_process(args: tuple) -> list:
+    name, count = args
+    generate = generate_booking_id if name == "ulid" else legacy_booking_id
+    return [generate() for _ in range(count)]
+
+
+def cross_process_collisions(name: str, count: int, processes: int) -> int:
+    """Duplicate IDs when several forked worker processes generate concurrently"""
+    with multiprocessing.get_context("fork").Pool(processes) as pool:
+        batches = pool.map(generate_in_process, [(name, count // processes)] * processes)
+    ids = [identifier for batch in batches for identifier in batch]
+    return len(ids) - len(set(ids))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ids", type=int, default=200_000)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    # Warm the parent's generator so forked children inherit a live sequence
+    generate_booking_id()
+
+    print(f"{'scheme':<10} {'ids/s':>12} {'threads ids/s':>14} {'sorted':>7} {'dups (threads)':>15} {'dups (procs)':>13}")
+    for name, generate in (("legacy", legacy_booking_id), ("ulid", generate_booking_id)):
+        single = throughput(generate, args.ids)
+        multi, ordered, thread_dups = threaded(generate, args.ids, args.threads)
+        process_dups = cross_process_collisions(name, args.ids, args.processes)
+        print(f"{name:<10} {single:>12,.0f} {multi:>14,.0f} {str(ordered):>7} {thread_dups:>15} {process_dups:>13}")
+
+    print(f"\nconfirmation codes/s: {throughput(generate_confirmation_code, args.ids):,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Catalogue benchmark - Memory and filter throughput of the columnar catalogue at several sizes.
+
+Compares retained memory with one record dict plus one serialised dict per attraction (the
+previous layout), and filter throughput with a Python scan over those dicts. Run from the
+attractions-mcp directory:
+    uv run python benchmarks/bench_catalogue.py [--sizes 10000 100000 1000000] [--legacy-max 100000]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import MOCK_ATTRACTIONS
+from catalogue import AttractionCatalogue
+from models import SearchFilters
+from utils import parse_entry_fee, parse_opening_hours, format_day_hours, parse_attraction_data
+
+QUERIES = {
+    "location": SearchFilters(location="Paris"),
+    "category + rating": SearchFilters(category="historical", rating_min=4.5),
+    "max price": SearchFilters(max_price=20),
+    "free entry": SearchFilters(free_entry=True),
+    "open at": SearchFilters(open_at=datetime(2030, 1, 2, 10, 30)),
+    "combined": SearchFilters(location="Italy", rating_min=4.0, max_price=30, open_at=datetime(2030, 1, 2, 10, 30)),
+}
+
+
+def generate_rows(count: int, seed: int = 7):
+    """Mock attractions varied into `count` distinct rows"""
+    rng = random.Random(seed)
+    for i in range(count):
+        base = MOCK_ATTRACTIONS[i % len(MOCK_ATTRACTIONS)]
+        location = dict(base["location"])
+        location["latitude"] += rng.uniform(-0.05, 0.05)
+        location["longitude"] += rng.uniform(-0.05, 0.05)
+        yield dict(
+            base,
+            id=i + 1,
+            name=f"{base['name']} {i}",
+            rating=round(min(5.0, max(1.0, base["rating"] + rng.uniform(-1, 0.3))), 1),
+            location=location
+        )
+
+
+def legacy_rows(count: int) -> list:
+    """The previous layout: an enriched record dict and a serialised Attraction dict per attraction"""
+    rows = []
+    for data in generate_rows(count):
+        country = data["location"]["country"]
+        hours = parse_opening_hours(data.get("opening_hours"))
+        record = dict(data, price=parse_entry_fee(data.get("entry_fee"), country), hours=format_day_hours(hours))
+        rows.append((record, asdict(parse_attraction_data(record))))
+    return rows
+
+
+def legacy_filter(rows: list, filters: SearchFilters) -> list:
+    """Scan record dicts in Python (the location filter is a plain substring test)"""
+    location = (filters.location or "").lower()
+    matches = []
+    for position, (record, _) in enumerate(rows):
+        place = record["location"]
+        if location and not any(location in place.get(field, "").lower() for field in ("city", "country", "region")):
+            continue
+        if filters.category and record["category"] != filters.category:
+            continue
+        if filters.rating_min is not None and (record.get("rating") or 0) < filters.rating_min:
+            continue
+        price = record["price"]
+        if filters.max_price is not None and not (price and price.min_usd is not None and price.min_usd <= filters.max_price):
+            continue
+        if filters.free_entry and not (price and price.is_free):
+            continue
+        matches.append(position)
+    return matches
+
+
+def measure_memory(build) -> tuple:
+    """Build under tracemalloc; returns the result, retained MB and build seconds"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current / 1024 / 1024, elapsed
+
+
+def queries_per_second(run, budget_seconds: float = 1.0) -> float:
+    count, start = 0, time.perf_counter()
+    while time.perf_counter() - start < budget_seconds:
+        run()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--legacy-max", type=int, default=100_000, help="largest size to build the dict layout at")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        catalogue, columnar_mb, build_seconds = measure_memory(lambda: AttractionCatalogue(generate_rows(size)))
+        print(f"\n{size:,} attractions - columnar: {columnar_mb:,.1f} MB retained, built in {build_seconds:.1f}s")
+
+        legacy = None
+        if size <= args.legacy_max:
+            legacy, legacy_mb, _ = measure_memory(lambda: legacy_rows(size))
+            print(f"{'':>{len(f'{size:,}')}} attractions - dicts:    {legacy_mb:,.1f} MB retained")
+
+        print(f"  {'filter':<20} {'matches':>9} {'columnar q/s':>13} {'dicts q/s':>10}")
+        for name, filters in QUERIES.items():
+            matches = len(catalogue.filter_positions(filters))
+            columnar_qps = queries_per_second(lambda: catalogue.filter_positions(filters))
+            legacy_qps = "-"
+            if legacy is not None and filters.open_at is None:
+                legacy_qps = f"{queries_per_second(lambda: legacy_filter(legacy, filters)):,.1f}"
+            print(f"  {name:<20} {matches:>9,} {columnar_qps:>13,.1f} {legacy_qps:>10}")
+
+        del catalogue, legacy
+        gc.collect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Encoding benchmark - CPU time of turning tool results into MCP responses, before and after the fast encoder.
+
+For realistic payloads of both servers (a 100-attraction search, a 31-day availability, a day
+plan and a 16-day weather forecast), compares the previous path - dataclasses.asdict, then
+FastMCP encoding the text content and validating and dumping the structured content - with
+encoding.to_builtins and encoding.tool_result under each installed encoder.
+Run from the attractions-mcp directory:
+    uv run python benchmarks/bench_encoding.py [--size 10000] [--repeat 50]
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import time
+from dataclasses import asdict
+from datetime import date, timedelta
+from typing import Any, Dict
+
+from mcp.server.fastmcp.utilities.func_metadata import func_metadata
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic import sample_catalogue
+from catalogue import reload_catalogue
+from availability import day_availability
+from planner import plan_day
+from models import AttractionsList, Availability
+from mcp_common.encoding import ENCODERS, set_encoder, to_builtins, tool_result
+
+WEATHER_MODELS = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                              "weather-mcp", "models.py")
+
+
+def returns_dict() -> Dict[str, Any]:
+    """Stands in for a tool, so FastMCP derives the same output model as for the real ones"""
+
+
+def weather_forecast(days: int) -> Any:
+    """A forecast built from the weather server's own models"""
+    spec = importlib.util.spec_from_file_location("weather_models", WEATHER_MODELS)
+    models = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(models)
+    forecasts = [
+        models.ForecastDay(
+            date=(date(2025, 9, 20) + timedelta(days=day)).isoformat(),
+            temperature=models.Temperature(current=0, min=11.2 + day % 3, max=21.7 + day % 5),
+            apparent_temperature=models.Temperature(current=0, min=10.4, max=22.9),
+            weather=models.Weather(description="Partly cloudy", code=2),
+            precipitation=models.Precipitation(total=1.4, rain=1.1, showers=0.3, hours=2),
+            wind=models.Wind(speed=14.8, direction=240, max_gusts=31.3)
+        )
+        for day in range(days)
+    ]
+    return models.WeatherForecast(
+        location="Paris, Île-de-France, France", coordinates=models.Coordinates(lat=48.85341, lon=2.3488),
+        timezone="Europe/Paris", forecast_days=days, forecasts=forecasts
+    )
+
+
+def payloads(size: int, seed: int) -> Dict[str, Any]:
+    """Result models as the services build them"""
+    catalogue = reload_catalogue(*sample_catalogue(size, seed))
+    search = AttractionsList(
+        category="All Categories", location="Worldwide", total_count=len(catalogue),
+        attractions=[catalogue.attraction_at(position) for position in range(100)]
+    )
+    first_day = date(2025, 9, 20)
+    availability = Availability(attraction_id=1, name=catalogue.text["name"][0], days=[
+        day_availability(catalogue.record(0), catalogue.get_opening_hours(1), first_day + timedelta(days=day), 0, [])
+        for day in range(31)
+    ])
+    day_plan = plan_day(catalogue, "Paris", first_day, [], 9 * 60, 19 * 60, 8)
+    return {
+        "search, 100 attractions": search,
+        "availability, 31 days": availability,
+        "day plan": day_plan,
+        "weather forecast, 16 days": weather_forecast(16),
+    }
+
+
+def best_ms(run, repeat: int) -> float:
+    """Best wall time of a call in ms"""
+    run()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    metadata = func_metadata(returns_dict)
+    encoders = {}
+    for name, encoder_class in ENCODERS.items():
+        try:
+            encoders[name] = encoder_class()
+        except ImportError:
+            print(f"{name} is not installed")
+
+    print(f"\n{'payload':<27} {'path':<22} {'KB':>7} {'ms':>8} {'speed-up':>9}")
+    for payload, model in payloads(args.size, args.seed).items():
+        before = best_ms(lambda: metadata.convert_result(asdict(model)), args.repeat)
+        text = metadata.convert_result(asdict(model))[0][0].text
+        print(f"{payload:<27} {'asdict + FastMCP':<22} {len(text.encode()) / 1024:>7.1f} {before:>8.2f} {'':>9}")
+        for name, encoder in encoders.items():
+            set_encoder(encoder)
+            # As encoded() does: results are left to FastMCP when the encoder is not faster than its own
+            respond = tool_result if encoder.fast else metadata.convert_result
+            elapsed = best_ms(lambda: respond(to_builtins(model)), args.repeat)
+            result = respond(to_builtins(model))
+            text = (result.content if encoder.fast else result[0])[0].text
+            print(f"{'':<27} {name:<22} {len(text.encode()) / 1024:>7.1f} {elapsed:>8.2f} {before / elapsed:>8.1f}x")
+    set_encoder()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Projection benchmark - Response size and CPU time of search results with field projection and byte budgets.
+
+Runs the same worldwide search returning every field, a few fields and one field, and with
+every field under a byte budget, and reports the size of each response, the time to build it
+(with the row caches cold and warm) and the time to encode it the way tool results are sent.
+Run from the attractions-mcp directory:
+    uv run python benchmarks/bench_projection.py [--size 10000] [--limit 100] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic import sample_catalogue
+from catalogue import reload_catalogue
+from attractions_service import search_attractions_data
+from mcp_common.encoding import dumps
+
+
+def best_ms(run, repeat: int, before=None) -> float:
+    """Best wall time of a call in ms, calling `before` untimed ahead of each run"""
+    best = float("inf")
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def encode(response: dict) -> bytes:
+    """Encode a tool result as its text content is sent"""
+    return dumps(response, indent=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    catalogue = reload_catalogue(*sample_catalogue(args.size, args.seed))
+    cases = {
+        "all fields": {},
+        "name,rating,price": {"fields": "name,rating,price"},
+        "name": {"fields": "name"},
+        "all fields, 16 KB budget": {"max_bytes": 16_384},
+        "all fields, 4 KB budget": {"max_bytes": 4_096},
+    }
+    print(f"{len(catalogue):,} attractions, {args.limit} results\n")
+    print(f"{'response':<26} {'results':>8} {'bytes':>9} {'cold ms':>9} {'warm ms':>9} {'encode ms':>10}")
+    for name, options in cases.items():
+        def search():
+            return search_attractions_data(limit=args.limit, **options)
+
+        response = search()
+        cold = best_ms(search, args.repeat, before=catalogue._start_caches)
+        search()
+        warm = best_ms(search, args.repeat)
+        encoded = encode(response)
+        encoding = best_ms(lambda: encode(response), args.repeat)
+        print(f"{name:<26} {len(response['attractions']):>8} {len(encoded):>9,} {cold:>9.2f} {warm:>9.2f} {encoding:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
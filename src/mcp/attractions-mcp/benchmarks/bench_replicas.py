@@ -0,0 +1,244 @@
+"""
+Replica benchmark - Runs several stateless server replicas behind a round-robin client and restarts them one by one under load.
+
+Starts `--replicas` copies of main.py on consecutive ports in stateless JSON-response mode
+(each with `--workers` uvicorn workers), then calls tools from several client threads. Each
+call goes to the next replica in turn, as a non-sticky load balancer would, and moves on to
+the following one when a replica refuses the connection. Meanwhile every replica in turn is
+sent SIGTERM, drains, and is started again. Throughput, latency, retries and failed calls are
+reported. Then visits are booked through each replica in turn and every replica is asked for
+the attraction's availability after each booking, to show that replicas sharing the booking
+ledger agree. Any failed call or disagreement makes the exit status 1.
+Run from the attractions-mcp directory:
+    uv run python benchmarks/bench_replicas.py [--replicas 3] [--workers 1] [--clients 8] [--seconds 20] [--bookings 6]
+"""
+
+import argparse
+import itertools
+import os
+import random
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+import requests
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STARTUP_SECONDS = 60
+CITIES = ["Paris", "Rome", "India", "Agra", "Japan", "Egypt", "Peru", "London", "Italy", "China"]
+MCP_HEADERS = {"Content-Type": "application/json", "Accept": "application/json, text/event-stream"}
+
+
+class Replica:
+    """One server process on its own port"""
+
+    def __init__(self, port: int, workers: int, scratch: str):
+        self.port = port
+        self.env = dict(
+            os.environ,
+            ATTRACTIONS_PORT=str(port),
+            ATTRACTIONS_WORKERS=str(workers),
+            ATTRACTIONS_STATELESS="true",
+            ATTRACTIONS_JSON_RESPONSE="true",
+            ATTRACTIONS_BOOKINGS_DB=os.path.join(scratch, "bookings.db"),
+            ATTRACTIONS_OUTBOX_DIR=os.path.join(scratch, "outbox")
+        )
+        self.process = None
+        self.served = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> None:
+        self.process = subprocess.Popen(
+            [sys.executable, "main.py"], cwd=PROJECT_DIR, env=self.env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        deadline = time.monotonic() + STARTUP_SECONDS
+        while True:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Replica on port {self.port} exited with status {self.process.returncode}")
+            try:
+                requests.get(f"{self.url}/healthz", timeout=1).raise_for_status()
+                return
+            except requests.RequestException:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"Replica on port {self.port} did not start within {STARTUP_SECONDS} s")
+                time.sleep(0.1)
+
+    def stop(self) -> float:
+        """SIGTERM the replica and wait for it to drain and exit; returns the seconds taken"""
+        start = time.perf_counter()
+        self.process.send_signal(signal.SIGTERM)
+        self.process.wait()
+        return time.perf_counter() - start
+
+
+class RoundRobinClient:
+    """Sends each call to the next replica, skipping replicas that refuse connections"""
+
+    def __init__(self, replicas: list):
+        self.replicas = replicas
+        self._next = itertools.count()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.latencies = []
+        self.retries = 0
+        self.failures = []
+
+    def session(self) -> requests.Session:
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def call(self, call_id: int, tool: str, arguments: dict) -> None:
+        payload = {"jsonrpc": "2.0", "id": call_id, "method": "tools/call", "params": {"name": tool, "arguments": arguments}}
+        start = time.perf_counter()
+        first = next(self._next)
+        for attempt in range(len(self.replicas)):
+            replica = self.replicas[(first + attempt) % len(self.replicas)]
+            try:
+                response = self.session().post(f"{replica.url}/mcp", json=payload, headers=MCP_HEADERS, timeout=30)
+            except requests.ConnectionError:
+                with self._lock:
+                    self.retries += 1
+                continue
+
+            body = response.json() if response.status_code == 200 else {}
+            with self._lock:
+                if response.status_code != 200 or "error" in body or body.get("result", {}).get("isError"):
+                    self.failures.append(f"{tool}{arguments}: HTTP {response.status_code} {response.text[:120]}")
+                else:
+                    replica.served += 1
+                    self.latencies.append(time.perf_counter() - start)
+            return
+        with self._lock:
+            self.failures.append(f"{tool}{arguments}: no replica accepted the connection")
+
+
+def call_tool(replica: Replica, tool: str, arguments: dict) -> dict:
+    """Call a tool on one replica and return its result"""
+    payload = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": tool, "arguments": arguments}}
+    response = requests.post(f"{replica.url}/mcp", json=payload, headers=MCP_HEADERS, timeout=30)
+    response.raise_for_status()
+    return response.json()["result"]["structuredContent"]["result"]
+
+
+def check_availability(replicas: list, bookings: int, attraction_id: int = 1) -> list:
+    """Book visits through each replica in turn and read the day's availability from every replica
+    after each booking; returns a description of each disagreement"""
+    visit_date = (date.today() + timedelta(days=7)).isoformat()
+    expected = call_tool(replicas[0], "get_availability", {"attraction_id": attraction_id, "start_date": visit_date})
+    expected = expected["days"][0]["reserved"]
+    problems = []
+    for number in range(bookings):
+        booked_on = replicas[number % len(replicas)]
+        booking = call_tool(booked_on, "book_attraction", {
+            "attraction_id": attraction_id, "visitor_name": "Replica Check", "email": "replicas@example.com",
+            "visit_date": visit_date, "num_visitors": 2
+        })
+        if "error" in booking:
+            problems.append(f"booking {number + 1} on port {booked_on.port}: {booking['error']}")
+            continue
+        expected += 2
+        for replica in replicas:
+            day = call_tool(replica, "get_availability", {"attraction_id": attraction_id, "start_date": visit_date})["days"][0]
+            slots = {slot["start"]: slot["reserved"] for slot in day["slots"]}
+            if day["reserved"] != expected or slots.get(booking["time_slot"], 0) < 2:
+                problems.append(
+                    f"after booking {number + 1} on port {booked_on.port}, port {replica.port} reports "
+                    f"{day['reserved']} reserved (expected {expected})"
+                )
+    return problems
+
+
+def load(client: RoundRobinClient, stop: threading.Event, seed: int) -> None:
+    rng = random.Random(seed)
+    for call_id in itertools.count(1):
+        if stop.is_set():
+            return
+        if rng.random() < 0.5:
+            client.call(call_id, "search_attractions", {"location": rng.choice(CITIES), "limit": 10})
+        else:
+            client.call(call_id, "get_attraction_details", {"attraction_id": rng.randint(1, 20)})
+
+
+def rolling_restart(replicas: list, pause: float) -> list:
+    """Restart each replica in turn; returns each one's drain time"""
+    drains = []
+    for replica in replicas:
+        time.sleep(pause)
+        drains.append(replica.stop())
+        replica.start()
+    return drains
+
+
+def percentile(values: list, share: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))] if ordered else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--replicas", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers per replica")
+    parser.add_argument("--clients", type=int, default=8, help="concurrent client threads")
+    parser.add_argument("--seconds", type=float, default=20.0, help="how long to keep the load running")
+    parser.add_argument("--port", type=int, default=8201, help="port of the first replica")
+    parser.add_argument("--no-restart", action="store_true", help="measure steady load without restarts")
+    parser.add_argument("--bookings", type=int, default=6, help="bookings made to check availability across replicas")
+    args = parser.parse_args()
+
+    scratch = tempfile.mkdtemp(prefix="attractions-replicas-")
+    replicas = [Replica(args.port + i, args.workers, scratch) for i in range(args.replicas)]
+    for replica in replicas:
+        replica.start()
+    print(f"{args.replicas} replicas of {args.workers} worker(s) on ports {args.port}-{args.port + args.replicas - 1}")
+
+    client = RoundRobinClient(replicas)
+    stop = threading.Event()
+    threads = [threading.Thread(target=load, args=(client, stop, seed)) for seed in range(args.clients)]
+    try:
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        drains = []
+        if not args.no_restart:
+            drains = rolling_restart(replicas, args.seconds / (len(replicas) + 1))
+        time.sleep(max(0.0, args.seconds - (time.perf_counter() - start)))
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        disagreements = check_availability(replicas, args.bookings)
+    finally:
+        stop.set()
+        for replica in replicas:
+            if replica.process and replica.process.poll() is None:
+                replica.stop()
+
+    calls = len(client.latencies)
+    print(f"\n  calls          {calls:,} ({calls / elapsed:,.1f}/s)")
+    print(f"  latency p50    {percentile(client.latencies, 0.5) * 1000:,.1f} ms")
+    print(f"  latency p99    {percentile(client.latencies, 0.99) * 1000:,.1f} ms")
+    print(f"  per replica    {', '.join(f'{replica.served:,}' for replica in replicas)}")
+    print(f"  retried        {client.retries:,} (connection refused, sent to the next replica)")
+    if drains:
+        print(f"  drain times    {', '.join(f'{seconds:.2f} s' for seconds in drains)}")
+    print(f"  failed         {len(client.failures):,}")
+    for failure in client.failures[:10]:
+        print(f"    {failure}")
+    print(f"  availability   {'agreed' if not disagreements else 'DISAGREED'} across replicas after {args.bookings} bookings")
+    for disagreement in disagreements[:10]:
+        print(f"    {disagreement}")
+    if client.failures or disagreements:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
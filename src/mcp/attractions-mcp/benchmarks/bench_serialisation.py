@@ -0,0 +1,99 @@
+"""
+Serialisation benchmark - CPU time and allocations of building and formatting large search results.
+
+Compares the previous path (parse each record into an Attraction, asdict the whole list, then
+re-parse every dict to format it) with serialising each attraction once at catalogue load.
+Run from the attractions-mcp directory:
+    uv run python benchmarks/bench_serialisation.py [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import MOCK_ATTRACTIONS
+from catalogue import AttractionCatalogue
+from models import AttractionsList, SearchFilters
+from attractions_service import attractions_list_data, format_search_results
+from utils import parse_attraction_data, get_category_display_name
+import catalogue as catalogue_module
+
+
+def replicate(rows: int) -> list:
+    """Copies of the mock attractions with unique IDs"""
+    return [
+        dict(MOCK_ATTRACTIONS[i % len(MOCK_ATTRACTIONS)], id=i + 1)
+        for i in range(rows)
+    ]
+
+
+def legacy_search(data: dict) -> dict:
+    attractions = [parse_attraction_data(item) for item in data["attractions"]]
+    return asdict(AttractionsList(
+        category="All Categories",
+        location="Worldwide",
+        total_count=data["total"],
+        attractions=attractions
+    ))
+
+
+def legacy_format(search_data: dict) -> str:
+    result = f"🎯 Found {search_data['total_count']} attractions:\n\n"
+    for i, attraction_data in enumerate(search_data["attractions"][:10], 1):
+        attraction = parse_attraction_data(attraction_data)
+        location_str = f"{attraction.location.city}, {attraction.location.country}" if attraction.location.city else attraction.location.country
+        result += f"{i}. 🏛️ **{attraction.name}**\n"
+        result += f"   📍 {location_str}\n"
+        result += f"   🏷️ {get_category_display_name(attraction.category)}\n"
+        if attraction.rating:
+            result += f"   ⭐ {attraction.rating}/5.0\n"
+        if attraction.entry_fee:
+            result += f"   💰 {attraction.entry_fee}\n"
+        result += "\n"
+    return result
+
+
+def measure(run, repeat: int) -> tuple:
+    """Best wall time in ms, and peak traced allocation in MB of one run"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    catalogue = AttractionCatalogue(replicate(args.rows))
+    catalogue_module._catalogue = catalogue
+    data = catalogue.search(SearchFilters(), limit=args.rows)
+    print(f"{args.rows:,} results\n")
+
+    cases = {
+        "search (parse + asdict)": lambda: legacy_search(data),
+        "search (serialised once)": lambda: attractions_list_data(data),
+        "format (re-parse)": lambda: legacy_format(legacy_search(data)),
+        "format (from dicts)": lambda: format_search_results(attractions_list_data(data)),
+    }
+    print(f"{'path':<28} {'ms':>9} {'peak MB':>9}")
+    for name, run in cases.items():
+        elapsed, peak = measure(run, args.repeat)
+        print(f"{name:<28} {elapsed:>9.1f} {peak:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Service benchmark - Throughput and peak memory of each service function and resource on synthetic catalogues.
+
+Loads seeded synthetic catalogues (see synthetic.py) at several sizes and reports operations per
+second and peak traced memory of one call for every tool and resource path. Peak memory is
+taken on a cold call; throughput cycles through 256 argument sets, so memoised resources report
+their warm-cache rate. Bookings go to a throwaway ledger. Results can be saved as a baseline
+and later runs compared against it; a throughput drop or memory growth beyond the tolerances is
+flagged and the exit status is 1.
+Run from the attractions-mcp directory:
+    uv run python benchmarks/bench_service.py [--sizes 1000 10000 100000] [--seconds 0.5] [--repeat 3]
+    uv run python benchmarks/bench_service.py --save-baseline
+    uv run python benchmarks/bench_service.py --compare
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Keep benchmark bookings and deliveries out of the real ledger
+_scratch = tempfile.mkdtemp(prefix="attractions-bench-")
+os.environ.setdefault("ATTRACTIONS_BOOKINGS_DB", os.path.join(_scratch, "bookings.db"))
+os.environ.setdefault("ATTRACTIONS_OUTBOX_DIR", os.path.join(_scratch, "outbox"))
+
+from synthetic import CITIES, CATEGORY_WEIGHTS, generate_attractions, pick_wonders
+from catalogue import reload_catalogue
+from attractions_service import (
+    get_attraction_details_data, search_attractions_data, find_open_attractions_data, plan_day_data,
+    autocomplete_attractions_data, get_similar_attractions_data, get_random_attraction_data, book_attraction_data, get_availability_data,
+    format_search_results, format_attraction_resource, format_attractions_resource, get_world_wonders_data,
+    get_attraction_categories_data
+)
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "bench_service.json")
+DEFAULT_TOLERANCE = 0.5  # flag a 50% throughput drop (timings on shared machines are noisy)
+DEFAULT_MEMORY_TOLERANCE = 0.25  # flag 25% peak memory growth...
+MEMORY_FLOOR_KB = 16  # ...of more than this
+VARIANTS = 256  # distinct argument sets cycled through per case
+
+
+def build_cases(attraction_ids: list, seed: int) -> dict:
+    """Each case is a list of zero-argument calls with varied, seeded arguments"""
+    rng = random.Random(seed)
+    tomorrow = date.today() + timedelta(days=1)
+    ids = [rng.choice(attraction_ids) for _ in range(VARIANTS)]
+    cities = rng.choices([city for city, *_ in CITIES], k=VARIANTS)
+    popular_cities = rng.choices([city for city, *_ in CITIES[:20]], k=VARIANTS)
+    categories = rng.choices(list(CATEGORY_WEIGHTS), k=VARIANTS)
+    prefixes = rng.choices(["Roy", "Gra", "Mus", "Tem", "Old T", "Gard", "Pal"], k=VARIANTS)
+    days = [(tomorrow + timedelta(days=i % 300)).isoformat() for i in range(VARIANTS)]
+    emails = [f"bench{rng.randrange(10**9)}@example.com" for _ in range(VARIANTS)]
+    variants = [
+        {"id": id_, "city": city, "popular_city": popular_city, "category": category, "prefix": prefix, "day": day, "email": email}
+        for id_, city, popular_city, category, prefix, day, email
+        in zip(ids, cities, popular_cities, categories, prefixes, days, emails)
+    ]
+
+    def calls(make):
+        return [partial(make, variant) for variant in variants]
+
+    return {
+        "get_attraction_details": calls(lambda v: get_attraction_details_data(v["id"])),
+        "search_attractions": calls(lambda v: search_attractions_data(
+            location=v["city"], category=v["category"], rating_min=4.0)),
+        "search_attractions (price)": calls(lambda v: search_attractions_data(location=v["city"], max_price=25)),
+        "find_open_attractions": calls(lambda v: find_open_attractions_data(
+            location=v["city"], start=f"{v['day']}T10:30", end=f"{v['day']}T16:00")),
+        "plan_day": calls(lambda v: plan_day_data(
+            location=v["popular_city"], date=v["day"], preferences="museums, historical")),
+        "autocomplete_attractions": calls(lambda v: autocomplete_attractions_data(v["prefix"])),
+        "get_similar_attractions": calls(lambda v: get_similar_attractions_data(v["id"])),
+        "get_similar_attractions (5 km)": calls(lambda v: get_similar_attractions_data(v["id"], within_km=5)),
+        "get_random_attraction": calls(lambda v: get_random_attraction_data("famous" if v["id"] % 2 else "india")),
+        "book_attraction": calls(lambda v: book_attraction_data(v["id"], "Bench Visitor", v["email"], v["day"])),
+        "get_availability": calls(lambda v: get_availability_data(v["id"], v["day"])),
+        "format_search_results": calls(lambda v: format_search_results(
+            search_attractions_data(location=v["city"], limit=100))),
+        "resource attraction://{id}": calls(lambda v: format_attraction_resource(v["id"])),
+        "resource attractions://location": calls(lambda v: format_attractions_resource(location=v["city"])),
+        "resource attractions://wonders": calls(lambda v: get_world_wonders_data()),
+        "resource attractions://categories": calls(lambda v: get_attraction_categories_data()),
+    }
+
+
+def ops_per_second(calls: list, seconds: float, repeat: int) -> float:
+    """Best rate of `repeat` rounds, each calling through the argument sets in growing batches until the time budget is spent"""
+    best = 0.0
+    for _ in range(repeat):
+        done, batch, start = 0, 1, time.perf_counter()
+        while time.perf_counter() - start < seconds:
+            for i in range(done, done + batch):
+                calls[i % len(calls)]()
+            done += batch
+            batch = min(batch * 2, 1024)
+        best = max(best, done / (time.perf_counter() - start))
+    return best
+
+
+def peak_kb(call) -> float:
+    """Peak memory traced during one call, above what was allocated before it"""
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (peak - baseline) / 1024
+
+
+def run(sizes: list, seconds: float, repeat: int, seed: int) -> dict:
+    results = {}
+    for size in sizes:
+        attractions = generate_attractions(size, seed=seed)
+        start = time.perf_counter()
+        reload_catalogue(attractions, pick_wonders(attractions))
+        load_seconds = time.perf_counter() - start
+        ids = [item["id"] for item in attractions]
+        del attractions
+
+        print(f"Benchmarking {size:,} attractions (catalogue loaded in {load_seconds * 1000:,.0f} ms)")
+        size_results = {"catalogue load": {"ops_per_sec": 1 / load_seconds, "peak_kb": None}}
+        for name, calls in build_cases(ids, seed).items():
+            # Peak memory first, so memoised resources are measured cold
+            peak = peak_kb(calls[0])
+            size_results[name] = {"ops_per_sec": ops_per_second(calls, seconds, repeat), "peak_kb": peak}
+        results[str(size)] = size_results
+    return results
+
+
+def change(current: float, baseline: float) -> float:
+    return (current - baseline) / baseline if baseline else 0.0
+
+
+def report(results: dict, baseline: dict, tolerance: float, memory_tolerance: float) -> list:
+    """Print a table per size, with changes against the baseline; returns the flagged regressions"""
+    regressions = []
+    for size, cases in results.items():
+        previous = baseline.get(size, {})
+        print(f"\n{int(size):,} attractions")
+        print(f"  {'case':<36} {'ops/s':>11} {'peak KB':>10} {'Δ ops/s':>9} {'Δ peak':>8}")
+        for name, result in cases.items():
+            ops, peak = result["ops_per_sec"], result["peak_kb"]
+            before = previous.get(name)
+            ops_delta = peak_delta = ""
+            flagged = False
+            if before:
+                ops_change = change(ops, before["ops_per_sec"])
+                ops_delta = f"{ops_change:+.0%}"
+                flagged = ops_change < -tolerance
+                if peak is not None and before["peak_kb"]:
+                    peak_change = change(peak, before["peak_kb"])
+                    peak_delta = f"{peak_change:+.0%}"
+                    grew = peak_change > memory_tolerance and peak - before["peak_kb"] > MEMORY_FLOOR_KB
+                    flagged = flagged or grew
+            if flagged:
+                regressions.append((size, name))
+            peak_text = f"{peak:,.1f}" if peak is not None else "-"
+            marker = "  REGRESSION" if flagged else ""
+            print(f"  {name:<36} {ops:>11,.1f} {peak_text:>10} {ops_delta:>9} {peak_delta:>8}{marker}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--seconds", type=float, default=0.5, help="time budget per round of a case")
+    parser.add_argument("--repeat", type=int, default=3, help="rounds per case; the best rate is kept")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline file to save or compare against")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed throughput drop")
+    parser.add_argument("--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE, help="allowed peak memory growth")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.seconds, args.repeat, args.seed)
+
+    baseline = {}
+    if args.compare:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+    regressions = report(results, baseline, args.tolerance, args.memory_tolerance)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "cpus": os.cpu_count(),
+                "seed": args.seed,
+                "seconds": args.seconds,
+                "repeat": args.repeat,
+                "results": results
+            }, file, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) against {args.baseline}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
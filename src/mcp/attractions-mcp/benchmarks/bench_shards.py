@@ -0,0 +1,144 @@
+"""
+Shard benchmark - Checks a sharded catalogue against a single node and times both.
+
+Starts one shard_server.py process per shard on local ports, each loading only its shard of a
+seeded sample catalogue, and routes queries to them through a ShardedProvider holding no shards
+of its own. Every query (location-scoped, misspelt and worldwide searches, lookups by ID and
+the wonders) is also answered by a single node holding the whole catalogue; any difference is
+reported and the exit status is 1. Throughput of both is printed per query kind; the router
+caches shard responses, so its rates are for repeated queries.
+Run from the attractions-mcp directory:
+    uv run python benchmarks/bench_shards.py [--shards 3] [--size 10000] [--port 8101]
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic import CITIES, CATEGORY_WEIGHTS, sample_catalogue
+from catalogue import reload_catalogue
+from providers import LocalProvider, ShardedProvider
+from sharding import record_shard
+
+SHARD_SERVER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "shard_server.py")
+STARTUP_SECONDS = 120
+QUERIES_PER_KIND = 64
+
+
+def start_shards(count: int, size: int, seed: int, port: int) -> list:
+    """Start one shard server process per shard and wait until all answer"""
+    processes = [
+        subprocess.Popen(
+            [sys.executable, SHARD_SERVER, "--count", str(count), "--shards", str(shard),
+             "--port", str(port + shard), "--size", str(size), "--seed", str(seed)],
+            stdout=subprocess.DEVNULL
+        )
+        for shard in range(count)
+    ]
+    deadline = time.monotonic() + STARTUP_SECONDS
+    for shard in range(count):
+        while True:
+            if processes[shard].poll() is not None:
+                raise RuntimeError(f"Shard {shard} exited with status {processes[shard].returncode}")
+            try:
+                requests.get(f"http://127.0.0.1:{port + shard}/api/v1/categories", timeout=1).raise_for_status()
+                break
+            except requests.RequestException:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"Shard {shard} did not start within {STARTUP_SECONDS} s")
+                time.sleep(0.2)
+    return processes
+
+
+def build_queries(ids: list, seed: int) -> dict:
+    """Each kind is a list of (method name, args, kwargs) calls with seeded arguments"""
+    rng = random.Random(seed)
+    cities = [city for city, *_ in CITIES]
+    countries = sorted({country for _, country, *_ in CITIES})
+    misspellable = [name for name in cities + countries if len(name) > 4]
+
+    def misspell(word: str) -> str:
+        """Swap two letters past the first (e.g. "Paris" to "Pairs")"""
+        i = rng.randrange(1, len(word) - 2)
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+    return {
+        "search city": [("search", (rng.choice(cities), rng.choice(list(CATEGORY_WEIGHTS)), 20), {})
+                        for _ in range(QUERIES_PER_KIND)],
+        "search country": [("search", (rng.choice(countries), None, 50), {"rating_min": 4.0})
+                           for _ in range(QUERIES_PER_KIND)],
+        "search misspelt": [("search", (misspell(rng.choice(misspellable)), None, 20), {})
+                            for _ in range(QUERIES_PER_KIND)],
+        "search worldwide": [("search", (None, rng.choice(list(CATEGORY_WEIGHTS)), 100), {"max_price": 25})
+                             for _ in range(QUERIES_PER_KIND)],
+        "attraction by ID": [("serialised", (rng.choice(ids),), {}) for _ in range(QUERIES_PER_KIND)],
+        "wonders": [("wonders", (), {})],
+    }
+
+
+def calls_per_second(provider, calls: list, seconds: float) -> float:
+    done, start = 0, time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        method, args, kwargs = calls[done % len(calls)]
+        getattr(provider, method)(*args, **kwargs)
+        done += 1
+    return done / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--shards", type=int, default=3)
+    parser.add_argument("--size", type=int, default=10_000, help="synthetic attractions added to the mocks")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--port", type=int, default=8101, help="port of shard 0; shard n listens on port + n")
+    parser.add_argument("--seconds", type=float, default=0.5, help="time budget per query kind")
+    args = parser.parse_args()
+
+    rows, wonder_ids = sample_catalogue(args.size, args.seed)
+    sizes = [sum(1 for data in rows if record_shard(data, args.shards) == shard) for shard in range(args.shards)]
+    print(f"{len(rows):,} attractions in {args.shards} shards of {', '.join(f'{size:,}' for size in sizes)}")
+
+    reload_catalogue(rows, wonder_ids)
+    single = LocalProvider()
+    processes = start_shards(args.shards, args.size, args.seed, args.port)
+    try:
+        urls = {shard: f"http://127.0.0.1:{args.port + shard}" for shard in range(args.shards)}
+        sharded = ShardedProvider(urls, args.shards, local=set())
+        queries = build_queries([data["id"] for data in rows], args.seed)
+
+        mismatches = 0
+        for kind, calls in queries.items():
+            for method, call_args, kwargs in calls:
+                expected = getattr(single, method)(*call_args, **kwargs)
+                actual = getattr(sharded, method)(*call_args, **kwargs)
+                if actual != expected:
+                    mismatches += 1
+                    print(f"  MISMATCH {method}{call_args} {kwargs}")
+
+        print(f"\n  {'query':<20} {'single ops/s':>13} {'sharded ops/s':>14}")
+        for kind, calls in queries.items():
+            single_rate = calls_per_second(single, calls, args.seconds)
+            sharded_rate = calls_per_second(sharded, calls, args.seconds)
+            print(f"  {kind:<20} {single_rate:>13,.1f} {sharded_rate:>14,.1f}")
+        print(f"\nRouter: {sharded.stats()['partial_results']} partial results")
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait()
+
+    if mismatches:
+        print(f"\n{mismatches} sharded result(s) differ from the single node")
+        sys.exit(1)
+    print("\nSharded results match the single node")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Startup benchmark - Measures where import time goes and how long the server takes to become healthy.
+
+Imports main.py of the attractions server, the weather server and the gateway in fresh
+interpreters under `python -X importtime`, and reports the median total and the top-level
+packages and project modules taking longest (self time, so the numbers add up to the total).
+Then compares building the catalogue with loading a snapshot of it (see build_snapshot.py), in
+process for a catalogue of `--size` synthetic attractions plus the mocks, and end to end as the
+time from starting main.py until /healthz answers.
+Run from the attractions-mcp directory:
+    uv run python benchmarks/bench_startup.py [--runs 5] [--size 10000] [--top 12]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+import requests
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVERS = {
+    "attractions": PROJECT_DIR,
+    "weather": os.path.join(os.path.dirname(PROJECT_DIR), "weather-mcp"),
+    "gateway": os.path.join(os.path.dirname(PROJECT_DIR), "gateway"),
+}
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+STARTUP_SECONDS = 60
+
+sys.path.insert(0, PROJECT_DIR)
+
+from catalogue import AttractionCatalogue, save_snapshot, load_snapshot
+from sharding import shard_rows
+from synthetic import sample_catalogue
+
+
+def import_profile(directory: str, env: dict) -> dict:
+    """Self time in microseconds of each module imported by `import main` in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=directory, env=env, capture_output=True, text=True, check=True
+    )
+    return {match.group(4): int(match.group(1)) for match in IMPORT_LINE.finditer(result.stderr)}
+
+
+def report_imports(name: str, directory: str, runs: int, top: int, env: dict) -> None:
+    profiles = [import_profile(directory, env) for _ in range(runs)]
+    project = {entry[:-3] for entry in os.listdir(directory) if entry.endswith(".py")}
+    packages, modules = defaultdict(list), defaultdict(list)
+    for profile in profiles:
+        totals = defaultdict(int)
+        for module, self_us in profile.items():
+            totals[module.split(".")[0]] += self_us
+            if module in project:
+                modules[module].append(self_us)
+        for package, self_us in totals.items():
+            packages[package].append(self_us)
+
+    total = statistics.median(sum(profile.values()) for profile in profiles) / 1000
+    print(f"\n{name}: `import main` takes {total:,.1f} ms (median of {runs})")
+    ranked = sorted(((statistics.median(times) / 1000, package) for package, times in packages.items()), reverse=True)
+    print("  by top-level package:  " + ", ".join(f"{package} {ms:,.1f}" for ms, package in ranked[:top]))
+    ranked = sorted(((statistics.median(times) / 1000, module) for module, times in modules.items()), reverse=True)
+    print("  project modules:       " + ", ".join(f"{module} {ms:,.1f}" for ms, module in ranked[:top]))
+
+
+def time_to_healthy(env: dict, port: int) -> float:
+    """Seconds from starting main.py until /healthz answers"""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "main.py"], cwd=PROJECT_DIR, env=dict(env, ATTRACTIONS_PORT=str(port)),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"Server exited with status {process.returncode}")
+            try:
+                requests.get(f"http://127.0.0.1:{port}/healthz", timeout=1).raise_for_status()
+                return time.perf_counter() - start
+            except requests.RequestException:
+                if time.perf_counter() - start > STARTUP_SECONDS:
+                    raise RuntimeError(f"Server did not start within {STARTUP_SECONDS} s")
+                time.sleep(0.01)
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--size", type=int, default=10_000, help="synthetic attractions for the snapshot comparison")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top", type=int, default=12, help="packages and modules listed per server")
+    parser.add_argument("--port", type=int, default=8301)
+    args = parser.parse_args()
+
+    scratch = tempfile.mkdtemp(prefix="attractions-startup-")
+    snapshot = os.path.join(scratch, "catalogue.snapshot")
+    env = dict(
+        os.environ,
+        ATTRACTIONS_CATALOGUE_SNAPSHOT="",
+        ATTRACTIONS_BOOKINGS_DB=os.path.join(scratch, "bookings.db"),
+        ATTRACTIONS_OUTBOX_DIR=os.path.join(scratch, "outbox")
+    )
+    for name, directory in SERVERS.items():
+        report_imports(name, directory, args.runs, args.top, env)
+
+    rows, wonder_ids = sample_catalogue(args.size, args.seed)
+    start = time.perf_counter()
+    catalogue = AttractionCatalogue(shard_rows(rows), wonder_ids)
+    built = time.perf_counter() - start
+    save_snapshot(catalogue, snapshot)
+    start = time.perf_counter()
+    loaded = load_snapshot(snapshot)
+    read = time.perf_counter() - start
+    if loaded is None or loaded.version != catalogue.version:
+        sys.exit("The snapshot did not load back as the same catalogue")
+    print(f"\n{len(catalogue):,} attractions: built in {built * 1000:,.1f} ms, "
+          f"loaded from a {os.path.getsize(snapshot) / 2**20:,.1f} MiB snapshot in {read * 1000:,.1f} ms")
+
+
+    # The server builds only the mocks itself, so a large catalogue can only come from a snapshot
+    built_mocks = statistics.median(time_to_healthy(env, args.port) for _ in range(args.runs))
+    from_snapshot = statistics.median(
+        time_to_healthy(dict(env, ATTRACTIONS_CATALOGUE_SNAPSHOT=snapshot), args.port) for _ in range(args.runs)
+    )
+    print(f"Time to healthy: {built_mocks:.2f} s building the mocks, "
+          f"{from_snapshot:.2f} s loading {len(catalogue):,} attractions from the snapshot")
+
+
+if __name__ == "__main__":
+    main()
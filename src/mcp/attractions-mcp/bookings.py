@@ -0,0 +1,579 @@
+"""
+Booking ledger - Durable booking storage in SQLite (WAL mode) with idempotency keys and group commit.
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Callable, Tuple
+
+from mcp_common.encoding import dumps
+
+from config import (
+    BOOKINGS_DB_PATH, BOOKINGS_SYNCHRONOUS, BOOKING_BATCH_SIZE, BOOKING_WRITE_TIMEOUT_SECONDS,
+    OUTBOX_SINKS, OUTBOX_LEASE_SECONDS, OUTBOX_MAX_ATTEMPTS, OUTBOX_RETRY_BASE_SECONDS, OUTBOX_RETRY_MAX_SECONDS
+)
+from models import BookingResponse, OutboxDelivery, DeliveryStatus
+from availability import SlotLayout
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bookings (
+    booking_id TEXT PRIMARY KEY,
+    idempotency_key TEXT UNIQUE,
+    attraction_id INTEGER NOT NULL,
+    visitor_name TEXT NOT NULL,
+    email TEXT NOT NULL COLLATE NOCASE,
+    visit_date TEXT NOT NULL,
+    num_visitors INTEGER NOT NULL,
+    phone TEXT,
+    special_requirements TEXT,
+    total_cost REAL,
+    total_cost_max REAL,
+    currency TEXT,
+    booking_status TEXT NOT NULL,
+    confirmation_code TEXT,
+    created_at TEXT NOT NULL,
+    cancelled_at TEXT
+);
+CREATE INDEX IF NOT EXISTS bookings_email ON bookings (email, created_at);
+CREATE INDEX IF NOT EXISTS bookings_attraction_date ON bookings (attraction_id, visit_date);
+CREATE TABLE IF NOT EXISTS slot_reservations (
+    attraction_id INTEGER NOT NULL,
+    visit_date TEXT NOT NULL,
+    slot_index INTEGER NOT NULL,  -- DAY_TOTAL for the whole day
+    reserved INTEGER NOT NULL,
+    PRIMARY KEY (attraction_id, visit_date, slot_index)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS outbox (
+    event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    booking_id TEXT NOT NULL,
+    event TEXT NOT NULL,
+    sink TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,  -- Unix time
+    last_error TEXT,
+    created_at TEXT NOT NULL,
+    delivered_at TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS outbox_booking ON outbox (booking_id);
+"""
+
+# Columns added after the first release, applied to existing databases on open
+MIGRATIONS = {
+    "slot_index": "ALTER TABLE bookings ADD COLUMN slot_index INTEGER",
+    "time_slot": "ALTER TABLE bookings ADD COLUMN time_slot TEXT",
+}
+
+DAY_TOTAL = -1
+
+# (booking values, slot layout, daily capacity, requested slot index) per batch item
+BookingItem = Tuple[Dict[str, Any], Optional[SlotLayout], Optional[int], Optional[int]]
+
+# Add visitors to a counter, only while it stays within capacity; returns no row when full
+RESERVE_SQL = """
+INSERT INTO slot_reservations (attraction_id, visit_date, slot_index, reserved) VALUES (?, ?, ?, ?)
+ON CONFLICT (attraction_id, visit_date, slot_index)
+DO UPDATE SET reserved = reserved + excluded.reserved WHERE reserved + excluded.reserved <= ?
+RETURNING reserved
+"""
+RELEASE_SQL = """
+UPDATE slot_reservations SET reserved = MAX(reserved - ?, 0)
+WHERE attraction_id = ? AND visit_date = ? AND slot_index = ?
+RETURNING reserved
+"""
+
+# Lease up to N due events to the caller; unsettled leases become due again when they expire
+CLAIM_SQL = """
+UPDATE outbox SET attempts = attempts + 1, next_attempt_at = ?
+WHERE event_id IN (
+    SELECT event_id FROM outbox WHERE status = 'pending' AND next_attempt_at <= ?
+    ORDER BY next_attempt_at LIMIT ?
+)
+RETURNING *
+"""
+
+BOOKING_COLUMNS = [
+    "booking_id", "idempotency_key", "attraction_id", "visitor_name", "email", "visit_date",
+    "num_visitors", "phone", "special_requirements", "total_cost", "total_cost_max", "currency",
+    "booking_status", "confirmation_code", "created_at", "cancelled_at", "slot_index", "time_slot"
+]
+
+
+class BookingError(Exception):
+    """A booking write rejected for a business reason (e.g. unknown booking, key reuse)"""
+
+
+class WriteTimeout(Exception):
+    """A write was not committed within BOOKING_WRITE_TIMEOUT_SECONDS. One that had not started was
+    withdrawn, so nothing was saved; one already running may still commit after the caller gave up"""
+
+    def __init__(self, may_commit: bool):
+        self.may_commit = may_commit
+        if may_commit:
+            message = ("The booking ledger did not confirm the change in time, and it may still be saved. "
+                       "Retrying is safe: a booking retried with the same idempotency_key returns its outcome "
+                       "instead of booking twice")
+        else:
+            message = "The booking ledger is busy and nothing was saved. Please retry"
+        super().__init__(message)
+
+
+class BatchBookingError(BookingError):
+    """A batch booking rejected because one of its items could not be booked"""
+
+    def __init__(self, index: int, message: str):
+        super().__init__(message)
+        self.index = index
+
+
+def utc_now() -> str:
+    """Current UTC time as an ISO 8601 string"""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+def row_to_delivery(row: sqlite3.Row) -> OutboxDelivery:
+    """Convert an outbox row to an OutboxDelivery"""
+    return OutboxDelivery(
+        event_id=row["event_id"],
+        booking_id=row["booking_id"],
+        event=row["event"],
+        sink=row["sink"],
+        status=row["status"],
+        attempts=row["attempts"],
+        last_error=row["last_error"],
+        created_at=row["created_at"],
+        delivered_at=row["delivered_at"]
+    )
+
+
+def row_to_booking(row: sqlite3.Row, replayed: bool = False) -> BookingResponse:
+    """Convert a bookings row to a BookingResponse"""
+    return BookingResponse(
+        booking_id=row["booking_id"],
+        attraction_id=row["attraction_id"],
+        visitor_name=row["visitor_name"],
+        visit_date=row["visit_date"],
+        num_visitors=row["num_visitors"],
+        total_cost=row["total_cost"],
+        total_cost_max=row["total_cost_max"],
+        currency=row["currency"],
+        booking_status=row["booking_status"],
+        confirmation_code=row["confirmation_code"],
+        time_slot=row["time_slot"],
+        email=row["email"],
+        idempotency_key=row["idempotency_key"],
+        created_at=row["created_at"],
+        cancelled_at=row["cancelled_at"],
+        replayed=replayed
+    )
+
+
+class BookingStore:
+    """SQLite booking ledger safe for concurrent sessions.
+
+    Reads use one connection per thread, which WAL mode lets run alongside writes. All writes
+    go through a single writer thread that drains whatever is queued and commits it as one
+    transaction (group commit), each operation in its own savepoint so one failure does not
+    affect the others. This keeps fsyncs per second low under hundreds of bookings per second.
+
+    Side-effects of a booking (confirmation email, partner API, audit log) are written to an
+    outbox table in the booking's transaction and delivered later by the outbox dispatcher,
+    so a booking never waits on, or is lost because of, a downstream service.
+
+    Capacity is tracked as per-day and per-slot visitor counters. Reservations are guarded
+    upserts in the booking's transaction, so capacity holds even across processes sharing the
+    database. Counters are read from the database rather than kept in memory, so every worker
+    and replica sharing it reports the same availability.
+    """
+
+    def __init__(self, path: str = BOOKINGS_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._writes: "queue.Queue[tuple]" = queue.Queue()
+        self._after_commit: List[Callable[[], None]] = []
+        # Set after any commit that adds outbox events, to wake the dispatcher
+        self.outbox_ready = threading.Event()
+        self._writer_connection = self._connect()
+        self._writer_connection.executescript(SCHEMA)
+        self._migrate()
+        self._writer = threading.Thread(target=self._write_loop, name="booking-writer", daemon=True)
+        self._writer.start()
+
+    def _migrate(self) -> None:
+        columns = {row["name"] for row in self._writer_connection.execute("PRAGMA table_info(bookings)")}
+        for column, statement in MIGRATIONS.items():
+            if column not in columns:
+                self._writer_connection.execute(statement)
+
+    def reserved_counts(
+        self,
+        attraction_id: int,
+        visit_date: str,
+        connection: Optional[sqlite3.Connection] = None
+    ) -> Tuple[int, List[int]]:
+        """Get visitors reserved for a day and for each of its slots.
+
+        Read from the database (a primary-key range), so reservations committed by other workers
+        and replicas are counted; pass the writer's connection to see the current transaction.
+        """
+        rows = (connection or self._reader()).execute(
+            "SELECT slot_index, reserved FROM slot_reservations WHERE attraction_id = ? AND visit_date = ?",
+            (attraction_id, visit_date)
+        ).fetchall()
+        day_reserved, slot_reserved = 0, []
+        for slot_index, reserved in rows:
+            if slot_index == DAY_TOTAL:
+                day_reserved = reserved
+                continue
+            if slot_index >= len(slot_reserved):
+                slot_reserved.extend([0] * (slot_index + 1 - len(slot_reserved)))
+            slot_reserved[slot_index] = reserved
+        return day_reserved, slot_reserved
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run a callback once the current write operation's transaction commits (writer thread only)"""
+        self._after_commit.append(callback)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(f"PRAGMA synchronous={BOOKINGS_SYNCHRONOUS}")
+        return connection
+
+    def _reader(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        return connection
+
+    def _write_loop(self) -> None:
+        connection = self._writer_connection
+        while True:
+            batch = [self._writes.get()]
+            while len(batch) < BOOKING_BATCH_SIZE:
+                try:
+                    batch.append(self._writes.get_nowait())
+                except queue.Empty:
+                    break
+            # Writes whose callers stopped waiting before they started are dropped unapplied
+            batch = [(operation, future) for operation, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            results = []
+            callbacks: List[Callable[[], None]] = []
+            try:
+                connection.execute("BEGIN IMMEDIATE")
+                for operation, future in batch:
+                    connection.execute("SAVEPOINT operation")
+                    self._after_commit = []
+                    try:
+                        results.append((future, operation(connection), None))
+                        connection.execute("RELEASE operation")
+                        callbacks.extend(self._after_commit)
+                    except Exception as e:
+                        connection.execute("ROLLBACK TO operation")
+                        connection.execute("RELEASE operation")
+                        results.append((future, None, e))
+                connection.execute("COMMIT")
+            except Exception as e:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                results = [(future, None, e) for _, future in batch]
+                callbacks = []
+
+            for callback in callbacks:
+                callback()
+
+            for future, result, error in results:
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+
+    def write(self, operation: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run an operation in the next group-committed write transaction and wait for its result.
+
+        Raises WriteTimeout if it has not committed within BOOKING_WRITE_TIMEOUT_SECONDS: withdrawn
+        from the queue if it had not started, otherwise still running and possibly committed later.
+        """
+        future: Future = Future()
+        self._writes.put((operation, future))
+        try:
+            return future.result(timeout=BOOKING_WRITE_TIMEOUT_SECONDS)
+        except TimeoutError:
+            if future.done():
+                raise  # raised by the operation itself
+            raise WriteTimeout(may_commit=not future.cancel()) from None
+
+    def _counter_update(self, connection: sqlite3.Connection, sql: str, params: tuple) -> Optional[int]:
+        """Run a counter upsert or update; returns the new count, or None when it did not apply"""
+        row = connection.execute(sql, params).fetchone()
+        return None if row is None else row["reserved"]
+
+    def reserve(
+        self,
+        connection: sqlite3.Connection,
+        attraction_id: int,
+        visit_date: str,
+        num_visitors: int,
+        slots: SlotLayout,
+        daily_capacity: int,
+        slot_index: Optional[int] = None
+    ) -> int:
+        """Atomically reserve capacity for visitors in a slot (the requested one, or the earliest
+        with room) within the current write transaction. Returns the slot index.
+
+        Raises BookingError if the day or slot is full or the attraction is closed.
+        """
+        if not slots:
+            raise BookingError(f"Attraction {attraction_id} is closed on {visit_date}")
+        if num_visitors > daily_capacity or self._counter_update(
+            connection, RESERVE_SQL, (attraction_id, visit_date, DAY_TOTAL, num_visitors, daily_capacity)
+        ) is None:
+            raise BookingError(f"Attraction {attraction_id} is fully booked on {visit_date}")
+
+        _, slot_reserved = self.reserved_counts(attraction_id, visit_date, connection)
+        candidates = [slot_index] if slot_index is not None else [
+            index for index, (_, capacity) in enumerate(slots)
+            if (slot_reserved[index] if index < len(slot_reserved) else 0) + num_visitors <= capacity
+        ]
+        for index in candidates:
+            capacity = slots[index][1]
+            if num_visitors <= capacity and self._counter_update(
+                connection, RESERVE_SQL, (attraction_id, visit_date, index, num_visitors, capacity)
+            ) is not None:
+                return index
+
+        if slot_index is not None:
+            raise BookingError(f"The {slots[slot_index][0]} slot on {visit_date} has no room for {num_visitors} visitor(s)")
+        raise BookingError(f"No time slot on {visit_date} has room for {num_visitors} visitor(s)")
+
+    def release(self, connection: sqlite3.Connection, row: sqlite3.Row) -> None:
+        """Return a booking's visitors to its day and slot capacity within the current write transaction"""
+        if row["slot_index"] is None:
+            return
+        for slot_index in (DAY_TOTAL, row["slot_index"]):
+            self._counter_update(
+                connection, RELEASE_SQL, (row["num_visitors"], row["attraction_id"], row["visit_date"], slot_index)
+            )
+
+    def insert_booking(
+        self,
+        connection: sqlite3.Connection,
+        booking: Dict[str, Any],
+        slots: Optional[SlotLayout] = None,
+        daily_capacity: Optional[int] = None,
+        slot_index: Optional[int] = None
+    ) -> BookingResponse:
+        """Insert a booking within the current write transaction; a repeated idempotency key
+        returns the original booking instead.
+
+        When a slot layout is given, capacity is reserved in the same transaction.
+        Raises BookingError if the idempotency key was used for a different booking request,
+        or there is not enough capacity.
+        """
+        key = booking.get("idempotency_key")
+        replayed = self._replay(connection, booking) if key else None
+        if replayed is not None:
+            return replayed
+
+        values = dict(booking, created_at=utc_now(), cancelled_at=None)
+        connection.execute("SAVEPOINT booking")
+        try:
+            if slots is not None:
+                index = self.reserve(
+                    connection, booking["attraction_id"], booking["visit_date"], booking["num_visitors"],
+                    slots, daily_capacity, slot_index
+                )
+                values.update(slot_index=index, time_slot=slots[index][0])
+            connection.execute(
+                f"INSERT INTO bookings ({', '.join(BOOKING_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in BOOKING_COLUMNS)})",
+                [values.get(column) for column in BOOKING_COLUMNS]
+            )
+        except BaseException:
+            connection.execute("ROLLBACK TO booking")
+            connection.execute("RELEASE booking")
+            raise
+        connection.execute("RELEASE booking")
+        row = connection.execute("SELECT * FROM bookings WHERE booking_id = ?", (booking["booking_id"],)).fetchone()
+        response = row_to_booking(row)
+        self.enqueue_events(connection, "booking.confirmed", response)
+        return response
+
+    def _replay(self, connection: sqlite3.Connection, booking: Dict[str, Any]) -> Optional[BookingResponse]:
+        """The booking already stored under a request's idempotency key, or None if there is none.
+
+        Raises BookingError if the key was used for a different booking request.
+        """
+        key = booking["idempotency_key"]
+        existing = connection.execute("SELECT * FROM bookings WHERE idempotency_key = ?", (key,)).fetchone()
+        if existing is None:
+            return None
+        if any(
+            str(existing[field]).lower() != str(booking[field]).lower()
+            for field in ("attraction_id", "email", "visit_date", "num_visitors")
+        ):
+            raise BookingError(f"Idempotency key '{key}' was already used for a different booking")
+        return row_to_booking(existing, replayed=True)
+
+    def create_booking(
+        self,
+        booking: Dict[str, Any],
+        slots: Optional[SlotLayout] = None,
+        daily_capacity: Optional[int] = None,
+        slot_index: Optional[int] = None
+    ) -> BookingResponse:
+        """Insert a booking in the next write transaction (see insert_booking)"""
+        return self.write(lambda connection: self.insert_booking(
+            connection, booking, slots, daily_capacity, slot_index
+        ))
+
+    def create_bookings(self, items: List[BookingItem]) -> List[BookingResponse]:
+        """Insert several bookings as one write operation: all of them commit or none do.
+
+        Raises BatchBookingError naming the first item that could not be booked; the
+        reservations of items before it are rolled back with it.
+        """
+        def insert_all(connection: sqlite3.Connection) -> List[BookingResponse]:
+            responses = []
+            for index, (booking, slots, capacity, slot_index) in enumerate(items):
+                try:
+                    responses.append(self.insert_booking(connection, booking, slots, capacity, slot_index))
+                except BookingError as e:
+                    raise BatchBookingError(index, str(e)) from e
+            return responses
+
+        return self.write(insert_all)
+
+    def cancel_booking(self, booking_id: str, email: str) -> BookingResponse:
+        """Cancel a confirmed booking, releasing its capacity; the email must match the one it was made with"""
+        def cancel(connection: sqlite3.Connection) -> BookingResponse:
+            row = connection.execute("SELECT * FROM bookings WHERE booking_id = ?", (booking_id,)).fetchone()
+            if row is None or row["email"].lower() != email.strip().lower():
+                raise BookingError(f"Booking {booking_id} not found for {email}")
+            if row["booking_status"] == "cancelled":
+                return row_to_booking(row)
+
+            connection.execute(
+                "UPDATE bookings SET booking_status = 'cancelled', cancelled_at = ? WHERE booking_id = ?",
+                (utc_now(), booking_id)
+            )
+            self.release(connection, row)
+            response = row_to_booking(connection.execute(
+                "SELECT * FROM bookings WHERE booking_id = ?", (booking_id,)
+            ).fetchone())
+            self.enqueue_events(connection, "booking.cancelled", response)
+            return response
+
+        return self.write(cancel)
+
+    def enqueue_events(self, connection: sqlite3.Connection, event: str, booking: BookingResponse) -> None:
+        """Add an event for each outbox sink within the current write transaction"""
+        payload = dumps(booking).decode()
+        created_at, now = utc_now(), time.time()
+        connection.executemany(
+            "INSERT INTO outbox (booking_id, event, sink, payload, next_attempt_at, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            [(booking.booking_id, event, sink, payload, now, created_at) for sink in OUTBOX_SINKS]
+        )
+        self.after_commit(self.outbox_ready.set)
+
+    def claim_events(self, limit: int) -> List[sqlite3.Row]:
+        """Lease up to `limit` due outbox events for delivery, oldest first"""
+        now = time.time()
+        return self.write(lambda connection: connection.execute(
+            CLAIM_SQL, (now + OUTBOX_LEASE_SECONDS, now, limit)
+        ).fetchall())
+
+    def settle_event(self, event_id: int, attempts: int, error: Optional[str] = None) -> None:
+        """Record a delivery attempt: delivered, retried with exponential backoff, or dead-lettered"""
+        def settle(connection: sqlite3.Connection) -> None:
+            if error is None:
+                connection.execute(
+                    "UPDATE outbox SET status = 'delivered', delivered_at = ?, last_error = NULL WHERE event_id = ?",
+                    (utc_now(), event_id)
+                )
+            elif attempts >= OUTBOX_MAX_ATTEMPTS:
+                connection.execute(
+                    "UPDATE outbox SET status = 'dead', last_error = ? WHERE event_id = ?", (error, event_id)
+                )
+            else:
+                delay = min(OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1), OUTBOX_RETRY_MAX_SECONDS)
+                connection.execute(
+                    "UPDATE outbox SET next_attempt_at = ?, last_error = ? WHERE event_id = ?",
+                    (time.time() + delay, error, event_id)
+                )
+
+        self.write(settle)
+
+    def retry_dead_events(self, booking_id: Optional[str] = None) -> int:
+        """Return dead-lettered events (optionally of one booking) to the queue; returns how many"""
+        def retry(connection: sqlite3.Connection) -> int:
+            query = "UPDATE outbox SET status = 'pending', attempts = 0, next_attempt_at = ? WHERE status = 'dead'"
+            params: List[Any] = [time.time()]
+            if booking_id:
+                query += " AND booking_id = ?"
+                params.append(booking_id)
+            count = connection.execute(query, params).rowcount
+            if count:
+                self.after_commit(self.outbox_ready.set)
+            return count
+
+        return self.write(retry)
+
+    def delivery_status(self, booking_id: Optional[str] = None) -> DeliveryStatus:
+        """Get outbox delivery state for one booking, or event counts across the whole outbox"""
+        reader = self._reader()
+        if booking_id:
+            rows = reader.execute(
+                "SELECT * FROM outbox WHERE booking_id = ? ORDER BY event_id", (booking_id,)
+            ).fetchall()
+            deliveries = [row_to_delivery(row) for row in rows]
+            counts: Dict[str, int] = {}
+            for delivery in deliveries:
+                counts[delivery.status] = counts.get(delivery.status, 0) + 1
+            return DeliveryStatus(booking_id=booking_id, counts=counts, deliveries=deliveries)
+
+        counts = dict(reader.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall())
+        dead = reader.execute(
+            "SELECT * FROM outbox WHERE status = 'dead' ORDER BY event_id DESC LIMIT 20"
+        ).fetchall()
+        return DeliveryStatus(counts=counts, deliveries=[row_to_delivery(row) for row in dead])
+
+    def get_booking(self, booking_id: str) -> Optional[BookingResponse]:
+        """Get a booking by ID"""
+        row = self._reader().execute("SELECT * FROM bookings WHERE booking_id = ?", (booking_id,)).fetchone()
+        return row_to_booking(row) if row is not None else None
+
+    def list_bookings(self, email: str, status: Optional[str] = None, limit: int = 20) -> List[BookingResponse]:
+        """List bookings made with an email address, newest first"""
+        query = "SELECT * FROM bookings WHERE email = ?"
+        params: List[Any] = [email.strip()]
+        if status:
+            query += " AND booking_status = ?"
+            params.append(status)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        return [row_to_booking(row) for row in self._reader().execute(query, params)]
+
+
+_store: Optional[BookingStore] = None
+_store_lock = threading.Lock()
+
+
+def get_booking_store() -> BookingStore:
+    """Get the booking store, opening the database on first use"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = BookingStore()
+    return _store
@@ -0,0 +1,55 @@
+"""
+Catalogue snapshot builder - Builds the attraction catalogue and its indexes once and writes them to a file.
+
+The server loads the snapshot at startup instead of parsing every record and building the
+indexes again, and falls back to building the catalogue when the snapshot was made by other
+code or data (see SNAPSHOT_SOURCES in config.py) or for other shards. Build it as part of a
+deployment, from the attractions-mcp directory:
+    uv run python build_snapshot.py [--size 0] [--seed 0] [--count 1] [--shards 0]
+--size adds synthetic attractions to the mocks, e.g. to try startup with a large catalogue.
+"""
+
+import argparse
+import os
+import time
+
+from config import MOCK_ATTRACTIONS, WORLD_WONDERS, ATTRACTIONS_SHARD_COUNT, ATTRACTIONS_SHARDS, CATALOGUE_SNAPSHOT_PATH
+from catalogue import AttractionCatalogue, save_snapshot, load_snapshot
+from sharding import local_shards, shard_rows
+from synthetic import sample_catalogue
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default=CATALOGUE_SNAPSHOT_PATH, help="snapshot file to write")
+    parser.add_argument("--count", type=int, default=ATTRACTIONS_SHARD_COUNT, help="shards the catalogue is split into")
+    parser.add_argument("--shards", default=ATTRACTIONS_SHARDS, help="comma-separated shards to include (default: this instance's)")
+    parser.add_argument("--size", type=int, default=0, help="synthetic attractions added to the mocks")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if not args.output:
+        parser.error("no snapshot path: pass --output or set ATTRACTIONS_CATALOGUE_SNAPSHOT")
+
+    shards = local_shards(args.shards, args.count)
+    if args.size:
+        rows, wonder_ids = sample_catalogue(args.size, args.seed)
+    else:
+        rows, wonder_ids = MOCK_ATTRACTIONS, WORLD_WONDERS
+
+    start = time.perf_counter()
+    catalogue = AttractionCatalogue(shard_rows(rows, shards, args.count), wonder_ids)
+    built = time.perf_counter() - start
+    save_snapshot(catalogue, args.output, args.count, shards)
+
+    start = time.perf_counter()
+    loaded = load_snapshot(args.output) if args.count == ATTRACTIONS_SHARD_COUNT and shards == local_shards() else None
+    print(f"{len(catalogue):,} attractions (version {catalogue.version}) built in {built * 1000:,.1f} ms")
+    print(f"Wrote {args.output} ({os.path.getsize(args.output) / 2**20:,.1f} MiB)")
+    if loaded is not None:
+        print(f"Loads in {(time.perf_counter() - start) * 1000:,.1f} ms")
+    else:
+        print("Built for other shards than this instance's; other instances will load it")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Caches - Thread-safe bounded caches for formatted resources and upstream responses.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class LRUCache:
+    """Least-recently-used cache holding at most `maxsize` entries"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value (None if absent), marking it recently used"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any], cacheable: Callable[[Any], bool] = None) -> Any:
+        """Get a cached value, building and caching it on a miss (only if `cacheable` accepts it)"""
+        value = self.get(key)
+        if value is None:
+            value = build()
+            if cacheable is None or cacheable(value):
+                self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class TTLCache(LRUCache):
+    """LRU cache whose entries expire after a per-entry time to live (None never expires).
+
+    Expired entries stay until evicted, so callers can fall back to a stale value when the
+    source is unavailable.
+    """
+
+    def __init__(self, maxsize: int, clock: Callable[[], float] = time.monotonic):
+        super().__init__(maxsize)
+        self.clock = clock
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a fresh cached value (None if absent or expired), marking it recently used"""
+        entry = super().get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and self.clock() >= expires_at:
+            with self._lock:
+                self.hits -= 1
+                self.misses += 1
+            return None
+        return value
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value even if it has expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache a value for `ttl` seconds (forever if None)"""
+        super().put(key, (value, None if ttl is None else self.clock() + ttl))
+
+    def get_or_build(
+        self, key: Hashable, build: Callable[[], Any], cacheable: Callable[[Any], bool] = None, ttl: Optional[float] = None
+    ) -> Any:
+        """Get a fresh cached value, building and caching it for `ttl` seconds on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = build()
+            if cacheable is None or cacheable(value):
+                self.put(key, value, ttl)
+        return value
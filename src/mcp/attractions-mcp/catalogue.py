@@ -0,0 +1,620 @@
+"""
+Attraction catalogue - Columnar in-memory attraction data and the indexes built over it at load.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import random
+import threading
+from bisect import bisect_right
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Iterable, Set, Tuple
+
+import numpy as np
+from mcp_common.encoding import to_builtins
+
+from config import (
+    MOCK_ATTRACTIONS, WORLD_WONDERS, PLANNER_MATRIX_MAX_SIZE, RESOURCE_CACHE_SIZE,
+    ROW_CACHE_SIZE, TRAVEL_MATRIX_CACHE_SIZE, SIMILARITY_WEIGHTS, PRICE_BANDS_USD,
+    ATTRACTIONS_SHARD_COUNT, CATALOGUE_SNAPSHOT_PATH, SNAPSHOT_FORMAT, SNAPSHOT_SOURCES
+)
+from models import SearchFilters, OpeningHours, Suggestion, Attraction, Price
+from indexes import (
+    OpeningHoursIndex, TravelMatrix, TrigramIndex, PrefixIndex, GeoGridIndex, SimilarityIndex,
+    distances_km, token_features, one_hot, unit_sphere
+)
+from columns import StringColumn, InternedColumn, RowSequence, float_column, optional_float
+from cache import LRUCache, TTLCache
+from sharding import local_shards, shard_rows
+from utils import (
+    parse_entry_fee, parse_opening_hours, format_day_hours, normalize_text, parse_attraction_data
+)
+from projection import project_attraction, project_model
+
+TEXT_FIELDS = ("name", "description", "image_url", "website", "opening_hours", "entry_fee")
+LOCATION_FIELDS = ("city", "country", "region")
+KNOWN_FIELDS = {"id", "category", "location", "rating", "price", "hours", *TEXT_FIELDS}
+KNOWN_LOCATION_FIELDS = {"latitude", "longitude", *LOCATION_FIELDS}
+TRANSIENT_ATTRIBUTES = {
+    "travel_matrices", "_rows", "_serialised", "records", "attractions", "serialised", "resources", "loaded_at"
+}
+
+
+class AttractionCatalogue:
+    """Attraction data held column by column, with filter indexes precomputed at load.
+
+    Numbers live in NumPy arrays, free text in shared UTF-8 buffers, and repeated values
+    (categories, places, parsed prices and opening hours) as small integer codes, so a
+    million attractions take a fraction of the memory of one dict per attraction. Filters
+    run as vectorised masks over the columns. Record dicts, Attraction models and their
+    serialised forms are only materialised for rows actually returned, and recently used
+    ones are cached.
+    """
+
+    def __init__(self, attractions: List[Dict[str, Any]], wonder_ids: Iterable[int] = ()):
+        rows = list(attractions)
+        locations = [data.get("location", {}) for data in rows]
+
+        # Parse each distinct fee and opening-hours text once
+        fees: Dict[Tuple[Any, str], Optional[Price]] = {}
+        hours: Dict[Tuple[Any, Any], Optional[OpeningHours]] = {}
+        prices = []
+        opening_hours = []
+        self.extras: Dict[int, Dict[str, Any]] = {}
+        for position, (data, location) in enumerate(zip(rows, locations)):
+            fee_key = (data.get("entry_fee"), location.get("country", ""))
+            if fee_key not in fees:
+                fees[fee_key] = parse_entry_fee(*fee_key)
+            prices.append(fees[fee_key])
+
+            hours_key = (data.get("opening_hours"), repr(data.get("hours")))
+            if hours_key not in hours:
+                hours[hours_key] = parse_opening_hours(data.get("opening_hours"), data.get("hours"))
+            opening_hours.append(hours[hours_key])
+
+            extras = {key: value for key, value in data.items() if key not in KNOWN_FIELDS}
+            if not KNOWN_LOCATION_FIELDS.issuperset(location):
+                extras["location"] = location
+            if extras:
+                self.extras[position] = extras
+
+        self.ids = np.array([data["id"] for data in rows], dtype=np.int64)
+        self.text = {field: StringColumn(data.get(field) for data in rows) for field in TEXT_FIELDS}
+        self.categories = InternedColumn(data.get("category") for data in rows)
+        self.places = {field: InternedColumn(location.get(field) for location in locations) for field in LOCATION_FIELDS}
+        self.latitudes = float_column(location.get("latitude") for location in locations)
+        self.longitudes = float_column(location.get("longitude") for location in locations)
+        self.ratings = float_column(data.get("rating") for data in rows)
+        self.prices = InternedColumn(prices)
+        self.opening_hours = InternedColumn(opening_hours)
+        self.day_hours = [format_day_hours(value) for value in self.opening_hours.values]
+
+        # Distinct normalised names, in first-seen order so their codes are name index term IDs
+        name_codes: Dict[str, int] = {}
+        distinct_names = []
+        codes = []
+        for data in rows:
+            key = normalize_text(data.get("name", ""))
+            if key not in name_codes:
+                name_codes[key] = len(name_codes)
+                distinct_names.append(data.get("name", ""))
+            codes.append(name_codes[key])
+        self.name_codes = np.array(codes, dtype=np.int32)
+        text_features = token_features(
+            [data.get("name") or "", data.get("description") or "", *tag_list(data.get("tags"))] for data in rows
+        )
+        del rows, locations, name_codes, codes
+
+        self.id_order = np.argsort(self.ids, kind="stable")
+        self.sorted_ids = self.ids[self.id_order]
+
+        self.location_codes: Dict[str, Dict[str, List[int]]] = {field: {} for field in LOCATION_FIELDS}
+        for field, column in self.places.items():
+            for code, value in enumerate(column.values):
+                if value:
+                    self.location_codes[field].setdefault(normalize_text(value), []).append(code)
+        self.location_index = TrigramIndex(
+            value for column in self.places.values() for value in column.values if value
+        )
+        self.name_index = TrigramIndex(distinct_names)
+        self.prefix_index = PrefixIndex(self._suggestions())
+        # Indexed over distinct opening hours; a query's codes are mapped back to rows
+        self.hours_index = OpeningHoursIndex(enumerate(self.opening_hours.values))
+        self.price_min_usd = np.array([
+            price.min_usd if price and price.min_usd is not None else np.nan for price in self.prices.values
+        ], dtype=np.float64)
+        self.price_is_free = np.array([bool(price and price.is_free) for price in self.prices.values], dtype=bool)
+        self.city_index = self._group_by_city()
+        self.geo_index = GeoGridIndex(self.latitudes, self.longitudes)
+        self.similarity_index = SimilarityIndex(self._feature_blocks(text_features), SIMILARITY_WEIGHTS)
+        del text_features
+        self.wonder_positions = [
+            position for position in (self.position_of(attraction_id) for attraction_id in wonder_ids)
+            if position is not None
+        ]
+
+        # ETag-style content version
+        self.version = self._digest()
+        self._start_caches()
+
+    def _start_caches(self) -> None:
+        """Create the empty caches and row views; formatted resources are memoised for this version only"""
+        self.travel_matrices = LRUCache(TRAVEL_MATRIX_CACHE_SIZE)
+        self._rows = LRUCache(ROW_CACHE_SIZE)
+        self._serialised = LRUCache(ROW_CACHE_SIZE)
+        self.records = RowSequence(len(self), self.record)
+        self.attractions = RowSequence(len(self), self.attraction_at)
+        self.serialised = RowSequence(len(self), self.serialise)
+        self.resources = TTLCache(RESOURCE_CACHE_SIZE)
+        self.loaded_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Snapshots hold the columns and indexes; caches and row views start afresh when loaded
+        return {key: value for key, value in self.__dict__.items() if key not in TRANSIENT_ATTRIBUTES}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._start_caches()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _digest(self) -> str:
+        digest = hashlib.blake2b(digest_size=8)
+        for column in self.text.values():
+            digest.update(column.buffer)
+            digest.update(column.offsets.tobytes())
+            digest.update(column.missing.tobytes())
+        for column in (self.categories, self.prices, self.opening_hours, *self.places.values()):
+            digest.update(repr(column.values).encode())
+            digest.update(column.codes.tobytes())
+        for values in (self.ids, self.latitudes, self.longitudes, self.ratings):
+            digest.update(values.tobytes())
+        digest.update(repr((sorted(self.extras.items()), self.wonder_positions)).encode())
+        return digest.hexdigest()
+
+    def position_of(self, attraction_id: int) -> Optional[int]:
+        """Get the catalogue position of an attraction ID, by bisection over the sorted IDs"""
+        index = int(np.searchsorted(self.sorted_ids, attraction_id))
+        if index < len(self.sorted_ids) and self.sorted_ids[index] == attraction_id:
+            return int(self.id_order[index])
+        return None
+
+    def location(self, position: int) -> Dict[str, Any]:
+        """Get the location dict of the attraction at a position"""
+        extra = self.extras.get(position, {}).get("location")
+        if extra is not None:
+            return extra
+        location = {field: self.places[field][position] for field in LOCATION_FIELDS}
+        location["latitude"] = optional_float(self.latitudes[position])
+        location["longitude"] = optional_float(self.longitudes[position])
+        return {key: value for key, value in location.items() if value is not None}
+
+    def record(self, position: int) -> Dict[str, Any]:
+        """Get the attraction record dict at a position (shared, so treat it as read-only)"""
+        record = self._rows.get(position)
+        if record is None:
+            fields = {"id": int(self.ids[position])}
+            for field in TEXT_FIELDS[:2]:
+                fields[field] = self.text[field][position]
+            fields["category"] = self.categories[position]
+            fields["location"] = self.location(position)
+            fields["rating"] = optional_float(self.ratings[position])
+            for field in TEXT_FIELDS[2:]:
+                fields[field] = self.text[field][position]
+            record = {key: value for key, value in fields.items() if value is not None}
+            record.update(self.extras.get(position, {}))
+            record["price"] = self.prices[position]
+            record["hours"] = self.day_hours[self.opening_hours.codes[position]]
+            self._rows.put(position, record)
+        return record
+
+    def attraction_at(self, position: int) -> Attraction:
+        """Get the Attraction model at a position"""
+        return parse_attraction_data(self.record(position))
+
+    def serialise(self, position: int) -> Dict[str, Any]:
+        """Get the serialised Attraction at a position (shared, so treat it as read-only)"""
+        serialised = self._serialised.get(position)
+        if serialised is None:
+            serialised = to_builtins(self.attraction_at(position))
+            self._serialised.put(position, serialised)
+        return serialised
+
+    def get(self, attraction_id: int) -> Optional[Dict[str, Any]]:
+        """Get an attraction record by ID"""
+        position = self.position_of(attraction_id)
+        return self.record(position) if position is not None else None
+
+    def attraction(self, attraction_id: int) -> Optional[Attraction]:
+        """Get the attraction model by ID"""
+        position = self.position_of(attraction_id)
+        return self.attraction_at(position) if position is not None else None
+
+    def project(self, position: int, fields: Tuple[str, ...]) -> Dict[str, Any]:
+        """Serialise only the given fields of the Attraction at a position, picked from its shared serialised form when cached"""
+        serialised = self._serialised.get(position)
+        if serialised is not None:
+            return project_attraction(serialised, fields)
+        return project_model(self.attraction_at(position), fields)
+
+    def to_dicts(self, positions: Iterable[int], fields: Optional[Tuple[str, ...]] = None) -> List[Dict[str, Any]]:
+        """Get the serialised attractions at catalogue positions, or only the given fields of each;
+        whole ones are shared, so treat them as read-only"""
+        if fields is None:
+            return [self.serialise(position) for position in positions]
+        return [self.project(position, fields) for position in positions]
+
+    def _suggestions(self) -> List[Suggestion]:
+        """Autocomplete suggestions: every attraction, plus each place ranked by its best attraction"""
+        names = self.text["name"]
+        suggestions = [
+            Suggestion(text=names[position], kind="attraction", attraction_id=attraction_id,
+                       rating=optional_float(self.ratings[position]))
+            for position, attraction_id in enumerate(self.ids.tolist())
+        ]
+
+        # Places in order of first appearance, each rated by its best attraction
+        ratings = np.nan_to_num(self.ratings)
+        candidates = []
+        for field_order, field in enumerate(LOCATION_FIELDS):
+            column = self.places[field]
+            best = np.zeros(len(column.values))
+            np.maximum.at(best, column.codes, ratings)
+            _, first_rows = np.unique(column.codes, return_index=True)
+            for code, first_row in enumerate(first_rows.tolist()):
+                if column.values[code]:
+                    candidates.append((first_row, field_order, column.values[code], field, float(best[code])))
+
+        places: Dict[str, Suggestion] = {}
+        for _, _, text, field, rating in sorted(candidates, key=lambda candidate: candidate[:2]):
+            place = places.setdefault(normalize_text(text), Suggestion(text=text, kind=field))
+            place.rating = max(place.rating or 0, rating)
+        return suggestions + list(places.values())
+
+    def _feature_blocks(self, text_features: np.ndarray) -> Dict[str, np.ndarray]:
+        """Similarity features per attraction: category, text tokens and tags, location, rating and price band"""
+        categories = np.array(
+            [-1 if value is None else code for code, value in enumerate(self.categories.values)], dtype=np.int64
+        )
+        angles = np.clip(self.ratings, 0, 5) / 5 * (np.pi / 2)
+        ratings = np.nan_to_num(np.stack([np.cos(angles), np.sin(angles)], axis=1), nan=0.0)
+        return {
+            "category": one_hot(categories[self.categories.codes], len(self.categories.values)),
+            "tags": text_features,
+            "location": unit_sphere(self.latitudes, self.longitudes),
+            "rating": ratings.astype(np.float32),
+            "price": one_hot(
+                np.array([price_band(price) for price in self.prices.values], dtype=np.int64)[self.prices.codes],
+                len(PRICE_BANDS_USD) + 2
+            ),
+        }
+
+    def _group_by_city(self) -> Dict[Tuple[str, str], np.ndarray]:
+        """Group positions by (city, country) key, case-insensitively"""
+        cities, countries = self.places["city"], self.places["country"]
+        num_countries = max(len(countries.values), 1)
+        pairs = cities.codes.astype(np.int64) * num_countries + countries.codes
+        unique_pairs, inverse = np.unique(pairs, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        groups = np.split(order, np.cumsum(np.bincount(inverse, minlength=len(unique_pairs)))[:-1])
+
+        city_index: Dict[Tuple[str, str], List[np.ndarray]] = {}
+        for pair, positions in zip(unique_pairs.tolist(), groups):
+            city, country = cities.values[pair // num_countries], countries.values[pair % num_countries]
+            city_index.setdefault(((city or "").lower(), (country or "").lower()), []).append(positions)
+        return {key: np.sort(np.concatenate(parts)) for key, parts in city_index.items()}
+
+    @staticmethod
+    def city_key(record: Dict[str, Any]) -> Tuple[str, str]:
+        """Get the (city, country) key used to group attractions for day planning"""
+        location = record.get("location", {})
+        return location.get("city", "").lower(), location.get("country", "").lower()
+
+    def city_key_at(self, position: int) -> Tuple[str, str]:
+        """Get the (city, country) key of the attraction at a position without materialising it"""
+        return (self.places["city"][position] or "").lower(), (self.places["country"][position] or "").lower()
+
+    def build_travel_matrix(self, positions: Iterable[int]) -> TravelMatrix:
+        """Build a travel-time matrix over the given catalogue positions"""
+        positions = [int(position) for position in positions]
+        return TravelMatrix(positions, [self.location(position) for position in positions])
+
+    def travel_matrix(self, positions: List[int]) -> TravelMatrix:
+        """Get the city matrix covering these positions (built on first use), or build one for them"""
+        if positions:
+            key = self.city_key_at(positions[0])
+            matrix = self.travel_matrices.get(key)
+            city_positions = self.city_index.get(key)
+            if matrix is None and city_positions is not None and 1 < len(city_positions) <= PLANNER_MATRIX_MAX_SIZE:
+                matrix = self.build_travel_matrix(city_positions)
+                self.travel_matrices.put(key, matrix)
+            if matrix is not None and all(position in matrix for position in positions):
+                return matrix
+        return self.build_travel_matrix(positions)
+
+    def similar(
+        self, position: int, limit: int, within_km: Optional[float] = None
+    ) -> List[Tuple[int, float, Optional[float]]]:
+        """Get (position, similarity, distance in km) of the attractions most similar to one, best first.
+
+        With `within_km`, only attractions within that radius of it are considered, found
+        through the spatial grid before any vectors are scored.
+        """
+        latitude, longitude = self.latitudes[position], self.longitudes[position]
+        if within_km is not None:
+            candidates, distances = self.geo_index.within(latitude, longitude, within_km)
+            distance_of = dict(zip(candidates.tolist(), distances.tolist()))
+            positions, scores = self.similarity_index.top_k(position, limit, candidates)
+            found = [distance_of[p] for p in positions.tolist()]
+        else:
+            positions, scores = self.similarity_index.top_k(position, limit)
+            found = distances_km(latitude, longitude, self.latitudes[positions], self.longitudes[positions]).tolist()
+        return [
+            (p, round(float(score), 4), optional_float(round(distance, 2)))
+            for p, score, distance in zip(positions.tolist(), scores.tolist(), found)
+        ]
+
+    def get_opening_hours(self, attraction_id: int) -> Optional[OpeningHours]:
+        """Get the parsed opening hours of an attraction by ID"""
+        position = self.position_of(attraction_id)
+        return self.opening_hours[position] if position is not None else None
+
+    def location_mask(self, location: str) -> np.ndarray:
+        """Get a row mask of attractions whose city, country or region contains the location"""
+        keys = {normalize_text(term) for term in self.location_index.containing(location)}
+        mask = np.zeros(len(self), dtype=bool)
+        for field, column in self.places.items():
+            codes = [code for key in keys for code in self.location_codes[field].get(key, ())]
+            if codes:
+                mask |= column.mask(codes)
+        return mask
+
+    def filter_positions(self, filters: SearchFilters) -> np.ndarray:
+        """Get catalogue positions matching all filters, in catalogue order"""
+        mask: Optional[np.ndarray] = None
+
+        def narrow(condition: np.ndarray) -> None:
+            nonlocal mask
+            mask = condition if mask is None else mask & condition
+
+        if filters.location:
+            narrow(self.location_mask(filters.location))
+        if filters.name:
+            narrow(np.isin(self.name_codes, self.name_index.containing_ids(filters.name)))
+        if filters.category:
+            code = self.categories.code(filters.category.lower())
+            narrow(self.categories.codes == code if code is not None else np.zeros(len(self), dtype=bool))
+        if filters.rating_min is not None:
+            narrow(self.ratings >= filters.rating_min)
+        if filters.max_price is not None:
+            narrow((self.price_min_usd <= filters.max_price)[self.prices.codes])
+        if filters.free_entry is not None:
+            free = self.price_is_free[self.prices.codes]
+            narrow(free if filters.free_entry else ~free)
+        if filters.open_at is not None:
+            if filters.open_until is not None:
+                codes = self.hours_index.open_between(filters.open_at, filters.open_until)
+            else:
+                codes = self.hours_index.open_at(filters.open_at)
+            narrow(np.isin(self.opening_hours.codes, codes))
+
+        if mask is None:
+            return np.arange(len(self))
+        return np.flatnonzero(mask)
+
+    def correct_location(self, location: str) -> Optional[Tuple[str, bool]]:
+        """Get the closest city, country, region or attraction name for a misspelt location.
+
+        Returns None when the location already matches, otherwise the best correction above
+        the similarity threshold and whether it is an attraction name.
+        """
+        if self.location_index.containing(location):
+            return None
+
+        place = self.location_index.lookup(location, limit=1)
+        name = self.name_index.lookup(location, limit=1)
+        if name and (not place or name[0][1] > place[0][1]):
+            return name[0][0], True
+        if place:
+            return place[0][0], False
+        return None
+
+    def resolve_filters(self, filters: SearchFilters) -> Tuple[SearchFilters, Optional[str]]:
+        """Apply any typo correction to the location filter, returning the corrected term"""
+        if not filters.location:
+            return filters, None
+
+        correction = self.correct_location(filters.location)
+        if correction is None:
+            return filters, None
+
+        term, is_name = correction
+        if is_name:
+            return replace(filters, location=None, name=term), term
+        return replace(filters, location=term), term
+
+    def first_by_id(self, positions: np.ndarray, limit: int) -> np.ndarray:
+        """Get the `limit` positions with the lowest attraction IDs, in ID order"""
+        ids = self.ids[positions]
+        if 0 < limit < len(positions):
+            lowest = np.argpartition(ids, limit - 1)[:limit]
+            positions, ids = positions[lowest], ids[lowest]
+        return positions[np.argsort(ids, kind="stable")][:limit]
+
+    def search(self, filters: SearchFilters, limit: int = 20, by_id: bool = False) -> Dict[str, Any]:
+        """Search attraction records, returning at most `limit` matches, their positions and the total match count.
+
+        Matches come in catalogue order, or in ID order with `by_id` (as shards do, so their pages can be merged).
+        """
+        filters, corrected_location = self.resolve_filters(filters)
+        positions = self.filter_positions(filters)
+        page = (self.first_by_id(positions, limit) if by_id else positions[:limit]).tolist()
+        return {
+            "attractions": [self.record(position) for position in page],
+            "positions": page,
+            "total": len(positions),
+            "corrected_location": corrected_location
+        }
+
+
+def tag_list(tags: Any) -> List[str]:
+    """Normalise an optional "tags" field (list or comma-separated string) to a list of tags"""
+    if not tags:
+        return []
+    if isinstance(tags, str):
+        return [tag.strip() for tag in tags.split(",")]
+    return [str(tag) for tag in tags]
+
+
+def price_band(price: Optional[Price]) -> int:
+    """Price band code: 0 for free entry, then one per PRICE_BANDS_USD bound and above; -1 if unknown"""
+    if price is None:
+        return -1
+    if price.is_free:
+        return 0
+    if price.min_usd is None:
+        return -1
+    return 1 + bisect_right(PRICE_BANDS_USD, price.min_usd)
+
+
+def snapshot_header(count: int = ATTRACTIONS_SHARD_COUNT, shards: Optional[Set[int]] = None) -> Dict[str, Any]:
+    """What a snapshot must have been built with to be loaded: the format, the source of the code
+    and data that build the catalogue, the NumPy version and the shards"""
+    digest = hashlib.blake2b(digest_size=8)
+    for name in SNAPSHOT_SOURCES:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), name), "rb") as source:
+            digest.update(source.read())
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "source": digest.hexdigest(),
+        "numpy": np.__version__,
+        "shard_count": count,
+        "shards": sorted(local_shards(count=count) if shards is None else shards)
+    }
+
+
+def save_snapshot(
+    catalogue: AttractionCatalogue,
+    path: str = CATALOGUE_SNAPSHOT_PATH,
+    count: int = ATTRACTIONS_SHARD_COUNT,
+    shards: Optional[Set[int]] = None
+) -> None:
+    """Pickle a built catalogue and its indexes, behind a header saying what it was built with"""
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as snapshot:
+        pickle.dump(snapshot_header(count, shards), snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(catalogue, snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary, path)
+
+
+class SnapshotUnpickler(pickle.Unpickler):
+    """Finds a snapshot's classes through this module's imports, so their modules resolve to this
+    server's even when it is loaded under another package name, as in the gateway"""
+
+    def find_class(self, module: str, name: str) -> Any:
+        return functools.reduce(getattr, name.split("."), __import__(module, fromlist=[name]))
+
+
+def load_snapshot(path: str = CATALOGUE_SNAPSHOT_PATH) -> Optional[AttractionCatalogue]:
+    """Load a catalogue snapshot, or None if there is none or it was built by other code, data or shards.
+
+    Snapshots are pickles: only load files this deployment built.
+    """
+    try:
+        with open(path, "rb") as snapshot:
+            if SnapshotUnpickler(snapshot).load() != snapshot_header():
+                return None
+            return SnapshotUnpickler(snapshot).load()
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+_catalogue: Optional[AttractionCatalogue] = None
+_catalogue_lock = threading.Lock()
+
+
+def get_catalogue() -> AttractionCatalogue:
+    """Get the attraction catalogue, loading its snapshot or building it from the mocks on first use"""
+    global _catalogue
+    if _catalogue is None:
+        with _catalogue_lock:
+            if _catalogue is None:
+                catalogue = load_snapshot() if CATALOGUE_SNAPSHOT_PATH else None
+                _catalogue = catalogue or AttractionCatalogue(shard_rows(MOCK_ATTRACTIONS), WORLD_WONDERS)
+    return _catalogue
+
+
+def reload_catalogue(
+    attractions: Optional[List[Dict[str, Any]]] = None,
+    wonder_ids: Optional[Iterable[int]] = None
+) -> AttractionCatalogue:
+    """Rebuild the catalogue and its indexes from this instance's shards, defaulting to the mock data; memoised resources start afresh"""
+    global _catalogue
+    catalogue = AttractionCatalogue(
+        shard_rows(MOCK_ATTRACTIONS if attractions is None else attractions),
+        WORLD_WONDERS if wonder_ids is None else wonder_ids
+    )
+    with _catalogue_lock:
+        _catalogue = catalogue
+    return catalogue
+
+
+def get_attraction_by_id(attraction_id: int) -> Optional[Dict[str, Any]]:
+    """Get attraction details by ID from the catalogue"""
+    return get_catalogue().get(attraction_id)
+
+
+def search_attractions(
+    location: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: int = 20,
+    rating_min: Optional[float] = None,
+    max_price: Optional[float] = None,
+    free_entry: Optional[bool] = None,
+    open_at: Optional[datetime] = None,
+    open_until: Optional[datetime] = None
+) -> Optional[Dict[str, Any]]:
+    """Search for attractions with filters using the catalogue indexes"""
+    filters = SearchFilters(
+        location=location,
+        category=category,
+        rating_min=rating_min,
+        max_price=max_price,
+        free_entry=free_entry,
+        open_at=open_at,
+        open_until=open_until
+    )
+    return get_catalogue().search(filters, limit)
+
+
+def get_random_famous_attraction() -> Optional[Dict[str, Any]]:
+    """Get a random famous attraction from the catalogue"""
+    catalogue = get_catalogue()
+    if len(catalogue):
+        return catalogue.record(random.randrange(len(catalogue)))
+    return None
+
+
+def get_random_india_attraction() -> Optional[Dict[str, Any]]:
+    """Get a random tourist attraction in India from the catalogue"""
+    catalogue = get_catalogue()
+    countries = catalogue.places["country"]
+    code = countries.code("India")
+    indian_positions = np.flatnonzero(countries.codes == code) if code is not None else []
+    if len(indian_positions):
+        return catalogue.record(int(random.choice(indian_positions)))
+    return None
+
+
+def get_wonders_of_world() -> Optional[Dict[str, Any]]:
+    """Get wonders of the world attractions from the catalogue"""
+    catalogue = get_catalogue()
+    wonders = [catalogue.record(position) for position in catalogue.wonder_positions]
+    return {
+        "attractions": wonders,
+        "total": len(wonders)
+    }
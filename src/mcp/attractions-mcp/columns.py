@@ -0,0 +1,106 @@
+"""
+Columnar storage - Compact per-attribute columns backing the attraction catalogue.
+"""
+
+import math
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+
+class StringColumn:
+    """Strings packed into one shared UTF-8 buffer, addressed by row offsets; None is kept as missing"""
+
+    __slots__ = ("buffer", "offsets", "missing")
+
+    def __init__(self, values: Iterable[Optional[str]]):
+        chunks = []
+        lengths = []
+        missing = []
+        for value in values:
+            encoded = value.encode("utf-8") if value is not None else b""
+            chunks.append(encoded)
+            lengths.append(len(encoded))
+            missing.append(value is None)
+        self.buffer = b"".join(chunks)
+        self.offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.offsets[1:])
+        self.missing = np.array(missing, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.missing)
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        if self.missing[row]:
+            return None
+        return self.buffer[self.offsets[row]:self.offsets[row + 1]].decode("utf-8")
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.buffer) + self.offsets.nbytes + self.missing.nbytes
+
+
+class InternedColumn:
+    """Low-cardinality values (categories, countries, cities) stored as codes into a table of distinct values"""
+
+    __slots__ = ("values", "lookup", "codes")
+
+    def __init__(self, values: Iterable[Any]):
+        self.lookup: Dict[Any, int] = {}
+        codes = [self.lookup.setdefault(value, len(self.lookup)) for value in values]
+        self.values: List[Any] = list(self.lookup)
+        dtype = np.uint16 if len(self.values) <= np.iinfo(np.uint16).max else np.uint32
+        self.codes = np.array(codes, dtype=dtype)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> Any:
+        return self.values[self.codes[row]]
+
+    def code(self, value: Any) -> Optional[int]:
+        """Get the code of a value, or None if no row holds it"""
+        return self.lookup.get(value)
+
+    def codes_where(self, predicate: Callable[[Any], bool]) -> List[int]:
+        """Get the codes of distinct values accepted by a predicate"""
+        return [code for code, value in enumerate(self.values) if predicate(value)]
+
+    def mask(self, codes: Iterable[int]) -> np.ndarray:
+        """Get a row mask of rows holding any of the given codes"""
+        return np.isin(self.codes, np.fromiter(codes, dtype=np.int64))
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes
+
+
+def float_column(values: Iterable[Optional[float]]) -> np.ndarray:
+    """Pack optional numbers into a float64 column, with NaN for missing values"""
+    return np.array([math.nan if value is None else value for value in values], dtype=np.float64)
+
+
+def optional_float(value: float) -> Optional[float]:
+    """Read a float column value back, with None for NaN"""
+    return None if math.isnan(value) else float(value)
+
+
+class RowSequence:
+    """Read-only sequence that materialises each row on access (e.g. catalogue.records[position])"""
+
+    __slots__ = ("length", "getter")
+
+    def __init__(self, length: int, getter: Callable[[int], Any]):
+        self.length = length
+        self.getter = getter
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, row: int) -> Any:
+        if not -self.length <= row < self.length:
+            raise IndexError(row)
+        return self.getter(int(row) % self.length)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self.getter(row) for row in range(self.length))
@@ -2,6 +2,8 @@
 Tourist attractions MCP configuration mocks data.
 """
 
+import os
+
 # World Tourist Attractions API configuration
 ATTRACTIONS_BASE_URL = "https://www.world-tourist-attractions-api.com"
 API_VERSION = "v1"
@@ -13,8 +15,87 @@ ENDPOINTS = {
     "random_india": f"/api/{API_VERSION}/random/india", 
     "wonders": f"/api/{API_VERSION}/wonders",
     "search": f"/api/{API_VERSION}/search",
-    "categories": f"/api/{API_VERSION}/categories"
+    "categories": f"/api/{API_VERSION}/categories",
+    "shard_locations": f"/api/{API_VERSION}/shard/locations"
+}
+
+# Where attraction data comes from: "local" (the in-memory catalogue only) or "upstream" (the API
+# above through a read-through cache, merged with the local catalogue and falling back to it)
+ATTRACTIONS_PROVIDER = os.environ.get("ATTRACTIONS_PROVIDER", "local")
+ATTRACTIONS_API_URL = os.environ.get("ATTRACTIONS_API_URL", ATTRACTIONS_BASE_URL)
+ATTRACTIONS_API_KEY = os.environ.get("ATTRACTIONS_API_KEY")
+
+# Pooled HTTP client for upstream calls
+UPSTREAM_POOL_SIZE = 16  # keep-alive connections per host
+UPSTREAM_TIMEOUT_SECONDS = (3.05, 5.0)  # connect, read
+UPSTREAM_RETRIES = 2  # retries of idempotent requests on connection errors and 502/503/504
+UPSTREAM_COOLDOWN_SECONDS = 30.0  # after a failure, serve cached or local data without calling upstream
+
+# Read-through cache of upstream responses; a TTL of 0 is never cached
+UPSTREAM_CACHE_SIZE = 2048
+UPSTREAM_CACHE_TTL_SECONDS = {
+    "attraction_by_id": 3600,
+    "search": 300,
+    "wonders": 86400,
+    "categories": 86400,
+    "random_famous": 0,
+    "random_india": 0,
+    "shard_locations": 300,
+}
+UPSTREAM_RESOURCE_TTL_SECONDS = 300  # memoised resources expire when their data can change upstream
+
+# Sharding: the catalogue is partitioned by country into ATTRACTIONS_SHARD_COUNT shards. An instance
+# loads ATTRACTIONS_SHARDS (comma-separated shard numbers; by default every shard without a URL) and
+# routes queries for the shards in ATTRACTIONS_SHARD_URLS ("0=http://host:port,1=...") to their shard API
+ATTRACTIONS_SHARD_COUNT = int(os.environ.get("ATTRACTIONS_SHARD_COUNT", "1"))
+ATTRACTIONS_SHARDS = os.environ.get("ATTRACTIONS_SHARDS", "")
+ATTRACTIONS_SHARD_URLS = os.environ.get("ATTRACTIONS_SHARD_URLS", "")
+ATTRACTIONS_SHARD_HOST = os.environ.get("ATTRACTIONS_SHARD_HOST", "127.0.0.1")
+ATTRACTIONS_SHARD_PORT = int(os.environ.get("ATTRACTIONS_SHARD_PORT", "0"))  # also serve the shard API; 0 = off
+SHARD_WORKERS = 8  # concurrent shard requests per scatter-gather query
+
+# MCP HTTP server. Stateless mode keeps no sessions between requests, so replicas and workers
+# can sit behind a plain load balancer and be restarted one at a time; it is on by default with
+# several workers, which share no memory. On shutdown, in-flight requests get SERVER_DRAIN_SECONDS.
+SERVER_NAME = "attractions-mcp"
+SERVER_HOST = os.environ.get("ATTRACTIONS_HOST", "127.0.0.1")
+SERVER_PORT = int(os.environ.get("ATTRACTIONS_PORT", "8008"))
+SERVER_WORKERS = int(os.environ.get("ATTRACTIONS_WORKERS", "1"))
+SERVER_STATELESS = os.environ.get("ATTRACTIONS_STATELESS", str(SERVER_WORKERS > 1)).lower() in ("1", "true", "yes")
+SERVER_JSON_RESPONSE = os.environ.get("ATTRACTIONS_JSON_RESPONSE", "false").lower() in ("1", "true", "yes")
+SERVER_DRAIN_SECONDS = float(os.environ.get("ATTRACTIONS_DRAIN_SECONDS", "30"))
+
+# Admission control: at most ADMISSION_MAX_CONCURRENT tool calls run at once per worker (fewer for
+# the tools in ADMISSION_TOOL_LIMITS) and up to ADMISSION_MAX_QUEUE wait. A call is rejected at once
+# with a retryable error when the queue is full or it could not finish within its deadline.
+ADMISSION_MAX_CONCURRENT = int(os.environ.get("ATTRACTIONS_MAX_CONCURRENT", "8"))
+ADMISSION_MAX_QUEUE = int(os.environ.get("ATTRACTIONS_MAX_QUEUE", "64"))
+ADMISSION_DEADLINE_SECONDS = float(os.environ.get("ATTRACTIONS_DEADLINE_SECONDS", "10"))
+ADMISSION_TOOL_LIMITS = {
+    "plan_day": 2,
+    "get_similar_attractions": 4,
+    "book_attractions_batch": 2,
+    "search_and_format_attractions": 4,
+}
+ADMISSION_TOOL_DEADLINES = {
+    "book_attraction": 20,
+    "book_attractions_batch": 30,
 }
+ADMISSION_EWMA_WEIGHT = 0.2  # weight of the latest run time in each tool's expected run time
+
+# Opt-in profiling and tracing of tool calls. ATTRACTIONS_PROFILE_RATE is the share of calls run under
+# cProfile; with ATTRACTIONS_PROFILE_ON_REQUEST a caller can also ask for one call to be profiled by
+# sending "profile": true in the request's _meta. Stats are written to PROFILE_DIR as .pstats files.
+# ATTRACTIONS_TRACE_FILE turns on spans, appended to that file as OTLP JSON lines
+PROFILE_SAMPLE_RATE = float(os.environ.get("ATTRACTIONS_PROFILE_RATE", "0"))
+PROFILE_ON_REQUEST = os.environ.get("ATTRACTIONS_PROFILE_ON_REQUEST", "false").lower() in ("1", "true", "yes")
+PROFILE_DIR = os.environ.get("ATTRACTIONS_PROFILE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles"))
+TRACE_FILE = os.environ.get("ATTRACTIONS_TRACE_FILE", "")
+TRACE_SERVICE_NAME = SERVER_NAME
+
+# JSON encoder for tool results and shard responses: "auto" picks the first installed of orjson,
+# msgspec, pydantic-core and the standard library; naming one that is not installed falls back the same way
+JSON_ENCODER = os.environ.get("ATTRACTIONS_JSON_ENCODER", "auto").lower()
 
 # Attraction categories
 ATTRACTION_CATEGORIES = {
@@ -47,11 +128,130 @@ BOOKING_STATUS = {
     "completed": "Completed"
 }
 
+# Booking ledger (SQLite in WAL mode)
+BOOKINGS_DB_PATH = os.environ.get(
+    "ATTRACTIONS_BOOKINGS_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "bookings.db")
+)
+BOOKINGS_SYNCHRONOUS = "NORMAL"  # durable across process crashes; "FULL" to also survive power loss
+BOOKING_BATCH_SIZE = 256  # most writes group-committed in one transaction
+BOOKING_WRITE_TIMEOUT_SECONDS = 10
+MAX_BATCH_BOOKINGS = 20  # items per all-or-nothing batch booking
+BOOKING_ID_PREFIX = "ATT-"
+CONFIRMATION_CODE_ALPHABET = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"  # no 0/O or 1/I look-alikes
+CONFIRMATION_CODE_LENGTH = 8
+
+# Booking side-effects, delivered from an outbox table by a background worker pool
+OUTBOX_SINKS = ["confirmation_email", "partner_api", "audit_log"]
+OUTBOX_WORKERS = 4
+OUTBOX_POLL_SECONDS = 1.0  # fallback poll; new events wake the dispatcher immediately
+OUTBOX_LEASE_SECONDS = 60  # a claimed event is retried if not settled within this time
+OUTBOX_MAX_ATTEMPTS = 5  # then dead-lettered
+OUTBOX_RETRY_BASE_SECONDS = 2.0
+OUTBOX_RETRY_MAX_SECONDS = 300.0
+# Local stand-in sink: appends each delivery to <dir>/<sink>.jsonl, optionally slow or flaky
+OUTBOX_SINK_DIR = os.environ.get(
+    "ATTRACTIONS_OUTBOX_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "outbox")
+)
+OUTBOX_SINK_LATENCY_SECONDS = float(os.environ.get("ATTRACTIONS_OUTBOX_LATENCY", "0"))
+OUTBOX_SINK_FAILURE_RATE = float(os.environ.get("ATTRACTIONS_OUTBOX_FAILURE_RATE", "0"))
+
+# Capacity - attractions may override with "daily_capacity" and "slot_capacity"
+SLOT_MINUTES = 60
+DEFAULT_SLOT_CAPACITY = 100  # visitors per time slot
+DEFAULT_DAILY_CAPACITY = 1000  # visitors per day across all slots
+MAX_AVAILABILITY_DAYS = 31
+
 # Default values
 DEFAULT_SEARCH_LIMIT = 20
 MAX_SEARCH_LIMIT = 100
 DEFAULT_RATING_MIN = 3.0
 
+# Responses over a caller's max_bytes have descriptions cut to about this many characters before results are dropped
+BUDGET_DESCRIPTION_CHARS = 160
+
+# Currency symbols used in free-text entry fees. Ambiguous symbols ("$", "¥")
+# are resolved against the attraction's country, falling back to the first code.
+CURRENCY_SYMBOLS = {
+    "R$": ["BRL"],
+    "€": ["EUR"],
+    "£": ["GBP"],
+    "₹": ["INR"],
+    "$": ["USD", "AUD", "CAD"],
+    "¥": ["JPY", "CNY"],
+}
+
+# Local currency per country, used to disambiguate currency symbols
+COUNTRY_CURRENCIES = {
+    "France": "EUR", "Italy": "EUR", "Spain": "EUR", "Greece": "EUR", "Germany": "EUR",
+    "India": "INR", "Peru": "USD", "China": "CNY", "Japan": "JPY", "Cambodia": "USD",
+    "USA": "USD", "Jordan": "JOD", "Australia": "AUD", "Brazil": "BRL", "UK": "GBP",
+    "Canada": "CAD",
+}
+
+# Approximate exchange rates used to compare prices across currencies
+EXCHANGE_RATES_TO_USD = {
+    "USD": 1.0, "EUR": 1.08, "GBP": 1.27, "INR": 0.012, "JPY": 0.0067,
+    "CNY": 0.14, "AUD": 0.66, "CAD": 0.73, "BRL": 0.18, "JOD": 1.41,
+}
+
+# Formatted resources memoised per catalogue version
+RESOURCE_CACHE_SIZE = 256
+# Catalogue rows materialised from the columns, and city travel-time matrices, kept while hot
+ROW_CACHE_SIZE = 4096
+TRAVEL_MATRIX_CACHE_SIZE = 64
+
+# Catalogue snapshot written by `python build_snapshot.py`: the built catalogue and its indexes,
+# loaded at startup instead of being rebuilt. It is skipped if the modules below, the NumPy version
+# or the shards differ from those it was built with; an empty path turns snapshots off
+CATALOGUE_SNAPSHOT_PATH = os.environ.get(
+    "ATTRACTIONS_CATALOGUE_SNAPSHOT", os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalogue.snapshot")
+)
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_SOURCES = ("catalogue.py", "indexes.py", "columns.py", "models.py", "utils.py", "config.py", "sharding.py")
+
+# Typo-tolerant matching
+FUZZY_MATCH_THRESHOLD = 0.6  # minimum similarity (0-1) for a correction
+FUZZY_CANDIDATES = 50  # terms sharing the most trigrams that are re-scored
+
+# Autocomplete
+AUTOCOMPLETE_DEFAULT_LIMIT = 10
+AUTOCOMPLETE_MAX_LIMIT = 20
+AUTOCOMPLETE_PRECOMPUTED_PREFIX = 2  # prefixes up to this length have their top suggestions cached
+
+# Similar-attraction recommendations
+SIMILAR_DEFAULT_LIMIT = 5
+SIMILAR_MAX_LIMIT = 20
+SIMILARITY_WEIGHTS = {  # share of each feature block in the similarity score (sums to 1)
+    "category": 0.35, "tags": 0.25, "location": 0.2, "rating": 0.1, "price": 0.1
+}
+SIMILARITY_TOKEN_DIMENSIONS = 32  # name, description and tag tokens are hashed into this many features
+SIMILARITY_STOPWORDS = {
+    "a", "an", "and", "at", "by", "for", "from", "in", "into", "is", "it", "of", "on", "or", "the", "to", "with"
+}
+PRICE_BANDS_USD = [10, 25, 50]  # upper bounds of the paid price bands; free entry is its own band
+GEO_CELL_DEGREES = 0.5  # spatial grid cell size for radius queries
+
+# Day planner defaults
+PLANNER_DAY_END = "20:00"
+PLANNER_MIN_STOPS = 3
+PLANNER_MAX_STOPS = 5
+PLANNER_TRAVEL_SPEED_KMH = 15.0  # door-to-door urban travel, walking and transit
+PLANNER_TRAVEL_OVERHEAD_MINUTES = 10
+PLANNER_DEFAULT_TRAVEL_MINUTES = 30  # when either attraction lacks coordinates
+PLANNER_MATRIX_MAX_SIZE = 500  # largest city given a travel-time matrix at load
+PLANNER_MAX_CANDIDATES = 50  # best-scoring attractions considered by the solver
+DEFAULT_VISIT_MINUTES = 90
+VISIT_MINUTES_BY_CATEGORY = {
+    "historical": 120, "natural": 180, "cultural": 90, "religious": 60,
+    "modern": 90, "museums": 150, "parks": 90, "beaches": 180,
+    "mountains": 240, "architecture": 75, "entertainment": 120, "adventure": 180
+}
+
+# Opening hours are held as minute offsets from Monday 00:00, local time
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
 # Mock attractions data for demonstration
 MOCK_ATTRACTIONS = [
     {
@@ -59,7 +259,7 @@ MOCK_ATTRACTIONS = [
         "name": "Eiffel Tower",
         "description": "Iconic iron lattice tower located on the Champ de Mars in Paris, France",
         "category": "architecture",
-        "location": {"city": "Paris", "country": "France", "region": "Île-de-France"},
+        "location": {"city": "Paris", "country": "France", "region": "Île-de-France", "latitude": 48.8584, "longitude": 2.2945},
         "rating": 4.6,
         "image_url": "https://example.com/eiffel-tower.jpg",
         "website": "https://www.toureiffel.paris",
@@ -71,7 +271,7 @@ MOCK_ATTRACTIONS = [
         "name": "Taj Mahal",
         "description": "Ivory-white marble mausoleum on the right bank of the river Yamuna in Agra",
         "category": "historical",
-        "location": {"city": "Agra", "country": "India", "region": "Uttar Pradesh"},
+        "location": {"city": "Agra", "country": "India", "region": "Uttar Pradesh", "latitude": 27.1751, "longitude": 78.0421},
         "rating": 4.8,
         "image_url": "https://example.com/taj-mahal.jpg",
         "website": "https://www.tajmahal.gov.in",
@@ -83,7 +283,7 @@ MOCK_ATTRACTIONS = [
         "name": "Colosseum",
         "description": "Ancient Roman amphitheater in the center of Rome, Italy",
         "category": "historical",
-        "location": {"city": "Rome", "country": "Italy", "region": "Lazio"},
+        "location": {"city": "Rome", "country": "Italy", "region": "Lazio", "latitude": 41.8902, "longitude": 12.4922},
         "rating": 4.5,
         "image_url": "https://example.com/colosseum.jpg",
         "website": "https://www.coopculture.it",
@@ -95,7 +295,7 @@ MOCK_ATTRACTIONS = [
         "name": "Machu Picchu",
         "description": "Ancient Incan city set high in the Andes Mountains of Peru",
         "category": "historical",
-        "location": {"city": "Cusco", "country": "Peru", "region": "Cusco"},
+        "location": {"city": "Cusco", "country": "Peru", "region": "Cusco", "latitude": -13.1631, "longitude": -72.545},
         "rating": 4.9,
         "image_url": "https://example.com/machu-picchu.jpg",
         "website": "https://www.machupicchu.gob.pe",
@@ -107,7 +307,7 @@ MOCK_ATTRACTIONS = [
         "name": "Louvre Museum",
         "description": "World's largest art museum and historic monument in Paris",
         "category": "museums",
-        "location": {"city": "Paris", "country": "France", "region": "Île-de-France"},
+        "location": {"city": "Paris", "country": "France", "region": "Île-de-France", "latitude": 48.8606, "longitude": 2.3376},
         "rating": 4.4,
         "image_url": "https://example.com/louvre.jpg",
         "website": "https://www.louvre.fr",
@@ -119,7 +319,7 @@ MOCK_ATTRACTIONS = [
         "name": "Great Wall of China",
         "description": "Ancient fortification built across northern China",
         "category": "historical",
-        "location": {"city": "Beijing", "country": "China", "region": "Beijing"},
+        "location": {"city": "Beijing", "country": "China", "region": "Beijing", "latitude": 40.3588, "longitude": 116.02},
         "rating": 4.7,
         "image_url": "https://example.com/great-wall.jpg",
         "website": "https://www.mutianyu.com",
@@ -131,7 +331,7 @@ MOCK_ATTRACTIONS = [
         "name": "Santorini",
         "description": "Beautiful Greek island with white buildings and blue domes",
         "category": "natural",
-        "location": {"city": "Santorini", "country": "Greece", "region": "Cyclades"},
+        "location": {"city": "Santorini", "country": "Greece", "region": "Cyclades", "latitude": 36.3932, "longitude": 25.4615},
         "rating": 4.6,
         "image_url": "https://example.com/santorini.jpg",
         "website": "https://www.santorini.com",
@@ -143,7 +343,7 @@ MOCK_ATTRACTIONS = [
         "name": "Angkor Wat",
         "description": "Largest religious monument in the world, originally a Hindu temple",
         "category": "religious",
-        "location": {"city": "Siem Reap", "country": "Cambodia", "region": "Siem Reap"},
+        "location": {"city": "Siem Reap", "country": "Cambodia", "region": "Siem Reap", "latitude": 13.4125, "longitude": 103.867},
         "rating": 4.8,
         "image_url": "https://example.com/angkor-wat.jpg",
         "website": "https://www.angkorwat.com",
@@ -155,7 +355,7 @@ MOCK_ATTRACTIONS = [
         "name": "Central Park",
         "description": "Large public park in Manhattan, New York City",
         "category": "parks",
-        "location": {"city": "New York", "country": "USA", "region": "New York"},
+        "location": {"city": "New York", "country": "USA", "region": "New York", "latitude": 40.7829, "longitude": -73.9654},
         "rating": 4.3,
         "image_url": "https://example.com/central-park.jpg",
         "website": "https://www.centralparknyc.org",
@@ -167,7 +367,7 @@ MOCK_ATTRACTIONS = [
         "name": "Petra",
         "description": "Archaeological city famous for rock-cut architecture and water conduit system",
         "category": "historical",
-        "location": {"city": "Ma'an", "country": "Jordan", "region": "Ma'an"},
+        "location": {"city": "Ma'an", "country": "Jordan", "region": "Ma'an", "latitude": 30.3285, "longitude": 35.4444},
         "rating": 4.7,
         "image_url": "https://example.com/petra.jpg",
         "website": "https://www.visitpetra.jo",
@@ -179,7 +379,7 @@ MOCK_ATTRACTIONS = [
         "name": "Statue of Liberty",
         "description": "Neoclassical sculpture on Liberty Island in New York Harbor",
         "category": "modern",
-        "location": {"city": "New York", "country": "USA", "region": "New York"},
+        "location": {"city": "New York", "country": "USA", "region": "New York", "latitude": 40.6892, "longitude": -74.0445},
         "rating": 4.4,
         "image_url": "https://example.com/statue-liberty.jpg",
         "website": "https://www.nps.gov/stli",
@@ -191,7 +391,7 @@ MOCK_ATTRACTIONS = [
         "name": "Sagrada Familia",
         "description": "Unfinished Roman Catholic minor basilica in Barcelona, Spain",
         "category": "religious",
-        "location": {"city": "Barcelona", "country": "Spain", "region": "Catalonia"},
+        "location": {"city": "Barcelona", "country": "Spain", "region": "Catalonia", "latitude": 41.4036, "longitude": 2.1744},
         "rating": 4.6,
         "image_url": "https://example.com/sagrada-familia.jpg",
         "website": "https://sagradafamilia.org",
@@ -203,7 +403,7 @@ MOCK_ATTRACTIONS = [
         "name": "Kinkaku-ji",
         "description": "Golden Pavilion, a Zen temple in Kyoto, Japan",
         "category": "religious",
-        "location": {"city": "Kyoto", "country": "Japan", "region": "Kansai"},
+        "location": {"city": "Kyoto", "country": "Japan", "region": "Kansai", "latitude": 35.0394, "longitude": 135.7292},
         "rating": 4.5,
         "image_url": "https://example.com/kinkaku-ji.jpg",
         "website": "https://www.shokoku-ji.jp",
@@ -215,7 +415,7 @@ MOCK_ATTRACTIONS = [
         "name": "Sydney Opera House",
         "description": "Multi-venue performing arts center in Sydney, Australia",
         "category": "modern",
-        "location": {"city": "Sydney", "country": "Australia", "region": "New South Wales"},
+        "location": {"city": "Sydney", "country": "Australia", "region": "New South Wales", "latitude": -33.8568, "longitude": 151.2153},
         "rating": 4.4,
         "image_url": "https://example.com/sydney-opera.jpg",
         "website": "https://www.sydneyoperahouse.com",
@@ -227,7 +427,7 @@ MOCK_ATTRACTIONS = [
         "name": "Christ the Redeemer",
         "description": "Art Deco statue of Jesus Christ in Rio de Janeiro, Brazil",
         "category": "religious",
-        "location": {"city": "Rio de Janeiro", "country": "Brazil", "region": "Rio de Janeiro"},
+        "location": {"city": "Rio de Janeiro", "country": "Brazil", "region": "Rio de Janeiro", "latitude": -22.9519, "longitude": -43.2105},
         "rating": 4.5,
         "image_url": "https://example.com/christ-redeemer.jpg",
         "website": "https://www.cristoredentor.com.br",
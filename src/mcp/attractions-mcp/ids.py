@@ -0,0 +1,77 @@
+"""
+Identifier generation - Time-sortable, collision-resistant booking IDs (ULID layout).
+"""
+
+import os
+import secrets
+import threading
+import time
+
+from config import BOOKING_ID_PREFIX
+
+# Crockford base32: no I, L, O or U, so IDs read back unambiguously
+ENCODING = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+RANDOM_BITS = 80
+ENCODED_LENGTH = 26  # 48-bit millisecond timestamp + 80 random bits
+
+
+def encode_ulid(value: int) -> str:
+    """Encode a 128-bit integer as 26 Crockford base32 characters, most significant first"""
+    chars = []
+    for _ in range(ENCODED_LENGTH):
+        chars.append(ENCODING[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+def decode_timestamp(identifier: str) -> int:
+    """Get the millisecond Unix timestamp embedded in a ULID (with or without prefix)"""
+    value = 0
+    for char in identifier[-ENCODED_LENGTH:][:10]:
+        value = (value << 5) | ENCODING.index(char)
+    return value
+
+
+class UlidGenerator:
+    """Monotonic ULID generator, safe across threads and forked worker processes.
+
+    Each millisecond starts from 80 fresh random bits, so independent processes sharing the
+    ledger collide with negligible probability. Within a millisecond the random part is
+    incremented, so IDs from one process always sort in creation order even if the clock
+    steps backwards.
+    """
+
+    __slots__ = ("_lock", "_last_ms", "_last_random")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Start a fresh sequence (used in forked children, where the lock may be held)"""
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def new(self) -> str:
+        """Generate the next identifier"""
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms, self._last_random = now_ms, secrets.randbits(RANDOM_BITS)
+            else:
+                self._last_random += 1
+                if self._last_random >> RANDOM_BITS:
+                    # Random part exhausted within one millisecond: borrow the next one
+                    self._last_ms, self._last_random = self._last_ms + 1, secrets.randbits(RANDOM_BITS)
+            value = (self._last_ms << RANDOM_BITS) | self._last_random
+        return encode_ulid(value)
+
+
+_booking_ids = UlidGenerator()
+# A forked worker must not continue its parent's monotonic sequence
+os.register_at_fork(after_in_child=_booking_ids.reset)
+
+
+def new_booking_id() -> str:
+    """Generate a booking ID, e.g. "ATT-01J8ZK6Q5XG4T7M2V9R3C1B0NA" """
+    return f"{BOOKING_ID_PREFIX}{_booking_ids.new()}"
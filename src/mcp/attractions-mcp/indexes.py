@@ -0,0 +1,372 @@
+"""
+Search indexes over catalogue positions - built once at catalogue load.
+"""
+
+import heapq
+import math
+import re
+import zlib
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Iterable, Tuple
+
+import numpy as np
+
+from config import (
+    MINUTES_PER_WEEK, FUZZY_MATCH_THRESHOLD, FUZZY_CANDIDATES,
+    AUTOCOMPLETE_MAX_LIMIT, AUTOCOMPLETE_PRECOMPUTED_PREFIX,
+    SIMILARITY_TOKEN_DIMENSIONS, SIMILARITY_STOPWORDS, GEO_CELL_DEGREES
+)
+from models import OpeningHours, Suggestion
+from utils import (
+    week_minute, merge_intervals, estimate_travel_minutes, normalize_text, edit_similarity
+)
+
+
+class OpeningHoursIndex:
+    """Opening intervals of every attraction as flat arrays sorted by start, answering "open at" and
+    "open throughout" queries with one bisection and a vectorised comparison.
+
+    Intervals are unrolled across the week boundary so overnight Sunday hours and windows
+    that run into the next week are handled without special cases; only intervals
+    overlapping the week itself are kept.
+    """
+
+    __slots__ = ("starts", "ends", "positions")
+
+    def __init__(self, opening_hours: Iterable[Tuple[int, Optional[OpeningHours]]]):
+        starts: List[int] = []
+        ends: List[int] = []
+        positions: List[int] = []
+        for position, hours in opening_hours:
+            if hours is None:
+                continue
+            unrolled = merge_intervals([
+                (start + shift, end + shift)
+                for start, end in hours.intervals
+                for shift in (-MINUTES_PER_WEEK, 0, MINUTES_PER_WEEK)
+            ])
+            for start, end in unrolled:
+                if end > 0 and start < MINUTES_PER_WEEK:
+                    starts.append(start)
+                    ends.append(end)
+                    positions.append(position)
+
+        order = np.argsort(np.array(starts, dtype=np.int32), kind="stable")
+        self.starts = np.array(starts, dtype=np.int32)[order]
+        self.ends = np.array(ends, dtype=np.int32)[order]
+        self.positions = np.array(positions, dtype=np.int64)[order]
+
+    def _covering(self, window_start: int, window_end: int, inclusive_end: bool) -> np.ndarray:
+        count = np.searchsorted(self.starts, window_start, side="right")
+        ends = self.ends[:count]
+        hits = ends >= window_end if inclusive_end else ends > window_end
+        return np.unique(self.positions[:count][hits])
+
+    def open_at(self, moment: datetime) -> np.ndarray:
+        """Get positions of attractions open at a local date and time"""
+        minute = week_minute(moment)
+        return self._covering(minute, minute, inclusive_end=False)
+
+    def open_between(self, start: datetime, end: datetime) -> np.ndarray:
+        """Get positions of attractions open for the whole local window [start, end]"""
+        window_start = week_minute(start)
+        window_end = window_start + int((end - start).total_seconds() // 60)
+        if window_end <= window_start:
+            return self.open_at(start)
+        return self._covering(window_start, window_end, inclusive_end=True)
+
+
+class TravelMatrix:
+    """Pairwise travel times in minutes between attractions, stored as a flat row-major array"""
+
+    __slots__ = ("positions", "rows", "minutes")
+
+    def __init__(self, positions: List[int], locations: List[Dict[str, Any]]):
+        self.positions = list(positions)
+        self.rows = {position: row for row, position in enumerate(self.positions)}
+        self.minutes = array("H", (
+            estimate_travel_minutes(origin, destination)
+            for origin in locations
+            for destination in locations
+        ))
+
+    def __contains__(self, position: int) -> bool:
+        return position in self.rows
+
+    def travel_minutes(self, origin: int, destination: int) -> int:
+        """Get travel minutes between two catalogue positions held by this matrix"""
+        return self.minutes[self.rows[origin] * len(self.positions) + self.rows[destination]]
+
+
+def trigrams(text: str, padded: bool = True) -> set:
+    """Get the character trigrams of normalised text, padded at word boundaries by default"""
+    if padded:
+        text = f"  {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """Character-trigram postings over distinct terms, for substring and typo-tolerant lookup"""
+
+    __slots__ = ("terms", "keys", "postings")
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms: List[str] = []
+        self.keys: List[str] = []
+        seen = set()
+        for term in terms:
+            key = normalize_text(term)
+            if key and key not in seen:
+                seen.add(key)
+                self.terms.append(term)
+                self.keys.append(key)
+
+        postings: Dict[str, List[int]] = {}
+        for term_id, key in enumerate(self.keys):
+            for trigram in trigrams(key):
+                postings.setdefault(trigram, []).append(term_id)
+        self.postings = {trigram: array("I", term_ids) for trigram, term_ids in postings.items()}
+
+    def containing_ids(self, query: str) -> List[int]:
+        """Get IDs (in insertion order of distinct terms) of terms containing the query as a substring"""
+        key = normalize_text(query)
+        query_trigrams = trigrams(key, padded=False)
+        if not query_trigrams:
+            return [term_id for term_id, term_key in enumerate(self.keys) if key in term_key]
+
+        postings = sorted((self.postings.get(trigram, ()) for trigram in query_trigrams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+        return [term_id for term_id in sorted(candidates) if key in self.keys[term_id]]
+
+    def containing(self, query: str) -> List[str]:
+        """Get terms containing the query as a substring, narrowed by trigram postings"""
+        return [self.terms[term_id] for term_id in self.containing_ids(query)]
+
+    def lookup(self, query: str, limit: int = 5, threshold: float = FUZZY_MATCH_THRESHOLD) -> List[Tuple[str, float]]:
+        """Get the most similar terms scoring at least `threshold`, best first.
+
+        Candidates sharing the most trigrams with the query are re-scored by the better of
+        trigram (Jaccard) similarity and edit similarity, so transpositions such as
+        "Itlay" still match "Italy".
+        """
+        key = normalize_text(query)
+        query_trigrams = trigrams(key)
+        shared: Dict[int, int] = {}
+        for trigram in query_trigrams:
+            for term_id in self.postings.get(trigram, ()):
+                shared[term_id] = shared.get(term_id, 0) + 1
+
+        best = sorted(shared.items(), key=lambda item: item[1], reverse=True)[:FUZZY_CANDIDATES]
+        scored = []
+        for term_id, count in best:
+            term_key = self.keys[term_id]
+            jaccard = count / (len(query_trigrams) + len(trigrams(term_key)) - count)
+            score = max(jaccard, edit_similarity(key, term_key))
+            if score >= threshold:
+                scored.append((self.terms[term_id], round(score, 3)))
+
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:limit]
+
+
+class PrefixIndex:
+    """Sorted keys searched by bisection for prefix completion, ranked by rating.
+
+    Every word start of a suggestion is a key, so "tow" completes "Eiffel Tower". The top
+    suggestions for the shortest (most common) prefixes are precomputed at build time.
+    """
+
+    __slots__ = ("suggestions", "keys", "suggestion_ids", "top")
+
+    def __init__(self, suggestions: Iterable[Suggestion]):
+        self.suggestions: List[Suggestion] = list(suggestions)
+
+        pairs = []
+        for suggestion_id, suggestion in enumerate(self.suggestions):
+            words = normalize_text(suggestion.text).split()
+            pairs.extend((" ".join(words[i:]), suggestion_id) for i in range(len(words)))
+        pairs.sort()
+        self.keys = [key for key, _ in pairs]
+        self.suggestion_ids = array("I", (suggestion_id for _, suggestion_id in pairs))
+
+        by_prefix: Dict[str, set] = {}
+        for key, suggestion_id in pairs:
+            for length in range(1, min(len(key), AUTOCOMPLETE_PRECOMPUTED_PREFIX) + 1):
+                by_prefix.setdefault(key[:length], set()).add(suggestion_id)
+        self.top = {
+            prefix: self._best(suggestion_ids, AUTOCOMPLETE_MAX_LIMIT)
+            for prefix, suggestion_ids in by_prefix.items()
+        }
+
+    def _best(self, suggestion_ids: Iterable[int], limit: int) -> List[int]:
+        return heapq.nlargest(limit, suggestion_ids, key=lambda i: (self.suggestions[i].rating or 0, -i))
+
+    def complete(self, prefix: str, limit: int = AUTOCOMPLETE_MAX_LIMIT) -> List[Suggestion]:
+        """Get the highest-rated suggestions with a word starting with the prefix"""
+        key = normalize_text(prefix)
+        if not key:
+            return []
+
+        if key in self.top:
+            suggestion_ids = self.top[key][:limit]
+        else:
+            start = bisect_left(self.keys, key)
+            end = bisect_left(self.keys, key + "\uffff", start)
+            suggestion_ids = self._best(set(self.suggestion_ids[start:end]), limit)
+        return [self.suggestions[i] for i in suggestion_ids]
+
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def distances_km(latitude: float, longitude: float, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Great-circle distances in kilometres from one point to arrays of coordinates"""
+    phi1, phi2 = math.radians(latitude), np.radians(latitudes)
+    d_phi = phi2 - phi1
+    d_lambda = np.radians(longitudes - longitude)
+    a = np.sin(d_phi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class GeoGridIndex:
+    """Attractions bucketed into latitude/longitude grid cells, for radius queries.
+
+    Positions are sorted by cell code (latitude row major), so the cells of one latitude row
+    inside a bounding box are a contiguous run found by bisection. Candidates from the
+    covering cells are then checked with exact great-circle distances.
+    """
+
+    __slots__ = ("latitudes", "longitudes", "cell_degrees", "row_cells", "codes", "positions")
+
+    def __init__(self, latitudes: np.ndarray, longitudes: np.ndarray, cell_degrees: float = GEO_CELL_DEGREES):
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+        self.cell_degrees = cell_degrees
+        self.row_cells = math.ceil(360 / cell_degrees)
+        located = np.flatnonzero(~(np.isnan(latitudes) | np.isnan(longitudes)))
+        codes = self._cell_row(latitudes[located]) * self.row_cells + self._cell_column(longitudes[located])
+        order = np.argsort(codes, kind="stable")
+        self.codes = codes[order]
+        self.positions = located[order]
+
+    def _cell_row(self, latitudes: np.ndarray) -> np.ndarray:
+        return np.floor((np.clip(latitudes, -90, 90) + 90) / self.cell_degrees).astype(np.int64)
+
+    def _cell_column(self, longitudes: np.ndarray) -> np.ndarray:
+        return np.floor(((longitudes + 180) % 360) / self.cell_degrees).astype(np.int64) % self.row_cells
+
+    def _column_ranges(self, longitude: float, degrees: float) -> List[Tuple[int, int]]:
+        """Inclusive cell column ranges covering longitude ± degrees, split at the antimeridian"""
+        if degrees >= 180:
+            return [(0, self.row_cells - 1)]
+        first = int(self._cell_column(np.array([longitude - degrees]))[0])
+        last = int(self._cell_column(np.array([longitude + degrees]))[0])
+        if first <= last:
+            return [(first, last)]
+        return [(first, self.row_cells - 1), (0, last)]
+
+    def within(self, latitude: float, longitude: float, radius_km: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Get positions within a radius of a point, and their distances in kilometres"""
+        latitude_degrees = radius_km / KM_PER_DEGREE
+        south, north = max(latitude - latitude_degrees, -90.0), min(latitude + latitude_degrees, 90.0)
+        widest = math.cos(math.radians(max(abs(south), abs(north))))
+        longitude_degrees = 180.0 if widest < 1e-6 else radius_km / (KM_PER_DEGREE * widest)
+        column_ranges = self._column_ranges(longitude, longitude_degrees)
+
+        chunks = []
+        rows = self._cell_row(np.array([south, north]))
+        for row in range(int(rows[0]), int(rows[1]) + 1):
+            for first, last in column_ranges:
+                start = np.searchsorted(self.codes, row * self.row_cells + first, side="left")
+                end = np.searchsorted(self.codes, row * self.row_cells + last, side="right")
+                chunks.append(self.positions[start:end])
+        candidates = np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+
+        distances = distances_km(latitude, longitude, self.latitudes[candidates], self.longitudes[candidates])
+        inside = distances <= radius_km
+        return candidates[inside], distances[inside]
+
+
+def tokens(text: str) -> List[str]:
+    """Lowercase, accent-free word tokens without stopwords"""
+    return [token for token in re.findall(r"[a-z0-9]+", normalize_text(text)) if token not in SIMILARITY_STOPWORDS]
+
+
+def token_features(texts: Iterable[Iterable[str]], dimensions: int = SIMILARITY_TOKEN_DIMENSIONS) -> np.ndarray:
+    """Hash each row's tokens into a fixed number of count features (stable across processes)"""
+    rows: List[int] = []
+    columns: List[int] = []
+    buckets: Dict[str, int] = {}
+    count = 0
+    for row, row_texts in enumerate(texts):
+        count += 1
+        for text in row_texts:
+            for token in tokens(text):
+                bucket = buckets.get(token)
+                if bucket is None:
+                    bucket = buckets[token] = zlib.crc32(token.encode("utf-8")) % dimensions
+                rows.append(row)
+                columns.append(bucket)
+    features = np.zeros((count, dimensions), dtype=np.float32)
+    np.add.at(features, (np.array(rows, dtype=np.int64), np.array(columns, dtype=np.int64)), 1.0)
+    return features
+
+
+def one_hot(codes: np.ndarray, size: int) -> np.ndarray:
+    """One-hot rows for integer codes; negative codes give all-zero rows"""
+    features = np.zeros((len(codes), size), dtype=np.float32)
+    known = np.flatnonzero(codes >= 0)
+    features[known, codes[known]] = 1.0
+    return features
+
+
+def unit_sphere(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Coordinates as 3D unit vectors, whose dot product is the cosine of the angle between them; missing ones are zero"""
+    phi, lam = np.radians(latitudes), np.radians(longitudes)
+    features = np.stack([np.cos(phi) * np.cos(lam), np.cos(phi) * np.sin(lam), np.sin(phi)], axis=1)
+    return np.nan_to_num(features, nan=0.0).astype(np.float32)
+
+
+class SimilarityIndex:
+    """Per-attraction feature vectors in one contiguous matrix, queried for the top-k most similar rows.
+
+    Each feature block is L2-normalised per row and scaled by the square root of its weight,
+    so the dot product of two rows is the weighted sum of per-block cosine similarities.
+    Rows missing a block (no coordinates, unknown price) simply get no score from it.
+    """
+
+    __slots__ = ("matrix",)
+
+    def __init__(self, blocks: Dict[str, np.ndarray], weights: Dict[str, float]):
+        scaled = []
+        for name, block in blocks.items():
+            norms = np.linalg.norm(block, axis=1, keepdims=True)
+            np.divide(block, norms, out=block, where=norms > 0)
+            scaled.append(block * np.float32(math.sqrt(weights[name])))
+        self.matrix = np.ascontiguousarray(np.hstack(scaled), dtype=np.float32)
+
+    def top_k(self, position: int, k: int, candidates: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the k positions most similar to one row (itself excluded) and their scores, best first"""
+        query = self.matrix[position]
+        if candidates is None:
+            scores = self.matrix @ query
+            scores[position] = -np.inf
+            available = len(scores) - 1
+        else:
+            candidates = candidates[candidates != position]
+            scores = self.matrix[candidates] @ query
+            available = len(candidates)
+
+        k = min(k, available)
+        if k < 1:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        best = np.argpartition(-scores, k - 1)[:k]
+        chosen = best if candidates is None else candidates[best]
+        # Best first, ties broken by catalogue position
+        order = np.lexsort((chosen, -scores[best]))
+        return chosen[order], scores[best][order]
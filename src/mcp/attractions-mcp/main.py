@@ -8,41 +8,98 @@ Uses World Tourist Attractions API to provide information about tourist attracti
 and booking capabilities.
 """
 
-from typing import Dict, Any, Optional
+import json
+import os
+from typing import Dict, Any, Optional, List
+
+import uvicorn
 from mcp.server.fastmcp import FastMCP
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from mcp_common.admission import get_admission_controller, register_server
+from mcp_common.encoding import configure_encoder, encoded
+from mcp_common.profiling import configure_instrumentation
 
 from attractions_service import (
     get_attraction_details_data,
     search_attractions_data, 
+    find_open_attractions_data,
+    plan_day_data,
+    autocomplete_attractions_data,
+    get_similar_attractions_data,
     get_random_attraction_data,
     get_world_wonders_data,
     book_attraction_data,
+    book_attractions_batch_data,
+    get_booking_data,
+    get_availability_data,
+    list_bookings_data,
+    cancel_booking_data,
+    get_delivery_status_data,
     get_attraction_categories_data,
     format_attraction_resource,
+    format_attractions_resource,
+    get_catalogue_version_data,
     get_booking_summary_prompt,
-    format_search_results
+    format_search_results,
+    format_autocomplete_results
+)
+from config import (
+    ATTRACTIONS_SHARD_HOST, ATTRACTIONS_SHARD_PORT, SERVER_NAME, SERVER_HOST, SERVER_PORT, SERVER_WORKERS,
+    SERVER_STATELESS, SERVER_JSON_RESPONSE, SERVER_DRAIN_SECONDS, ADMISSION_MAX_CONCURRENT, ADMISSION_MAX_QUEUE,
+    ADMISSION_DEADLINE_SECONDS, ADMISSION_TOOL_LIMITS, ADMISSION_TOOL_DEADLINES, ADMISSION_EWMA_WEIGHT,
+    PROFILE_SAMPLE_RATE, PROFILE_ON_REQUEST, PROFILE_DIR, TRACE_FILE, TRACE_SERVICE_NAME, JSON_ENCODER
 )
+from catalogue import get_catalogue
+from outbox import get_outbox_dispatcher
+from shard_server import ShardApi, serve
 
-mcp = FastMCP("Attractions", port=8008)
+# Admission control, profiling and the JSON encoder are shared by every server in the process; when
+# the gateway mounts this server its own settings are already in place, and these only add our limits
+admission = register_server(
+    SERVER_NAME, ADMISSION_MAX_CONCURRENT, ADMISSION_MAX_QUEUE, ADMISSION_DEADLINE_SECONDS, ADMISSION_TOOL_LIMITS,
+    ADMISSION_TOOL_DEADLINES, ADMISSION_EWMA_WEIGHT
+)
+configure_instrumentation(TRACE_SERVICE_NAME, TRACE_FILE, PROFILE_SAMPLE_RATE, PROFILE_ON_REQUEST, PROFILE_DIR)
+configure_encoder(JSON_ENCODER)
+
+mcp = FastMCP(
+    "Attractions",
+    host=SERVER_HOST,
+    port=SERVER_PORT,
+    stateless_http=SERVER_STATELESS,
+    json_response=SERVER_JSON_RESPONSE
+)
 
 # tools
 @mcp.tool()
-def get_attraction_details(attraction_id: int) -> Dict[str, Any]:
+@encoded
+@admission.admitted
+def get_attraction_details(attraction_id: int, fields: Optional[str] = None) -> Dict[str, Any]:
     """Get detailed information about a specific tourist attraction
     
     Args:
         attraction_id: Unique ID of the attraction
+        fields: Optional comma-separated attraction fields to return, to keep the response small - "name", "description", "category", "location", "rating", "image_url", "website", "opening_hours", "entry_fee", "price", "hours" (default: all)
         
     Returns:
         AttractionDetails object as dictionary with attraction info, facilities, and visiting tips
     """
-    return get_attraction_details_data(attraction_id)
+    return get_attraction_details_data(attraction_id, fields)
 
 @mcp.tool()
+@encoded
+@admission.admitted
 def search_attractions(
     location: Optional[str] = None, 
     category: Optional[str] = None, 
-    limit: int = 20
+    limit: int = 20,
+    rating_min: Optional[float] = None,
+    max_price: Optional[float] = None,
+    free_entry: Optional[bool] = None,
+    fields: Optional[str] = None,
+    max_bytes: Optional[int] = None
 ) -> Dict[str, Any]:
     """Search for tourist attractions with optional filters
     
@@ -50,25 +107,128 @@ def search_attractions(
         location: Location to search in (e.g., "Paris", "India", "Italy")
         category: Category filter - "historical", "natural", "cultural", "religious", "modern", "museums", "parks", "beaches", "mountains", "architecture", "entertainment", "adventure"
         limit: Maximum number of results (1-100, default: 20)
+        rating_min: Optional minimum rating (0-5)
+        max_price: Optional maximum lowest ticket price in USD (converted at approximate rates)
+        free_entry: Optional - True for free attractions only, False for paid attractions only
+        fields: Optional comma-separated attraction fields to return (e.g., "name,rating,price"); the id is always included (default: all)
+        max_bytes: Optional size limit for the response (roughly 4 bytes per token); descriptions are shortened and the lowest ranked results dropped to fit, and "truncated" is set
         
     Returns:
         AttractionsList object as dictionary with matching attractions
     """
-    return search_attractions_data(location, category, limit)
+    return search_attractions_data(location, category, limit, rating_min, max_price, free_entry, fields, max_bytes)
+
+@mcp.tool()
+@encoded
+@admission.admitted
+def find_open_attractions(
+    location: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: int = 20,
+    fields: Optional[str] = None,
+    max_bytes: Optional[int] = None
+) -> Dict[str, Any]:
+    """Find tourist attractions that are open at a given local time, or for a whole time window
+    
+    Args:
+        location: Location to search in (e.g., "Paris", "India", "Italy")
+        start: Local date and time in ISO format (e.g., "2025-09-20T14:30")
+        end: Optional end of the visit window in ISO format (e.g., "2025-09-20T17:00")
+        category: Optional category filter (e.g., "historical", "museums")
+        limit: Maximum number of results (1-100, default: 20)
+        fields: Optional comma-separated attraction fields to return (e.g., "name,hours"); the id is always included (default: all)
+        max_bytes: Optional size limit for the response (roughly 4 bytes per token); descriptions are shortened and the lowest ranked results dropped to fit
+        
+    Returns:
+        AttractionsList object as dictionary with attractions open for the requested time
+    """
+    return find_open_attractions_data(location, start, end, category, limit, fields, max_bytes)
+
+@mcp.tool()
+@encoded
+@admission.admitted
+def plan_day(
+    location: str,
+    date: str,
+    preferences: Optional[str] = None,
+    start_time: str = "09:00",
+    max_stops: int = 5,
+    budget: Optional[float] = None
+) -> Dict[str, Any]:
+    """Plan a one-day itinerary: choose and order attractions that are open, fit the day and the budget
+    
+    Args:
+        location: City to plan around (e.g., "Paris", "Rome")
+        date: Visit date in YYYY-MM-DD format
+        preferences: Optional comma-separated interests or categories (e.g., "museums, art, parks")
+        start_time: Time to start the day in HH:MM format (default: "09:00")
+        max_stops: Maximum number of attractions to visit (1-8, default: 5)
+        budget: Optional maximum total entry cost per person, in USD
+        
+    Returns:
+        DayPlan object as dictionary with a timed schedule of stops, travel times and costs
+    """
+    return plan_day_data(location, date, preferences, start_time, max_stops, budget)
 
 @mcp.tool()
-def get_random_attraction(region: str = "famous") -> Dict[str, Any]:
+@encoded
+@admission.admitted
+def autocomplete_attractions(prefix: str, limit: int = 10) -> Dict[str, Any]:
+    """Suggest attraction, city, country and region names as the user types
+    
+    Args:
+        prefix: Start of a name (e.g., "Eif", "Par", "tow")
+        limit: Maximum number of suggestions (1-20, default: 10)
+        
+    Returns:
+        AutocompleteResults object as dictionary with suggestions ranked by rating
+    """
+    return autocomplete_attractions_data(prefix, limit)
+
+@mcp.tool()
+@encoded
+@admission.admitted
+def get_similar_attractions(
+    attraction_id: int,
+    k: int = 5,
+    within_km: Optional[float] = None,
+    fields: Optional[str] = None,
+    max_bytes: Optional[int] = None
+) -> Dict[str, Any]:
+    """Find alternatives to an attraction - similar category, themes, rating, price and location
+    
+    Args:
+        attraction_id: ID of the attraction to find alternatives for (e.g., when it is full or closed)
+        k: Number of similar attractions to return (1-20, default: 5)
+        within_km: Optional radius in kilometres around the attraction to stay within
+        fields: Optional comma-separated attraction fields to return (e.g., "name,location"); the id is always included (default: all)
+        max_bytes: Optional size limit for the response (roughly 4 bytes per token); descriptions are shortened and the least similar results dropped to fit
+        
+    Returns:
+        SimilarAttractions object as dictionary with attractions ranked by similarity
+    """
+    return get_similar_attractions_data(attraction_id, k, within_km, fields, max_bytes)
+
+@mcp.tool()
+@encoded
+@admission.admitted
+def get_random_attraction(region: str = "famous", fields: Optional[str] = None) -> Dict[str, Any]:
     """Get a random tourist attraction for inspiration
     
     Args:
         region: Region type - "famous" for world famous attractions, "india" for Indian attractions
+        fields: Optional comma-separated attraction fields to return (e.g., "name,description"); the id is always included (default: all)
         
     Returns:
         Attraction object as dictionary with random attraction details
     """
-    return get_random_attraction_data(region)
+    return get_random_attraction_data(region, fields)
 
 @mcp.tool()
+@encoded
+@admission.admitted
 def book_attraction(
     attraction_id: int,
     visitor_name: str,
@@ -76,7 +236,9 @@ def book_attraction(
     visit_date: str,
     num_visitors: int = 1,
     phone: Optional[str] = None,
-    special_requirements: Optional[str] = None
+    special_requirements: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
+    time_slot: Optional[str] = None
 ) -> Dict[str, Any]:
     """Book a visit to a tourist attraction
     
@@ -88,16 +250,124 @@ def book_attraction(
         num_visitors: Number of visitors (1-50, default: 1)
         phone: Optional phone number
         special_requirements: Optional special requirements or requests
+        idempotency_key: Optional unique key for this booking; retrying with the same key never books twice
+        time_slot: Optional entry time slot in HH:MM format (see get_availability); defaults to the earliest with room
         
     Returns:
         BookingResponse object as dictionary with booking confirmation details
     """
     return book_attraction_data(
         attraction_id, visitor_name, email, visit_date, 
-        num_visitors, phone, special_requirements
+        num_visitors, phone, special_requirements, idempotency_key, time_slot
     )
 
 @mcp.tool()
+@encoded
+@admission.admitted
+def book_attractions_batch(
+    items: List[Dict[str, Any]],
+    visitor_name: str,
+    email: str,
+    phone: Optional[str] = None,
+    idempotency_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """Book several attraction visits (e.g. every stop of an itinerary) in one call, all or nothing
+    
+    Either every item is booked or none is: if any item is invalid or full, nothing is reserved
+    and the per-item results say which item failed and why.
+    
+    Args:
+        items: Up to 20 bookings, each {"attraction_id": int, "visit_date": "YYYY-MM-DD"} with optional
+            "num_visitors", "time_slot" (HH:MM), "special_requirements" and "idempotency_key"
+        visitor_name: Name of the primary visitor for every booking
+        email: Email address for booking confirmation
+        phone: Optional phone number
+        idempotency_key: Optional unique key for the whole batch; retrying with the same key never books twice
+        
+    Returns:
+        BatchBookingResponse object as dictionary with overall status and per-item results
+    """
+    return book_attractions_batch_data(items, visitor_name, email, phone, idempotency_key)
+
+@mcp.tool()
+@encoded
+@admission.admitted
+def get_availability(attraction_id: int, start_date: str, end_date: Optional[str] = None) -> Dict[str, Any]:
+    """Check remaining capacity for an attraction per day and entry time slot
+    
+    Args:
+        attraction_id: ID of the attraction
+        start_date: First date in YYYY-MM-DD format
+        end_date: Optional last date in YYYY-MM-DD format (up to 31 days; default: start_date only)
+        
+    Returns:
+        Availability object as dictionary with capacity, reserved and available visitors per day and slot
+    """
+    return get_availability_data(attraction_id, start_date, end_date)
+
+@mcp.tool()
+@encoded
+@admission.admitted
+def get_booking(booking_id: str) -> Dict[str, Any]:
+    """Get the details and status of an existing booking
+    
+    Args:
+        booking_id: Booking ID returned by book_attraction
+        
+    Returns:
+        BookingResponse object as dictionary
+    """
+    return get_booking_data(booking_id)
+
+@mcp.tool()
+@encoded
+@admission.admitted
+def list_bookings(email: str, status: Optional[str] = None, limit: int = 20) -> Dict[str, Any]:
+    """List bookings made with an email address, newest first
+    
+    Args:
+        email: Email address used when booking
+        status: Optional status filter - "confirmed" or "cancelled"
+        limit: Maximum number of bookings (1-100, default: 20)
+        
+    Returns:
+        BookingsList object as dictionary with matching bookings
+    """
+    return list_bookings_data(email, status, limit)
+
+@mcp.tool()
+@encoded
+@admission.admitted
+def cancel_booking(booking_id: str, email: str) -> Dict[str, Any]:
+    """Cancel an existing booking
+    
+    Args:
+        booking_id: Booking ID to cancel
+        email: Email address the booking was made with
+        
+    Returns:
+        BookingResponse object as dictionary with the cancelled booking
+    """
+    return cancel_booking_data(booking_id, email)
+
+@mcp.tool()
+@encoded
+@admission.admitted
+def get_delivery_status(booking_id: Optional[str] = None, retry_dead: bool = False) -> Dict[str, Any]:
+    """Check whether a booking's confirmation email, partner notification and audit entry were delivered
+    
+    Args:
+        booking_id: Optional booking ID; omit for counts across all bookings plus recent failures
+        retry_dead: Retry deliveries that failed permanently (default: False)
+        
+    Returns:
+        DeliveryStatus object as dictionary with per-sink status, attempts and last error
+    """
+    return get_delivery_status_data(booking_id, retry_dead)
+
+@mcp.tool()
+@encoded
+@admission.admitted
 def search_and_format_attractions(
     location: Optional[str] = None,
     category: Optional[str] = None,
@@ -128,26 +398,33 @@ def get_attraction_resource(attraction_id: int) -> str:
 @mcp.resource("attractions://search/{location}")
 def get_attractions_by_location_resource(location: str) -> str:
     """Get attractions for a location as a formatted resource"""
-    search_data = search_attractions_data(location=location, limit=10)
-    return format_search_results(search_data)
+    return format_attractions_resource(location=location)
 
 @mcp.resource("attractions://category/{category}")
 def get_attractions_by_category_resource(category: str) -> str:
     """Get attractions by category as a formatted resource"""
-    search_data = search_attractions_data(category=category, limit=10)
-    return format_search_results(search_data)
+    return format_attractions_resource(category=category)
 
 @mcp.resource("attractions://category")
 def get_attractions() -> str:
     """Get 10 attractions by formatted resource"""
-    search_data = search_attractions_data(limit=10)
-    return format_search_results(search_data)
+    return format_attractions_resource()
+
+@mcp.resource("attractions://autocomplete/{prefix}")
+def get_autocomplete_resource(prefix: str) -> str:
+    """Get name suggestions for a prefix as a formatted resource"""
+    return format_autocomplete_results(autocomplete_attractions_data(prefix))
 
 @mcp.resource("attractions://categories")
 def get_attraction_categories_resource() -> str:
     """Get list of available attraction categories as a formatted resource"""
     return get_attraction_categories_data()
 
+@mcp.resource("attractions://version")
+def get_catalogue_version_resource() -> str:
+    """Get the catalogue version; memoised resources end with it, so clients can skip unchanged content"""
+    return json.dumps(get_catalogue_version_data())
+
 @mcp.resource("attractions://wonders")
 def get_world_wonders_resource() -> str:
     """Get list of the Wonders of the World attractions as a formatted resource"""
@@ -188,5 +465,41 @@ def attraction_comparison_prompt(attraction_ids: str) -> str:
 
 Help decide which attractions to prioritize based on time, budget, and interests."""
 
+# health check and metrics, for load balancers, monitoring and replica harnesses
+@mcp.custom_route("/healthz", methods=["GET"])
+async def healthz(request: Request) -> JSONResponse:
+    """Report that this worker is serving, with its process and catalogue version"""
+    return JSONResponse({
+        "status": "ok",
+        "pid": os.getpid(),
+        "stateless": SERVER_STATELESS,
+        "catalogue_version": get_catalogue().version
+    })
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> JSONResponse:
+    """Report this worker's tool concurrency, queue depth and shed counts"""
+    return JSONResponse(dict(get_admission_controller().stats(), pid=os.getpid()))
+
+def create_app() -> Starlette:
+    """Build the streamable HTTP app; each uvicorn worker imports this module and calls it"""
+    # Load the catalogue before the worker accepts requests rather than on the first one
+    get_catalogue()
+    # Deliver booking side-effects from this worker's outbox in the background
+    get_outbox_dispatcher()
+    return mcp.streamable_http_app()
+
 if __name__ == "__main__":
-    mcp.run(transport="streamable-http")
\ No newline at end of file
+    if ATTRACTIONS_SHARD_PORT:
+        # Serve this instance's catalogue shards to routing instances alongside the MCP endpoint
+        serve(ShardApi(), ATTRACTIONS_SHARD_HOST, ATTRACTIONS_SHARD_PORT)
+    # Workers import the app by name; on SIGTERM uvicorn stops accepting connections and lets
+    # in-flight requests finish, and SIGHUP restarts workers one at a time
+    uvicorn.run(
+        "main:create_app" if SERVER_WORKERS > 1 else create_app(),
+        factory=SERVER_WORKERS > 1,
+        host=SERVER_HOST,
+        port=SERVER_PORT,
+        workers=SERVER_WORKERS,
+        timeout_graceful_shutdown=SERVER_DRAIN_SECONDS
+    )
\ No newline at end of file
@@ -3,16 +3,17 @@ Tourist attractions data models - Data classes for attractions objects.
 """
 
 from dataclasses import dataclass
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple, Dict
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Coordinates:
     lat: float
     lon: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Location:
     city: str
     country: str
@@ -20,7 +21,32 @@ class Location:
     coordinates: Optional[Coordinates] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class Price:
+    currency: Optional[str] = None
+    min_amount: float = 0.0
+    max_amount: float = 0.0
+    min_usd: Optional[float] = None
+    max_usd: Optional[float] = None
+    is_free: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class OpeningHours:
+    # Sorted, non-overlapping (start, end) minute offsets from Monday 00:00;
+    # overnight hours on Sunday may end past the end of the week
+    intervals: Tuple[Tuple[int, int], ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class DayHours:
+    day: str
+    open: str
+    close: str
+
+
+# Built once per attraction at catalogue load and shared between responses
+@dataclass(frozen=True, slots=True)
 class Attraction:
     id: int
     name: str
@@ -32,6 +58,8 @@ class Attraction:
     website: Optional[str] = None
     opening_hours: Optional[str] = None
     entry_fee: Optional[str] = None
+    price: Optional[Price] = None
+    hours: Optional[List[DayHours]] = None
 
 
 @dataclass
@@ -52,6 +80,8 @@ class BookingRequest:
     num_visitors: int = 1
     phone: Optional[str] = None
     special_requirements: Optional[str] = None
+    idempotency_key: Optional[str] = None
+    time_slot: Optional[str] = None
 
 
 @dataclass
@@ -62,8 +92,85 @@ class BookingResponse:
     visit_date: str
     num_visitors: int
     total_cost: Optional[float] = None
+    total_cost_max: Optional[float] = None
+    currency: Optional[str] = None
     booking_status: str = "confirmed"
     confirmation_code: Optional[str] = None
+    time_slot: Optional[str] = None
+    email: Optional[str] = None
+    idempotency_key: Optional[str] = None
+    created_at: Optional[str] = None
+    cancelled_at: Optional[str] = None
+    replayed: bool = False  # True when an idempotency key matched an earlier booking
+
+
+@dataclass
+class BatchBookingItem:
+    index: int
+    attraction_id: Optional[int] = None
+    status: str = "pending"  # "confirmed", "failed" or "not_booked"
+    booking: Optional[BookingResponse] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchBookingResponse:
+    status: str  # "confirmed" when every item was booked, otherwise "rejected"
+    total_items: int
+    booked: int = 0
+    results: List[BatchBookingItem] = None
+
+
+@dataclass
+class OutboxDelivery:
+    event_id: int
+    booking_id: str
+    event: str  # "booking.confirmed" or "booking.cancelled"
+    sink: str
+    status: str  # "pending", "delivered" or "dead"
+    attempts: int = 0
+    last_error: Optional[str] = None
+    created_at: Optional[str] = None
+    delivered_at: Optional[str] = None
+
+
+@dataclass
+class DeliveryStatus:
+    booking_id: Optional[str] = None
+    counts: Dict[str, int] = None  # deliveries per status
+    deliveries: List[OutboxDelivery] = None
+
+
+@dataclass
+class TimeSlot:
+    start: str
+    end: str
+    capacity: int
+    reserved: int = 0
+    available: int = 0
+
+
+@dataclass
+class DayAvailability:
+    date: str
+    capacity: int
+    reserved: int = 0
+    available: int = 0
+    slots: List[TimeSlot] = None
+
+
+@dataclass
+class Availability:
+    attraction_id: int
+    name: str
+    days: List[DayAvailability] = None
+
+
+@dataclass
+class BookingsList:
+    email: str
+    total_count: int = 0
+    bookings: List[BookingResponse] = None
 
 
 @dataclass
@@ -72,11 +179,75 @@ class AttractionsList:
     location: Optional[str] = None
     total_count: int = 0
     attractions: List[Attraction] = None
+    corrected_location: Optional[str] = None
+    truncated: bool = False  # descriptions or results were cut to fit a size budget
+    total_is_estimate: bool = False  # total_count includes upstream matches that were not checked
+
+
+@dataclass
+class Suggestion:
+    text: str
+    kind: str  # "attraction", "city", "country" or "region"
+    attraction_id: Optional[int] = None
+    rating: Optional[float] = None
+
+
+@dataclass
+class AutocompleteResults:
+    prefix: str
+    suggestions: List[Suggestion] = None
+
+
+@dataclass
+class SimilarAttraction:
+    attraction: Attraction
+    similarity: float  # cosine similarity of feature vectors, -1 to 1
+    distance_km: Optional[float] = None
+
+
+@dataclass
+class SimilarAttractions:
+    attraction_id: int
+    name: str
+    within_km: Optional[float] = None
+    total_count: int = 0
+    attractions: List[SimilarAttraction] = None
+    truncated: bool = False  # descriptions or results were cut to fit a size budget
+
+
+@dataclass
+class PlannedStop:
+    order: int
+    attraction_id: int
+    name: str
+    category: str
+    arrival: str
+    start: str
+    end: str
+    visit_minutes: int
+    travel_minutes: int = 0
+    estimated_cost_usd: Optional[float] = None
+
+
+@dataclass
+class DayPlan:
+    location: str
+    date: str
+    start_time: str
+    end_time: Optional[str] = None
+    total_travel_minutes: int = 0
+    total_cost_usd: float = 0.0
+    stops: List[PlannedStop] = None
+    notes: List[str] = None
 
 
 @dataclass
 class SearchFilters:
     location: Optional[str] = None
+    name: Optional[str] = None
     category: Optional[str] = None
     rating_min: Optional[float] = None
+    max_price: Optional[float] = None
     free_entry: Optional[bool] = None
+    open_at: Optional[datetime] = None
+    open_until: Optional[datetime] = None
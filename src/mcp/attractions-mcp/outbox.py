@@ -0,0 +1,149 @@
+"""
+Outbox dispatcher - Delivers booking side-effects from the outbox table with a bounded worker pool.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Callable
+
+from config import (
+    OUTBOX_SINKS, OUTBOX_WORKERS, OUTBOX_POLL_SECONDS, OUTBOX_SINK_DIR,
+    OUTBOX_SINK_LATENCY_SECONDS, OUTBOX_SINK_FAILURE_RATE
+)
+from bookings import BookingStore, get_booking_store, utc_now
+
+# A sink receives (event, booking payload) and raises to have the delivery retried
+Sink = Callable[[str, Dict[str, Any]], None]
+
+
+class LocalSink:
+    """Stand-in for a downstream service: appends deliveries to a JSON Lines file.
+
+    Latency and a failure rate can be injected to exercise retries and dead-lettering.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        directory: str = OUTBOX_SINK_DIR,
+        latency_seconds: float = OUTBOX_SINK_LATENCY_SECONDS,
+        failure_rate: float = OUTBOX_SINK_FAILURE_RATE
+    ):
+        self.name = name
+        self.path = os.path.join(directory, f"{name}.jsonl")
+        self.latency_seconds = latency_seconds
+        self.failure_rate = failure_rate
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def __call__(self, event: str, payload: Dict[str, Any]) -> None:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise ConnectionError(f"{self.name} unavailable (simulated)")
+        line = json.dumps({"event": event, "delivered_at": utc_now(), "booking": payload})
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class OutboxDispatcher:
+    """Claims due outbox events and delivers them to their sinks on a bounded worker pool.
+
+    Delivery is at least once: an event is leased when claimed and becomes due again if the
+    process dies before settling it. Failed deliveries back off exponentially and are
+    dead-lettered after the maximum number of attempts. Commits that add events wake the
+    dispatcher straight away; otherwise it polls for retries that have come due.
+    """
+
+    def __init__(self, store: BookingStore, sinks: Dict[str, Sink], workers: int = OUTBOX_WORKERS):
+        self.store = store
+        self.sinks = sinks
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="outbox-worker")
+        # Never claim more events than there are workers to take them
+        self._slots = threading.BoundedSemaphore(workers)
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="outbox-dispatcher", daemon=True)
+
+    def start(self) -> "OutboxDispatcher":
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop claiming events and wait for in-flight deliveries to finish"""
+        self._stopping.set()
+        self.store.outbox_ready.set()
+        self._thread.join(timeout)
+        self._executor.shutdown(wait=True)
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self.store.outbox_ready.wait(OUTBOX_POLL_SECONDS)
+            self.store.outbox_ready.clear()
+            try:
+                while self._dispatch_due():
+                    pass
+            except Exception:
+                # The ledger is busy or failing; leased events are retried once their lease expires
+                time.sleep(OUTBOX_POLL_SECONDS)
+
+    def _dispatch_due(self) -> bool:
+        """Hand due events to free workers; returns whether any were claimed"""
+        self._slots.acquire()
+        free = 1
+        while free < self.workers and self._slots.acquire(blocking=False):
+            free += 1
+
+        try:
+            events = self.store.claim_events(free)
+        except Exception:
+            for _ in range(free):
+                self._slots.release()
+            raise
+
+        for _ in range(free - len(events)):
+            self._slots.release()
+        for event in events:
+            self._executor.submit(self._deliver, event)
+        return bool(events)
+
+    def _deliver(self, event) -> None:
+        error = None
+        try:
+            sink = self.sinks.get(event["sink"])
+            if sink is None:
+                raise LookupError(f"No sink registered for {event['sink']}")
+            sink(event["event"], json.loads(event["payload"]))
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            self._slots.release()
+
+        try:
+            self.store.settle_event(event["event_id"], event["attempts"], error)
+        except Exception:
+            pass  # unsettled: redelivered when the lease expires
+
+
+_dispatcher: Optional[OutboxDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_outbox_dispatcher() -> OutboxDispatcher:
+    """Get the outbox dispatcher, starting it with local sinks on first use"""
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                sinks: Dict[str, Sink] = {name: LocalSink(name) for name in OUTBOX_SINKS}
+                _dispatcher = OutboxDispatcher(get_booking_store(), sinks).start()
+    return _dispatcher
+
+
+def register_sink(name: str, sink: Sink) -> None:
+    """Deliver a sink's events through a different callable (e.g. a real email or partner client)"""
+    get_outbox_dispatcher().sinks[name] = sink
@@ -0,0 +1,204 @@
+"""
+Day itinerary planner - Chooses and orders attractions for a day within opening hours and budget.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Any, Optional, List, Tuple
+
+from config import (
+    PLANNER_MAX_STOPS, PLANNER_MIN_STOPS, PLANNER_MAX_CANDIDATES,
+    DEFAULT_VISIT_MINUTES, VISIT_MINUTES_BY_CATEGORY
+)
+from catalogue import AttractionCatalogue
+from indexes import TravelMatrix
+from models import SearchFilters, DayPlan, PlannedStop
+from utils import day_windows, format_clock
+
+
+@dataclass
+class Candidate:
+    position: int
+    record: Dict[str, Any]
+    windows: List[Tuple[int, int]]
+    visit_minutes: int
+    cost_usd: float
+    score: float
+
+
+# (arrival, start, end, travel minutes) per stop
+Schedule = List[Tuple[int, int, int, int]]
+
+
+def visit_minutes_for(record: Dict[str, Any]) -> int:
+    """Get the expected visit duration for an attraction record"""
+    return record.get("avg_visit_minutes") or VISIT_MINUTES_BY_CATEGORY.get(record.get("category", ""), DEFAULT_VISIT_MINUTES)
+
+
+def preference_score(record: Dict[str, Any], preferences: List[str]) -> float:
+    """Score an attraction by rating plus a bonus for each matching preference"""
+    text = f"{record.get('category', '')} {record.get('name', '')} {record.get('description', '')}".lower()
+    matches = sum(1 for preference in preferences if preference in text)
+    return (record.get("rating") or 3.0) + matches
+
+
+def simulate(
+    route: List[Candidate],
+    matrix: TravelMatrix,
+    day_start: int,
+    day_end: int
+) -> Optional[Schedule]:
+    """Schedule a route in order, waiting for openings; returns None if any stop cannot fit"""
+    schedule = []
+    current_time = day_start
+    previous = None
+    for candidate in route:
+        travel = matrix.travel_minutes(previous.position, candidate.position) if previous else 0
+        arrival = current_time + travel
+        for opens, closes in candidate.windows:
+            start = max(arrival, opens)
+            end = start + candidate.visit_minutes
+            if end <= min(closes, day_end):
+                break
+        else:
+            return None
+        schedule.append((arrival, start, end, travel))
+        current_time = end
+        previous = candidate
+    return schedule
+
+
+def route_cost(schedule: Schedule) -> Tuple[int, int]:
+    """Rank feasible schedules by finish time, then total travel"""
+    if not schedule:
+        return 0, 0
+    return schedule[-1][2], sum(stop[3] for stop in schedule)
+
+
+def build_route(
+    candidates: List[Candidate],
+    matrix: TravelMatrix,
+    day_start: int,
+    day_end: int,
+    max_stops: int,
+    budget: Optional[float]
+) -> List[Candidate]:
+    """Greedy cheapest insertion in candidate order (best first), keeping the route feasible and in budget"""
+    route: List[Candidate] = []
+    spent = 0.0
+    for candidate in candidates:
+        if len(route) >= max_stops:
+            break
+        if budget is not None and spent + candidate.cost_usd > budget:
+            continue
+
+        best_route, best_cost = None, None
+        for index in range(len(route) + 1):
+            trial = route[:index] + [candidate] + route[index:]
+            schedule = simulate(trial, matrix, day_start, day_end)
+            if schedule is not None and (best_cost is None or route_cost(schedule) < best_cost):
+                best_route, best_cost = trial, route_cost(schedule)
+
+        if best_route is not None:
+            route = best_route
+            spent += candidate.cost_usd
+    return route
+
+
+def improve_route(route: List[Candidate], matrix: TravelMatrix, day_start: int, day_end: int) -> List[Candidate]:
+    """2-opt improvement: reverse segments while that finishes earlier or travels less"""
+    best_cost = route_cost(simulate(route, matrix, day_start, day_end))
+    improved = True
+    while improved:
+        improved = False
+        for i in range(len(route) - 1):
+            for j in range(i + 1, len(route)):
+                trial = route[:i] + route[i:j + 1][::-1] + route[j + 1:]
+                schedule = simulate(trial, matrix, day_start, day_end)
+                if schedule is not None and route_cost(schedule) < best_cost:
+                    route, best_cost, improved = trial, route_cost(schedule), True
+    return route
+
+
+def plan_day(
+    catalogue: AttractionCatalogue,
+    location: str,
+    visit_date: date,
+    preferences: List[str],
+    day_start: int,
+    day_end: int,
+    max_stops: int = PLANNER_MAX_STOPS,
+    budget: Optional[float] = None
+) -> DayPlan:
+    """Plan a timed single-city itinerary for a location and date"""
+    notes = []
+    filters, corrected_location = catalogue.resolve_filters(SearchFilters(location=location))
+    if corrected_location:
+        notes.append(f"No matches for '{location}'; planned for '{corrected_location}' instead")
+    positions = catalogue.filter_positions(filters).tolist()
+
+    # Plan within one city: the one with the most matching attractions
+    cities: Dict[Tuple[str, str], List[int]] = {}
+    for position in positions:
+        cities.setdefault(catalogue.city_key_at(position), []).append(position)
+    if len(cities) > 1:
+        positions = max(cities.values(), key=len)
+        notes.append(f"Planned around {catalogue.records[positions[0]]['location']['city']}, "
+                     f"the best-covered city matching '{location}'")
+
+    candidates = []
+    for position in positions:
+        record = catalogue.records[position]
+        windows = day_windows(catalogue.opening_hours[position], visit_date.weekday())
+        if not windows:
+            continue
+        price = record.get("price")
+        candidates.append(Candidate(
+            position=position,
+            record=record,
+            windows=windows,
+            visit_minutes=visit_minutes_for(record),
+            cost_usd=price.min_usd if price and price.min_usd is not None else 0.0,
+            score=preference_score(record, preferences)
+        ))
+
+    candidates.sort(key=lambda c: c.score, reverse=True)
+    candidates = candidates[:PLANNER_MAX_CANDIDATES]
+
+    route: List[Candidate] = []
+    schedule: Schedule = []
+    if candidates:
+        matrix = catalogue.travel_matrix([candidate.position for candidate in candidates])
+        route = build_route(candidates, matrix, day_start, day_end, max_stops, budget)
+        route = improve_route(route, matrix, day_start, day_end)
+        schedule = simulate(route, matrix, day_start, day_end) or []
+
+    stops = [
+        PlannedStop(
+            order=order,
+            attraction_id=candidate.record["id"],
+            name=candidate.record["name"],
+            category=candidate.record.get("category", ""),
+            arrival=format_clock(arrival),
+            start=format_clock(start),
+            end=format_clock(end),
+            visit_minutes=candidate.visit_minutes,
+            travel_minutes=travel,
+            estimated_cost_usd=candidate.cost_usd
+        )
+        for order, (candidate, (arrival, start, end, travel)) in enumerate(zip(route, schedule), 1)
+    ]
+
+    if len(stops) < min(PLANNER_MIN_STOPS, max_stops):
+        notes.append(f"Only {len(stops)} attraction(s) fit the opening hours, time window and budget")
+
+    return DayPlan(
+        location=location,
+        date=visit_date.isoformat(),
+        start_time=format_clock(day_start),
+        end_time=stops[-1].end if stops else None,
+        total_travel_minutes=sum(stop.travel_minutes for stop in stops),
+        total_cost_usd=round(sum(stop.estimated_cost_usd for stop in stops), 2),
+        stops=stops,
+        notes=notes
+    )
@@ -0,0 +1,100 @@
+"""
+Response shaping - Field projection and byte budgets for attraction results.
+"""
+
+from dataclasses import fields as dataclass_fields
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp_common.encoding import dumps, to_builtins
+
+from config import BUDGET_DESCRIPTION_CHARS
+from models import Attraction
+
+ATTRACTION_FIELDS = tuple(field.name for field in dataclass_fields(Attraction))
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Parse a comma-separated list of Attraction fields to return; None (every field) when empty.
+
+    The ID is always returned, first. Raises ValueError naming any field an Attraction does not have.
+    """
+    names = [name.strip().lower() for name in (fields or "").split(",") if name.strip()]
+    if not names:
+        return None
+    unknown = [name for name in names if name not in ATTRACTION_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Choose from: {', '.join(ATTRACTION_FIELDS)}")
+    return ("id",) + tuple(dict.fromkeys(name for name in names if name != "id"))
+
+
+def project_model(attraction: Attraction, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """Serialise only the given fields of an Attraction"""
+    return to_builtins({field: getattr(attraction, field) for field in fields})
+
+
+def project_attraction(attraction: Dict[str, Any], fields: Optional[Tuple[str, ...]]) -> Dict[str, Any]:
+    """Copy the given fields of a serialised Attraction; the shared serialised form is left as it is"""
+    if fields is None:
+        return attraction
+    return {field: attraction[field] for field in fields if field in attraction}
+
+
+def response_size(response: Any) -> int:
+    """Size in bytes of a response encoded as JSON the way tool results are sent"""
+    return len(dumps(response, indent=True))
+
+
+def shorten_description(attraction: Dict[str, Any], limit: int = BUDGET_DESCRIPTION_CHARS) -> Dict[str, Any]:
+    """Copy a serialised Attraction with its description cut to about `limit` characters at a word break"""
+    description = attraction.get("description")
+    if not description or len(description) <= limit:
+        return attraction
+    cut = description[:limit].rsplit(" ", 1)[0].rstrip(" ,;:.")
+    return dict(attraction, description=cut + "…")
+
+
+def fit_to_budget(response: Dict[str, Any], max_bytes: Optional[int], nested: Optional[str] = None) -> Dict[str, Any]:
+    """Shrink a response listing attractions until its JSON fits in max_bytes.
+
+    Descriptions are shortened first; if that is not enough, results are dropped from the end
+    of the list, where the lowest ranked are. The response gets "truncated": true when anything
+    was cut. At least one result is always kept: when even the top one does not fit, an error
+    dict gives the smallest budget that would. Results are copied as they are changed, never
+    modified, since they are shared.
+
+    Args:
+        response: Response with its results under "attractions"
+        max_bytes: Budget for the encoded response, or None for no limit
+        nested: Key of each result's attraction, for results that wrap one (e.g. "attraction")
+
+    Returns:
+        The response, fitted to the budget, or an error dict if no result fits
+    """
+    if max_bytes is None or not response["attractions"] or response_size(response) <= max_bytes:
+        return response
+
+    def shortened(item: Dict[str, Any]) -> Dict[str, Any]:
+        if nested is None:
+            return shorten_description(item)
+        return dict(item, **{nested: shorten_description(item[nested])})
+
+    fitted = dict(response, truncated=True)
+    items: List[Dict[str, Any]] = [shortened(item) for item in response["attractions"]]
+
+    # The longest run of top results that fits
+    low, high = 0, len(items)
+    while low < high:
+        middle = (low + high + 1) // 2
+        fitted["attractions"] = items[:middle]
+        if response_size(fitted) <= max_bytes:
+            low = middle
+        else:
+            high = middle - 1
+    if low == 0:
+        fitted["attractions"] = items[:1]
+        return {"error": (
+            f"max_bytes {max_bytes} is too small for even one result, which takes {response_size(fitted)} bytes; "
+            "raise max_bytes or ask for fewer fields"
+        )}
+    fitted["attractions"] = items[:low]
+    return fitted
@@ -0,0 +1,513 @@
+"""
+Attraction providers - Where the service layer gets attraction data: the local catalogue, the
+upstream API merged with it, or a catalogue sharded across instances.
+"""
+
+import heapq
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from mcp_common.profiling import span
+from mcp_common.encoding import to_builtins
+
+from config import (
+    ATTRACTIONS_PROVIDER, ATTRACTION_CATEGORIES, UPSTREAM_CACHE_SIZE, UPSTREAM_RESOURCE_TTL_SECONDS,
+    ATTRACTIONS_SHARD_COUNT, SHARD_WORKERS
+)
+from models import OpeningHours, SearchFilters
+from cache import LRUCache
+from catalogue import (
+    get_catalogue, get_attraction_by_id, search_attractions, get_random_famous_attraction,
+    get_random_india_attraction, get_wonders_of_world
+)
+from indexes import OpeningHoursIndex, TrigramIndex
+from sharding import shard_of, shard_urls, local_shards
+from upstream import UpstreamClient, UpstreamUnavailable
+from projection import project_attraction
+from utils import parse_attraction_data, parse_entry_fee, parse_opening_hours, format_day_hours, normalize_text
+
+SEARCH_PARAMETERS = ("location", "category", "limit", "rating_min", "max_price", "free_entry", "open_at", "open_until")
+
+
+def query_value(value: Any) -> Any:
+    """Format a search filter as a query parameter (ISO date-times, lowercase booleans)"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return str(value).lower()
+    return value
+
+
+def local_serialised(attraction_id: int) -> Optional[Dict[str, Any]]:
+    """Get the catalogue's serialised Attraction by ID"""
+    catalogue = get_catalogue()
+    position = catalogue.position_of(attraction_id)
+    return catalogue.serialised[position] if position is not None else None
+
+
+def parse_entry(data: Dict[str, Any], local: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Parse an API record, merged over any local record with the same ID, into its record, serialised Attraction and opening hours"""
+    local = local or {}
+    record = {key: value for key, value in local.items() if key not in ("price", "hours")}
+    record.update(data)
+    record["location"] = {**local.get("location", {}), **data.get("location", {})}
+    opening_hours = parse_opening_hours(record.get("opening_hours"), data.get("hours"))
+    record["price"] = parse_entry_fee(record.get("entry_fee"), record["location"].get("country", ""))
+    record["hours"] = format_day_hours(opening_hours)
+    return {
+        "upstream": data,
+        "record": record,
+        "serialised": to_builtins(parse_attraction_data(record)),
+        "opening_hours": opening_hours
+    }
+
+
+def matching_entries(
+    entries: List[Dict[str, Any]],
+    rating_min: Optional[float] = None,
+    max_price: Optional[float] = None,
+    free_entry: Optional[bool] = None,
+    open_at: Optional[datetime] = None,
+    open_until: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """Keep parsed API entries that match search filters as the catalogue applies them"""
+    if open_at is not None:
+        hours = OpeningHoursIndex(enumerate(entry["opening_hours"] for entry in entries))
+        open_now = hours.open_between(open_at, open_until) if open_until is not None else hours.open_at(open_at)
+        entries = [entries[position] for position in sorted(open_now.tolist())]
+
+    def matches(record: Dict[str, Any]) -> bool:
+        price = record["price"]
+        if rating_min is not None and not (record.get("rating") or 0) >= rating_min:
+            return False
+        if max_price is not None and not (price and price.min_usd is not None and price.min_usd <= max_price):
+            return False
+        if free_entry is not None and bool(price and price.is_free) != free_entry:
+            return False
+        return True
+
+    return [entry for entry in entries if matches(entry["record"])]
+
+
+def local_matches(attraction_ids: Iterable[int], location: Optional[str] = None, category: Optional[str] = None,
+                  **filters: Any) -> int:
+    """Count the given attractions that the local catalogue would return for a search"""
+    catalogue = get_catalogue()
+    positions = [catalogue.position_of(attraction_id) for attraction_id in attraction_ids]
+    positions = [position for position in positions if position is not None]
+    if not positions:
+        return 0
+    resolved, _ = catalogue.resolve_filters(SearchFilters(location=location, category=category, **filters))
+    return int(np.isin(positions, catalogue.filter_positions(resolved)).sum())
+
+
+class LocalProvider:
+    """Attractions from the in-memory catalogue.
+
+    Records are the catalogue's enriched record dicts (with parsed "price" and "hours") and
+    serialised attractions are its shared Attraction dicts; both are read-only.
+    """
+
+    name = "local"
+    resource_ttl: Optional[float] = None  # memoised resources live as long as the catalogue
+
+    def attraction(self, attraction_id: int) -> Optional[Dict[str, Any]]:
+        """Get an attraction record by ID"""
+        return get_attraction_by_id(attraction_id)
+
+    def serialised(self, attraction_id: int) -> Optional[Dict[str, Any]]:
+        """Get a serialised Attraction by ID"""
+        return local_serialised(attraction_id)
+
+    def opening_hours(self, attraction_id: int) -> Optional[OpeningHours]:
+        """Get the parsed opening hours of an attraction by ID"""
+        return get_catalogue().get_opening_hours(attraction_id)
+
+    def search(self, location: Optional[str] = None, category: Optional[str] = None, limit: int = 20,
+               fields: Optional[Tuple[str, ...]] = None, **filters: Any) -> Dict[str, Any]:
+        """Search attractions; returns serialised attractions (only `fields` of each, if given) with the total match count"""
+        with span("catalogue search") as search_span:
+            data = search_attractions(location, category, limit, **filters)
+            search_span.set("matches", data["total"])
+        with span("catalogue serialise", rows=len(data["positions"])):
+            attractions = get_catalogue().to_dicts(data["positions"], fields)
+        return {"attractions": attractions, "total": data["total"], "corrected_location": data.get("corrected_location")}
+
+    def random(self, region: str = "famous") -> Optional[Dict[str, Any]]:
+        """Get a random serialised attraction, famous or in India"""
+        data = get_random_india_attraction() if region.lower() == "india" else get_random_famous_attraction()
+        return local_serialised(data["id"]) if data else None
+
+    def wonders(self) -> Dict[str, Any]:
+        """Get the world wonders as serialised attractions"""
+        attractions = [local_serialised(data["id"]) for data in get_wonders_of_world()["attractions"]]
+        return {"attractions": attractions, "total": len(attractions)}
+
+    def categories(self) -> Dict[str, str]:
+        """Get category codes and display names"""
+        return dict(ATTRACTION_CATEGORIES)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"provider": self.name}
+
+
+class UpstreamProvider(LocalProvider):
+    """Attractions from the World Tourist Attractions API, merged with the local catalogue.
+
+    Upstream records override local ones with the same ID field by field (so local
+    coordinates or extras fill gaps), and are parsed and serialised once per version seen.
+    Search results list upstream matches first, then local-only ones; the search filters are
+    applied to upstream records here too, in case the API ignores any. Whenever upstream is
+    unavailable and nothing is cached, the local catalogue answers instead.
+    """
+
+    name = "upstream"
+    resource_ttl = UPSTREAM_RESOURCE_TTL_SECONDS
+
+    def __init__(self, client: Optional[UpstreamClient] = None):
+        self.client = client or UpstreamClient()
+        self.fallbacks = 0
+        self._entries = LRUCache(UPSTREAM_CACHE_SIZE)
+        self._lock = threading.Lock()
+
+    def _fetch(self, endpoint: str, path: str = "", params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """Fetch from upstream, or None (counted as a fallback) when it is unavailable"""
+        try:
+            return self.client.fetch(endpoint, path, params)
+        except UpstreamUnavailable:
+            with self._lock:
+                self.fallbacks += 1
+            return None
+
+    def _entry(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge an upstream record with the local one and parse it, once per distinct upstream record"""
+        entry = self._entries.get(data["id"])
+        if entry is not None and entry["upstream"] == data:
+            return entry
+
+        entry = parse_entry(data, get_attraction_by_id(data["id"]))
+        self._entries.put(data["id"], entry)
+        return entry
+
+    def _attraction_entry(self, attraction_id: int) -> Optional[Dict[str, Any]]:
+        data = self._fetch("attraction_by_id", str(attraction_id))
+        return self._entry(data) if data else None
+
+    def attraction(self, attraction_id: int) -> Optional[Dict[str, Any]]:
+        entry = self._attraction_entry(attraction_id)
+        return entry["record"] if entry else super().attraction(attraction_id)
+
+    def serialised(self, attraction_id: int) -> Optional[Dict[str, Any]]:
+        entry = self._attraction_entry(attraction_id)
+        return entry["serialised"] if entry else super().serialised(attraction_id)
+
+    def opening_hours(self, attraction_id: int) -> Optional[OpeningHours]:
+        entry = self._attraction_entry(attraction_id)
+        return entry["opening_hours"] if entry else super().opening_hours(attraction_id)
+
+    def search(self, location: Optional[str] = None, category: Optional[str] = None, limit: int = 20,
+               fields: Optional[Tuple[str, ...]] = None, **filters: Any) -> Dict[str, Any]:
+        params = dict(filters, location=location, category=category, limit=limit)
+        params = {key: query_value(value) for key, value in params.items() if key in SEARCH_PARAMETERS}
+        body = self._fetch("search", params=params)
+        if not body:
+            return super().search(location, category, limit, fields, **filters)
+
+        page = [self._entry(data) for data in body.get("attractions", [])]
+        entries = matching_entries(page, **filters)
+        upstream_ids = {entry["record"]["id"] for entry in page}
+        # Local records with an ID upstream returned are superseded by it, whether or not its version matched
+        local = super().search(location, category, limit + len(upstream_ids), fields, **filters)
+        local_only = [attraction for attraction in local["attractions"] if attraction["id"] not in upstream_ids]
+
+        # Upstream matches beyond its page can't be checked against the filters or the local
+        # matches, so the total is then an estimate
+        unseen = max(body.get("total", len(page)) - len(page), 0)
+        superseded = local_matches(upstream_ids, location, category, **filters)
+        return {
+            "attractions": ([project_attraction(entry["serialised"], fields) for entry in entries] + local_only)[:limit],
+            "total": len(entries) + unseen + local["total"] - superseded,
+            "total_is_estimate": unseen > 0,
+            "corrected_location": local.get("corrected_location")
+        }
+
+    def random(self, region: str = "famous") -> Optional[Dict[str, Any]]:
+        endpoint = "random_india" if region.lower() == "india" else "random_famous"
+        data = self._fetch(endpoint)
+        return self._entry(data)["serialised"] if data else super().random(region)
+
+    def wonders(self) -> Dict[str, Any]:
+        local = super().wonders()
+        body = self._fetch("wonders")
+        if not body:
+            return local
+        attractions: List[Dict[str, Any]] = [self._entry(data)["serialised"] for data in body.get("attractions", [])]
+        upstream_ids = {attraction["id"] for attraction in attractions}
+        attractions += [attraction for attraction in local["attractions"] if attraction["id"] not in upstream_ids]
+        return {"attractions": attractions, "total": len(attractions)}
+
+    def categories(self) -> Dict[str, str]:
+        body = self._fetch("categories")
+        return {**super().categories(), **((body or {}).get("categories") or {})}
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(self.client.stats(), provider=self.name, fallbacks=self.fallbacks)
+
+
+LOCAL = -1  # results of the shards loaded on this instance, answered by its catalogue
+
+
+class ShardedProvider(LocalProvider):
+    """Attractions from a catalogue sharded by country: this instance's shards plus remote shard servers.
+
+    A location-scoped search goes only to the shards holding a city, country or region whose
+    name contains the location, found in a directory of every shard's place names. Other
+    searches scatter to all shards in parallel, and the shards' ID-ordered pages are k-way
+    merged up to the global limit. A location no shard holds is corrected by each shard and
+    the closest correction wins. Shards that cannot answer are left out of the results and
+    counted, and remote records are parsed and serialised once per version seen.
+    """
+
+    name = "sharded"
+    resource_ttl = UPSTREAM_RESOURCE_TTL_SECONDS
+
+    def __init__(
+        self,
+        urls: Optional[Dict[int, str]] = None,
+        count: int = ATTRACTIONS_SHARD_COUNT,
+        local: Optional[Set[int]] = None
+    ):
+        urls = shard_urls() if urls is None else urls
+        self.count = count
+        self.local = local_shards(count=count, remote=urls) if local is None else set(local)
+        self.clients = {
+            shard: UpstreamClient(url, api_key=None) for shard, url in sorted(urls.items()) if shard not in self.local
+        }
+        self.missing = set(range(count)) - self.local - set(self.clients)
+        self.partial_results = 0
+        self._entries = LRUCache(UPSTREAM_CACHE_SIZE)
+        self._owners = LRUCache(UPSTREAM_CACHE_SIZE)  # attraction ID -> remote shard it came from
+        self._directory: Optional[Dict[str, Any]] = None
+        self._executor = ThreadPoolExecutor(max(1, min(SHARD_WORKERS, len(self.clients))), thread_name_prefix="shard")
+        self._lock = threading.Lock()
+
+    def _fetch(self, shard: int, endpoint: str, path: str = "", params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """Fetch from a remote shard, or None (counted as a partial result) when it is unavailable"""
+        try:
+            return self.clients[shard].fetch(endpoint, path, params)
+        except UpstreamUnavailable:
+            with self._lock:
+                self.partial_results += 1
+            return None
+
+    def _scatter(self, shards: Iterable[int], endpoint: str, path: str = "",
+                 params: Optional[Dict[str, Any]] = None) -> Dict[int, Any]:
+        """Fetch from several remote shards in parallel; unavailable shards are left out"""
+        shards = [shard for shard in shards if shard in self.clients]
+        if len(shards) == 1:
+            bodies = {shards[0]: self._fetch(shards[0], endpoint, path, params)}
+        else:
+            futures = {shard: self._executor.submit(self._fetch, shard, endpoint, path, params) for shard in shards}
+            bodies = {shard: future.result() for shard, future in futures.items()}
+        return {shard: body for shard, body in bodies.items() if body is not None}
+
+    def _entry(self, shard: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse a remote record, once per distinct record, remembering the shard it came from"""
+        self._owners.put(data["id"], shard)
+        entry = self._entries.get(data["id"])
+        if entry is None or entry["upstream"] != data:
+            entry = parse_entry(data)
+            self._entries.put(data["id"], entry)
+        return entry
+
+    def sources(self, shards: Iterable[int]) -> Set[int]:
+        """Map shard numbers to the sources answering them: remote shards, and LOCAL for this instance's"""
+        shards = set(shards)
+        return (shards & set(self.clients)) | ({LOCAL} if shards & self.local else set())
+
+    def directory(self) -> Dict[str, Any]:
+        """Place names of every shard, indexed for substring lookup, with the sources holding each and their sizes"""
+        catalogue = get_catalogue()
+        listings = self._scatter(self.clients, "shard_locations")
+        key = (catalogue.version, tuple((shard, body.get("version")) for shard, body in listings.items()))
+        directory = self._directory
+        if directory is not None and directory["key"] == key:
+            return directory
+
+        places: Dict[str, Set[int]] = {}
+        terms = []
+        sizes = {}
+        sources = [(LOCAL, catalogue.location_index.terms, len(catalogue))] if self.local else []
+        sources += [(shard, body.get("locations", []), body.get("attractions", 0)) for shard, body in listings.items()]
+        for source, names, size in sources:
+            sizes[source] = size
+            for name in names:
+                places.setdefault(normalize_text(name), set()).add(source)
+                terms.append(name)
+        directory = {"key": key, "index": TrigramIndex(terms), "places": places, "sizes": sizes}
+        self._directory = directory
+        return directory
+
+    def owners(self, location: str) -> Set[int]:
+        """Get the sources holding a place whose name contains the location"""
+        directory = self.directory()
+        return {
+            source for term in directory["index"].containing(location)
+            for source in directory["places"][normalize_text(term)]
+        }
+
+    def _local_search(self, filters: SearchFilters, limit: int, fields: Optional[Tuple[str, ...]]) -> Dict[str, Any]:
+        catalogue = get_catalogue()
+        filters, corrected_location = catalogue.resolve_filters(filters)
+        positions = catalogue.filter_positions(filters)
+        return {
+            "attractions": catalogue.to_dicts(catalogue.first_by_id(positions, limit).tolist(), fields),
+            "total": len(positions),
+            "corrected_location": corrected_location
+        }
+
+    def _search_sources(self, sources: Set[int], filters: SearchFilters, limit: int,
+                        fields: Optional[Tuple[str, ...]] = None) -> Dict[int, Dict[str, Any]]:
+        """Search each source in parallel, returning their ID-ordered pages (of only `fields`, if given), totals and location corrections"""
+        params = {field: query_value(value) for field, value in to_builtins(filters).items() if value is not None}
+        params["limit"] = limit
+        remote = [source for source in sorted(sources) if source != LOCAL]
+        futures = {shard: self._executor.submit(self._fetch, shard, "search", "", params) for shard in remote}
+        results = {LOCAL: self._local_search(filters, limit, fields)} if LOCAL in sources else {}
+        for shard, future in futures.items():
+            body = future.result()
+            if body is not None:
+                results[shard] = {
+                    "attractions": [
+                        project_attraction(self._entry(shard, data)["serialised"], fields) for data in body.get("attractions", [])
+                    ],
+                    "total": body.get("total", 0),
+                    "corrected_location": body.get("corrected_location")
+                }
+        return results
+
+    def search(self, location: Optional[str] = None, category: Optional[str] = None, limit: int = 20,
+               fields: Optional[Tuple[str, ...]] = None, **filters: Any) -> Dict[str, Any]:
+        query = SearchFilters(location=location, category=category, **filters)
+        everywhere = self.sources(self.local | set(self.clients))
+        owners = self.owners(location) if location else everywhere
+        corrected_location = None
+        if owners:
+            results = self._search_sources(owners, query, limit, fields)
+        else:
+            # No shard holds the location: each corrects it against its own places and names, the closest
+            # correction is kept, and shards that corrected it differently are asked for that one instead
+            results = self._search_sources(everywhere, query, limit, fields)
+            corrections = [result["corrected_location"] for _, result in sorted(results.items())]
+            corrections = [term for term in corrections if term]
+            if corrections:
+                closest = TrigramIndex(corrections).lookup(location, limit=1, threshold=0)
+                corrected_location = closest[0][0] if closest else corrections[0]
+                agreed = {source for source, result in results.items() if result["corrected_location"] == corrected_location}
+                results = {source: results[source] for source in agreed}
+                if normalize_text(corrected_location) in self.directory()["places"]:
+                    others = self.owners(corrected_location) - agreed
+                    query = replace(query, location=corrected_location)
+                else:
+                    others = everywhere - agreed
+                    query = replace(query, location=None, name=corrected_location)
+                results.update(self._search_sources(others, query, limit, fields))
+
+        pages = [result["attractions"] for result in results.values()]
+        return {
+            "attractions": list(islice(heapq.merge(*pages, key=lambda attraction: attraction["id"]), limit)),
+            "total": sum(result["total"] for result in results.values()),
+            "corrected_location": corrected_location
+        }
+
+    def _remote_entry(self, attraction_id: int) -> Optional[Dict[str, Any]]:
+        """Find an attraction on the remote shards: the one it was last seen on, else all of them"""
+        owner = self._owners.get(attraction_id)
+        for shards in ([owner] if owner is not None else [], list(self.clients)):
+            for shard, data in self._scatter(shards, "attraction_by_id", str(attraction_id)).items():
+                return self._entry(shard, data)
+        return None
+
+    def attraction(self, attraction_id: int) -> Optional[Dict[str, Any]]:
+        data = super().attraction(attraction_id) if self.local else None
+        if data is not None:
+            return data
+        entry = self._remote_entry(attraction_id)
+        return entry["record"] if entry else None
+
+    def serialised(self, attraction_id: int) -> Optional[Dict[str, Any]]:
+        data = super().serialised(attraction_id) if self.local else None
+        if data is not None:
+            return data
+        entry = self._remote_entry(attraction_id)
+        return entry["serialised"] if entry else None
+
+    def opening_hours(self, attraction_id: int) -> Optional[OpeningHours]:
+        if self.local and get_catalogue().position_of(attraction_id) is not None:
+            return super().opening_hours(attraction_id)
+        entry = self._remote_entry(attraction_id)
+        return entry["opening_hours"] if entry else None
+
+    def random(self, region: str = "famous") -> Optional[Dict[str, Any]]:
+        """Get a random attraction: in India from the shard owning India, otherwise from a shard picked by size"""
+        if region.lower() == "india":
+            shard = shard_of("India", self.count)
+            source, endpoint = (LOCAL if shard in self.local else shard), "random_india"
+        else:
+            sizes = self.directory()["sizes"]
+            if not any(sizes.values()):
+                return None
+            source = random.choices(list(sizes), list(sizes.values()))[0]
+            endpoint = "random_famous"
+        if source == LOCAL:
+            return super().random(region)
+        data = self._fetch(source, endpoint) if source in self.clients else None
+        return self._entry(source, data)["serialised"] if data else None
+
+    def wonders(self) -> Dict[str, Any]:
+        attractions = super().wonders()["attractions"] if self.local else []
+        for shard, body in self._scatter(self.clients, "wonders").items():
+            attractions += [self._entry(shard, data)["serialised"] for data in body.get("attractions", [])]
+        attractions.sort(key=lambda attraction: attraction["id"])
+        return {"attractions": attractions, "total": len(attractions)}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "provider": self.name,
+            "shard_count": self.count,
+            "local_shards": sorted(self.local),
+            "missing_shards": sorted(self.missing),
+            "partial_results": self.partial_results,
+            "shards": {str(shard): client.stats() for shard, client in self.clients.items()}
+        }
+
+
+_provider = None
+_provider_lock = threading.Lock()
+
+
+def get_provider() -> LocalProvider:
+    """Get the configured attraction provider (ATTRACTIONS_PROVIDER, or sharded when ATTRACTIONS_SHARD_URLS is set), created on first use"""
+    global _provider
+    with _provider_lock:
+        if _provider is None:
+            if ATTRACTIONS_PROVIDER == "upstream":
+                _provider = UpstreamProvider()
+            elif shard_urls():
+                _provider = ShardedProvider()
+            else:
+                _provider = LocalProvider()
+        return _provider
+
+
+def set_provider(provider: LocalProvider) -> None:
+    """Replace the attraction provider (e.g. an UpstreamProvider pointed at a stub server)"""
+    global _provider
+    with _provider_lock:
+        _provider = provider
@@ -0,0 +1,186 @@
+"""
+Shard server - Serves an instance's catalogue shards on the attractions API endpoints, for routing instances.
+
+Search pages come in attraction ID order, so a router can merge the pages of several shards.
+A shard also lists its city, country and region names, which routers use to send
+location-scoped queries only to the shards holding that location. Run one process per shard
+from the attractions-mcp directory, e.g. three shards of a 10,000-attraction sample catalogue:
+    uv run python shard_server.py --count 3 --shards 0 --port 8101 --size 10000
+    uv run python shard_server.py --count 3 --shards 1 --port 8102 --size 10000
+    uv run python shard_server.py --count 3 --shards 2 --port 8103 --size 10000
+then a router with no shards of its own:
+    ATTRACTIONS_SHARD_COUNT=3 ATTRACTIONS_SHARD_URLS=0=http://127.0.0.1:8101,1=http://127.0.0.1:8102,2=http://127.0.0.1:8103 uv run python main.py
+An MCP server instance serves its own shards too when ATTRACTIONS_SHARD_PORT is set.
+"""
+
+import argparse
+import random
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import parse_qs, urlparse
+
+from mcp_common.encoding import configure_encoder, dumps
+
+from config import MOCK_ATTRACTIONS, WORLD_WONDERS, ATTRACTION_CATEGORIES, ENDPOINTS, ATTRACTIONS_SHARD_COUNT, JSON_ENCODER
+from catalogue import AttractionCatalogue, get_catalogue
+from models import SearchFilters
+from sharding import local_shards, shard_rows
+from synthetic import sample_catalogue
+
+
+class ShardApi:
+    """The attractions API over a catalogue (by default this instance's live catalogue)"""
+
+    def __init__(self, catalogue: Optional[AttractionCatalogue] = None, shards: Optional[Set[int]] = None,
+                 seed: Optional[int] = None):
+        self._catalogue = catalogue
+        self.shards = local_shards() if shards is None else shards
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @property
+    def catalogue(self) -> AttractionCatalogue:
+        return self._catalogue if self._catalogue is not None else get_catalogue()
+
+    def record(self, position: int) -> Dict[str, Any]:
+        """The raw API form of an attraction (without the fields parsed at load)"""
+        return {key: value for key, value in self.catalogue.records[position].items() if key not in ("price", "hours")}
+
+    def records(self, positions: List[int]) -> List[Dict[str, Any]]:
+        return [self.record(position) for position in positions]
+
+    def respond(self, path: str, query: Dict[str, str]) -> tuple:
+        """Status code and JSON body for a request"""
+        with self._lock:
+            self.requests += 1
+        catalogue = self.catalogue
+
+        if path.startswith(ENDPOINTS["attraction_by_id"] + "/"):
+            try:
+                position = catalogue.position_of(int(path.rsplit("/", 1)[1]))
+            except ValueError:
+                position = None
+            if position is None:
+                return 404, {"error": "Attraction not found"}
+            return 200, self.record(position)
+
+        if path == ENDPOINTS["search"]:
+            try:
+                filters = SearchFilters(
+                    location=query.get("location"),
+                    name=query.get("name"),
+                    category=query.get("category"),
+                    rating_min=optional_number(query.get("rating_min")),
+                    max_price=optional_number(query.get("max_price")),
+                    free_entry={"true": True, "false": False}.get(query.get("free_entry", "").lower()),
+                    open_at=optional_datetime(query.get("open_at")),
+                    open_until=optional_datetime(query.get("open_until"))
+                )
+                limit = int(query.get("limit", 20))
+            except ValueError as e:
+                return 400, {"error": str(e)}
+            data = catalogue.search(filters, limit, by_id=True)
+            return 200, {
+                "attractions": self.records(data["positions"]),
+                "total": data["total"],
+                "corrected_location": data["corrected_location"]
+            }
+
+        if path in (ENDPOINTS["random_famous"], ENDPOINTS["random_india"]):
+            positions = list(range(len(catalogue)))
+            if path == ENDPOINTS["random_india"]:
+                positions = [p for p in positions if catalogue.places["country"][p] == "India"]
+            if not positions:
+                return 404, {"error": "No attractions"}
+            with self._lock:
+                position = self._random.choice(positions)
+            return 200, self.record(position)
+
+        if path == ENDPOINTS["wonders"]:
+            wonders = self.records(catalogue.wonder_positions)
+            return 200, {"attractions": wonders, "total": len(wonders)}
+
+        if path == ENDPOINTS["categories"]:
+            return 200, {"categories": ATTRACTION_CATEGORIES}
+
+        if path == ENDPOINTS["shard_locations"]:
+            return 200, {
+                "shards": sorted(self.shards),
+                "attractions": len(catalogue),
+                "version": catalogue.version,
+                "locations": catalogue.location_index.terms
+            }
+
+        return 404, {"error": f"Unknown endpoint {path}"}
+
+
+def optional_number(value: Optional[str]) -> Optional[float]:
+    return float(value) if value not in (None, "") else None
+
+
+def optional_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def make_handler(api: ShardApi, quiet: bool = True) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, so pooled clients reuse connections
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            status, body = api.respond(url.path.rstrip("/"), query)
+            payload = dumps(body)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            if not quiet:
+                super().log_message(format, *args)
+
+    return Handler
+
+
+def serve(api: ShardApi, host: str = "127.0.0.1", port: int = 8101, quiet: bool = True) -> ThreadingHTTPServer:
+    """Start serving in a background thread; call shutdown() on the returned server to stop it"""
+    server = ThreadingHTTPServer((host, port), make_handler(api, quiet))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="shard-api", daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8101)
+    parser.add_argument("--count", type=int, default=ATTRACTIONS_SHARD_COUNT, help="shards the catalogue is split into")
+    parser.add_argument("--shards", default="0", help="comma-separated shard numbers to serve")
+    parser.add_argument("--size", type=int, default=0, help="synthetic attractions added to the mocks before sharding")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    configure_encoder(JSON_ENCODER)
+    shards = local_shards(args.shards, args.count)
+    if args.size:
+        rows, wonder_ids = sample_catalogue(args.size, args.seed)
+    else:
+        rows, wonder_ids = MOCK_ATTRACTIONS, WORLD_WONDERS
+    api = ShardApi(AttractionCatalogue(shard_rows(rows, shards, args.count), wonder_ids), shards)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(api, quiet=not args.verbose))
+    print(f"Shard {args.shards} of {args.count} serving {len(api.catalogue):,} attractions on http://{args.host}:{args.port}",
+          flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
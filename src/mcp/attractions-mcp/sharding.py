@@ -0,0 +1,55 @@
+"""
+Catalogue sharding - Which country-partitioned shards an instance loads, and where the others are served.
+"""
+
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from config import ATTRACTIONS_SHARD_COUNT, ATTRACTIONS_SHARDS, ATTRACTIONS_SHARD_URLS
+from utils import normalize_text
+
+
+def shard_of(country: Optional[str], count: int = ATTRACTIONS_SHARD_COUNT) -> int:
+    """Get the shard owning a country: a stable hash of its normalised name, so every instance agrees"""
+    if count <= 1:
+        return 0
+    return zlib.crc32(normalize_text(country or "").encode("utf-8")) % count
+
+
+def record_shard(data: Dict[str, Any], count: int = ATTRACTIONS_SHARD_COUNT) -> int:
+    """Get the shard owning an attraction record"""
+    return shard_of((data.get("location") or {}).get("country"), count)
+
+
+def shard_urls(setting: str = ATTRACTIONS_SHARD_URLS) -> Dict[int, str]:
+    """Parse "0=http://host:port,1=..." into shard numbers and shard API base URLs"""
+    urls = {}
+    for item in setting.split(","):
+        if item.strip():
+            shard, url = item.split("=", 1)
+            urls[int(shard)] = url.strip().rstrip("/")
+    return urls
+
+
+def local_shards(
+    setting: str = ATTRACTIONS_SHARDS,
+    count: int = ATTRACTIONS_SHARD_COUNT,
+    remote: Iterable[int] = None
+) -> Set[int]:
+    """Get the shards this instance loads: those listed, or by default every shard without a URL"""
+    if setting.strip():
+        return {int(shard) for shard in setting.split(",") if shard.strip()}
+    remote = set(shard_urls() if remote is None else remote)
+    return set(range(max(count, 1))) - remote
+
+
+def shard_rows(
+    attractions: List[Dict[str, Any]],
+    shards: Optional[Set[int]] = None,
+    count: int = ATTRACTIONS_SHARD_COUNT
+) -> List[Dict[str, Any]]:
+    """Keep the attraction records belonging to the given shards (by default this instance's)"""
+    shards = local_shards(count=count) if shards is None else shards
+    if count <= 1 and 0 in shards:
+        return attractions
+    return [data for data in attractions if record_shard(data, count) in shards]
@@ -0,0 +1,64 @@
+"""
+Stub upstream - A local stand-in for the World Tourist Attractions API, for testing the upstream provider.
+
+Serves the mock attractions plus a seeded synthetic catalogue (IDs from 1001) on the API's
+endpoints through the shard server, with optional added latency and a failure rate. Run from
+the attractions-mcp directory:
+    uv run python stub_upstream.py [--port 8090] [--size 1000] [--latency 0.2] [--failure-rate 0.1]
+then start the server against it:
+    ATTRACTIONS_PROVIDER=upstream ATTRACTIONS_API_URL=http://127.0.0.1:8090 uv run python main.py
+"""
+
+import argparse
+import time
+from http.server import ThreadingHTTPServer
+from typing import Dict
+
+from catalogue import AttractionCatalogue
+from shard_server import ShardApi, make_handler, serve
+from synthetic import sample_catalogue
+
+
+class StubUpstream(ShardApi):
+    """The shard API over a sample catalogue, with added latency and failures"""
+
+    def __init__(self, size: int = 1000, seed: int = 0, latency: float = 0.0, failure_rate: float = 0.0):
+        rows, wonder_ids = sample_catalogue(size, seed)
+        super().__init__(AttractionCatalogue(rows, wonder_ids), {0}, seed)
+        self.latency = latency
+        self.failure_rate = failure_rate
+
+    def respond(self, path: str, query: Dict[str, str]) -> tuple:
+        with self._lock:
+            fail = self._random.random() < self.failure_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            with self._lock:
+                self.requests += 1
+            return 503, {"error": "Service temporarily unavailable"}
+        return super().respond(path, query)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--size", type=int, default=1000, help="synthetic attractions served besides the mocks")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of requests answered 503")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    stub = StubUpstream(args.size, args.seed, args.latency, args.failure_rate)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(stub, quiet=not args.verbose))
+    print(f"Stub attractions API serving {len(stub.catalogue):,} attractions on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
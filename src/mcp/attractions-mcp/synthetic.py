@@ -0,0 +1,213 @@
+"""
+Synthetic catalogue - Deterministic, seeded generator of large realistic attraction catalogues.
+
+Cities are drawn from a Zipf-like distribution, so a few destinations (and their countries) hold
+most attractions while a long tail holds a handful each, as in real catalogues. Records use the
+same shape and free-text formats as MOCK_ATTRACTIONS, so they exercise the same parsing paths.
+"""
+
+import random
+from itertools import accumulate
+from typing import Any, Dict, List, Tuple
+
+from config import ATTRACTION_CATEGORIES, COUNTRY_CURRENCIES, EXCHANGE_RATES_TO_USD, MOCK_ATTRACTIONS
+
+# (city, country, region, latitude, longitude), most visited first
+CITIES: List[Tuple[str, str, str, float, float]] = [
+    ("Paris", "France", "Île-de-France", 48.8566, 2.3522),
+    ("London", "UK", "England", 51.5072, -0.1276),
+    ("Rome", "Italy", "Lazio", 41.9028, 12.4964),
+    ("New York", "USA", "New York", 40.7128, -74.0060),
+    ("Barcelona", "Spain", "Catalonia", 41.3874, 2.1686),
+    ("Tokyo", "Japan", "Kanto", 35.6762, 139.6503),
+    ("Beijing", "China", "Beijing", 39.9042, 116.4074),
+    ("Delhi", "India", "Delhi", 28.6139, 77.2090),
+    ("Kyoto", "Japan", "Kansai", 35.0116, 135.7681),
+    ("Florence", "Italy", "Tuscany", 43.7696, 11.2558),
+    ("Madrid", "Spain", "Community of Madrid", 40.4168, -3.7038),
+    ("Berlin", "Germany", "Berlin", 52.5200, 13.4050),
+    ("Sydney", "Australia", "New South Wales", -33.8688, 151.2093),
+    ("Athens", "Greece", "Attica", 37.9838, 23.7275),
+    ("Venice", "Italy", "Veneto", 45.4408, 12.3155),
+    ("Agra", "India", "Uttar Pradesh", 27.1767, 78.0081),
+    ("San Francisco", "USA", "California", 37.7749, -122.4194),
+    ("Rio de Janeiro", "Brazil", "Rio de Janeiro", -22.9068, -43.1729),
+    ("Shanghai", "China", "Shanghai", 31.2304, 121.4737),
+    ("Edinburgh", "UK", "Scotland", 55.9533, -3.1883),
+    ("Mumbai", "India", "Maharashtra", 19.0760, 72.8777),
+    ("Munich", "Germany", "Bavaria", 48.1351, 11.5820),
+    ("Seville", "Spain", "Andalusia", 37.3891, -5.9845),
+    ("Nice", "France", "Provence-Alpes-Côte d'Azur", 43.7102, 7.2620),
+    ("Toronto", "Canada", "Ontario", 43.6532, -79.3832),
+    ("Osaka", "Japan", "Kansai", 34.6937, 135.5023),
+    ("Melbourne", "Australia", "Victoria", -37.8136, 144.9631),
+    ("Jaipur", "India", "Rajasthan", 26.9124, 75.7873),
+    ("Cusco", "Peru", "Cusco", -13.5320, -71.9675),
+    ("Santorini", "Greece", "Cyclades", 36.3932, 25.4615),
+    ("Siem Reap", "Cambodia", "Siem Reap", 13.3671, 103.8448),
+    ("Lyon", "France", "Auvergne-Rhône-Alpes", 45.7640, 4.8357),
+    ("Naples", "Italy", "Campania", 40.8518, 14.2681),
+    ("Chicago", "USA", "Illinois", 41.8781, -87.6298),
+    ("Xi'an", "China", "Shaanxi", 34.3416, 108.9398),
+    ("Vancouver", "Canada", "British Columbia", 49.2827, -123.1207),
+    ("São Paulo", "Brazil", "São Paulo", -23.5558, -46.6396),
+    ("Lima", "Peru", "Lima", -12.0464, -77.0428),
+    ("Amman", "Jordan", "Amman", 31.9454, 35.9284),
+    ("Ma'an", "Jordan", "Ma'an", 30.1962, 35.7341),
+    ("Hamburg", "Germany", "Hamburg", 53.5511, 9.9937),
+    ("Bath", "UK", "England", 51.3811, -2.3590),
+    ("Thessaloniki", "Greece", "Central Macedonia", 40.6401, 22.9444),
+    ("Hiroshima", "Japan", "Chugoku", 34.3853, 132.4553),
+    ("Varanasi", "India", "Uttar Pradesh", 25.3176, 82.9739),
+    ("Granada", "Spain", "Andalusia", 37.1773, -3.5986),
+    ("Cairns", "Australia", "Queensland", -16.9186, 145.7781),
+    ("Phnom Penh", "Cambodia", "Phnom Penh", 11.5564, 104.9282),
+]
+
+CITY_SKEW = 1.1  # Zipf exponent of the city distribution
+CITY_RADIUS_DEGREES = 0.08  # spread of attractions around the city centre
+
+CATEGORY_WEIGHTS = {
+    "historical": 18, "museums": 16, "religious": 12, "architecture": 10, "cultural": 10,
+    "parks": 9, "modern": 7, "entertainment": 6, "natural": 5, "beaches": 3,
+    "mountains": 2, "adventure": 2,
+}
+
+CATEGORY_NOUNS = {
+    "historical": ["Fort", "Castle", "Palace", "Ruins", "Old Town", "Citadel", "Amphitheatre"],
+    "museums": ["Museum", "Gallery", "Collection", "Science Centre", "Archive"],
+    "religious": ["Cathedral", "Temple", "Mosque", "Basilica", "Shrine", "Monastery"],
+    "architecture": ["Tower", "Bridge", "Arch", "Opera House", "Library"],
+    "cultural": ["Quarter", "Market", "Theatre", "Cultural Centre", "Bazaar"],
+    "parks": ["Gardens", "Park", "Botanical Garden", "Arboretum"],
+    "modern": ["Skyline Deck", "Observation Wheel", "Design District", "Waterfront"],
+    "entertainment": ["Aquarium", "Zoo", "Theme Park", "Arena"],
+    "natural": ["Falls", "Gorge", "Lake", "Caves", "Canyon"],
+    "beaches": ["Beach", "Bay", "Cove"],
+    "mountains": ["Peak", "Ridge", "Summit Trail"],
+    "adventure": ["Zipline", "Rafting Base", "Climbing Centre"],
+}
+
+NAME_QUALIFIERS = [
+    "Royal", "Grand", "Old", "New", "National", "Imperial", "Little", "Great", "Upper", "Lower",
+    "North", "South", "East", "West", "Golden", "Silver", "Crystal", "Ancient", "Hidden", "Sunset",
+]
+
+CURRENCY_FORMATS = {
+    "EUR": "€{}", "GBP": "£{}", "INR": "₹{}", "JPY": "¥{}", "CNY": "¥{}",
+    "USD": "${}", "AUD": "${}", "CAD": "${}", "BRL": "R${}", "JOD": "{} JOD",
+}
+
+# (weight, opening_hours) before closing days are added; None means the hours are unknown
+HOURS_PATTERNS = [
+    (30, ("9:00 AM", "5:00 PM")), (15, ("9:30 AM", "6:00 PM")), (12, ("10:00 AM", "6:00 PM")),
+    (8, ("8:00 AM", "7:00 PM")), (6, ("8:30 AM", "4:00 PM")), (5, ("10:00 AM", "11:00 PM")),
+    (4, ("6:00 AM", "6:00 PM")), (3, ("7:30 AM", "8:30 PM")), (2, ("6:00 AM", "1:00 AM")),
+    (6, "24/7"), (4, None),
+]
+CLOSED_DAYS = ["Mondays", "Tuesdays", "Sundays"]
+CLOSED_DAY_RATE = 0.25
+
+SAMPLE_START_ID = 1001  # synthetic IDs in sample catalogues, after the mock attractions
+
+FREE_RATE = 0.18
+MISSING_FEE_RATE = 0.04
+MISSING_RATING_RATE = 0.03
+
+
+def city_weights(count: int, skew: float = CITY_SKEW) -> List[float]:
+    """Zipf-like weights by popularity rank"""
+    return [1 / (rank ** skew) for rank in range(1, count + 1)]
+
+
+def format_amount(amount_usd: float, currency: str) -> str:
+    """Convert a USD amount to a local-currency fee string (e.g. "€16", "₹1100")"""
+    local = amount_usd / EXCHANGE_RATES_TO_USD[currency]
+    amount = f"{local:.2f}".rstrip("0").rstrip(".") if local < 10 else str(int(round(local)))
+    return CURRENCY_FORMATS[currency].format(amount)
+
+
+def generate_entry_fee(rng: random.Random, country: str) -> Any:
+    """Free-text entry fee in one of the catalogue's formats: free, single, range or tiered"""
+    roll = rng.random()
+    if roll < MISSING_FEE_RATE:
+        return None
+    if roll < MISSING_FEE_RATE + FREE_RATE:
+        return "Free"
+    currency = COUNTRY_CURRENCIES.get(country, "USD")
+    low = round(rng.lognormvariate(2.8, 0.6), 2)
+    style = rng.random()
+    if style < 0.5:
+        return format_amount(low, currency)
+    high = low * rng.uniform(1.3, 3.0)
+    if style < 0.85:
+        return f"{format_amount(low, currency)} - {format_amount(high, currency)}"
+    return f"{format_amount(high, currency)} (adults), {format_amount(low, currency)} (children)"
+
+
+def generate_opening_hours(rng: random.Random) -> Any:
+    """Free-text opening hours (e.g. "9:30 AM - 6:00 PM (closed Mondays)", "24/7")"""
+    pattern = rng.choices([pattern for _, pattern in HOURS_PATTERNS], [weight for weight, _ in HOURS_PATTERNS])[0]
+    if pattern is None or isinstance(pattern, str):
+        return pattern
+    hours = f"{pattern[0]} - {pattern[1]}"
+    if rng.random() < CLOSED_DAY_RATE:
+        hours += f" (closed {rng.choice(CLOSED_DAYS)})"
+    return hours
+
+
+def generate_attractions(count: int, seed: int = 0, start_id: int = 1) -> List[Dict[str, Any]]:
+    """Generate `count` attraction records in the MOCK_ATTRACTIONS format; the same seed gives the same catalogue"""
+    rng = random.Random(seed)
+    cities = rng.choices(CITIES, city_weights(len(CITIES)), k=count)
+    categories = list(CATEGORY_WEIGHTS)
+    category_cum_weights = list(accumulate(CATEGORY_WEIGHTS.values()))
+    attractions = []
+    for attraction_id, (city, country, region, latitude, longitude) in enumerate(cities, start_id):
+        category = rng.choices(categories, cum_weights=category_cum_weights)[0]
+        noun = rng.choice(CATEGORY_NOUNS[category])
+        name = f"{rng.choice(NAME_QUALIFIERS)} {noun} of {city}"
+        slug = f"{name.lower().replace(' ', '-')}-{attraction_id}"
+        rating = None
+        if rng.random() >= MISSING_RATING_RATE:
+            rating = round(min(5.0, max(1.0, rng.gauss(4.3, 0.35))), 1)
+        attractions.append({
+            "id": attraction_id,
+            "name": name,
+            "description": f"{ATTRACTION_CATEGORIES[category]} highlight: a {noun.lower()} in {city}, {country}",
+            "category": category,
+            "location": {
+                "city": city,
+                "country": country,
+                "region": region,
+                "latitude": round(latitude + rng.uniform(-CITY_RADIUS_DEGREES, CITY_RADIUS_DEGREES), 4),
+                "longitude": round(longitude + rng.uniform(-CITY_RADIUS_DEGREES, CITY_RADIUS_DEGREES), 4)
+            },
+            "rating": rating,
+            "image_url": f"https://example.com/{slug}.jpg",
+            "website": f"https://example.com/{slug}",
+            "opening_hours": generate_opening_hours(rng),
+            "entry_fee": generate_entry_fee(rng, country)
+        })
+    return attractions
+
+
+def pick_wonders(attractions: List[Dict[str, Any]], count: int = 8) -> List[int]:
+    """IDs of the best-rated historical or architectural attractions, one per city"""
+    seen = set()
+    wonders = []
+    ranked = sorted(attractions, key=lambda item: (-(item.get("rating") or 0), item["id"]))
+    for item in ranked:
+        city = item["location"]["city"]
+        if item["category"] in ("historical", "architecture") and city not in seen:
+            seen.add(city)
+            wonders.append(item["id"])
+            if len(wonders) == count:
+                break
+    return wonders
+
+
+def sample_catalogue(size: int, seed: int = 0) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """The mock attractions plus `size` synthetic ones (IDs from SAMPLE_START_ID), and their wonder IDs"""
+    attractions = MOCK_ATTRACTIONS + generate_attractions(size, seed=seed, start_id=SAMPLE_START_ID)
+    return attractions, pick_wonders(attractions)
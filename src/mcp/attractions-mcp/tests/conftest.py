@@ -0,0 +1,13 @@
+"""
+Test setup - Keeps the booking ledger, outbox, snapshot and profiles of a test run in a directory of its own.
+"""
+
+import os
+import tempfile
+
+# Set before config is first imported, so nothing is written next to the sources
+_run_dir = tempfile.mkdtemp(prefix="attractions-tests-")
+os.environ.setdefault("ATTRACTIONS_BOOKINGS_DB", os.path.join(_run_dir, "bookings.db"))
+os.environ.setdefault("ATTRACTIONS_OUTBOX_DIR", os.path.join(_run_dir, "outbox"))
+os.environ.setdefault("ATTRACTIONS_CATALOGUE_SNAPSHOT", os.path.join(_run_dir, "catalogue.snapshot"))
+os.environ.setdefault("ATTRACTIONS_PROFILE_DIR", os.path.join(_run_dir, "profiles"))
@@ -0,0 +1,50 @@
+"""
+Tests of autocomplete over attraction and place names with the prefix index.
+"""
+
+import attractions_service
+from indexes import PrefixIndex
+from models import Suggestion
+
+SUGGESTIONS = [
+    Suggestion("Eiffel Tower", "attraction", 1, 4.6),
+    Suggestion("Tower of London", "attraction", 2, 4.5),
+    Suggestion("Torre di Pisa", "attraction", 3, 4.8),
+    Suggestion("Tokyo", "city"),
+]
+
+
+def test_prefix_completes_any_word():
+    index = PrefixIndex(SUGGESTIONS)
+
+    assert [suggestion.text for suggestion in index.complete("tow")] == ["Eiffel Tower", "Tower of London"]
+    assert [suggestion.text for suggestion in index.complete("lon")] == ["Tower of London"]
+
+
+def test_prefix_ranks_by_rating_and_limits():
+    index = PrefixIndex(SUGGESTIONS)
+
+    assert [suggestion.text for suggestion in index.complete("to", limit=2)] == ["Torre di Pisa", "Eiffel Tower"]
+
+
+def test_prefix_beyond_precomputed_length():
+    index = PrefixIndex(SUGGESTIONS)
+
+    assert [suggestion.text for suggestion in index.complete("tower of lo")] == ["Tower of London"]
+    assert index.complete("towers") == []
+    assert index.complete("  ") == []
+
+
+def test_autocomplete_tool_suggests_places_and_attractions():
+    result = attractions_service.autocomplete_attractions_data("par")
+
+    assert result["prefix"] == "par"
+    assert [(suggestion["text"], suggestion["kind"]) for suggestion in result["suggestions"]] == [
+        ("Paris", "city"), ("Central Park", "attraction")
+    ]
+
+
+def test_autocomplete_tool_limit():
+    result = attractions_service.autocomplete_attractions_data("par", limit=1)
+
+    assert [suggestion["text"] for suggestion in result["suggestions"]] == ["Paris"]
@@ -0,0 +1,76 @@
+"""
+Tests of per-day and per-slot capacity and the availability tool.
+"""
+
+import pytest
+
+import attractions_service
+from bookings import BookingError, BookingStore
+from utils import generate_booking_id
+
+VISIT_DATE = "2030-06-03"
+SLOTS = [("09:00", 2), ("10:00", 2)]
+DAILY_CAPACITY = 3
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BookingStore(str(tmp_path / "bookings.db"))
+
+
+def booking(**values):
+    return dict({
+        "booking_id": generate_booking_id(),
+        "idempotency_key": None,
+        "attraction_id": 1,
+        "visitor_name": "Ada Lovelace",
+        "email": "ada@example.com",
+        "visit_date": VISIT_DATE,
+        "num_visitors": 1,
+        "booking_status": "confirmed"
+    }, **values)
+
+
+def test_bookings_fill_the_earliest_slot_with_room(store):
+    slots = [store.create_booking(booking(), SLOTS, DAILY_CAPACITY).time_slot for _ in range(3)]
+
+    assert slots == ["09:00", "09:00", "10:00"]
+    assert store.reserved_counts(1, VISIT_DATE) == (3, [2, 1])
+
+
+def test_daily_capacity_is_not_exceeded(store):
+    store.create_booking(booking(num_visitors=3), [("09:00", 3)], DAILY_CAPACITY)
+
+    with pytest.raises(BookingError, match="fully booked"):
+        store.create_booking(booking(), SLOTS, DAILY_CAPACITY)
+
+
+def test_requested_slot_without_room(store):
+    store.create_booking(booking(num_visitors=2), SLOTS, DAILY_CAPACITY, slot_index=0)
+
+    with pytest.raises(BookingError, match="09:00 slot"):
+        store.create_booking(booking(), SLOTS, DAILY_CAPACITY, slot_index=0)
+    assert store.reserved_counts(1, VISIT_DATE) == (2, [2])
+
+
+def test_availability_reports_reserved_places():
+    attractions_service.book_attraction_data(3, "Ada Lovelace", "ada@example.com", "2031-03-04", 2)
+
+    availability = attractions_service.get_availability_data(3, "2031-03-04", "2031-03-05")
+
+    booked, following = availability["days"]
+    assert (booked["date"], booked["reserved"], booked["available"]) == ("2031-03-04", 2, booked["capacity"] - 2)
+    assert booked["slots"][0]["reserved"] == 2
+    assert following["reserved"] == 0
+
+
+@pytest.mark.parametrize("attraction_id, start_date, end_date, error", [
+    (999, "2031-03-04", None, "not found"),
+    (3, "March 4th", None, "YYYY-MM-DD"),
+    (3, "2031-03-04", "2031-03-03", "1 to 31 days"),
+    (3, "2031-03-04", "2031-05-04", "1 to 31 days")
+])
+def test_availability_argument_errors(attraction_id, start_date, end_date, error):
+    result = attractions_service.get_availability_data(attraction_id, start_date, end_date)
+
+    assert error in result["error"]
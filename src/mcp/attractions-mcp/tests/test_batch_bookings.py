@@ -0,0 +1,86 @@
+"""
+Tests of booking several attractions at once, all or nothing.
+"""
+
+import pytest
+
+import attractions_service
+from bookings import BatchBookingError, BookingStore
+from utils import generate_booking_id
+
+VISIT_DATE = "2030-06-03"
+SLOTS = [("09:00", 2), ("10:00", 2)]
+DAILY_CAPACITY = 3
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BookingStore(str(tmp_path / "bookings.db"))
+
+
+def booking(**values):
+    return dict({
+        "booking_id": generate_booking_id(),
+        "idempotency_key": None,
+        "attraction_id": 1,
+        "visitor_name": "Ada Lovelace",
+        "email": "ada@example.com",
+        "visit_date": VISIT_DATE,
+        "num_visitors": 1,
+        "booking_status": "confirmed"
+    }, **values)
+
+
+def test_batch_books_every_item(store):
+    bookings = store.create_bookings([
+        (booking(attraction_id=1), SLOTS, DAILY_CAPACITY, None),
+        (booking(attraction_id=2), SLOTS, DAILY_CAPACITY, None)
+    ])
+
+    assert [confirmed.attraction_id for confirmed in bookings] == [1, 2]
+    assert store.reserved_counts(2, VISIT_DATE) == (1, [1])
+
+
+def test_batch_is_all_or_nothing(store):
+    items = [
+        (booking(attraction_id=1, num_visitors=2), SLOTS, DAILY_CAPACITY, None),
+        (booking(attraction_id=2, num_visitors=2), SLOTS, DAILY_CAPACITY, None),
+        (booking(attraction_id=2, num_visitors=2), SLOTS, DAILY_CAPACITY, None)
+    ]
+
+    with pytest.raises(BatchBookingError) as error:
+        store.create_bookings(items)
+
+    assert error.value.index == 2
+    assert store.reserved_counts(1, VISIT_DATE) == (0, [])
+    assert store.reserved_counts(2, VISIT_DATE) == (0, [])
+    assert store.list_bookings("ada@example.com") == []
+
+
+def test_service_reports_each_malformed_batch_item():
+    result = attractions_service.book_attractions_batch_data(
+        [{"attraction_id": 1, "visit_date": VISIT_DATE}, "not an item", {"attraction_id": "2", "visit_date": VISIT_DATE}],
+        "Ada Lovelace", "ada@example.com"
+    )
+
+    assert result["status"] == "rejected"
+    assert [item["status"] for item in result["results"]] == ["not_booked", "failed", "failed"]
+
+
+@pytest.mark.parametrize("field, value, error", [
+    ("num_visitors", "2", "whole number"),
+    ("num_visitors", True, "whole number"),
+    ("num_visitors", 51, "between 1 and 50"),
+    ("visit_date", 20300603, "YYYY-MM-DD"),
+    ("visit_date", "03/06/2030", "YYYY-MM-DD"),
+    ("time_slot", 930, "HH:MM")
+])
+def test_service_reports_malformed_fields_on_their_item(field, value, error):
+    items = [{"attraction_id": 1, "visit_date": VISIT_DATE}, {"attraction_id": 2, "visit_date": VISIT_DATE, field: value}]
+
+    result = attractions_service.book_attractions_batch_data(items, "Ada Lovelace", "ada@example.com")
+
+    assert result["status"] == "rejected"
+    valid, malformed = result["results"]
+    assert valid["status"] == "not_booked"
+    assert malformed["status"] == "failed" and error in malformed["error"]
@@ -0,0 +1,69 @@
+"""
+Tests of the booking ledger: idempotent bookings and cancellation.
+"""
+
+import pytest
+
+import attractions_service
+from bookings import BookingError, BookingStore
+from utils import generate_booking_id
+
+VISIT_DATE = "2030-06-03"
+SLOTS = [("09:00", 2), ("10:00", 2)]
+DAILY_CAPACITY = 3
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BookingStore(str(tmp_path / "bookings.db"))
+
+
+def booking(**values):
+    return dict({
+        "booking_id": generate_booking_id(),
+        "idempotency_key": None,
+        "attraction_id": 1,
+        "visitor_name": "Ada Lovelace",
+        "email": "ada@example.com",
+        "visit_date": VISIT_DATE,
+        "num_visitors": 1,
+        "booking_status": "confirmed"
+    }, **values)
+
+
+def test_idempotency_key_replays_the_booking(store):
+    first = store.create_booking(booking(idempotency_key="retry-1"), SLOTS, DAILY_CAPACITY)
+    again = store.create_booking(booking(idempotency_key="retry-1"), SLOTS, DAILY_CAPACITY)
+
+    assert again.booking_id == first.booking_id
+    assert again.replayed and not first.replayed
+    assert store.reserved_counts(1, VISIT_DATE) == (1, [1])
+
+
+def test_idempotency_key_reuse_for_another_booking(store):
+    store.create_booking(booking(idempotency_key="retry-2"))
+
+    with pytest.raises(BookingError, match="already used"):
+        store.create_booking(booking(idempotency_key="retry-2", num_visitors=2))
+
+
+def test_cancelling_releases_capacity(store):
+    confirmed = store.create_booking(booking(num_visitors=2), SLOTS, DAILY_CAPACITY)
+
+    store.cancel_booking(confirmed.booking_id, "ADA@example.com")
+
+    assert store.reserved_counts(1, VISIT_DATE) == (0, [0])
+    assert store.get_booking(confirmed.booking_id).booking_status == "cancelled"
+
+
+def test_service_replays_an_idempotent_booking():
+    arguments = dict(
+        attraction_id=1, visitor_name="Ada Lovelace", email="ada@example.com", visit_date=VISIT_DATE,
+        num_visitors=2, idempotency_key="service-retry"
+    )
+
+    first = attractions_service.book_attraction_data(**arguments)
+    again = attractions_service.book_attraction_data(**arguments)
+
+    assert "error" not in first
+    assert again["booking_id"] == first["booking_id"] and again["replayed"]
@@ -0,0 +1,47 @@
+"""
+Tests of tool results built by the shared encoder, called through the MCP SDK.
+"""
+
+import asyncio
+
+import pytest
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp_common.encoding import ENCODERS, make_encoder, set_encoder
+
+import main
+from models import Price
+
+
+def call_tool(name, arguments):
+    async def call():
+        async with create_connected_server_and_client_session(main.mcp) as session:
+            return await session.call_tool(name, arguments)
+
+    return asyncio.run(call())
+
+
+@pytest.fixture(params=list(ENCODERS))
+def encoder(request):
+    encoder = make_encoder(request.param)
+    if encoder.name != request.param:
+        pytest.skip(f"{request.param} is not installed")
+    yield set_encoder(encoder)
+    set_encoder()
+
+
+def test_dict_tool_returns_structured_result(encoder):
+    result = call_tool("search_attractions", {"limit": 2})
+
+    assert not result.isError
+    search = result.structuredContent["result"]
+    assert isinstance(search, dict)
+    assert len(search["attractions"]) == 2
+    assert encoder.loads(result.content[0].text.encode()) == search
+
+
+def test_models_convert_to_builtins(encoder):
+    price = Price(currency="EUR", min_amount=10.0, max_amount=15.0)
+    expected = {"currency": "EUR", "min_amount": 10.0, "max_amount": 15.0, "min_usd": None, "max_usd": None, "is_free": False}
+
+    assert encoder.to_builtins({"prices": [price]}) == {"prices": [expected]}
+    assert encoder.loads(encoder.dumps(price)) == expected
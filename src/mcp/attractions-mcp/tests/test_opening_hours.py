@@ -0,0 +1,98 @@
+"""
+Tests of opening hours parsing and the open-at index.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from catalogue import get_catalogue
+from models import SearchFilters
+from utils import parse_opening_hours, day_windows, format_day_hours
+
+
+def test_daily_hours():
+    hours = parse_opening_hours("9:30 AM - 11:45 PM")
+
+    assert all(day_windows(hours, weekday) == [(570, 1425)] for weekday in range(7))
+
+
+def test_hours_per_day_range():
+    hours = parse_opening_hours("Mon-Fri 9:00 AM - 5:00 PM; Sat 10:00 AM - 2:00 PM")
+
+    assert day_windows(hours, 0) == [(540, 1020)]
+    assert day_windows(hours, 5) == [(600, 840)]
+    assert day_windows(hours, 6) == []
+
+
+def test_closed_days():
+    hours = parse_opening_hours("9:00 AM - 6:00 PM (closed Tuesdays)")
+
+    assert day_windows(hours, 1) == []
+    assert day_windows(hours, 2) == [(540, 1080)]
+
+
+def test_overnight_hours_carry_into_next_day():
+    hours = parse_opening_hours("8 PM - 2 AM")
+
+    assert day_windows(hours, 3) == [(0, 120), (1200, 1560)]
+
+
+def test_always_open():
+    hours = parse_opening_hours("24/7")
+
+    assert day_windows(hours, 4)[0][0] == 0 and day_windows(hours, 4)[0][1] >= 1440
+
+
+def test_per_day_entries():
+    hours = parse_opening_hours(None, [{"day": "Mon", "open": "10:00", "close": "17:00"}])
+
+    assert [(entry.day, entry.open, entry.close) for entry in format_day_hours(hours)] == [("Mon", "10:00", "17:00")]
+
+
+@pytest.mark.parametrize("opening_hours", [None, "", "By appointment"])
+def test_unparsed_hours(opening_hours):
+    assert parse_opening_hours(opening_hours) is None
+
+
+@pytest.mark.parametrize("opening_hours, window", [
+    ("1 - 5 PM", (780, 1020)),
+    # The closing meridiem would open at 23:00, after closing, so the opening time is in the morning
+    ("11 - 3 PM", (660, 900)),
+    ("9 - 5 PM", (540, 1020)),
+    ("10:00 - 18:00", (600, 1080)),
+])
+def test_opening_time_without_meridiem(opening_hours, window):
+    assert day_windows(parse_opening_hours(opening_hours), 0) == [window]
+
+
+def test_malformed_entries_are_skipped():
+    hours = parse_opening_hours(None, [
+        {"day": "Mon", "open": "10"},
+        None,
+        {"day": "Wed", "open": "10:00"},
+        {"open": "10:00", "close": "17:00"},
+        {"day": "Tue", "open": "10:00", "close": "24:00"}
+    ])
+
+    assert [(entry.day, entry.open, entry.close) for entry in format_day_hours(hours)] == [("Tue", "10:00", "24:00")]
+
+
+def test_unusable_entries_fall_back_to_the_display_string():
+    hours = parse_opening_hours("9:00 AM - 5:00 PM", [{"day": "Mon", "open": "late", "close": "17:00"}])
+
+    assert all(day_windows(hours, weekday) == [(540, 1020)] for weekday in range(7))
+    assert parse_opening_hours(None, [{"day": "Mon"}]) is None
+
+
+def test_open_at_filter_matches_day_windows():
+    catalogue = get_catalogue()
+    moment = datetime(2030, 6, 3, 8, 30)  # a Monday
+
+    result = catalogue.search(SearchFilters(open_at=moment), limit=100)
+
+    minute = moment.hour * 60 + moment.minute
+    for attraction in result["attractions"]:
+        hours = catalogue.get_opening_hours(attraction["id"])
+        assert any(start <= minute < end for start, end in day_windows(hours, moment.weekday()))
+    assert len(result["attractions"]) < len(catalogue)
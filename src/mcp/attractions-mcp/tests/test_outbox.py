@@ -0,0 +1,109 @@
+"""
+Tests of delivering booking side-effects from the outbox.
+"""
+
+import threading
+import time
+
+import pytest
+
+from bookings import BookingStore
+from config import OUTBOX_SINKS
+from outbox import LocalSink, OutboxDispatcher
+from utils import generate_booking_id
+
+
+class RecordingSink:
+    def __init__(self, failing: bool = False):
+        self.failing = failing
+        self.deliveries = []
+        self._lock = threading.Lock()
+
+    def __call__(self, event, payload):
+        if self.failing:
+            raise ConnectionError("sink unavailable")
+        with self._lock:
+            self.deliveries.append((event, payload))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BookingStore(str(tmp_path / "bookings.db"))
+
+
+def settled(delivery):
+    # A claimed delivery counts its attempt before the sink is called; it is settled once its outcome is stored
+    return delivery.status != "pending" or delivery.last_error is not None
+
+
+def dispatch(store, sinks):
+    dispatcher = OutboxDispatcher(store, sinks, workers=2).start()
+    try:
+        booking = store.create_booking({
+            "booking_id": generate_booking_id(), "attraction_id": 1, "visitor_name": "Ada Lovelace",
+            "email": "ada@example.com", "visit_date": "2030-06-03", "num_visitors": 2, "booking_status": "confirmed"
+        })
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            status = store.delivery_status(booking.booking_id)
+            if all(settled(delivery) for delivery in status.deliveries):
+                break
+            time.sleep(0.02)
+        return booking, status
+    finally:
+        dispatcher.stop(timeout=5)
+
+
+def test_every_sink_receives_the_booking(store):
+    sinks = {name: RecordingSink() for name in OUTBOX_SINKS}
+
+    booking, status = dispatch(store, sinks)
+
+    assert status.counts == {"delivered": len(OUTBOX_SINKS)}
+    for sink in sinks.values():
+        [(event, payload)] = sink.deliveries
+        assert event == "booking.confirmed"
+        assert payload["booking_id"] == booking.booking_id and payload["num_visitors"] == 2
+
+
+def test_failed_delivery_is_kept_for_retry(store):
+    sinks = {name: RecordingSink(failing=name == "partner_api") for name in OUTBOX_SINKS}
+
+    _, status = dispatch(store, sinks)
+
+    failed = [delivery for delivery in status.deliveries if delivery.status == "pending"]
+    assert [delivery.sink for delivery in failed] == ["partner_api"]
+    assert failed[0].attempts == 1 and "sink unavailable" in failed[0].last_error
+    assert status.counts == {"delivered": len(OUTBOX_SINKS) - 1, "pending": 1}
+
+
+def test_unregistered_sink_is_not_delivered(store):
+    sinks = {name: RecordingSink() for name in OUTBOX_SINKS if name != "audit_log"}
+
+    _, status = dispatch(store, sinks)
+
+    assert [delivery.last_error for delivery in status.deliveries if delivery.sink == "audit_log"] == [
+        "LookupError: No sink registered for audit_log"
+    ]
+
+
+def test_outbox_events_are_written_with_the_booking(store):
+    confirmed = store.create_booking({
+        "booking_id": generate_booking_id(), "attraction_id": 1, "visitor_name": "Ada Lovelace",
+        "email": "ada@example.com", "visit_date": "2030-06-03", "num_visitors": 1, "booking_status": "confirmed"
+    })
+
+    status = store.delivery_status(confirmed.booking_id)
+
+    assert status.counts == {"pending": 3}
+    assert {delivery.sink for delivery in status.deliveries} == {"confirmation_email", "partner_api", "audit_log"}
+
+
+def test_local_sink_appends_json_lines(tmp_path):
+    sink = LocalSink("audit_log", str(tmp_path))
+
+    sink("booking.confirmed", {"booking_id": "ATT-1"})
+    sink("booking.cancelled", {"booking_id": "ATT-1"})
+
+    lines = (tmp_path / "audit_log.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2 and '"event": "booking.cancelled"' in lines[1]
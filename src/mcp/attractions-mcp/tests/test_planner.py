@@ -0,0 +1,141 @@
+"""
+Tests of the day itinerary planner.
+"""
+
+from datetime import date
+
+import pytest
+
+import attractions_service
+from catalogue import AttractionCatalogue
+from config import MOCK_ATTRACTIONS, WORLD_WONDERS
+from planner import plan_day
+from utils import day_windows, parse_clock
+
+# More Paris and Rome attractions than the shared mocks have, so plans have several stops to order
+CITY_ATTRACTIONS = [
+    {
+        "id": 16,
+        "name": "Musée d'Orsay",
+        "description": "Impressionist and post-Impressionist masterpieces in a former Beaux-Arts railway station",
+        "category": "museums",
+        "location": {"city": "Paris", "country": "France", "region": "Île-de-France", "latitude": 48.86, "longitude": 2.3266},
+        "rating": 4.7,
+        "image_url": "https://example.com/musee-orsay.jpg",
+        "website": "https://www.musee-orsay.fr",
+        "opening_hours": "9:30 AM - 6:00 PM (closed Mondays)",
+        "entry_fee": "€16"
+    },
+    {
+        "id": 17,
+        "name": "Arc de Triomphe",
+        "description": "Triumphal arch at the western end of the Champs-Élysées with a rooftop view over Paris",
+        "category": "historical",
+        "location": {"city": "Paris", "country": "France", "region": "Île-de-France", "latitude": 48.8738, "longitude": 2.295},
+        "rating": 4.6,
+        "image_url": "https://example.com/arc-de-triomphe.jpg",
+        "website": "https://www.paris-arc-de-triomphe.fr",
+        "opening_hours": "10:00 AM - 11:00 PM",
+        "entry_fee": "€16"
+    },
+    {
+        "id": 18,
+        "name": "Jardin du Luxembourg",
+        "description": "17th-century palace gardens with fountains, orchards and tree-lined promenades",
+        "category": "parks",
+        "location": {"city": "Paris", "country": "France", "region": "Île-de-France", "latitude": 48.8462, "longitude": 2.3372},
+        "rating": 4.7,
+        "image_url": "https://example.com/jardin-luxembourg.jpg",
+        "website": "https://www.senat.fr/visite/jardin",
+        "opening_hours": "7:30 AM - 8:30 PM",
+        "entry_fee": "Free"
+    },
+    {
+        "id": 19,
+        "name": "Trevi Fountain",
+        "description": "Baroque fountain in the Trevi district, the largest and most famous fountain in Rome",
+        "category": "architecture",
+        "location": {"city": "Rome", "country": "Italy", "region": "Lazio", "latitude": 41.9009, "longitude": 12.4833},
+        "rating": 4.7,
+        "image_url": "https://example.com/trevi-fountain.jpg",
+        "website": "https://www.turismoroma.it",
+        "opening_hours": "24/7",
+        "entry_fee": "Free"
+    },
+    {
+        "id": 20,
+        "name": "Vatican Museums",
+        "description": "Papal art collections including the Raphael Rooms and the Sistine Chapel",
+        "category": "museums",
+        "location": {"city": "Rome", "country": "Italy", "region": "Lazio", "latitude": 41.9065, "longitude": 12.4536},
+        "rating": 4.6,
+        "image_url": "https://example.com/vatican-museums.jpg",
+        "website": "https://www.museivaticani.va",
+        "opening_hours": "8:00 AM - 7:00 PM (closed Sundays)",
+        "entry_fee": "€20 - €25"
+    }
+]
+
+MONDAY = date(2030, 6, 3)
+DAY_START, DAY_END = parse_clock("09:00"), parse_clock("20:00")
+
+
+@pytest.fixture(scope="module")
+def catalogue():
+    return AttractionCatalogue(MOCK_ATTRACTIONS + CITY_ATTRACTIONS, WORLD_WONDERS)
+
+
+def minutes(clock):
+    return parse_clock(clock)
+
+
+def test_stops_are_scheduled_within_opening_hours(catalogue):
+    plan = plan_day(catalogue, "Paris", MONDAY, [], DAY_START, DAY_END)
+
+    assert len(plan.stops) >= 3
+    previous_end = DAY_START
+    for stop in plan.stops:
+        windows = day_windows(catalogue.get_opening_hours(stop.attraction_id), MONDAY.weekday())
+        assert any(opens <= minutes(stop.start) and minutes(stop.end) <= closes for opens, closes in windows)
+        assert minutes(stop.arrival) == previous_end + stop.travel_minutes
+        assert minutes(stop.start) >= minutes(stop.arrival)
+        previous_end = minutes(stop.end)
+    assert previous_end <= DAY_END
+
+
+def test_closed_attractions_are_left_out(catalogue):
+    plan = plan_day(catalogue, "Paris", MONDAY, [], DAY_START, DAY_END, max_stops=8)
+
+    # Musée d'Orsay is closed on Mondays
+    assert 16 not in [stop.attraction_id for stop in plan.stops]
+
+
+def test_budget_limits_entry_costs(catalogue):
+    plan = plan_day(catalogue, "Paris", MONDAY, [], DAY_START, DAY_END, budget=0)
+
+    assert plan.stops and all(stop.estimated_cost_usd == 0 for stop in plan.stops)
+    assert plan.total_cost_usd == 0
+
+
+def test_preferences_and_stop_limit(catalogue):
+    plan = plan_day(catalogue, "Rome", MONDAY, ["museums"], DAY_START, DAY_END, max_stops=1)
+
+    assert [stop.category for stop in plan.stops] == ["museums"]
+
+
+def test_plan_is_for_one_city(catalogue):
+    plan = plan_day(catalogue, "Italy", MONDAY, [], DAY_START, DAY_END)
+
+    assert {catalogue.get(stop.attraction_id)["location"]["city"] for stop in plan.stops} == {"Rome"}
+
+
+@pytest.mark.parametrize("arguments, error", [
+    ({"date": "03/06/2030"}, "Date must be in YYYY-MM-DD format"),
+    ({"start_time": "9am"}, "Start time must be in HH:MM format"),
+    ({"start_time": "21:00"}, "Start time must be before 20:00"),
+    ({"budget": -1}, "Budget cannot be negative"),
+])
+def test_service_rejects_invalid_arguments(arguments, error):
+    result = attractions_service.plan_day_data(**dict({"location": "Paris", "date": "2030-06-03"}, **arguments))
+
+    assert result == {"error": error}
@@ -0,0 +1,66 @@
+"""
+Tests of entry fee parsing, price filters and cost estimates.
+"""
+
+import pytest
+
+from catalogue import get_catalogue
+from models import SearchFilters
+from utils import calculate_estimated_cost, parse_entry_fee
+
+
+@pytest.mark.parametrize("entry_fee, currency, min_amount, max_amount, is_free", [
+    ("€29.40 - €73.30", "EUR", 29.4, 73.3, False),
+    ("USD 20", "USD", 20.0, 20.0, False),
+    ("$1,250", "USD", 1250.0, 1250.0, False),
+    ("₹1100 (foreigners), ₹50 (Indians)", "INR", 50.0, 1100.0, False),
+    # A free tier makes the lowest price 0
+    ("Adults 15 EUR, children free", "EUR", 0.0, 15.0, False),
+    # Free entry to the attraction itself, with a paid extra
+    ("Free entry; museum €10", "EUR", 0.0, 10.0, True),
+])
+def test_entry_fee_amounts(entry_fee, currency, min_amount, max_amount, is_free):
+    price = parse_entry_fee(entry_fee)
+
+    assert (price.currency, price.min_amount, price.max_amount, price.is_free) == (currency, min_amount, max_amount, is_free)
+
+
+def test_entry_fee_converts_to_usd():
+    price = parse_entry_fee("USD 20")
+
+    assert (price.min_usd, price.max_usd) == (20.0, 20.0)
+
+
+def test_free_entry_without_amounts():
+    price = parse_entry_fee("Free")
+
+    assert price.is_free and price.currency is None and price.max_usd == 0.0
+
+
+@pytest.mark.parametrize("entry_fee", [None, "", "Donations welcome"])
+def test_entry_fee_without_amounts(entry_fee):
+    assert parse_entry_fee(entry_fee) is None
+
+
+def test_cost_estimate_uses_lowest_or_highest_price():
+    price = parse_entry_fee("€29.40 - €73.30")
+
+    assert calculate_estimated_cost(2, price) == 58.8
+    assert calculate_estimated_cost(2, price, upper=True) == 146.6
+    assert calculate_estimated_cost(3, parse_entry_fee("Free")) == 0.0
+    assert calculate_estimated_cost(3, None) is None
+
+
+def test_max_price_filter_uses_usd_prices():
+    catalogue = get_catalogue()
+
+    result = catalogue.search(SearchFilters(max_price=20), limit=100)
+
+    prices = [attraction["price"] for attraction in result["attractions"]]
+    assert prices and all(price.min_usd is not None and price.min_usd <= 20 for price in prices)
+
+
+def test_free_entry_filter():
+    result = get_catalogue().search(SearchFilters(free_entry=True), limit=100)
+
+    assert result["attractions"] and all(attraction["price"].is_free for attraction in result["attractions"])
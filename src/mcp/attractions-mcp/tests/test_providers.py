@@ -0,0 +1,126 @@
+"""
+Tests of the upstream provider against a local stand-in of the attractions API.
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from cache import TTLCache
+from providers import LocalProvider, UpstreamProvider
+from shard_server import serve
+from stub_upstream import StubUpstream
+from upstream import UpstreamClient
+
+OPEN_AT = datetime(2030, 6, 3, 11, 0)
+
+
+class UnfilteredStub(StubUpstream):
+    """The stub API ignoring every search filter but location, category and limit"""
+
+    def respond(self, path, query):
+        return super().respond(path, {key: value for key, value in query.items() if key in ("location", "category", "limit")})
+
+
+def serve_stub(stub):
+    server = serve(stub, port=0)
+    stub.url = f"http://127.0.0.1:{server.server_address[1]}"
+    return server
+
+
+@pytest.fixture
+def stub():
+    stub = StubUpstream(size=20)
+    server = serve_stub(stub)
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="module")
+def stubs():
+    """A stub applying search filters and one ignoring them, over the same catalogue"""
+    stubs = StubUpstream(size=20), UnfilteredStub(size=20)
+    servers = [serve_stub(stub) for stub in stubs]
+    yield stubs
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def ids(result):
+    return [attraction["id"] for attraction in result["attractions"]]
+
+
+def test_upstream_results_are_merged_with_local(stub):
+    provider = UpstreamProvider(UpstreamClient(stub.url))
+
+    result = provider.search("Paris", limit=50)
+
+    local = LocalProvider().search("Paris", limit=50)
+    assert set(ids(local)) < set(ids(result))
+    assert provider.fallbacks == 0
+
+
+@pytest.mark.parametrize("filters", [
+    {"rating_min": 4.5}, {"max_price": 20}, {"free_entry": True}, {"free_entry": False}, {"open_at": OPEN_AT},
+    {"open_at": OPEN_AT, "open_until": OPEN_AT.replace(hour=16)}
+])
+def test_filters_are_applied_to_upstream_records(stubs, filters):
+    filtering_stub, unfiltered_stub = stubs
+    filtered = UpstreamProvider(UpstreamClient(filtering_stub.url))
+    unfiltered = UpstreamProvider(UpstreamClient(unfiltered_stub.url))
+
+    expected = filtered.search(limit=500, **filters)
+    result = unfiltered.search(limit=500, **filters)
+
+    assert ids(result) and ids(result) == ids(expected)
+    assert result["total"] == len(ids(result)) and not result["total_is_estimate"]
+
+
+def test_total_beyond_the_upstream_page_is_an_estimate(stubs):
+    provider = UpstreamProvider(UpstreamClient(stubs[1].url))
+
+    page = provider.search("Paris", limit=2)
+    everything = provider.search("Paris", limit=500)
+
+    assert page["total_is_estimate"] and page["total"] >= everything["total"]
+    assert not everything["total_is_estimate"] and everything["total"] == len(ids(everything))
+
+
+def test_unavailable_upstream_falls_back_to_local(stub):
+    stub.failure_rate = 1.0
+    provider = UpstreamProvider(UpstreamClient(stub.url, cooldown_seconds=60))
+
+    result = provider.search("Paris", limit=50)
+    again = provider.search("Rome", limit=50)
+
+    assert ids(result) == ids(LocalProvider().search("Paris", limit=50))
+    assert ids(again) == ids(LocalProvider().search("Rome", limit=50))
+    assert provider.fallbacks == 2
+    # Upstream is left alone during the cooldown rather than called again
+    assert provider.client.requests == 1 and not provider.client.available()
+
+
+def test_stale_response_is_served_while_upstream_fails(stub):
+    provider = UpstreamProvider(UpstreamClient(stub.url, ttls={"search": 0.01}, cooldown_seconds=60))
+    fresh = provider.search("Paris", limit=50)
+    stub.failure_rate = 1.0
+    time.sleep(0.05)
+
+    stale = provider.search("Paris", limit=50)
+
+    assert ids(stale) == ids(fresh)
+    assert provider.client.stale_served == 1 and provider.fallbacks == 0
+
+
+def test_ttl_cache_keeps_expired_entries_as_stale():
+    now = [0.0]
+    cache = TTLCache(4, clock=lambda: now[0])
+    cache.put("search", "paris", ttl=10)
+
+    now[0] = 10.0
+
+    assert cache.get("search") is None
+    assert cache.get_stale("search") == "paris"
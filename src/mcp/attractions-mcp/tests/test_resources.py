@@ -0,0 +1,61 @@
+"""
+Tests of formatted resources memoised per catalogue version.
+"""
+
+import pytest
+
+import attractions_service
+from cache import LRUCache
+from catalogue import get_catalogue, reload_catalogue
+from config import MOCK_ATTRACTIONS
+
+
+@pytest.fixture
+def catalogue():
+    yield reload_catalogue()
+    reload_catalogue()
+
+
+def test_resources_end_with_the_catalogue_version(catalogue):
+    wonders = attractions_service.get_world_wonders_data()
+
+    assert wonders.endswith(f"_Catalogue version: {catalogue.version}_\n")
+
+
+def test_resources_are_built_once_per_version(catalogue):
+    first = attractions_service.get_attraction_categories_data()
+    again = attractions_service.get_attraction_categories_data()
+
+    assert again is first
+    assert (catalogue.resources.misses, catalogue.resources.hits) == (1, 1)
+
+
+def test_errors_are_not_cached(catalogue):
+    error = attractions_service.format_attraction_resource(999)
+
+    assert error == "Error: Attraction with ID 999 not found"
+    assert len(catalogue.resources) == 0
+
+
+def test_reloading_starts_a_new_version_with_an_empty_cache(catalogue):
+    attractions_service.get_world_wonders_data()
+
+    same = reload_catalogue()
+    changed = reload_catalogue(MOCK_ATTRACTIONS[:-1])
+
+    assert same.version == catalogue.version and len(same.resources) == 0
+    assert changed.version != catalogue.version
+    assert get_catalogue() is changed
+    assert attractions_service.get_catalogue_version_data()["version"] == changed.version
+
+
+def test_lru_cache_evicts_the_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
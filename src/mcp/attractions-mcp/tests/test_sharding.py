@@ -0,0 +1,82 @@
+"""
+Tests of the catalogue sharded by country across shard servers.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from catalogue import AttractionCatalogue
+from config import MOCK_ATTRACTIONS, WORLD_WONDERS
+from providers import LocalProvider, ShardedProvider
+from shard_server import ShardApi, serve
+from sharding import local_shards, shard_of, shard_rows, shard_urls
+
+OPEN_AT = datetime(2030, 6, 3, 11, 0)
+
+
+def serve_shard(shard, count=2):
+    catalogue = AttractionCatalogue(shard_rows(MOCK_ATTRACTIONS, {shard}, count), WORLD_WONDERS)
+    server = serve(ShardApi(catalogue, {shard}), port=0)
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+@pytest.fixture
+def shard_servers():
+    served = [serve_shard(shard) for shard in range(2)]
+    yield {shard: url for shard, (_, url) in enumerate(served)}
+    for server, _ in served:
+        server.shutdown()
+        server.server_close()
+
+
+def ids(result):
+    return [attraction["id"] for attraction in result["attractions"]]
+
+
+def test_every_attraction_has_one_shard():
+    shards = [shard_rows(MOCK_ATTRACTIONS, {shard}, 3) for shard in range(3)]
+
+    assert sorted(data["id"] for rows in shards for data in rows) == [data["id"] for data in MOCK_ATTRACTIONS]
+    assert shard_of("France", 3) == shard_of("  FRANCE ", 3)
+
+
+def test_shard_settings():
+    urls = shard_urls("0=http://a:8001/, 2=http://c:8001")
+
+    assert urls == {0: "http://a:8001", 2: "http://c:8001"}
+    assert local_shards("", count=3, remote=urls) == {1}
+    assert local_shards("0,2", count=3, remote=urls) == {0, 2}
+
+
+def test_sharded_search_matches_one_catalogue(shard_servers):
+    provider = ShardedProvider(shard_servers, count=2, local=set())
+
+    result = provider.search(category="historical", limit=50, rating_min=4.5, open_at=OPEN_AT)
+
+    expected = LocalProvider().search(category="historical", limit=50, rating_min=4.5, open_at=OPEN_AT)
+    assert ids(result) and ids(result) == ids(expected) and result["total"] == expected["total"]
+    assert provider.partial_results == 0
+
+
+def test_location_search_goes_to_the_owning_shard(shard_servers):
+    provider = ShardedProvider(shard_servers, count=2, local=set())
+
+    result = provider.search("Pariss", limit=10)
+
+    assert provider.owners("Paris") == {shard_of("France", 2)}
+    assert ids(result) == [1, 5] and result["corrected_location"] == "Paris"
+
+
+def test_unavailable_shard_is_left_out():
+    server, url = serve_shard(0)
+    try:
+        provider = ShardedProvider({0: url, 1: "http://127.0.0.1:9"}, count=2, local=set())
+
+        result = provider.search(limit=50)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert ids(result) == [data["id"] for data in shard_rows(MOCK_ATTRACTIONS, {0}, 2)]
+    assert provider.partial_results >= 1
@@ -0,0 +1,65 @@
+"""
+Tests of similar-attraction recommendations from feature vectors.
+"""
+
+import copy
+
+import pytest
+
+import attractions_service
+from catalogue import AttractionCatalogue
+from config import MOCK_ATTRACTIONS, WORLD_WONDERS
+
+LOUVRE = 5
+
+
+def test_similar_attractions_are_ranked_best_first():
+    result = attractions_service.get_similar_attractions_data(LOUVRE, 5)
+
+    scores = [similar["similarity"] for similar in result["attractions"]]
+    assert result["name"] == "Louvre Museum" and result["total_count"] == 5
+    assert scores == sorted(scores, reverse=True)
+    assert LOUVRE not in [similar["attraction"]["id"] for similar in result["attractions"]]
+
+
+def test_within_km_keeps_nearby_attractions():
+    result = attractions_service.get_similar_attractions_data(LOUVRE, 5, within_km=10)
+
+    assert [(similar["attraction"]["name"], similar["distance_km"]) for similar in result["attractions"]] == [
+        ("Eiffel Tower", 3.16)
+    ]
+
+
+def test_k_is_capped_at_the_rest_of_the_catalogue():
+    result = attractions_service.get_similar_attractions_data(LOUVRE, 100)
+
+    assert result["total_count"] == len(MOCK_ATTRACTIONS) - 1
+
+
+def test_fields_project_each_attraction():
+    result = attractions_service.get_similar_attractions_data(LOUVRE, 2, fields="name")
+
+    assert [set(similar["attraction"]) for similar in result["attractions"]] == [{"id", "name"}, {"id", "name"}]
+
+
+def test_an_identical_attraction_is_the_most_similar():
+    twin = copy.deepcopy(MOCK_ATTRACTIONS[LOUVRE - 1])
+    twin["id"] = 99
+    catalogue = AttractionCatalogue(MOCK_ATTRACTIONS + [twin], WORLD_WONDERS)
+
+    [(position, similarity, distance)] = catalogue.similar(catalogue.position_of(LOUVRE), 1)
+
+    assert catalogue.text["name"][position] == "Louvre Museum" and catalogue.records[position]["id"] == 99
+    assert similarity == pytest.approx(1.0) and distance == 0.0
+
+
+@pytest.mark.parametrize("arguments, error", [
+    ({"attraction_id": 999}, "not found"),
+    ({"attraction_id": LOUVRE, "within_km": 0}, "within_km must be greater than 0"),
+    ({"attraction_id": LOUVRE, "fields": "nope"}, "Unknown fields: nope"),
+    ({"attraction_id": LOUVRE, "max_bytes": 0}, "max_bytes must be greater than 0")
+])
+def test_similar_attractions_argument_errors(arguments, error):
+    result = attractions_service.get_similar_attractions_data(**arguments)
+
+    assert error in result["error"]
@@ -0,0 +1,48 @@
+"""
+Tests of typo-tolerant location and name matching with the trigram index.
+"""
+
+import attractions_service
+from indexes import TrigramIndex
+
+PLACES = ["Paris", "Italy", "Rome", "New York", "Agra", "paris"]
+
+
+def test_trigram_substring_lookup():
+    index = TrigramIndex(PLACES)
+
+    assert index.containing("ari") == ["Paris"]
+    assert index.containing("YORK") == ["New York"]
+    assert index.containing("xyz") == []
+
+
+def test_trigram_short_queries_scan_terms():
+    index = TrigramIndex(PLACES)
+
+    assert index.containing("ag") == ["Agra"]
+
+
+def test_trigram_terms_are_distinct_after_normalising():
+    assert TrigramIndex(PLACES).terms == ["Paris", "Italy", "Rome", "New York", "Agra"]
+
+
+def test_trigram_fuzzy_lookup_tolerates_typos():
+    index = TrigramIndex(PLACES)
+
+    assert index.lookup("Itlay")[0][0] == "Italy"
+    assert index.lookup("Pariss")[0][0] == "Paris"
+    assert index.lookup("Zanzibar") == []
+
+
+def test_search_corrects_a_misspelt_location():
+    result = attractions_service.search_attractions_data(location="Pariss")
+
+    assert result["corrected_location"] == "Paris"
+    assert [attraction["name"] for attraction in result["attractions"]] == ["Eiffel Tower", "Louvre Museum"]
+
+
+def test_search_by_part_of_a_name():
+    result = attractions_service.search_attractions_data(location="Agr")
+
+    assert result["corrected_location"] is None
+    assert [attraction["name"] for attraction in result["attractions"]] == ["Taj Mahal"]
@@ -0,0 +1,114 @@
+"""
+Upstream API client - World Tourist Attractions API calls through the pooled session and a read-through cache.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from mcp_common.profiling import span
+
+from config import (
+    ATTRACTIONS_API_URL, ATTRACTIONS_API_KEY, ENDPOINTS, UPSTREAM_CACHE_SIZE, UPSTREAM_CACHE_TTL_SECONDS, UPSTREAM_COOLDOWN_SECONDS
+)
+from cache import TTLCache
+from utils import make_api_request, ApiRequestError
+
+
+class UpstreamUnavailable(Exception):
+    """Upstream could not answer and nothing usable was cached"""
+
+
+class UpstreamClient:
+    """Read-through client for the attractions API.
+
+    Responses are cached per endpoint and parameters for that endpoint's TTL. A fresh cached
+    response is served without a request; otherwise upstream is called, and if that fails the
+    last response is served even if stale. After a failure upstream is left alone for a
+    cooldown, so an outage costs one timeout rather than one per tool call.
+    """
+
+    def __init__(
+        self,
+        base_url: str = ATTRACTIONS_API_URL,
+        ttls: Dict[str, float] = None,
+        cache_size: int = UPSTREAM_CACHE_SIZE,
+        cooldown_seconds: float = UPSTREAM_COOLDOWN_SECONDS,
+        api_key: Optional[str] = ATTRACTIONS_API_KEY
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.headers = {"X-API-Key": api_key} if api_key else None
+        self.ttls = UPSTREAM_CACHE_TTL_SECONDS if ttls is None else ttls
+        self.cache = TTLCache(cache_size)
+        self.cooldown_seconds = cooldown_seconds
+        self.requests = 0
+        self.failures = 0
+        self.stale_served = 0
+        self.last_error: Optional[str] = None
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        """Whether upstream may be called (it is not cooling down after a failure)"""
+        return time.monotonic() >= self._retry_at
+
+    def fetch(self, endpoint: str, path: str = "", params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """Get an endpoint's response, from the cache while fresh.
+
+        Returns None when upstream answers 404. Raises UpstreamUnavailable when upstream
+        fails (or is cooling down) and no response is cached.
+        """
+        with span(f"upstream {endpoint}", endpoint=endpoint) as fetch_span:
+            return self._fetch(endpoint, path, params, fetch_span)
+
+    def _fetch(self, endpoint: str, path: str, params: Optional[Dict[str, Any]], fetch_span: Any) -> Optional[Any]:
+        params = {key: value for key, value in (params or {}).items() if value is not None}
+        key = (endpoint, path, tuple(sorted(params.items())))
+        ttl = self.ttls.get(endpoint, 0)
+        if ttl:
+            cached = self.cache.get(key)
+            if cached is not None:
+                fetch_span.set("cache", "hit")
+                return cached["body"]
+        fetch_span.set("cache", "miss")
+
+        if self.available():
+            url = f"{self.base_url}{ENDPOINTS[endpoint]}{'/' + path if path else ''}"
+            with self._lock:
+                self.requests += 1
+            try:
+                body = make_api_request(url, params, self.headers)
+                if ttl:
+                    self.cache.put(key, {"body": body}, ttl)
+                return body
+            except ApiRequestError as e:
+                if e.status_code == 404:
+                    if ttl:
+                        self.cache.put(key, {"body": None}, ttl)
+                    return None
+                with self._lock:
+                    self.failures += 1
+                    self.last_error = str(e)
+                    self._retry_at = time.monotonic() + self.cooldown_seconds
+
+        stale = self.cache.get_stale(key)
+        if stale is not None:
+            with self._lock:
+                self.stale_served += 1
+            fetch_span.set("cache", "stale")
+            return stale["body"]
+        raise UpstreamUnavailable(self.last_error or "upstream unavailable")
+
+    def stats(self) -> Dict[str, Any]:
+        """Request, failure and cache counters"""
+        return {
+            "base_url": self.base_url,
+            "available": self.available(),
+            "requests": self.requests,
+            "failures": self.failures,
+            "stale_served": self.stale_served,
+            "cached_responses": len(self.cache),
+            "cache_hits": self.cache.hits,
+            "cache_misses": self.cache.misses,
+            "last_error": self.last_error
+        }
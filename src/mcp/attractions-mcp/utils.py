@@ -2,93 +2,109 @@
 Utility functions for tourist attractions operations.
 """
 
-import requests
-import random
-import string
-from typing import Dict, Any, Optional, List
+import math
+import re
+import unicodedata
+import secrets
+import threading
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 
-from config import ATTRACTIONS_BASE_URL, ENDPOINTS, ATTRACTION_CATEGORIES, MOCK_ATTRACTIONS, WORLD_WONDERS
-from models import Coordinates, Location, Attraction
-
-
-def make_api_request(url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """Make an API request with error handling"""
-    try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"API request failed: {str(e)}")
-
-
-def get_attraction_by_id(attraction_id: int) -> Optional[Dict[str, Any]]:
-    """Get attraction details by ID from mock data"""
-    for attraction in MOCK_ATTRACTIONS:
-        if attraction["id"] == attraction_id:
-            return attraction
-    return None
-
-
-def search_attractions(
-    location: Optional[str] = None,
-    category: Optional[str] = None,
-    limit: int = 20
-) -> Optional[Dict[str, Any]]:
-    """Search for attractions with filters using mock data"""
-    filtered_attractions = []
-    
-    for attraction in MOCK_ATTRACTIONS:
-        # Filter by location (check city, country, or region)
-        location_match = True
-        if location:
-            location_lower = location.lower()
-            attr_location = attraction["location"]
-            location_match = (
-                location_lower in attr_location.get("city", "").lower() or
-                location_lower in attr_location.get("country", "").lower() or
-                location_lower in attr_location.get("region", "").lower()
+from mcp_common.profiling import span
+from mcp_common.encoding import loads
+
+from config import (
+    ATTRACTIONS_BASE_URL, ENDPOINTS, ATTRACTION_CATEGORIES,
+    CURRENCY_SYMBOLS, COUNTRY_CURRENCIES, EXCHANGE_RATES_TO_USD,
+    WEEKDAYS, MINUTES_PER_DAY, MINUTES_PER_WEEK, PLANNER_TRAVEL_SPEED_KMH,
+    PLANNER_TRAVEL_OVERHEAD_MINUTES, PLANNER_DEFAULT_TRAVEL_MINUTES,
+    CONFIRMATION_CODE_ALPHABET, CONFIRMATION_CODE_LENGTH,
+    UPSTREAM_POOL_SIZE, UPSTREAM_TIMEOUT_SECONDS, UPSTREAM_RETRIES
+)
+from ids import new_booking_id
+from models import Coordinates, Location, Attraction, Price, OpeningHours, DayHours
+
+if TYPE_CHECKING:
+    import requests
+
+# Amounts prefixed by a currency symbol ("€29.40", "R$65"), followed by an ISO code ("70 JOD") or
+# preceded by a known one ("USD 20"); a leading code must be known so words like "USA 2025" are not fees
+FEE_AMOUNT_PATTERN = re.compile(
+    r"(R\$|[€£₹$¥])\s*(\d[\d,]*(?:\.\d+)?)|(\d[\d,]*(?:\.\d+)?)\s*([A-Z]{3})\b"
+    rf"|\b({'|'.join(EXCHANGE_RATES_TO_USD)})\s*(\d[\d,]*(?:\.\d+)?)"
+)
+# A free tier ("children free") makes the lowest price 0; free entry ("Free", "Free entry; museum €10",
+# "admission free") makes the attraction free to enter
+FREE_TIER_PATTERN = re.compile(r"\bfree\b", re.IGNORECASE)
+FREE_ENTRY_PATTERN = re.compile(
+    r"^\W*free\b(?!\s+for\b)|\bfree\s+(?:entry|admission)\b|\b(?:entry|admission)\s+(?:is\s+)?free\b", re.IGNORECASE
+)
+
+# Opening time ranges such as "9:30 AM - 11:45 PM" or "10:00 - 17:00"
+TIME_RANGE_PATTERN = re.compile(
+    r"(\d{1,2})(?::(\d{2}))?\s*([AaPp][Mm])?\s*(?:-|–|to)\s*(\d{1,2})(?::(\d{2}))?\s*([AaPp][Mm])?"
+)
+DAY_PATTERN = re.compile(r"\b(mon|tues?|wed(?:nes)?|thu(?:rs?)?|fri|sat(?:ur)?|sun)(?:days?|s)?\b", re.IGNORECASE)
+
+
+class ApiRequestError(Exception):
+    """An upstream API request that failed, with the HTTP status if the server answered"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> "requests.Session":
+    """Get the shared HTTP session, pooling keep-alive connections and retrying idempotent requests.
+
+    The session carries no credentials, so other servers in the same process (see the gateway)
+    can share its connection pools. requests is only imported here, so a server reading the
+    local catalogue never loads it.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retries = Retry(
+                total=UPSTREAM_RETRIES, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET", "HEAD"}), raise_on_status=False
             )
-        
-        # Filter by category
-        category_match = True
-        if category:
-            category_match = attraction["category"] == category.lower()
-            
-        if location_match and category_match:
-            filtered_attractions.append(attraction)
-    
-    # Apply limit
-    filtered_attractions = filtered_attractions[:limit]
-    
-    return {
-        "attractions": filtered_attractions,
-        "total": len(filtered_attractions)
-    }
-
-
-def get_random_famous_attraction() -> Optional[Dict[str, Any]]:
-    """Get a random famous attraction from mock data"""
-    if MOCK_ATTRACTIONS:
-        return random.choice(MOCK_ATTRACTIONS)
-    return None
-
-
-def get_random_india_attraction() -> Optional[Dict[str, Any]]:
-    """Get a random tourist attraction in India from mock data"""
-    indian_attractions = [attr for attr in MOCK_ATTRACTIONS if attr["location"]["country"] == "India"]
-    if indian_attractions:
-        return random.choice(indian_attractions)
-    return None
-
-
-def get_wonders_of_world() -> Optional[Dict[str, Any]]:
-    """Get wonders of the world attractions from mock data"""
-    wonders = [attr for attr in MOCK_ATTRACTIONS if attr["id"] in WORLD_WONDERS]
-    return {
-        "attractions": wonders,
-        "total": len(wonders)
-    }
+            adapter = HTTPAdapter(pool_connections=UPSTREAM_POOL_SIZE, pool_maxsize=UPSTREAM_POOL_SIZE, max_retries=retries)
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["Accept"] = "application/json"
+            _session = session
+        return _session
+
+
+def make_api_request(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """Make an API request over the shared session with error handling"""
+    import requests
+
+    with span("GET", kind="client", **{"url.full": url}) as request_span:
+        try:
+            response = get_http_session().get(url, params=params, headers=headers, timeout=UPSTREAM_TIMEOUT_SECONDS)
+            request_span.set("http.response.status_code", response.status_code)
+            response.raise_for_status()
+            return loads(response.content)
+        except requests.exceptions.RequestException as e:
+            status_code = e.response.status_code if e.response is not None else None
+            raise ApiRequestError(f"API request failed: {str(e)}", status_code)
+        except ValueError as e:
+            raise ApiRequestError(f"API request failed: invalid JSON ({str(e)})")
 
 
 def parse_coordinates(lat: float, lon: float) -> Coordinates:
@@ -124,10 +140,250 @@ def parse_attraction_data(data: Dict[str, Any]) -> Attraction:
         image_url=data.get("image_url"),
         website=data.get("website"),
         opening_hours=data.get("opening_hours"),
-        entry_fee=data.get("entry_fee")
+        entry_fee=data.get("entry_fee"),
+        price=data.get("price"),
+        hours=data.get("hours")
     )
 
 
+def _clock_to_minutes(hour: str, minute: str, meridiem: str) -> int:
+    """Convert a parsed clock time to minutes after midnight"""
+    hours = int(hour) % 24
+    if meridiem:
+        hours = hours % 12 + (12 if meridiem.lower() == "pm" else 0)
+    return hours * 60 + int(minute or 0)
+
+
+def _opening_minutes(hour: str, minute: str, meridiem: Optional[str], closes: int, close_meridiem: Optional[str]) -> int:
+    """Convert an opening time to minutes after midnight. Without a meridiem of its own it takes the
+    closing time's only when it then opens before closing ("1 - 5 PM"), else the other one ("11 - 3 PM")"""
+    if meridiem or not close_meridiem:
+        return _clock_to_minutes(hour, minute, meridiem)
+    opens = _clock_to_minutes(hour, minute, close_meridiem)
+    if opens < closes:
+        return opens
+    return _clock_to_minutes(hour, minute, "am" if close_meridiem.lower() == "pm" else "pm")
+
+
+def _entry_minutes(value: Any) -> Optional[int]:
+    """Parse a per-day entry's "HH:MM" time (up to 24:00) into minutes after midnight, or None if invalid"""
+    match = re.fullmatch(r"\s*(\d{1,2}):(\d{2})\s*", value) if isinstance(value, str) else None
+    if not match:
+        return None
+    minutes = int(match.group(1)) * 60 + int(match.group(2))
+    return minutes if int(match.group(2)) < 60 and minutes <= MINUTES_PER_DAY else None
+
+
+def _parse_days(text: str) -> List[int]:
+    """Parse weekday names and ranges (e.g. "Mon-Fri", "Tuesdays") into weekday indexes"""
+    matches = list(DAY_PATTERN.finditer(text))
+    days: List[int] = []
+    for i, match in enumerate(matches):
+        day = WEEKDAYS.index(match.group(1)[:3].title())
+        previous = matches[i - 1] if i else None
+        if previous and text[previous.end():match.start()].strip() in ("-", "–", "to"):
+            start = WEEKDAYS.index(previous.group(1)[:3].title())
+            days.extend((start + offset) % 7 for offset in range(1, (day - start) % 7 + 1))
+        else:
+            days.append(day)
+    return days
+
+
+def merge_intervals(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Merge overlapping or touching (start, end) intervals"""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _entry_ranges(hours: List[Dict[str, str]]) -> Optional[Dict[int, List[Tuple[int, int]]]]:
+    """Opening ranges per weekday from per-day entries, skipping malformed ones; None if none are usable"""
+    daily: Dict[int, List[Tuple[int, int]]] = {day: [] for day in range(7)}
+    usable = False
+    for entry in hours:
+        if not isinstance(entry, dict) or not isinstance(entry.get("day"), str):
+            continue
+        opens, closes = _entry_minutes(entry.get("open")), _entry_minutes(entry.get("close"))
+        days = _parse_days(entry["day"])
+        if opens is None or closes is None or not days:
+            continue
+        usable = True
+        for day in days:
+            daily[day].append((opens, closes))
+    return daily if usable else None
+
+
+def _text_ranges(opening_hours: str) -> Optional[Dict[int, List[Tuple[int, int]]]]:
+    """Opening ranges per weekday from a display string; None if it has no time range"""
+    daily: Dict[int, List[Tuple[int, int]]] = {day: [] for day in range(7)}
+    closed_days = set()
+    matched = False
+    for segment in re.split(r"[;\n]", opening_hours):
+        closed = re.search(r"closed", segment, re.IGNORECASE)
+        if closed:
+            closed_days.update(_parse_days(segment[closed.end():]))
+            segment = segment[:closed.start()]
+
+        time_range = TIME_RANGE_PATTERN.search(segment)
+        if not time_range:
+            continue
+        matched = True
+        open_hour, open_minute, open_meridiem, close_hour, close_minute, close_meridiem = time_range.groups()
+        closes = _clock_to_minutes(close_hour, close_minute, close_meridiem)
+        opens = _opening_minutes(open_hour, open_minute, open_meridiem, closes, close_meridiem)
+        for day in _parse_days(segment[:time_range.start()]) or range(7):
+            daily[day].append((opens, closes))
+
+    if not matched:
+        return None
+    for day in closed_days:
+        daily[day] = []
+    return daily
+
+
+def parse_opening_hours(
+    opening_hours: Optional[str],
+    hours: Optional[List[Dict[str, str]]] = None
+) -> Optional[OpeningHours]:
+    """Parse opening hours into weekly minute intervals.
+
+    Accepts per-day entries ({"day": "Mon", "open": "10:00", "close": "17:00"}) or display
+    strings such as "9:30 AM - 11:45 PM", "24/7", "Mon-Fri 9:00 AM - 5:00 PM; Sat 10:00 AM - 2:00 PM"
+    and "9:00 AM - 6:00 PM (closed Tuesdays)". Closing times at or before opening are overnight.
+    Malformed entries are skipped; when none is usable the display string is parsed instead.
+    """
+    daily = _entry_ranges(hours) if hours else None
+    if daily is None:
+        if not opening_hours:
+            return None
+        if "24/7" in opening_hours or "24 hours" in opening_hours.lower():
+            return OpeningHours(intervals=((0, MINUTES_PER_WEEK),))
+        daily = _text_ranges(opening_hours)
+        if daily is None:
+            return None
+
+    intervals = []
+    for day, ranges in daily.items():
+        for opens, closes in ranges:
+            if closes <= opens:
+                closes += MINUTES_PER_DAY
+            intervals.append((day * MINUTES_PER_DAY + opens, day * MINUTES_PER_DAY + closes))
+
+    return OpeningHours(intervals=tuple(merge_intervals(intervals)))
+
+
+def format_day_hours(opening_hours: Optional[OpeningHours]) -> Optional[List[DayHours]]:
+    """Split weekly opening intervals into per-day entries (e.g. {"day": "Mon", "open": "09:30", "close": "23:45"})"""
+    if opening_hours is None:
+        return None
+
+    day_hours = []
+    for start, end in opening_hours.intervals:
+        while start < end:
+            day_start = start - start % MINUTES_PER_DAY
+            piece_end = min(end, day_start + MINUTES_PER_DAY)
+            day_hours.append(DayHours(
+                day=WEEKDAYS[(day_start // MINUTES_PER_DAY) % 7],
+                open=format_clock(start - day_start),
+                close=format_clock(piece_end - day_start)
+            ))
+            start = piece_end
+
+    day_hours.sort(key=lambda entry: (WEEKDAYS.index(entry.day), entry.open))
+    return day_hours
+
+
+def week_minute(moment: datetime) -> int:
+    """Get minutes elapsed since Monday 00:00 for a (local) datetime"""
+    return moment.weekday() * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+
+def day_windows(opening_hours: Optional[OpeningHours], weekday: int) -> List[Tuple[int, int]]:
+    """Get opening windows for a weekday as minutes after that day's midnight,
+    including hours carried over from the previous night"""
+    if opening_hours is None:
+        return []
+
+    day_offset = weekday * MINUTES_PER_DAY
+    windows = []
+    for start, end in opening_hours.intervals:
+        for shift in (-MINUTES_PER_WEEK, 0, MINUTES_PER_WEEK):
+            window_start = start + shift - day_offset
+            window_end = end + shift - day_offset
+            if window_end > 0 and window_start < MINUTES_PER_DAY:
+                windows.append((max(window_start, 0), window_end))
+    return merge_intervals(windows)
+
+
+def parse_clock(value: str) -> Optional[int]:
+    """Parse an "HH:MM" clock time into minutes after midnight, returning None if invalid"""
+    try:
+        parsed = datetime.strptime(value, "%H:%M")
+        return parsed.hour * 60 + parsed.minute
+    except (TypeError, ValueError):
+        return None
+
+
+def format_clock(minutes: int) -> str:
+    """Format minutes after midnight as "HH:MM" """
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two coordinates in kilometres"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * 6371.0 * math.asin(math.sqrt(a))
+
+
+def estimate_travel_minutes(origin: Dict[str, Any], destination: Dict[str, Any]) -> int:
+    """Estimate door-to-door travel time in minutes between two attraction locations"""
+    if origin is destination:
+        return 0
+    if not all(place.get(key) is not None for place in (origin, destination) for key in ("latitude", "longitude")):
+        return PLANNER_DEFAULT_TRAVEL_MINUTES
+
+    distance = haversine_km(origin["latitude"], origin["longitude"], destination["latitude"], destination["longitude"])
+    return PLANNER_TRAVEL_OVERHEAD_MINUTES + round(distance / PLANNER_TRAVEL_SPEED_KMH * 60)
+
+
+def parse_datetime(value: str) -> Optional[datetime]:
+    """Parse an ISO date-time string (e.g. "2025-09-20T14:30"), returning None if invalid"""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and strip accents for matching (e.g. "Île-de-France" -> "ile-de-france")"""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).strip()
+
+
+def edit_similarity(a: str, b: str) -> float:
+    """Similarity in [0, 1] from the optimal string alignment distance (edits incl. transpositions)"""
+    if not a or not b:
+        return 0.0
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        previous_previous, previous = previous, current
+    return 1 - previous[len(b)] / max(len(a), len(b))
+
+
 def format_attraction_name(attraction: Attraction) -> str:
     """Format attraction name with location"""
     name = attraction.name
@@ -144,15 +400,13 @@ def get_category_display_name(category: str) -> str:
 
 
 def generate_booking_id() -> str:
-    """Generate a unique booking ID"""
-    timestamp = datetime.now().strftime("%Y%m%d%H%M")
-    random_part = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
-    return f"ATT-{timestamp}-{random_part}"
+    """Generate a unique, creation-ordered booking ID"""
+    return new_booking_id()
 
 
 def generate_confirmation_code() -> str:
-    """Generate a confirmation code"""
-    return ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+    """Generate an unguessable confirmation code"""
+    return ''.join(secrets.choice(CONFIRMATION_CODE_ALPHABET) for _ in range(CONFIRMATION_CODE_LENGTH))
 
 
 def validate_visit_date(date_str: str) -> bool:
@@ -160,7 +414,7 @@ def validate_visit_date(date_str: str) -> bool:
     try:
         visit_date = datetime.strptime(date_str, "%Y-%m-%d")
         return visit_date.date() > datetime.now().date()
-    except ValueError:
+    except (TypeError, ValueError):
         return False
 
 
@@ -169,23 +423,77 @@ def validate_email(email: str) -> bool:
     return "@" in email and "." in email.split("@")[1]
 
 
-def calculate_estimated_cost(num_visitors: int, entry_fee: Optional[str] = None) -> Optional[float]:
-    """Calculate estimated cost based on number of visitors"""
-    if not entry_fee or "free" in entry_fee.lower():
+def resolve_currency(symbol: str, country: str = "") -> str:
+    """Resolve a currency symbol or ISO code to an ISO code using the attraction's country"""
+    candidates = CURRENCY_SYMBOLS.get(symbol)
+    if not candidates:
+        return symbol
+    local_currency = COUNTRY_CURRENCIES.get(country)
+    return local_currency if local_currency in candidates else candidates[0]
+
+
+def parse_entry_fee(entry_fee: Optional[str], country: str = "") -> Optional[Price]:
+    """Parse a free-text entry fee (e.g. "€29.40 - €73.30", "₹1100 (foreigners), ₹50 (Indians)",
+    "USD 20", "Adults 15 EUR, children free") into a structured price range. Any free tier makes
+    the lowest price 0. Returns None when the fee is missing or has no amounts."""
+    if not entry_fee:
+        return None
+
+    amounts: Dict[str, List[float]] = {}
+    for symbol, symbol_amount, code_amount, code, leading_code, leading_amount in FEE_AMOUNT_PATTERN.findall(entry_fee):
+        currency = resolve_currency(symbol or code or leading_code, country)
+        amount = float((symbol_amount or code_amount or leading_amount).replace(",", ""))
+        amounts.setdefault(currency, []).append(amount)
+
+    has_free_tier = FREE_TIER_PATTERN.search(entry_fee) is not None
+    if not amounts:
+        if has_free_tier:
+            return Price(min_usd=0.0, max_usd=0.0, is_free=True)
+        return None
+
+    # Mixed-currency fees are rare; keep the first currency mentioned
+    currency, values = next(iter(amounts.items()))
+    rate = EXCHANGE_RATES_TO_USD.get(currency)
+    min_amount, max_amount = 0.0 if has_free_tier else min(values), max(values)
+
+    return Price(
+        currency=currency,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        min_usd=round(min_amount * rate, 2) if rate is not None else None,
+        max_usd=round(max_amount * rate, 2) if rate is not None else None,
+        is_free=max_amount == 0 or FREE_ENTRY_PATTERN.search(entry_fee) is not None
+    )
+
+
+def calculate_estimated_cost(num_visitors: int, price: Optional[Price] = None, upper: bool = False) -> Optional[float]:
+    """Calculate estimated cost based on number of visitors, using the lowest (or highest) ticket price"""
+    if price is None:
+        return None
+    if price.is_free:
         return 0.0
+
+    amount = price.max_amount if upper else price.min_amount
+    return round(amount * num_visitors, 2)
+
+
+def format_attraction_listing(index: int, attraction: Dict[str, Any], include_description: bool = False) -> str:
+    """Format a numbered list entry from a serialised attraction"""
+    location = attraction["location"]
+    location_str = f"{location['city']}, {location['country']}" if location.get("city") else location.get("country", "")
     
-    # Simple cost calculation - in reality this would be more complex
-    try:
-        # Extract number from entry fee string (e.g., "$15", "₹500")
-        import re
-        numbers = re.findall(r'\d+\.?\d*', entry_fee)
-        if numbers:
-            base_cost = float(numbers[0])
-            return base_cost * num_visitors
-    except (ValueError, IndexError):
-        pass
+    entry = f"{index}. 🏛️ **{attraction['name']}**\n"
+    entry += f"   📍 {location_str}\n"
+    entry += f"   🏷️ {get_category_display_name(attraction['category'])}\n"
+    
+    if attraction.get("rating"):
+        entry += f"   ⭐ {attraction['rating']}/5.0\n"
+    if attraction.get("entry_fee"):
+        entry += f"   💰 {attraction['entry_fee']}\n"
+    if include_description and attraction.get("description"):
+        entry += f"   📝 {attraction['description']}\n"
     
-    return None
+    return entry + "\n"
 
 
 def format_attraction_details(attraction: Attraction) -> str:
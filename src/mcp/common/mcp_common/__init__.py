@@ -0,0 +1,58 @@
+"""
+MCP Common Package - Admission control, profiling and tracing, and JSON encoding shared by the
+attractions and weather servers and the gateway.
+"""
+
+import importlib
+
+# Exported names are imported from their modules on first use, so importing the package
+# does not load the MCP framework up front
+_EXPORTS = {
+    "mcp_common.admission": (
+        "AdmissionController", "ServerAdmission", "Overloaded", "get_admission_controller", "configure_admission",
+        "register_server"
+    ),
+    "mcp_common.profiling": (
+        "Instrumentation", "configure_instrumentation", "get_instrumentation", "span", "instrumented"
+    ),
+    "mcp_common.encoding": (
+        "configure_encoder", "make_encoder", "get_encoder", "set_encoder", "dumps", "loads", "to_builtins",
+        "tool_result", "encoded"
+    )
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__version__ = "1.0.0"
+__all__ = [
+    # Admission control
+    "AdmissionController",
+    "ServerAdmission",
+    "Overloaded",
+    "get_admission_controller",
+    "configure_admission",
+    "register_server",
+    # Profiling and tracing
+    "Instrumentation",
+    "configure_instrumentation",
+    "get_instrumentation",
+    "span",
+    "instrumented",
+    # JSON encoding
+    "configure_encoder",
+    "make_encoder",
+    "get_encoder",
+    "set_encoder",
+    "dumps",
+    "loads",
+    "to_builtins",
+    "tool_result",
+    "encoded"
+]
+
+
+def __getattr__(name: str):
+    """Import an exported name from its module the first time it is used"""
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
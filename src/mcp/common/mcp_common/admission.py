@@ -0,0 +1,275 @@
+"""
+Admission control - Concurrency limits, a bounded queue and deadline-aware shedding for tool calls.
+
+There is one controller per process. Each server registers its own limits on it, so when the
+gateway runs several servers in one process their calls share one worker pool and one global
+limit, and each server also keeps its own limit, so one server's calls cannot take every slot.
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from mcp_common.profiling import instrumented
+
+
+class Overloaded(Exception):
+    """A tool call was shed; the caller may retry after `retry_after` seconds"""
+
+    def __init__(self, tool: str, reason: str, retry_after: float):
+        self.tool = tool
+        self.reason = reason
+        self.retry_after = round(max(retry_after, 0.1), 1)
+        detail = "too many calls are queued" if reason == "queue_full" else "it could not finish before its deadline"
+        super().__init__(f"Server busy: {tool} was not started because {detail}. Retry in {self.retry_after} seconds")
+
+
+class Slots:
+    """A concurrency limit with its counters: for the process, one server or one tool"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.semaphore = asyncio.Semaphore(limit)
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted = 0
+        self.shed = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "shed": self.shed
+        }
+
+
+class ToolStats(Slots):
+    """Concurrency limit, counters and recent run time of one tool"""
+
+    def __init__(self, limit: int, ewma_weight: float, deadline_seconds: float):
+        super().__init__(limit)
+        self.ewma_weight = ewma_weight
+        self.deadline_seconds = deadline_seconds
+        self.completed = 0
+        self.expected_seconds = 0.0  # moving average of run time
+
+    def record(self, seconds: float) -> None:
+        # A call that overran its deadline counts as taking the deadline, so one stalled call
+        # cannot push the estimate beyond what any call is allowed
+        seconds = min(seconds, self.deadline_seconds)
+        self.completed += 1
+        if self.completed == 1:
+            self.expected_seconds = seconds
+        else:
+            self.expected_seconds += self.ewma_weight * (seconds - self.expected_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(super().stats(), completed=self.completed, expected_ms=round(self.expected_seconds * 1000, 1))
+
+
+class ServerAdmission:
+    """One server's limits on the process's admission controller: how many of its calls run at once,
+    its default deadline, and the limits and deadlines of particular tools"""
+
+    def __init__(
+        self,
+        controller: "AdmissionController",
+        name: str,
+        max_concurrent: int,
+        deadline_seconds: float,
+        tool_limits: Optional[Dict[str, int]] = None,
+        tool_deadlines: Optional[Dict[str, float]] = None
+    ):
+        self.controller = controller
+        self.name = name
+        self.max_concurrent = min(max_concurrent, controller.max_concurrent)
+        self.deadline_seconds = deadline_seconds
+        self.tool_limits = tool_limits or {}
+        self.tool_deadlines = tool_deadlines or {}
+        self.slots = Slots(self.max_concurrent)
+
+    async def run(self, tool: str, call: Callable[[], Any]) -> Any:
+        """Run a call of one of this server's tools within the limits; raises Overloaded when it is shed"""
+        return await self.controller.run(self, tool, call)
+
+    def admitted(self, tool: Callable[..., Any]) -> Callable[..., Any]:
+        """Run a tool function through admission control, traced and profiled when those are on; a shed
+        call returns a retryable error (an error dict, or an "Error: ..." string for tools returning text)"""
+        returns_text = inspect.signature(tool).return_annotation is str
+
+        @functools.wraps(tool)
+        async def run(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await self.run(tool.__name__, instrumented(tool.__name__, functools.partial(tool, *args, **kwargs)))
+            except Overloaded as e:
+                if returns_text:
+                    return f"Error: {e}"
+                return {"error": str(e), "retryable": True, "retry_after_seconds": e.retry_after}
+
+        return run
+
+
+class AdmissionController:
+    """Admits tool calls up to a global, a per-server and a per-tool concurrency limit, with a bounded queue.
+
+    Every call has a deadline. A call is shed at once, with a retryable error, when the queue
+    is full or when its expected wait plus the tool's usual run time would overrun the deadline;
+    a queued call that still cannot start in time is shed when that becomes certain rather than
+    left to time out. A call that can start at once is always admitted, so a tool whose estimate
+    went up after a slow call gets run again and its estimate follows its actual run times. Admitted calls run in worker threads, so the event loop keeps accepting
+    and shedding requests while tools run.
+    """
+
+    def __init__(self, max_concurrent: int = 8, max_queue: int = 64, ewma_weight: float = 0.2):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.ewma_weight = ewma_weight
+        self.servers: Dict[str, ServerAdmission] = {}
+        self.tools: Dict[Tuple[str, str], ToolStats] = {}  # by server and tool name
+        self.peak_queued = 0
+        self.shed = {"queue_full": 0, "deadline": 0}
+        self._slots = Slots(max_concurrent)
+        self._executor = ThreadPoolExecutor(max_concurrent, thread_name_prefix="tool")
+
+    def add_server(
+        self,
+        name: str,
+        max_concurrent: int,
+        deadline_seconds: float,
+        tool_limits: Optional[Dict[str, int]] = None,
+        tool_deadlines: Optional[Dict[str, float]] = None
+    ) -> ServerAdmission:
+        """Set a server's limits, or get them if it was added already"""
+        if name not in self.servers:
+            self.servers[name] = ServerAdmission(self, name, max_concurrent, deadline_seconds, tool_limits, tool_deadlines)
+        return self.servers[name]
+
+    def _stats(self, server: ServerAdmission, tool: str) -> ToolStats:
+        stats = self.tools.get((server.name, tool))
+        if stats is None:
+            limit = min(server.tool_limits.get(tool, server.max_concurrent), server.max_concurrent)
+            deadline = server.tool_deadlines.get(tool, server.deadline_seconds)
+            stats = self.tools[(server.name, tool)] = ToolStats(limit, self.ewma_weight, deadline)
+        return stats
+
+    def expected_wait(self, server: ServerAdmission, stats: ToolStats) -> float:
+        """Estimate how long a call arriving now waits to start, from the queues ahead of it and recent run times"""
+        average = sum(s.expected_seconds for s in self.tools.values()) / len(self.tools)
+        waits = [0.0]
+        for slots, expected in ((self._slots, average), (server.slots, average), (stats, stats.expected_seconds)):
+            if slots.in_flight >= slots.limit:
+                waits.append(slots.queued * expected / slots.limit)
+        return max(waits)
+
+    def _reject(self, server: ServerAdmission, stats: ToolStats, tool: str, reason: str, retry_after: float) -> Overloaded:
+        self.shed[reason] += 1
+        server.slots.shed += 1
+        stats.shed += 1
+        return Overloaded(tool, reason, retry_after)
+
+    async def run(self, server: ServerAdmission, tool: str, call: Callable[[], Any]) -> Any:
+        """Run a call within the limits; raises Overloaded when it is shed"""
+        stats = self._stats(server, tool)
+        levels = (stats, server.slots, self._slots)
+        now = time.monotonic()
+        deadline = now + stats.deadline_seconds
+        wait = self.expected_wait(server, stats)
+        starts_now = all(slots.in_flight < slots.limit and not slots.queued for slots in levels)
+        if not starts_now and self._slots.queued >= self.max_queue:
+            raise self._reject(server, stats, tool, "queue_full", max(wait, stats.expected_seconds))
+        if not starts_now and now + wait + stats.expected_seconds > deadline:
+            raise self._reject(server, stats, tool, "deadline", max(wait, stats.expected_seconds))
+
+        # Wait for a tool slot, then a server one and a global one, giving up once the call could no longer finish in time
+        for slots in levels:
+            slots.queued += 1
+        self.peak_queued = max(self.peak_queued, self._slots.queued)
+        held = []
+        try:
+            for slots in levels:
+                if slots.semaphore.locked():
+                    timeout = deadline - stats.expected_seconds - time.monotonic()
+                    await asyncio.wait_for(slots.semaphore.acquire(), max(timeout, 0))
+                else:
+                    await slots.semaphore.acquire()
+                held.append(slots)
+        except asyncio.TimeoutError:
+            for slots in held:
+                slots.semaphore.release()
+            raise self._reject(
+                server, stats, tool, "deadline", max(self.expected_wait(server, stats), stats.expected_seconds)
+            ) from None
+        finally:
+            for slots in levels:
+                slots.queued -= 1
+
+        for slots in levels:
+            slots.admitted += 1
+            slots.in_flight += 1
+        start = time.monotonic()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+        finally:
+            stats.record(time.monotonic() - start)
+            for slots in levels:
+                slots.in_flight -= 1
+                slots.semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Limits, queue depth, admitted and shed counts, overall, per server and per tool"""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "in_flight": self._slots.in_flight,
+            "queued": self._slots.queued,
+            "peak_queued": self.peak_queued,
+            "admitted": self._slots.admitted,
+            "shed": dict(self.shed),
+            "servers": {name: server.slots.stats() for name, server in sorted(self.servers.items())},
+            "tools": {f"{server}/{tool}": stats.stats() for (server, tool), stats in sorted(self.tools.items())}
+        }
+
+
+_controller: Optional[AdmissionController] = None
+_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get the process's admission controller, created with the default limits if no server has set it up"""
+    global _controller
+    with _controller_lock:
+        if _controller is None:
+            _controller = AdmissionController()
+        return _controller
+
+
+def configure_admission(max_concurrent: int, max_queue: int, ewma_weight: float = 0.2) -> AdmissionController:
+    """Set the process's global limit and queue size, unless they were set already (the gateway sets
+    its own before loading the servers it mounts); returns the controller in use"""
+    global _controller
+    with _controller_lock:
+        if _controller is None:
+            _controller = AdmissionController(max_concurrent, max_queue, ewma_weight)
+        return _controller
+
+
+def register_server(
+    name: str,
+    max_concurrent: int,
+    max_queue: int,
+    deadline_seconds: float,
+    tool_limits: Optional[Dict[str, int]] = None,
+    tool_deadlines: Optional[Dict[str, float]] = None,
+    ewma_weight: float = 0.2
+) -> ServerAdmission:
+    """Set a server's limits on the process's admission controller; a server running on its own
+    also sets the global limit and queue size with them"""
+    controller = configure_admission(max_concurrent, max_queue, ewma_weight)
+    with _controller_lock:
+        return controller.add_server(name, max_concurrent, deadline_seconds, tool_limits, tool_deadlines)
@@ -0,0 +1,208 @@
+"""
+JSON encoding - A pluggable fast encoder for tool results and API responses.
+
+Uses orjson or msgspec when installed (`uv sync --extra fast-json`), otherwise pydantic-core (which
+the MCP SDK depends on), and the standard library as a last resort. Models are converted and encoded
+by the encoder itself, without dataclasses.asdict. There is one encoder per process; the first
+server (or the gateway) to configure it picks it.
+"""
+
+import functools
+import inspect
+import json
+import threading
+from dataclasses import fields, is_dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from mcp.types import CallToolResult
+
+
+class StdlibEncoder:
+    """The standard library json module; always available. It encodes in Python, slower than FastMCP's
+    own encoder, so tool results are then left to FastMCP"""
+
+    name = "json"
+    fast = False
+
+    def dumps(self, value: Any, indent: bool = False) -> bytes:
+        return json.dumps(value, default=self.default, ensure_ascii=False, indent=2 if indent else None).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def to_builtins(self, value: Any) -> Any:
+        if is_dataclass(value) and not isinstance(value, type):
+            return {field.name: self.to_builtins(getattr(value, field.name)) for field in fields(value)}
+        if isinstance(value, dict):
+            return {key: self.to_builtins(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self.to_builtins(item) for item in value]
+        return value
+
+    def default(self, value: Any) -> Any:
+        # json encodes the fields' own values, so a model's fields are handed over without copying them
+        if is_dataclass(value) and not isinstance(value, type):
+            return {field.name: getattr(value, field.name) for field in fields(value)}
+        return str(value)
+
+
+class OrjsonEncoder(StdlibEncoder):
+    """orjson, which encodes dataclasses natively; it has no conversion to builtins, so pydantic-core's is used"""
+
+    name = "orjson"
+    fast = True
+
+    def __init__(self):
+        import orjson
+        import pydantic_core
+        self.orjson = orjson
+        self.pydantic_core = pydantic_core
+        self.options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        self.indented = self.options | orjson.OPT_INDENT_2
+
+    def dumps(self, value: Any, indent: bool = False) -> bytes:
+        return self.orjson.dumps(value, default=str, option=self.indented if indent else self.options)
+
+    def loads(self, data: bytes) -> Any:
+        return self.orjson.loads(data)  # its JSONDecodeError is a ValueError
+
+    def to_builtins(self, value: Any) -> Any:
+        return self.pydantic_core.to_jsonable_python(value, fallback=str)
+
+
+class MsgspecEncoder(StdlibEncoder):
+    """msgspec, which encodes dataclasses natively and converts them to builtins directly"""
+
+    name = "msgspec"
+    fast = True
+
+    def __init__(self):
+        import msgspec
+        self.msgspec = msgspec
+        self.encoder = msgspec.json.Encoder(enc_hook=str)
+        self.decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any, indent: bool = False) -> bytes:
+        encoded = self.encoder.encode(value)
+        return self.msgspec.json.format(encoded, indent=2) if indent else encoded
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return self.decoder.decode(data)
+        except self.msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def to_builtins(self, value: Any) -> Any:
+        return self.msgspec.to_builtins(value, enc_hook=str)
+
+
+class PydanticEncoder(StdlibEncoder):
+    """pydantic-core, which FastMCP itself encodes with; converts dataclasses to builtins directly"""
+
+    name = "pydantic"
+    fast = True
+
+    def __init__(self):
+        import pydantic_core
+        self.pydantic_core = pydantic_core
+
+    def dumps(self, value: Any, indent: bool = False) -> bytes:
+        return self.pydantic_core.to_json(value, fallback=str, indent=2 if indent else None)
+
+    def loads(self, data: bytes) -> Any:
+        return self.pydantic_core.from_json(data)  # raises ValueError when invalid
+
+    def to_builtins(self, value: Any) -> Any:
+        return self.pydantic_core.to_jsonable_python(value, fallback=str)
+
+
+ENCODERS: Dict[str, type] = {
+    "orjson": OrjsonEncoder, "msgspec": MsgspecEncoder, "pydantic": PydanticEncoder, "json": StdlibEncoder
+}
+
+
+def make_encoder(name: str = "auto") -> StdlibEncoder:
+    """Create the named encoder if it is installed, else the fastest one installed ("auto" for the fastest)"""
+    candidates = list(ENCODERS) if name == "auto" else [name] + list(ENCODERS)
+    for candidate in candidates:
+        if candidate in ENCODERS:
+            try:
+                return ENCODERS[candidate]()
+            except ImportError:
+                continue
+    return StdlibEncoder()
+
+
+_encoder: Optional[StdlibEncoder] = None
+_configured: Optional[StdlibEncoder] = None
+_encoder_lock = threading.Lock()
+
+
+def configure_encoder(name: str) -> StdlibEncoder:
+    """Set the process's encoder by name ("auto" for the fastest installed), unless it was set
+    already (the gateway sets its own before loading the servers it mounts); returns the one in use"""
+    global _encoder, _configured
+    with _encoder_lock:
+        if _configured is None:
+            _encoder = _configured = make_encoder(name)
+        return _encoder
+
+
+def get_encoder() -> StdlibEncoder:
+    """Get the encoder in use: the configured one, or the fastest installed"""
+    global _encoder
+    if _encoder is None:
+        with _encoder_lock:
+            if _encoder is None:
+                _encoder = make_encoder()
+    return _encoder
+
+
+def set_encoder(encoder: Optional[StdlibEncoder] = None) -> StdlibEncoder:
+    """Replace the encoder in use (e.g. to compare them); None goes back to the configured one"""
+    global _encoder
+    with _encoder_lock:
+        _encoder = encoder or _configured or make_encoder()
+        return _encoder
+
+
+def dumps(value: Any, indent: bool = False) -> bytes:
+    """Encode a value (builtins or models) as UTF-8 JSON, indented by two spaces if asked"""
+    return get_encoder().dumps(value, indent)
+
+
+def loads(data: bytes) -> Any:
+    """Decode UTF-8 JSON; raises ValueError when it is not valid"""
+    return get_encoder().loads(data)
+
+
+def to_builtins(value: Any) -> Any:
+    """Convert models, and dicts and lists of them, to dicts, lists and JSON scalars"""
+    return get_encoder().to_builtins(value)
+
+
+def tool_result(result: Any) -> "CallToolResult":
+    """Build the MCP result of a tool returning a dict, with its text content encoded here rather than by
+    FastMCP; FastMCP 1.22 and later send such a result as it is, after checking it against the output schema"""
+    from mcp.types import CallToolResult, TextContent  # loaded by the server in any case
+
+    return CallToolResult(
+        content=[TextContent(type="text", text=get_encoder().dumps(result, indent=True).decode())],
+        structuredContent={"result": result}  # the output schema FastMCP gives a dict-returning tool
+    )
+
+
+def encoded(tool: Callable[..., Any]) -> Callable[..., Any]:
+    """Send a dict-returning tool's results through the fast encoder; tools returning text are left as they are"""
+    if inspect.signature(tool).return_annotation is str:
+        return tool
+
+    @functools.wraps(tool)
+    async def run(*args: Any, **kwargs: Any) -> Any:
+        result = tool(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return tool_result(result) if get_encoder().fast else result
+
+    return run
@@ -0,0 +1,228 @@
+"""
+Profiling and tracing - Opt-in cProfile captures and OpenTelemetry-style spans for tool calls.
+
+Settings are per process: cProfile can only run one profiler at a time in a process, and spans
+nest across every server loaded into it. The first server (or the gateway) to configure them wins.
+"""
+
+import contextvars
+import cProfile
+import functools
+import json
+import os
+import random
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, Optional
+
+SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """One timed operation of a trace, with attributes"""
+
+    __slots__ = ("name", "kind", "trace_id", "span_id", "parent_id", "attributes", "start_ns", "end_ns", "error")
+
+    def __init__(self, name: str, kind: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else ""
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.error: Optional[str] = None
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """The span in OTLP JSON form"""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "kind": SPAN_KINDS[self.kind],
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [otlp_attribute(key, value) for key, value in self.attributes.items() if value is not None],
+            "status": {"code": STATUS_ERROR, "message": self.error} if self.error else {"code": STATUS_OK}
+        }
+
+
+class NoSpan:
+    """Stands in for a span when tracing is off, so instrumented code costs one check"""
+
+    def __enter__(self) -> "NoSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        return None
+
+
+def otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class SpanExporter:
+    """Appends finished spans to a file, one OTLP JSON export request per line (the format the
+    OpenTelemetry Collector's otlpjsonfile receiver reads)"""
+
+    def __init__(self, path: str, service_name: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.resource = {"attributes": [otlp_attribute("service.name", service_name)]}
+        self.scope = {"name": service_name}
+        self.exported = 0
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps({
+            "resourceSpans": [{"resource": self.resource, "scopeSpans": [{"scope": self.scope, "spans": [span.to_otlp()]}]}]
+        })
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            self.exported += 1
+
+
+class Instrumentation:
+    """A process's profiling and tracing settings, and the exporter spans are written with"""
+
+    def __init__(
+        self,
+        service_name: str = "mcp",
+        trace_file: str = "",
+        sample_rate: float = 0.0,
+        on_request: bool = False,
+        profile_dir: str = "profiles"
+    ):
+        self.service_name = service_name
+        self.sample_rate = sample_rate
+        self.on_request = on_request
+        self.profile_dir = profile_dir
+        self.exporter = SpanExporter(trace_file, service_name) if trace_file else None
+
+
+_instrumentation = Instrumentation()
+_configured = False
+_configure_lock = threading.Lock()
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("current_span", default=None)
+_no_span = NoSpan()
+_profile_lock = threading.Lock()
+
+
+def configure_instrumentation(
+    service_name: str,
+    trace_file: str = "",
+    sample_rate: float = 0.0,
+    on_request: bool = False,
+    profile_dir: str = "profiles"
+) -> Instrumentation:
+    """Set the process's profiling and tracing settings, unless they were set already (the gateway
+    sets its own before loading the servers it mounts); returns the settings in use"""
+    global _instrumentation, _configured
+    with _configure_lock:
+        if not _configured:
+            _instrumentation = Instrumentation(service_name, trace_file, sample_rate, on_request, profile_dir)
+            _configured = True
+        return _instrumentation
+
+
+def get_instrumentation() -> Instrumentation:
+    """Get the process's profiling and tracing settings (both off until configured)"""
+    return _instrumentation
+
+
+@contextmanager
+def _recorded_span(exporter: SpanExporter, name: str, kind: str, attributes: Dict[str, Any]) -> Iterator[Span]:
+    span = Span(name, kind, _current_span.get(), attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        span.end_ns = time.time_ns()
+        _current_span.reset(token)
+        exporter.export(span)
+
+
+def span(name: str, kind: str = "internal", **attributes: Any) -> Any:
+    """Time a block as a span, a child of the current span if there is one; a no-op unless tracing is on"""
+    exporter = _instrumentation.exporter
+    if exporter is None:
+        return _no_span
+    return _recorded_span(exporter, name, kind, attributes)
+
+
+def profile_requested() -> bool:
+    """Whether to profile the current tool call: a sample_rate share of calls, or one whose
+    request carries "profile": true in its _meta when on_request is set"""
+    settings = _instrumentation
+    if settings.sample_rate and random.random() < settings.sample_rate:
+        return True
+    if not settings.on_request:
+        return False
+    from mcp.server.lowlevel.server import request_ctx  # loaded by the server in any case
+
+    try:
+        meta = request_ctx.get().meta
+    except LookupError:
+        return False
+    return bool(meta is not None and (meta.model_extra or {}).get("profile"))
+
+
+def profiled(tool: str, call: Callable[[], Any]) -> Any:
+    """Run a call under cProfile and write its stats to the profile directory.
+
+    One call is profiled at a time (from Python 3.12 a profiler covers the whole process), so a
+    call arriving while another is profiled runs without.
+    """
+    if not _profile_lock.acquire(blocking=False):
+        return call()
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    try:
+        return profiler.runcall(call)
+    finally:
+        milliseconds = (time.perf_counter() - start) * 1000
+        _profile_lock.release()
+        profile_dir = _instrumentation.profile_dir
+        os.makedirs(profile_dir, exist_ok=True)
+        name = f"{datetime.now():%Y%m%dT%H%M%S}-{tool}-{os.getpid()}-{secrets.token_hex(2)}-{milliseconds:.0f}ms.pstats"
+        profiler.dump_stats(os.path.join(profile_dir, name))
+
+
+def instrumented(tool: str, call: Callable[[], Any]) -> Callable[[], Any]:
+    """Wrap a tool call, before it is handed to a worker thread, to run in a span and, when
+    requested, under the profiler; returned as is when neither is on"""
+    profile = profile_requested()
+    if _instrumentation.exporter is None and not profile:
+        return call
+
+    def run() -> Any:
+        with span(f"tool {tool}", tool=tool, profiled=profile):
+            return profiled(tool, call) if profile else call()
+
+    # Worker threads do not inherit context variables, so the span's parent travels with the call
+    return functools.partial(contextvars.copy_context().run, run)
@@ -0,0 +1,129 @@
+"""
+Tests of admission control and load shedding of tool calls.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mcp_common.admission import AdmissionController, Overloaded
+
+
+def blocked_call(started: threading.Event, release: threading.Event):
+    def call():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    return call
+
+
+async def while_busy(server, tool, attempt):
+    """Await `attempt()` while a blocked call holds the tool's only slot"""
+    started, release = threading.Event(), threading.Event()
+    busy = asyncio.ensure_future(server.run(tool, blocked_call(started, release)))
+    while not started.is_set():
+        await asyncio.sleep(0.001)
+    try:
+        return await attempt()
+    finally:
+        release.set()
+        await busy
+
+
+def test_call_is_admitted_while_idle_after_a_slow_call():
+    controller = AdmissionController(max_concurrent=1, max_queue=4)
+    server = controller.add_server("attractions", 1, deadline_seconds=0.05)
+
+    async def calls():
+        await server.run("search", lambda: time.sleep(0.2))
+        return await server.run("search", lambda: "fast")
+
+    assert asyncio.run(calls()) == "fast"
+    stats = controller.tools[("attractions", "search")]
+    assert stats.completed == 2 and stats.expected_seconds <= 0.05
+
+
+def test_queued_call_that_cannot_finish_in_time_is_shed():
+    controller = AdmissionController(max_concurrent=1, max_queue=4)
+    server = controller.add_server("attractions", 1, deadline_seconds=0.05)
+    asyncio.run(server.run("search", lambda: time.sleep(0.2)))
+
+    with pytest.raises(Overloaded) as shed:
+        asyncio.run(while_busy(server, "search", lambda: server.run("search", lambda: "queued")))
+
+    assert shed.value.reason == "deadline" and shed.value.retry_after >= 0.05
+    assert controller.shed == {"queue_full": 0, "deadline": 1}
+
+
+def test_call_finding_the_queue_full_is_shed():
+    controller = AdmissionController(max_concurrent=1, max_queue=1)
+    server = controller.add_server("weather", 1, deadline_seconds=5)
+
+    async def queue_full():
+        started, release = threading.Event(), threading.Event()
+        busy = asyncio.ensure_future(server.run("forecast", blocked_call(started, release)))
+        while not started.is_set():
+            await asyncio.sleep(0.001)
+        queued = asyncio.ensure_future(server.run("forecast", lambda: "queued"))
+        await asyncio.sleep(0.01)
+        try:
+            await server.run("forecast", lambda: "shed")
+        finally:
+            release.set()
+            assert await queued == "queued"
+            await busy
+
+    with pytest.raises(Overloaded) as shed:
+        asyncio.run(queue_full())
+
+    assert shed.value.reason == "queue_full"
+    assert controller.stats()["peak_queued"] == 1
+
+
+def test_tools_are_counted_per_server():
+    controller = AdmissionController()
+    attractions = controller.add_server("attractions", 4, deadline_seconds=5)
+    weather = controller.add_server("weather", 4, deadline_seconds=5)
+
+    async def calls():
+        await attractions.run("search", lambda: None)
+        await weather.run("search", lambda: None)
+        await weather.run("search", lambda: None)
+
+    asyncio.run(calls())
+
+    tools = controller.stats()["tools"]
+    assert {name: stats["completed"] for name, stats in tools.items()} == {"attractions/search": 1, "weather/search": 2}
+
+
+def test_tool_limits_and_deadlines_apply_to_their_server_only():
+    controller = AdmissionController()
+    attractions = controller.add_server("attractions", 4, 5, tool_limits={"book": 1}, tool_deadlines={"book": 30})
+    weather = controller.add_server("weather", 4, 5)
+
+    async def calls():
+        await attractions.run("book", lambda: None)
+        await weather.run("book", lambda: None)
+
+    asyncio.run(calls())
+
+    booking, other = controller.tools[("attractions", "book")], controller.tools[("weather", "book")]
+    assert (booking.limit, booking.deadline_seconds) == (1, 30)
+    assert (other.limit, other.deadline_seconds) == (4, 5)
+
+
+def test_shed_calls_return_a_retryable_error():
+    controller = AdmissionController(max_concurrent=1, max_queue=4)
+    server = controller.add_server("attractions", 1, deadline_seconds=0.05)
+
+    @server.admitted
+    def search() -> dict:
+        return {"attractions": []}
+
+    asyncio.run(server.run("search", lambda: time.sleep(0.2)))
+    result = asyncio.run(while_busy(server, "search", search))
+
+    assert result["retryable"] and result["error"].startswith("Server busy: search was not started")
@@ -0,0 +1,33 @@
+"""
+Gateway MCP Package - Attractions and weather tools served from one process.
+"""
+
+import importlib
+
+# Exported names are imported from their modules on first use, so importing the package
+# does not load the MCP framework and the mounted servers up front
+_EXPORTS = {
+    "servers": ("MountedServer", "load_server", "mount_server"),
+    "outing": ("plan_outing_data",),
+    "models": ("OutingPlan", "OutingStop", "OutingForecast")
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__version__ = "1.0.0"
+__all__ = [
+    "MountedServer",
+    "load_server",
+    "mount_server",
+    "plan_outing_data",
+    "OutingPlan",
+    "OutingStop",
+    "OutingForecast"
+]
+
+
+def __getattr__(name: str):
+    """Import an exported name from its module the first time it is used"""
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -0,0 +1,69 @@
+"""
+Gateway MCP configuration - which servers are mounted and how the combined server is run.
+"""
+
+import os
+
+MCP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Servers mounted in this process, by prefix. Their tools and prompts are served as
+# "<prefix>_<name>"; resources keep their own URIs, whose schemes already differ
+MOUNTED_SERVERS = {
+    "attractions": os.environ.get("GATEWAY_ATTRACTIONS_DIR", os.path.join(MCP_DIR, "attractions-mcp")),
+    "weather": os.environ.get("GATEWAY_WEATHER_DIR", os.path.join(MCP_DIR, "weather-mcp")),
+}
+
+# HTTP serving, as for the mounted servers: stateless mode is on by default with several workers.
+# In-flight requests get SERVER_DRAIN_SECONDS to finish on shutdown.
+SERVER_HOST = os.environ.get("GATEWAY_HOST", "127.0.0.1")
+SERVER_PORT = int(os.environ.get("GATEWAY_PORT", "8010"))
+SERVER_WORKERS = int(os.environ.get("GATEWAY_WORKERS", "1"))
+SERVER_STATELESS = os.environ.get("GATEWAY_STATELESS", str(SERVER_WORKERS > 1)).lower() in ("1", "true", "yes")
+SERVER_JSON_RESPONSE = os.environ.get("GATEWAY_JSON_RESPONSE", "false").lower() in ("1", "true", "yes")
+SERVER_DRAIN_SECONDS = float(os.environ.get("GATEWAY_DRAIN_SECONDS", "30"))
+
+# Admission control, profiling and the JSON encoder are shared by the mounted servers, and set up here
+# before they are loaded. At most ADMISSION_MAX_CONCURRENT tool calls run at once across the servers,
+# each also within its own server's limit, and up to ADMISSION_MAX_QUEUE wait
+ADMISSION_MAX_CONCURRENT = int(os.environ.get("GATEWAY_MAX_CONCURRENT", "24"))
+ADMISSION_MAX_QUEUE = int(os.environ.get("GATEWAY_MAX_QUEUE", "128"))
+ADMISSION_EWMA_WEIGHT = 0.2  # weight of the latest run time in each tool's expected run time
+PROFILE_SAMPLE_RATE = float(os.environ.get("GATEWAY_PROFILE_RATE", "0"))
+PROFILE_ON_REQUEST = os.environ.get("GATEWAY_PROFILE_ON_REQUEST", "false").lower() in ("1", "true", "yes")
+PROFILE_DIR = os.environ.get("GATEWAY_PROFILE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles"))
+TRACE_FILE = os.environ.get("GATEWAY_TRACE_FILE", "")
+TRACE_SERVICE_NAME = "gateway-mcp"
+JSON_ENCODER = os.environ.get("GATEWAY_JSON_ENCODER", "auto").lower()
+
+# Outing planner: candidates considered per requested result, and how far ahead forecasts reach
+OUTING_DEFAULT_LIMIT = 8
+OUTING_MAX_LIMIT = 20
+OUTING_CANDIDATES_PER_RESULT = 3
+OUTING_ATTRACTION_FIELDS = "name,category,rating,price,hours"  # all that ranking and the plan use of each candidate
+OUTING_FORECAST_DAYS = 16
+
+# Where a visit to each attraction category mostly happens: "indoor", "outdoor" or "mixed"
+OUTING_CATEGORY_SETTINGS = {
+    "museums": "indoor",
+    "religious": "indoor",
+    "entertainment": "indoor",
+    "cultural": "mixed",
+    "modern": "mixed",
+    "historical": "mixed",
+    "architecture": "outdoor",
+    "natural": "outdoor",
+    "parks": "outdoor",
+    "beaches": "outdoor",
+    "mountains": "outdoor",
+    "adventure": "outdoor"
+}
+
+# Outdoor conditions: each limit crossed lowers the day's outdoor score (1 = ideal, 0 = stay inside)
+OUTING_WET_WEATHER_CODES = range(51, 100)  # drizzle, rain, snow, showers and thunderstorms
+OUTING_SEVERE_WEATHER_CODES = range(95, 100)  # thunderstorms
+OUTING_COMFORT_TEMPERATURE = (10.0, 28.0)  # apparent daily maximum, °C
+OUTING_LIGHT_PRECIPITATION_MM = 1.0
+OUTING_HEAVY_PRECIPITATION_MM = 5.0
+OUTING_STRONG_GUSTS_KMH = 50.0
+OUTING_CONDITION_LABELS = [(0.7, "good"), (0.4, "fair"), (0.0, "poor")]  # lowest score for each label
+OUTING_RATING_WEIGHT = 0.5  # share of the ranking score from rating; the rest is weather fit
@@ -0,0 +1,108 @@
+"""
+Gateway MCP Server - Serves the attractions and weather tools from one process.
+
+To run this server:
+    uv run python main.py
+
+Tools and prompts are namespaced by server (e.g. attractions_search_attractions,
+weather_get_weather_forecast); resources keep their URIs. Both servers still run on their own
+from their own directories.
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+import uvicorn
+from mcp.server.fastmcp import FastMCP
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from mcp_common.admission import configure_admission, get_admission_controller
+from mcp_common.encoding import configure_encoder
+from mcp_common.profiling import configure_instrumentation
+
+from config import (
+    MOUNTED_SERVERS, OUTING_DEFAULT_LIMIT, SERVER_HOST, SERVER_PORT, SERVER_WORKERS, SERVER_STATELESS, SERVER_JSON_RESPONSE,
+    SERVER_DRAIN_SECONDS, ADMISSION_MAX_CONCURRENT, ADMISSION_MAX_QUEUE, ADMISSION_EWMA_WEIGHT, PROFILE_SAMPLE_RATE,
+    PROFILE_ON_REQUEST, PROFILE_DIR, TRACE_FILE, TRACE_SERVICE_NAME, JSON_ENCODER
+)
+from servers import load_server, mount_server
+from outing import plan_outing_data
+
+# Set up the process-wide admission control, profiling and encoder before the servers are loaded,
+# so the gateway's settings apply and the servers only add their own limits
+configure_admission(ADMISSION_MAX_CONCURRENT, ADMISSION_MAX_QUEUE, ADMISSION_EWMA_WEIGHT)
+configure_instrumentation(TRACE_SERVICE_NAME, TRACE_FILE, PROFILE_SAMPLE_RATE, PROFILE_ON_REQUEST, PROFILE_DIR)
+configure_encoder(JSON_ENCODER)
+
+mcp = FastMCP(
+    "Gateway",
+    host=SERVER_HOST,
+    port=SERVER_PORT,
+    stateless_http=SERVER_STATELESS,
+    json_response=SERVER_JSON_RESPONSE
+)
+
+servers = {prefix: load_server(prefix, directory) for prefix, directory in MOUNTED_SERVERS.items()}
+for server in servers.values():
+    mount_server(mcp, server)
+
+# One pool of keep-alive connections for both servers' outbound API calls
+servers["weather"].module("utils").set_http_session(servers["attractions"].module("utils").get_http_session())
+
+# tools combining several servers, so the agent needs one call instead of several
+@mcp.tool()
+async def plan_outing(
+    location: str,
+    date: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: int = OUTING_DEFAULT_LIMIT
+) -> Dict[str, Any]:
+    """Plan a day out: attractions open on the day, tagged indoor/outdoor and ranked for the weather forecast
+    
+    Args:
+        location: City or place to visit (e.g., "Paris", "Rome")
+        date: Day of the visit in YYYY-MM-DD format, up to 15 days ahead (default: today)
+        category: Optional attraction category (e.g., "museums", "parks")
+        limit: Maximum number of attractions to return (1-20, default: 8)
+        
+    Returns:
+        OutingPlan object as dictionary (the day's forecast and ranked attractions) or error dict
+    """
+    return await plan_outing_data(servers["attractions"], servers["weather"], location, date, category, limit)
+
+# health check and metrics for load balancers and monitoring
+@mcp.custom_route("/healthz", methods=["GET"])
+async def healthz(request: Request) -> JSONResponse:
+    """Report that this worker is serving, with the mounted servers and catalogue version"""
+    return JSONResponse({
+        "status": "ok",
+        "pid": os.getpid(),
+        "stateless": SERVER_STATELESS,
+        "servers": list(servers),
+        "catalogue_version": servers["attractions"].module("catalogue").get_catalogue().version
+    })
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> JSONResponse:
+    """Report tool concurrency, queue depth and shed counts, overall and for each mounted server"""
+    return JSONResponse(dict(get_admission_controller().stats(), pid=os.getpid()))
+
+def create_app() -> Starlette:
+    """Build the streamable HTTP app (called in each uvicorn worker)"""
+    # As the attractions server does on its own: load the catalogue before the worker accepts
+    # requests rather than on the first one, and deliver booking side-effects in the background
+    servers["attractions"].module("catalogue").get_catalogue()
+    servers["attractions"].module("outbox").get_outbox_dispatcher()
+    return mcp.streamable_http_app()
+
+if __name__ == "__main__":
+    # Several workers need the app as an import string; SIGTERM drains in-flight requests
+    uvicorn.run(
+        "main:create_app" if SERVER_WORKERS > 1 else create_app(),
+        factory=SERVER_WORKERS > 1,
+        host=SERVER_HOST,
+        port=SERVER_PORT,
+        workers=SERVER_WORKERS,
+        timeout_graceful_shutdown=SERVER_DRAIN_SECONDS
+    )
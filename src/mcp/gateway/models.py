@@ -0,0 +1,46 @@
+"""
+Gateway data models - Data classes for results combining several servers.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class OutingForecast:
+    date: str
+    description: str
+    code: int
+    temperature_min: float
+    temperature_max: float
+    precipitation_mm: float
+    precipitation_hours: float
+    max_gusts_kmh: Optional[float]
+    outdoor_score: float
+    outdoor_conditions: str  # good, fair or poor
+    unit: str = "°C"
+
+
+@dataclass
+class OutingStop:
+    id: int
+    name: str
+    category: str
+    setting: str  # indoor, outdoor or mixed
+    suitable: Optional[bool]  # the day's weather suits this attraction; None without a forecast
+    rating: Optional[float]
+    hours: Optional[str]  # opening hours on the day, e.g. "09:00-18:00"; None if not known
+    price_usd: Optional[float]  # lowest ticket price
+    score: float
+
+
+@dataclass
+class OutingPlan:
+    location: str
+    date: str
+    forecast: Optional[OutingForecast]
+    attractions: List[OutingStop]
+    candidates: int  # attractions considered
+    closed: int  # candidates closed on the day, left out
+    corrected_location: Optional[str] = None
+    forecast_error: Optional[str] = None
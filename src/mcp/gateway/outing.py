@@ -0,0 +1,214 @@
+"""
+Outing planner - Joins attraction search and the weather forecast for one place and day.
+"""
+
+import asyncio
+import functools
+from datetime import date as Date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp_common.admission import Overloaded
+from mcp_common.encoding import to_builtins
+
+from config import (
+    OUTING_DEFAULT_LIMIT, OUTING_MAX_LIMIT, OUTING_CANDIDATES_PER_RESULT, OUTING_ATTRACTION_FIELDS, OUTING_FORECAST_DAYS,
+    OUTING_CATEGORY_SETTINGS, OUTING_WET_WEATHER_CODES, OUTING_SEVERE_WEATHER_CODES, OUTING_COMFORT_TEMPERATURE,
+    OUTING_LIGHT_PRECIPITATION_MM, OUTING_HEAVY_PRECIPITATION_MM, OUTING_STRONG_GUSTS_KMH,
+    OUTING_CONDITION_LABELS, OUTING_RATING_WEIGHT
+)
+from models import OutingForecast, OutingStop, OutingPlan
+from servers import MountedServer
+
+
+def outdoor_score(day: Dict[str, Any]) -> float:
+    """Score a forecast day's conditions for being outside, from 1 (ideal) to 0"""
+    score = 1.0
+    code = day["weather"]["code"]
+    if code in OUTING_SEVERE_WEATHER_CODES:
+        score -= 0.6
+    elif code in OUTING_WET_WEATHER_CODES:
+        score -= 0.3
+
+    precipitation = day["precipitation"]["total"] or 0
+    if precipitation >= OUTING_HEAVY_PRECIPITATION_MM:
+        score -= 0.4
+    elif precipitation >= OUTING_LIGHT_PRECIPITATION_MM:
+        score -= 0.2
+
+    feels_like = day["apparent_temperature"]["max"]
+    if feels_like is None:
+        feels_like = day["temperature"]["max"]
+    if feels_like is not None:
+        low, high = OUTING_COMFORT_TEMPERATURE
+        score -= min(0.4, 0.03 * max(low - feels_like, feels_like - high, 0))
+
+    gusts = day["wind"].get("max_gusts")
+    if gusts is not None and gusts >= OUTING_STRONG_GUSTS_KMH:
+        score -= 0.2
+    return round(max(score, 0.0), 2)
+
+
+def condition_label(score: float) -> str:
+    return next(label for lowest, label in OUTING_CONDITION_LABELS if score >= lowest)
+
+
+def forecast_for(forecast_data: Dict[str, Any], day: str) -> Optional[OutingForecast]:
+    """Summarise one day of a WeatherForecast dictionary, or None if the day is not in it"""
+    for forecast_day in forecast_data.get("forecasts", []):
+        if forecast_day["date"] == day:
+            score = outdoor_score(forecast_day)
+            return OutingForecast(
+                date=day,
+                description=forecast_day["weather"]["description"],
+                code=forecast_day["weather"]["code"],
+                temperature_min=forecast_day["temperature"]["min"],
+                temperature_max=forecast_day["temperature"]["max"],
+                precipitation_mm=forecast_day["precipitation"]["total"],
+                precipitation_hours=forecast_day["precipitation"]["hours"],
+                max_gusts_kmh=forecast_day["wind"].get("max_gusts"),
+                outdoor_score=score,
+                outdoor_conditions=condition_label(score)
+            )
+    return None
+
+
+def hours_on(attraction: Dict[str, Any], weekday: str) -> Tuple[bool, Optional[str]]:
+    """Whether an attraction opens on a weekday, and its hours that day (None if it lists no hours)"""
+    hours = attraction.get("hours") or []
+    if not hours:
+        return True, None
+    today = [f"{entry['open']}-{entry['close']}" for entry in hours if entry["day"] == weekday]
+    return bool(today), ", ".join(today) or None
+
+
+def weather_fit(setting: str, score: float) -> float:
+    """How well a day with the given outdoor score suits an indoor, outdoor or mixed visit, from 0 to 1"""
+    if setting == "indoor":
+        return 1.0 - 0.2 * score  # always fine, and the better choice on a poor day
+    if setting == "outdoor":
+        return score
+    return 0.5 + 0.5 * score
+
+
+def rank_attractions(
+    attractions: List[Dict[str, Any]],
+    forecast: Optional[OutingForecast],
+    weekday: str
+) -> Tuple[List[OutingStop], int]:
+    """Tag attractions open on the day as indoor/outdoor and rank them by rating and weather fit
+
+    Returns:
+        The ranked stops, best first, and the number of attractions closed that day
+    """
+    stops, closed = [], 0
+    for attraction in attractions:
+        is_open, hours = hours_on(attraction, weekday)
+        if not is_open:
+            closed += 1
+            continue
+
+        setting = OUTING_CATEGORY_SETTINGS.get(attraction.get("category"), "mixed")
+        fit = weather_fit(setting, forecast.outdoor_score) if forecast else None
+        rating = attraction.get("rating")
+        score = OUTING_RATING_WEIGHT * (rating or 0) / 5 + (1 - OUTING_RATING_WEIGHT) * (1.0 if fit is None else fit)
+        price = attraction.get("price") or {}
+        stops.append(OutingStop(
+            id=attraction["id"],
+            name=attraction["name"],
+            category=attraction.get("category"),
+            setting=setting,
+            suitable=None if fit is None else fit >= 0.5,
+            rating=rating,
+            hours=hours,
+            price_usd=0.0 if price.get("is_free") else price.get("min_usd"),
+            score=round(score, 3)
+        ))
+
+    # sorted() is stable, so equal scores keep the search's order
+    return sorted(stops, key=lambda stop: -stop.score), closed
+
+
+async def plan_outing_data(
+    attractions: MountedServer,
+    weather: MountedServer,
+    location: str,
+    date: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: int = OUTING_DEFAULT_LIMIT
+) -> Dict[str, Any]:
+    """Rank attractions for a day out, fetching candidates and the forecast concurrently
+
+    Args:
+        attractions: The mounted attractions server
+        weather: The mounted weather server
+        location: City or place to visit (e.g., "Paris", "Rome")
+        date: Day of the visit in YYYY-MM-DD format, within the forecast range (default: today)
+        category: Optional attraction category filter
+        limit: Maximum number of attractions to return (1-20, default: 8)
+
+    Returns:
+        OutingPlan object as dictionary or error dict
+    """
+    if not location or not location.strip():
+        return {"error": "Location is required"}
+    try:
+        visit_date = datetime.strptime(date, "%Y-%m-%d").date() if date else Date.today()
+    except ValueError:
+        return {"error": "Date must be in YYYY-MM-DD format"}
+
+    # Forecast days start today in the place's own time zone, which may be a day either side of ours
+    days_ahead = (visit_date - Date.today()).days
+    if not -1 <= days_ahead < OUTING_FORECAST_DAYS:
+        return {"error": f"Date must be within the next {OUTING_FORECAST_DAYS} days"}
+    limit = max(1, min(limit, OUTING_MAX_LIMIT))
+
+    # Both calls run at once, each under its own server's admission control
+    search = functools.partial(
+        attractions.module("attractions_service").search_attractions_data,
+        location, category, limit * OUTING_CANDIDATES_PER_RESULT, fields=OUTING_ATTRACTION_FIELDS
+    )
+    forecast = functools.partial(
+        weather.module("weather_service").get_weather_forecast_data,
+        location, max(1, min(days_ahead + 2, OUTING_FORECAST_DAYS))
+    )
+    search_data, forecast_data = await asyncio.gather(
+        attractions.run("search_attractions", search),
+        weather.run("get_weather_forecast", forecast),
+        return_exceptions=True
+    )
+
+    if isinstance(search_data, Overloaded):
+        return {"error": str(search_data), "retryable": True, "retry_after_seconds": search_data.retry_after}
+    if isinstance(search_data, BaseException):
+        raise search_data
+    if "error" in search_data:
+        return search_data
+    if not search_data["attractions"]:
+        return {"error": f"No attractions found in {location}"}
+
+    # Without a forecast the attractions are still ranked, by rating alone
+    day_forecast, forecast_error = None, None
+    if isinstance(forecast_data, Overloaded):
+        forecast_error = str(forecast_data)
+    elif isinstance(forecast_data, BaseException):
+        forecast_error = f"Failed to get weather forecast: {forecast_data}"
+    elif "error" in forecast_data:
+        forecast_error = forecast_data["error"]
+    else:
+        day_forecast = forecast_for(forecast_data, visit_date.isoformat())
+        if day_forecast is None:
+            forecast_error = f"No forecast for {visit_date.isoformat()} in {location}"
+
+    weekday = attractions.module("config").WEEKDAYS[visit_date.weekday()]
+    stops, closed = rank_attractions(search_data["attractions"], day_forecast, weekday)
+    outing_plan = OutingPlan(
+        location=location,
+        date=visit_date.isoformat(),
+        forecast=day_forecast,
+        attractions=stops[:limit],
+        candidates=len(search_data["attractions"]),
+        closed=closed,
+        corrected_location=search_data.get("corrected_location"),
+        forecast_error=forecast_error
+    )
+    return to_builtins(outing_plan)
@@ -0,0 +1,156 @@
+"""
+Mounting - Loads MCP servers side by side in one process and registers their tools on the gateway.
+"""
+
+import asyncio
+import builtins
+import importlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Callable, Dict, FrozenSet, Optional
+
+from mcp.server.fastmcp import FastMCP
+from mcp_common.admission import ServerAdmission
+from mcp_common.profiling import instrumented
+
+
+class ServerLoader(importlib.machinery.SourceFileLoader):
+    """Runs a server module with builtins whose __import__ resolves the server's flat module names
+    (config, models, utils, ...) to that server's package, including imports made later in functions"""
+
+    def __init__(self, fullname: str, path: str, server_builtins: Dict[str, Any]):
+        super().__init__(fullname, path)
+        self.server_builtins = server_builtins
+
+    def exec_module(self, module: ModuleType) -> None:
+        module.__builtins__ = self.server_builtins
+        super().exec_module(module)
+
+
+class ServerFinder(importlib.abc.MetaPathFinder):
+    """Finds the modules of one server directory under a package of its own, e.g. attractions_server.config"""
+
+    def __init__(self, package: str, directory: str):
+        self.package = package
+        self.directory = directory
+        self.names: FrozenSet[str] = frozenset(
+            os.path.splitext(entry)[0] for entry in os.listdir(directory)
+            if entry.endswith(".py") and entry != "__init__.py"
+        )
+        self.builtins = dict(vars(builtins), __import__=self.server_import)
+
+    def server_import(
+        self, name: str, globals: Optional[Dict[str, Any]] = None, locals: Any = None, fromlist: Any = (), level: int = 0
+    ) -> ModuleType:
+        if level == 0 and name in self.names:
+            return importlib.import_module(f"{self.package}.{name}")
+        return builtins.__import__(name, globals, locals, fromlist, level)
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> Optional[importlib.machinery.ModuleSpec]:
+        package, _, name = fullname.partition(".")
+        if package != self.package or name not in self.names:
+            return None
+        location = os.path.join(self.directory, f"{name}.py")
+        return importlib.util.spec_from_file_location(fullname, location, loader=ServerLoader(fullname, location, self.builtins))
+
+
+@dataclass
+class MountedServer:
+    """A server loaded into the gateway process, with the package its modules were imported under"""
+    prefix: str
+    directory: str
+    package: str
+
+    @property
+    def main(self) -> ModuleType:
+        return self.module("main")
+
+    @property
+    def mcp(self) -> FastMCP:
+        return self.main.mcp
+
+    def module(self, name: str) -> ModuleType:
+        return importlib.import_module(f"{self.package}.{name}")
+
+    @property
+    def admission(self) -> ServerAdmission:
+        """This server's limits on the process's admission controller"""
+        return self.main.admission
+
+    async def run(self, tool: str, call: Callable[[], Any]) -> Any:
+        """Run a call under this server's admission control, counted against one of its tools, traced
+        and profiled as the server's own tool calls are"""
+        return await self.admission.run(tool, instrumented(tool, call))
+
+
+def load_server(prefix: str, directory: str) -> MountedServer:
+    """Import a server's main module from its directory without clashing with other servers.
+
+    Every server uses flat module names (main, config, models, utils, ...), so each server's
+    modules are imported as a package of their own, "<prefix>_server" (attractions_server.config,
+    weather_server.config, ...), and their imports of one another, at load time or later, resolve
+    within it. Nothing is added to sys.path, so the server behaves as it does when run on its own.
+    """
+    package_name = f"{prefix}_server"
+    if package_name not in sys.modules:
+        finder = ServerFinder(package_name, directory)
+        package = importlib.util.module_from_spec(importlib.machinery.ModuleSpec(package_name, None, is_package=True))
+        package.__path__ = [directory]
+        sys.modules[package_name] = package
+        sys.meta_path.insert(0, finder)
+    server = MountedServer(prefix, directory, package_name)
+    server.module("main")
+    return server
+
+
+async def _listings(source: FastMCP) -> tuple:
+    return await asyncio.gather(
+        source.list_tools(), source.list_resources(), source.list_resource_templates(), source.list_prompts()
+    )
+
+
+def mount_server(gateway: FastMCP, server: MountedServer) -> None:
+    """Register a loaded server's tools and prompts on the gateway under "<prefix>_<name>",
+    and its resources and resource templates under their own URIs.
+
+    The server's public listings give each one's name and metadata; its function is the attribute
+    of that name in the server's main module, where FastMCP names tools, resources and prompts after
+    the functions they wrap.
+    """
+    # The listings are coroutines, and the gateway may be imported by uvicorn inside its running
+    # event loop, so they are run on a loop of their own
+    with ThreadPoolExecutor(1) as executor:
+        tools, resources, templates, prompts = executor.submit(asyncio.run, _listings(server.mcp)).result()
+
+    def function(name: str) -> Callable[..., Any]:
+        fn = getattr(server.main, name, None)
+        if not callable(fn):
+            raise LookupError(f"{server.prefix} lists {name!r}, but its main module has no function of that name")
+        return fn
+
+    for tool in tools:
+        gateway.add_tool(
+            function(tool.name),
+            name=f"{server.prefix}_{tool.name}",
+            title=tool.title,
+            description=tool.description,
+            annotations=tool.annotations
+        )
+    for resource in [*resources, *templates]:
+        gateway.resource(
+            getattr(resource, "uriTemplate", None) or str(resource.uri),
+            name=resource.name,
+            title=resource.title,
+            description=resource.description,
+            mime_type=resource.mimeType
+        )(function(resource.name))
+    for prompt in prompts:
+        gateway.prompt(name=f"{server.prefix}_{prompt.name}", title=prompt.title, description=prompt.description)(
+            function(prompt.name)
+        )
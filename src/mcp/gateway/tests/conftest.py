@@ -0,0 +1,15 @@
+"""
+Test setup - Keeps the mounted attractions server's booking ledger, outbox, snapshot and profiles in a directory of their own.
+"""
+
+import os
+import tempfile
+
+# Set before the mounted servers are loaded, so nothing is written next to their sources
+_run_dir = tempfile.mkdtemp(prefix="gateway-tests-")
+os.environ.setdefault("ATTRACTIONS_BOOKINGS_DB", os.path.join(_run_dir, "bookings.db"))
+os.environ.setdefault("ATTRACTIONS_OUTBOX_DIR", os.path.join(_run_dir, "outbox"))
+os.environ.setdefault("ATTRACTIONS_CATALOGUE_SNAPSHOT", os.path.join(_run_dir, "catalogue.snapshot"))
+os.environ.setdefault("ATTRACTIONS_PROFILE_DIR", os.path.join(_run_dir, "profiles"))
+os.environ.setdefault("WEATHER_PROFILE_DIR", os.path.join(_run_dir, "profiles"))
+os.environ.setdefault("GATEWAY_PROFILE_DIR", os.path.join(_run_dir, "profiles"))
@@ -0,0 +1,73 @@
+"""
+Tests of serving the attractions and weather servers from the gateway process.
+"""
+
+import asyncio
+
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp_common.admission import get_admission_controller
+
+import main
+from servers import load_server
+
+
+def listed():
+    async def listings():
+        async with create_connected_server_and_client_session(main.mcp) as session:
+            tools = await session.list_tools()
+            templates = await session.list_resource_templates()
+            prompts = await session.list_prompts()
+            return (
+                [tool.name for tool in tools.tools],
+                [template.uriTemplate for template in templates.resourceTemplates],
+                [prompt.name for prompt in prompts.prompts]
+            )
+
+    return asyncio.run(listings())
+
+
+def call_tool(name, arguments):
+    async def call():
+        async with create_connected_server_and_client_session(main.mcp) as session:
+            return await session.call_tool(name, arguments)
+
+    return asyncio.run(call())
+
+
+def test_tools_and_prompts_are_prefixed_by_server():
+    tools, templates, prompts = listed()
+
+    assert {"attractions_search_attractions", "attractions_book_attraction", "weather_get_weather_forecast",
+            "plan_outing"} <= set(tools)
+    assert "search_attractions" not in tools
+    assert {"attractions_attraction_booking_prompt", "weather_weather_summary_prompt"} <= set(prompts)
+    assert "weather://{location}" in templates
+
+
+def test_mounted_tool_runs_under_its_servers_admission_control():
+    result = call_tool("attractions_search_attractions", {"location": "Paris", "limit": 5})
+
+    assert not result.isError
+    names = [attraction["name"] for attraction in result.structuredContent["result"]["attractions"]]
+    assert names == ["Eiffel Tower", "Louvre Museum"]
+    assert get_admission_controller().stats()["tools"]["attractions-mcp/search_attractions"]["completed"] >= 1
+
+
+def test_servers_keep_their_own_modules():
+    attractions, weather = main.servers["attractions"], main.servers["weather"]
+
+    assert attractions.module("config") is not weather.module("config")
+    assert attractions.module("config").SERVER_NAME == "attractions-mcp"
+    assert weather.module("config").SERVER_NAME == "weather-mcp"
+    assert load_server("attractions", attractions.directory).main is attractions.main
+
+
+def test_create_app_warms_the_attractions_catalogue(monkeypatch):
+    catalogue = main.servers["attractions"].module("catalogue")
+    outbox = main.servers["attractions"].module("outbox")
+    monkeypatch.setattr(catalogue, "_catalogue", None)
+
+    main.create_app()
+
+    assert catalogue._catalogue is not None
+    assert outbox._dispatcher is not None
@@ -0,0 +1,181 @@
+"""
+Tests of plan_outing: attractions ranked for the day's weather forecast.
+"""
+
+import asyncio
+import json
+from datetime import date, timedelta
+
+import pytest
+import requests
+from mcp.shared.memory import create_connected_server_and_client_session
+
+import main
+from outing import forecast_for, outdoor_score, rank_attractions
+
+VISIT_DATE = date.today() + timedelta(days=2)
+GEOCODING = {"results": [{
+    "name": "Paris", "latitude": 48.85, "longitude": 2.35, "country": "France", "timezone": "Europe/Paris"
+}]}
+CLEAR = {"code": 0, "precipitation": 0.0, "feels_like": 22.0, "gusts": 15.0}
+RAIN = {"code": 63, "precipitation": 8.0, "feels_like": 14.0, "gusts": 30.0}
+
+
+def forecast_day(day, code, precipitation, feels_like, gusts):
+    return {
+        "date": day.isoformat(),
+        "weather": {"description": "Moderate rain" if code else "Clear sky", "code": code},
+        "temperature": {"current": 0, "min": feels_like - 8, "max": feels_like},
+        "apparent_temperature": {"current": 0, "min": feels_like - 9, "max": feels_like},
+        "precipitation": {"total": precipitation, "hours": 4.0 if precipitation else 0.0},
+        "wind": {"speed": 12.0, "direction": 200, "max_gusts": gusts}
+    }
+
+
+def open_meteo_forecast(conditions, days):
+    """An Open-Meteo daily forecast with the same conditions every day from today"""
+    dates = [date.today() + timedelta(days=offset) for offset in range(days)]
+    return {"daily": {
+        "time": [day.isoformat() for day in dates],
+        "weather_code": [conditions["code"]] * days,
+        "temperature_2m_min": [conditions["feels_like"] - 8] * days,
+        "temperature_2m_max": [conditions["feels_like"]] * days,
+        "apparent_temperature_min": [conditions["feels_like"] - 9] * days,
+        "apparent_temperature_max": [conditions["feels_like"]] * days,
+        "precipitation_sum": [conditions["precipitation"]] * days,
+        "rain_sum": [conditions["precipitation"]] * days,
+        "showers_sum": [0.0] * days,
+        "snowfall_sum": [0.0] * days,
+        "precipitation_hours": [4.0 if conditions["precipitation"] else 0.0] * days,
+        "wind_speed_10m_max": [12.0] * days,
+        "wind_gusts_10m_max": [conditions["gusts"]] * days,
+        "wind_direction_10m_dominant": [200] * days
+    }}
+
+
+class CannedResponse:
+    def __init__(self, body, status_code=200):
+        self.content = json.dumps(body).encode()
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Server Error")
+
+
+class CannedSession:
+    """Answers the weather server's geocoding and forecast requests"""
+
+    def __init__(self, conditions=None, status_code=200):
+        self.conditions = conditions
+        self.status_code = status_code
+
+    def get(self, url, params=None, timeout=None):
+        if url.endswith("/search"):
+            return CannedResponse(GEOCODING)
+        if self.status_code >= 400:
+            return CannedResponse({"error": True, "reason": "unavailable"}, self.status_code)
+        return CannedResponse(open_meteo_forecast(self.conditions, params["forecast_days"]))
+
+
+@pytest.fixture
+def weather():
+    """Point the mounted weather server at canned responses, restoring the shared session afterwards"""
+    utils = main.servers["weather"].module("utils")
+    shared = utils.get_http_session()
+
+    def use(**canned):
+        utils.get_coordinates.cache_clear()
+        utils.set_http_session(CannedSession(**canned))
+
+    yield use
+    utils.get_coordinates.cache_clear()
+    utils.set_http_session(shared)
+
+
+def plan_outing(**arguments):
+    async def call():
+        async with create_connected_server_and_client_session(main.mcp) as session:
+            return await session.call_tool("plan_outing", arguments)
+
+    result = asyncio.run(call())
+    assert not result.isError
+    return result.structuredContent["result"]
+
+
+def names(plan):
+    return [stop["name"] for stop in plan["attractions"]]
+
+
+def test_outdoor_score():
+    clear = outdoor_score(forecast_day(VISIT_DATE, **CLEAR))
+    rain = outdoor_score(forecast_day(VISIT_DATE, **RAIN))
+    storm = outdoor_score(forecast_day(VISIT_DATE, code=95, precipitation=20.0, feels_like=35.0, gusts=80.0))
+
+    assert (clear, rain, storm) == (1.0, 0.3, 0.0)
+
+
+def test_forecast_for_a_day_not_forecast():
+    forecast = {"forecasts": [forecast_day(VISIT_DATE, **CLEAR)]}
+
+    assert forecast_for(forecast, VISIT_DATE.isoformat()).outdoor_conditions == "good"
+    assert forecast_for(forecast, (VISIT_DATE + timedelta(days=1)).isoformat()) is None
+
+
+def test_closed_attractions_are_left_out():
+    attractions = [
+        {"id": 1, "name": "Park", "category": "parks", "rating": 4.0,
+         "hours": [{"day": "Monday", "open": "08:00", "close": "20:00"}]},
+        {"id": 2, "name": "Gallery", "category": "museums", "rating": 4.0,
+         "hours": [{"day": "Tuesday", "open": "10:00", "close": "18:00"}]},
+        {"id": 3, "name": "Square", "category": "architecture", "rating": 3.0, "hours": []}
+    ]
+
+    stops, closed = rank_attractions(attractions, None, "Monday")
+
+    assert [(stop.name, stop.hours, stop.suitable) for stop in stops] == [("Park", "08:00-20:00", None), ("Square", None, None)]
+    assert closed == 1
+
+
+def test_clear_day_puts_outdoor_attractions_first(weather):
+    weather(conditions=CLEAR)
+
+    plan = plan_outing(location="Paris", date=VISIT_DATE.isoformat())
+
+    assert plan["forecast"]["outdoor_conditions"] == "good"
+    assert names(plan) == ["Eiffel Tower", "Louvre Museum"]
+    assert [stop["setting"] for stop in plan["attractions"]] == ["outdoor", "indoor"]
+    assert plan["candidates"] == 2 and plan["forecast_error"] is None
+
+
+def test_rainy_day_puts_indoor_attractions_first(weather):
+    weather(conditions=RAIN)
+
+    plan = plan_outing(location="Paris", date=VISIT_DATE.isoformat())
+
+    assert plan["forecast"]["outdoor_conditions"] == "poor"
+    assert names(plan) == ["Louvre Museum", "Eiffel Tower"]
+    assert [stop["suitable"] for stop in plan["attractions"]] == [True, False]
+
+
+def test_plan_without_a_forecast_is_ranked_by_rating(weather):
+    weather(status_code=503)
+
+    plan = plan_outing(location="Paris", date=VISIT_DATE.isoformat(), limit=1)
+
+    assert plan["forecast"] is None and "API request failed" in plan["forecast_error"]
+    assert names(plan) == ["Eiffel Tower"]
+
+
+@pytest.mark.parametrize("arguments, error", [
+    ({"location": " "}, "Location is required"),
+    ({"location": "Paris", "date": "next week"}, "YYYY-MM-DD"),
+    ({"location": "Paris", "date": (date.today() + timedelta(days=30)).isoformat()}, "within the next 16 days"),
+    ({"location": "Paris", "category": "beaches"}, "No attractions found in Paris")
+])
+def test_plan_outing_argument_errors(weather, arguments, error):
+    weather(conditions=CLEAR)
+
+    plan = plan_outing(**arguments)
+
+    assert error in plan["error"]
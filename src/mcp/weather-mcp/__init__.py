@@ -2,10 +2,16 @@
 Weather MCP Package - Modular weather information service.
 """
 
+import importlib
 
-from weather_service import get_current_weather_data, get_weather_forecast_data
-from models import CurrentWeather, WeatherForecast, Temperature, Weather, Wind, Precipitation
-from utils import get_coordinates, format_location_name, get_weather_description
+# Exported names are imported from their modules on first use, so importing the package
+# does not load the weather service and its dependencies up front
+_EXPORTS = {
+    "weather_service": ("get_current_weather_data", "get_weather_forecast_data"),
+    "models": ("CurrentWeather", "WeatherForecast", "Temperature", "Weather", "Wind", "Precipitation"),
+    "utils": ("get_coordinates", "format_location_name", "get_weather_description")
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
 
 __version__ = "1.0.0"
 __all__ = [
@@ -21,3 +27,11 @@ __all__ = [
     "format_location_name",
     "get_weather_description"
 ]
+
+
+def __getattr__(name: str):
+    """Import an exported name from its module the first time it is used"""
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -2,10 +2,17 @@
 Weather MCP configuration constants.
 """
 
+import os
+
 # Weather API configuration - Open-Meteo (free, no API key required)
 WEATHER_BASE_URL = "https://api.open-meteo.com/v1"
 GEOCODING_BASE_URL = "https://geocoding-api.open-meteo.com/v1"
 
+# Pooled HTTP client: keep-alive connections per host, and places resolved by geocoding kept in memory
+HTTP_POOL_SIZE = 16
+HTTP_TIMEOUT_SECONDS = 10
+GEOCODING_CACHE_SIZE = 1024
+
 # Weather code descriptions (WMO Weather interpretation codes)
 WEATHER_CODES = {
     0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
@@ -19,3 +26,38 @@ WEATHER_CODES = {
     85: "Slight snow showers", 86: "Heavy snow showers",
     95: "Slight thunderstorm", 96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail"
 }
+
+# MCP HTTP server. In stateless mode no session outlives a request, so any replica or worker can
+# answer any call and a plain (non-sticky) load balancer will do; stateless is the default with
+# several workers. In-flight requests get SERVER_DRAIN_SECONDS to finish on shutdown.
+SERVER_NAME = "weather-mcp"
+SERVER_HOST = os.environ.get("WEATHER_HOST", "127.0.0.1")
+SERVER_PORT = int(os.environ.get("WEATHER_PORT", "8009"))
+SERVER_WORKERS = int(os.environ.get("WEATHER_WORKERS", "1"))
+SERVER_STATELESS = os.environ.get("WEATHER_STATELESS", str(SERVER_WORKERS > 1)).lower() in ("1", "true", "yes")
+SERVER_JSON_RESPONSE = os.environ.get("WEATHER_JSON_RESPONSE", "false").lower() in ("1", "true", "yes")
+SERVER_DRAIN_SECONDS = float(os.environ.get("WEATHER_DRAIN_SECONDS", "30"))
+
+# Admission control: up to ADMISSION_MAX_CONCURRENT tool calls run at once per worker and
+# ADMISSION_MAX_QUEUE wait for a slot. Calls that find the queue full, or could not finish by
+# their deadline, are rejected straight away with a retryable error.
+ADMISSION_MAX_CONCURRENT = int(os.environ.get("WEATHER_MAX_CONCURRENT", "16"))
+ADMISSION_MAX_QUEUE = int(os.environ.get("WEATHER_MAX_QUEUE", "64"))
+ADMISSION_DEADLINE_SECONDS = float(os.environ.get("WEATHER_DEADLINE_SECONDS", "20"))  # two API calls of up to 10 s
+ADMISSION_TOOL_LIMITS = {}
+ADMISSION_TOOL_DEADLINES = {}
+ADMISSION_EWMA_WEIGHT = 0.2  # weight of the latest run time in each tool's expected run time
+
+# Opt-in profiling and tracing of tool calls. WEATHER_PROFILE_RATE is the share of calls run under
+# cProfile; with WEATHER_PROFILE_ON_REQUEST a caller can also ask for one call to be profiled by
+# sending "profile": true in the request's _meta. Stats are written to PROFILE_DIR as .pstats files.
+# WEATHER_TRACE_FILE turns on spans, appended to that file as OTLP JSON lines
+PROFILE_SAMPLE_RATE = float(os.environ.get("WEATHER_PROFILE_RATE", "0"))
+PROFILE_ON_REQUEST = os.environ.get("WEATHER_PROFILE_ON_REQUEST", "false").lower() in ("1", "true", "yes")
+PROFILE_DIR = os.environ.get("WEATHER_PROFILE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles"))
+TRACE_FILE = os.environ.get("WEATHER_TRACE_FILE", "")
+TRACE_SERVICE_NAME = SERVER_NAME
+
+# JSON encoder for tool results and weather API responses: "auto" picks the first installed of orjson,
+# msgspec, pydantic-core and the standard library; naming one that is not installed falls back the same way
+JSON_ENCODER = os.environ.get("WEATHER_JSON_ENCODER", "auto").lower()
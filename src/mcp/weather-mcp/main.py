@@ -8,8 +8,17 @@ Uses Open-Meteo free weather API - no API key required!
 https://open-meteo.com/
 """
 
+import os
 from typing import Dict, Any
+
+import uvicorn
 from mcp.server.fastmcp import FastMCP
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from mcp_common.admission import get_admission_controller, register_server
+from mcp_common.encoding import configure_encoder, encoded
+from mcp_common.profiling import configure_instrumentation
 
 from weather_service import (
     get_current_weather_data, 
@@ -17,12 +26,35 @@ from weather_service import (
     format_weather_resource,
     get_weather_summary_prompt
 )
+from config import (
+    SERVER_NAME, SERVER_HOST, SERVER_PORT, SERVER_WORKERS, SERVER_STATELESS, SERVER_JSON_RESPONSE, SERVER_DRAIN_SECONDS,
+    ADMISSION_MAX_CONCURRENT, ADMISSION_MAX_QUEUE, ADMISSION_DEADLINE_SECONDS, ADMISSION_TOOL_LIMITS,
+    ADMISSION_TOOL_DEADLINES, ADMISSION_EWMA_WEIGHT, PROFILE_SAMPLE_RATE, PROFILE_ON_REQUEST, PROFILE_DIR, TRACE_FILE,
+    TRACE_SERVICE_NAME, JSON_ENCODER
+)
+
+# Admission control, profiling and the JSON encoder are shared by every server in the process; when
+# the gateway mounts this server its own settings are already in place, and these only add our limits
+admission = register_server(
+    SERVER_NAME, ADMISSION_MAX_CONCURRENT, ADMISSION_MAX_QUEUE, ADMISSION_DEADLINE_SECONDS, ADMISSION_TOOL_LIMITS,
+    ADMISSION_TOOL_DEADLINES, ADMISSION_EWMA_WEIGHT
+)
+configure_instrumentation(TRACE_SERVICE_NAME, TRACE_FILE, PROFILE_SAMPLE_RATE, PROFILE_ON_REQUEST, PROFILE_DIR)
+configure_encoder(JSON_ENCODER)
 
 
-mcp = FastMCP("Weather", port=8009)
+mcp = FastMCP(
+    "Weather",
+    host=SERVER_HOST,
+    port=SERVER_PORT,
+    stateless_http=SERVER_STATELESS,
+    json_response=SERVER_JSON_RESPONSE
+)
 
 # tools
 @mcp.tool()
+@encoded
+@admission.admitted
 def get_current_weather(location: str) -> Dict[str, Any]:
     """Get current weather information for a specific location
     
@@ -35,6 +67,8 @@ def get_current_weather(location: str) -> Dict[str, Any]:
     return get_current_weather_data(location)
 
 @mcp.tool()
+@encoded
+@admission.admitted
 def get_weather_forecast(location: str, days: int = 7) -> Dict[str, Any]:
     """Get weather forecast for a specific location
     
@@ -58,5 +92,29 @@ def weather_summary_prompt(location: str, include_forecast: bool = False) -> str
     """Generate a prompt for weather summary"""
     return get_weather_summary_prompt(location, include_forecast)
 
+# health check and metrics for load balancers and monitoring
+@mcp.custom_route("/healthz", methods=["GET"])
+async def healthz(request: Request) -> JSONResponse:
+    """Report that this worker is up"""
+    return JSONResponse({"status": "ok", "pid": os.getpid(), "stateless": SERVER_STATELESS})
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> JSONResponse:
+    """Report this worker's tool concurrency, queue depth and shed counts"""
+    return JSONResponse(dict(get_admission_controller().stats(), pid=os.getpid()))
+
+def create_app() -> Starlette:
+    """Build the streamable HTTP app (called in each uvicorn worker)"""
+    return mcp.streamable_http_app()
+
 if __name__ == "__main__":
-    mcp.run("streamable-http")
\ No newline at end of file
+    # Several workers need the app as an import string. SIGTERM drains in-flight requests before
+    # exiting; SIGHUP replaces workers one by one
+    uvicorn.run(
+        "main:create_app" if SERVER_WORKERS > 1 else create_app(),
+        factory=SERVER_WORKERS > 1,
+        host=SERVER_HOST,
+        port=SERVER_PORT,
+        workers=SERVER_WORKERS,
+        timeout_graceful_shutdown=SERVER_DRAIN_SECONDS
+    )
\ No newline at end of file
@@ -0,0 +1,139 @@
+"""
+Tests of the weather tools against canned Open-Meteo responses.
+"""
+
+import json
+
+import pytest
+import requests
+
+import utils
+import weather_service
+
+GEOCODING = {"results": [{
+    "name": "Paris", "latitude": 48.85, "longitude": 2.35, "country": "France", "admin1": "Île-de-France",
+    "timezone": "Europe/Paris"
+}]}
+CURRENT = {
+    "current_weather": {"temperature": 21.5, "weathercode": 2, "windspeed": 11.2, "winddirection": 240, "time": "2030-06-03T12:00"},
+    "hourly": {
+        "apparent_temperature": [20.9], "relative_humidity_2m": [55], "surface_pressure": [1012.4],
+        "precipitation": [0.0]
+    }
+}
+FORECAST = {"daily": {
+    "time": ["2030-06-03", "2030-06-04"], "weather_code": [61, 0],
+    "temperature_2m_min": [14.0, 15.5], "temperature_2m_max": [22.0, 26.0],
+    "apparent_temperature_min": [13.1, 15.0], "apparent_temperature_max": [21.4, 26.3],
+    "precipitation_sum": [4.2, 0.0], "rain_sum": [4.2, 0.0], "showers_sum": [0.0, 0.0], "snowfall_sum": [0.0, 0.0],
+    "precipitation_hours": [3.0, 0.0], "wind_speed_10m_max": [18.0, 9.5], "wind_gusts_10m_max": [35.0, 20.1],
+    "wind_direction_10m_dominant": [250, 180]
+}}
+
+
+class CannedResponse:
+    def __init__(self, body, status_code=200):
+        self.content = json.dumps(body).encode()
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Server Error")
+
+
+class CannedSession:
+    """Answers geocoding and forecast requests with canned bodies, recording each request"""
+
+    def __init__(self, geocoding=GEOCODING, forecast=None, status_code=200):
+        self.geocoding = geocoding
+        self.forecast = forecast
+        self.status_code = status_code
+        self.requests = []
+
+    def get(self, url, params=None, timeout=None):
+        self.requests.append((url, params))
+        if url.endswith("/search"):
+            return CannedResponse(self.geocoding)
+        return CannedResponse(self.forecast, self.status_code)
+
+
+@pytest.fixture
+def session():
+    def use(**canned):
+        session = CannedSession(**canned)
+        utils.set_http_session(session)
+        return session
+
+    utils.get_coordinates.cache_clear()
+    yield use
+    utils.get_coordinates.cache_clear()
+    utils.set_http_session(None)
+
+
+def test_current_weather(session):
+    session(forecast=CURRENT)
+
+    weather = weather_service.get_current_weather_data("Paris")
+
+    assert weather["location"] == "Paris, Île-de-France, France"
+    assert weather["temperature"]["current"] == 21.5 and weather["temperature"]["feels_like"] == 20.9
+    assert weather["weather"]["description"] == "Partly cloudy"
+    assert (weather["humidity"], weather["pressure"], weather["timezone"]) == (55, 1012.4, "Europe/Paris")
+
+
+def test_forecast_has_one_entry_per_day(session):
+    requested = session(forecast=FORECAST)
+
+    forecast = weather_service.get_weather_forecast_data("Paris", 2)
+
+    assert forecast["forecast_days"] == 2
+    assert [day["weather"]["description"] for day in forecast["forecasts"]] == ["Slight rain", "Clear sky"]
+    assert forecast["forecasts"][0]["wind"]["max_gusts"] == 35.0
+    assert requested.requests[-1][1]["forecast_days"] == 2
+
+
+@pytest.mark.parametrize("days", [0, 17])
+def test_forecast_days_out_of_range(session, days):
+    requested = session(forecast=FORECAST)
+
+    result = weather_service.get_weather_forecast_data("Paris", days)
+
+    assert result == {"error": "Days must be between 1 and 16"}
+    assert requested.requests == []
+
+
+def test_unknown_location(session):
+    session(geocoding={"results": []})
+
+    result = weather_service.get_current_weather_data("Atlantis")
+
+    assert result == {"error": "Location 'Atlantis' not found"}
+
+
+def test_places_are_geocoded_once(session):
+    requested = session(forecast=CURRENT)
+
+    weather_service.get_current_weather_data("Paris")
+    weather_service.get_current_weather_data("Paris")
+
+    assert [url for url, _ in requested.requests].count(f"{utils.GEOCODING_BASE_URL}/search") == 1
+
+
+def test_api_failure_is_reported(session):
+    session(forecast={}, status_code=503)
+
+    result = weather_service.get_weather_forecast_data("Paris")
+
+    assert result["error"].startswith("Failed to get forecast for Paris: API request failed: 503")
+
+
+def test_weather_resource(session):
+    session(forecast=CURRENT)
+
+    resource = weather_service.format_weather_resource("Paris")
+
+    assert resource.splitlines()[:3] == [
+        "Weather for Paris, Île-de-France, France:",
+        "Temperature: 21.5°C (feels like 20.9°C)",
+        "Condition: Partly cloudy"
+    ]
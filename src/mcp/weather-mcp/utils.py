@@ -2,25 +2,66 @@
 Utility functions for weather operations.
 """
 
-import requests
-from typing import Dict, Any, Optional
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, Optional
 
-from config import WEATHER_CODES, GEOCODING_BASE_URL
+from mcp_common.profiling import span
+from mcp_common.encoding import loads
+
+from config import WEATHER_CODES, GEOCODING_BASE_URL, HTTP_POOL_SIZE, HTTP_TIMEOUT_SECONDS, GEOCODING_CACHE_SIZE
 from models import Coordinates, Location
 
+if TYPE_CHECKING:
+    import requests
+
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> "requests.Session":
+    """Get the HTTP session shared by all API calls, keeping connections alive between them
+    (requests is imported on the first call rather than at startup)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def set_http_session(session: "requests.Session") -> None:
+    """Use another session for API calls (e.g. one shared with other servers in the same process)"""
+    global _session
+    with _session_lock:
+        _session = session
+
 
 def make_api_request(url: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """Make an API request with error handling"""
-    try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"API request failed: {str(e)}")
+    import requests
+
+    with span("GET", kind="client", **{"url.full": url}) as request_span:
+        try:
+            response = get_http_session().get(url, params=params, timeout=HTTP_TIMEOUT_SECONDS)
+            request_span.set("http.response.status_code", response.status_code)
+            response.raise_for_status()
+            return loads(response.content)
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"API request failed: {str(e)}")
+        except ValueError as e:
+            raise Exception(f"API request failed: invalid JSON ({str(e)})")
 
 
+@lru_cache(maxsize=GEOCODING_CACHE_SIZE)
 def get_coordinates(location: str) -> Optional[Location]:
-    """Get latitude and longitude for a location using Open-Meteo Geocoding API"""
+    """Get latitude and longitude for a location using Open-Meteo Geocoding API (cached; places don't move)"""
     url = f"{GEOCODING_BASE_URL}/search"
     params = {"name": location, "count": 1, "language": "en", "format": "json"}
     
@@ -3,7 +3,9 @@ Weather service with MCP tools and API logic.
 """
 
 from typing import Dict, Any, List
-from dataclasses import asdict
+
+from mcp_common.profiling import span
+from mcp_common.encoding import to_builtins
 
 from config import WEATHER_BASE_URL
 from models import (
@@ -26,7 +28,8 @@ def get_current_weather_data(location: str) -> Dict[str, Any]:
         CurrentWeather object as dictionary or error dict
     """
     try:
-        location_obj = get_coordinates(location)
+        with span("geocode", location=location):
+            location_obj = get_coordinates(location)
         if not location_obj:
             return {"error": f"Location '{location}' not found"}
         
@@ -73,7 +76,8 @@ def get_current_weather_data(location: str) -> Dict[str, Any]:
         )
         
         # Return as dictionary for MCP compatibility
-        return asdict(current_weather)
+        with span("serialise"):
+            return to_builtins(current_weather)
         
     except Exception as e:
         return {"error": f"Failed to get weather for {location}: {str(e)}"}
@@ -93,7 +97,8 @@ def get_weather_forecast_data(location: str, days: int = 7) -> Dict[str, Any]:
         return {"error": "Days must be between 1 and 16"}
     
     try:
-        location_obj = get_coordinates(location)
+        with span("geocode", location=location):
+            location_obj = get_coordinates(location)
         if not location_obj:
             return {"error": f"Location '{location}' not found"}
         
@@ -162,7 +167,8 @@ def get_weather_forecast_data(location: str, days: int = 7) -> Dict[str, Any]:
         )
         
         # Return as dictionary for MCP compatibility
-        return asdict(forecast)
+        with span("serialise"):
+            return to_builtins(forecast)
         
     except Exception as e:
         return {"error": f"Failed to get forecast for {location}: {str(e)}"}